@@ -0,0 +1,51 @@
+"""
+Cold import time of `routelit_mantine`, measured in fresh interpreters.
+
+Usage:
+    python benchmarks/import_time.py [--runs 20] [--module routelit_mantine]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+SNIPPET = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+loaded = sorted(m for m in sys.modules if m.startswith("routelit_mantine.") or m == "numpy")
+print(elapsed * 1000, ",".join(loaded))
+"""
+
+
+def measure(module: str, runs: int) -> tuple[list[float], list[str]]:
+    timings: list[float] = []
+    loaded: list[str] = []
+    for _ in range(runs):
+        output = subprocess.run(  # noqa: S603 - runs the current interpreter
+            [sys.executable, "-c", SNIPPET.format(module=module)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        timings.append(float(output[0]))
+        loaded = output[1].split(",") if len(output) > 1 else []
+    return timings, loaded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--module", default="routelit_mantine")
+    args = parser.parse_args()
+    timings, loaded = measure(args.module, args.runs)
+    print(
+        f"import {args.module}: median {statistics.median(timings):.1f} ms, min {min(timings):.1f} ms ({args.runs} runs)"
+    )
+    print("loaded:", ", ".join(loaded) or "-")
+
+
+if __name__ == "__main__":
+    main()
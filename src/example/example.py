@@ -4,7 +4,7 @@ from flask import Flask, Response
 from routelit import RouteLit
 from routelit_flask import RouteLitFlaskAdapter
 
-from routelit_mantine import RLBuilder, create_drawer_decorator
+from routelit_mantine import RLBuilder, create_drawer_decorator, resample
 
 app = Flask(__name__)
 
@@ -702,207 +702,208 @@ def nested_fragment(ui: RLBuilder) -> None:
 def sidebar_view(ui: RLBuilder) -> None:
     ui.set_provider_props(theme={"primaryColor": "green"})
     ui.set_app_shell_props(title="Mantine RouteLit", navbar_props={"width": 200})
-    with ui.scroll_area():
-        ui.nav_link(
-            href="/",
-            label="Home",
-            left_section=ui.icon("Home"),
-            exact=True,
-        )
-        ui.nav_link(
-            href="/layouts",
-            label="Layouts",
-            left_section=ui.icon("Layout"),
-        )
-        ui.nav_link(
-            href="/checkboxes",
-            label="Checkboxes",
-            left_section=ui.icon("Checkbox"),
-        )
-        ui.nav_link(
-            href="/chips",
-            label="Chips",
-            left_section=ui.icon("Label"),
-        )
-        ui.nav_link(
-            href="/inputs",
-            label="Inputs",
-            left_section=ui.icon("Forms"),
-        )
-        ui.nav_link(
-            href="/combobox",
-            label="Combobox",
-            left_section=ui.icon("Select"),
-        )
-        ui.nav_link(
-            href="/buttons",
-            label="Buttons",
-            left_section=ui.icon("CircuitPushbutton"),
-        )
-        ui.nav_link(
-            href="/navigation",
-            label="Navigation",
-            left_section=ui.icon("Navigation"),
-        )
-        ui.nav_link(
-            href="/feedback",
-            label="Feedback",
-            left_section=ui.icon("ExclamationCircle"),
-        )
-        ui.nav_link(
-            href="/overlays",
-            label="Overlays",
-            left_section=ui.icon("ImageInPicture"),
-        )
-        ui.nav_link(
-            href="/data_display",
-            label="Data Display",
-            left_section=ui.icon("Database"),
-        )
-        ui.nav_link(
-            href="/miscellaneous",
-            label="Miscellaneous",
-            left_section=ui.icon("Tools"),
-        )
-        ui.nav_link(
-            href="/dates",
-            label="Dates",
-            left_section=ui.icon("Calendar"),
-        )
-        with ui.nav_link(
-            href="#",
-            label="Charts",
-            is_external=True,
-            left_section=ui.icon("Graph"),
-        ):
-            ui.nav_link(
-                href="/area_chart",
-                label="Area Chart",
-                left_section=ui.icon("ChartArea"),
-            )
-            ui.nav_link(
-                href="/bar_chart",
-                label="Bar Chart",
-                left_section=ui.icon("ChartBar"),
-            )
-            ui.nav_link(
-                href="/line_chart",
-                label="Line Chart",
-                left_section=ui.icon("ChartLine"),
-            )
-            ui.nav_link(
-                href="/composite_chart",
-                label="Composite Chart",
-                left_section=ui.icon("ChartAreaLine"),
-            )
-            ui.nav_link(
-                href="/donut_chart",
-                label="Donut Chart",
-                left_section=ui.icon("ChartDonut"),
-            )
+    with ui.scroll_area(), ui.static("nav") as cached:
+        if not cached:
             ui.nav_link(
-                href="/funnel_chart",
-                label="Funnel Chart",
-                left_section=ui.icon("ChartFunnel"),
+                href="/",
+                label="Home",
+                left_section=ui.icon("Home"),
+                exact=True,
             )
             ui.nav_link(
-                href="/pie_chart",
-                label="Pie Chart",
-                left_section=ui.icon("ChartPie"),
+                href="/layouts",
+                label="Layouts",
+                left_section=ui.icon("Layout"),
             )
             ui.nav_link(
-                href="/radar_chart",
-                label="Radar Chart",
-                left_section=ui.icon("ChartRadar"),
+                href="/checkboxes",
+                label="Checkboxes",
+                left_section=ui.icon("Checkbox"),
             )
             ui.nav_link(
-                href="/scatter_chart",
-                label="Scatter Chart",
-                left_section=ui.icon("ChartScatter"),
+                href="/chips",
+                label="Chips",
+                left_section=ui.icon("Label"),
             )
             ui.nav_link(
-                href="/bubble_chart",
-                label="Bubble Chart",
-                left_section=ui.icon("ChartBubble"),
+                href="/inputs",
+                label="Inputs",
+                left_section=ui.icon("Forms"),
             )
             ui.nav_link(
-                href="/radial_bar_chart",
-                label="Radial Bar Chart",
-                left_section=ui.icon("ChartArcs"),
+                href="/combobox",
+                label="Combobox",
+                left_section=ui.icon("Select"),
             )
             ui.nav_link(
-                href="/sparkline_chart",
-                label="Sparkline Chart",
-                left_section=ui.icon("ChartLine"),
+                href="/buttons",
+                label="Buttons",
+                left_section=ui.icon("CircuitPushbutton"),
             )
             ui.nav_link(
-                href="/heatmap",
-                label="Heatmap",
-                left_section=ui.icon("Matrix"),
+                href="/navigation",
+                label="Navigation",
+                left_section=ui.icon("Navigation"),
             )
-        with ui.nav_link(
-            href="#",
-            label="Search Engines",
-            is_external=True,
-            variant="gradient",
-            gradient={"from": "blue", "to": "red"},
-            left_section=ui.icon("ListSearch"),
-            default_opened=False,
-        ):
-            # region search engines
             ui.nav_link(
-                href="https://www.google.com",
-                label="Google",
-                is_external=True,
-                variant="gradient",
-                gradient={"from": "blue", "to": "red"},
-                left_section=ui.icon("BrandGoogle"),
+                href="/feedback",
+                label="Feedback",
+                left_section=ui.icon("ExclamationCircle"),
             )
             ui.nav_link(
-                href="https://www.bing.com",
-                label="Bing",
-                is_external=True,
-                variant="gradient",
-                gradient={"from": "blue", "to": "red"},
-                right_section=ui.icon("ChevronRightPipe"),
+                href="/overlays",
+                label="Overlays",
+                left_section=ui.icon("ImageInPicture"),
             )
             ui.nav_link(
-                href="https://www.duckduckgo.com",
-                label="DuckDuckGo",
-                is_external=True,
-                variant="gradient",
-                gradient={"from": "blue", "to": "red"},
+                href="/data_display",
+                label="Data Display",
+                left_section=ui.icon("Database"),
             )
             ui.nav_link(
-                href="https://www.yahoo.com",
-                label="Yahoo",
-                is_external=True,
-                variant="gradient",
-                gradient={"from": "blue", "to": "red"},
+                href="/miscellaneous",
+                label="Miscellaneous",
+                left_section=ui.icon("Tools"),
             )
             ui.nav_link(
-                href="https://www.ask.com",
-                label="Ask",
-                is_external=True,
-                variant="gradient",
-                gradient={"from": "blue", "to": "red"},
+                href="/dates",
+                label="Dates",
+                left_section=ui.icon("Calendar"),
             )
-            ui.nav_link(
-                href="https://www.aol.com",
-                label="AOL",
+            with ui.nav_link(
+                href="#",
+                label="Charts",
                 is_external=True,
-                variant="gradient",
-                gradient={"from": "blue", "to": "red"},
-            )
-            ui.nav_link(
-                href="https://www.ask.com",
-                label="Ask",
+                left_section=ui.icon("Graph"),
+            ):
+                ui.nav_link(
+                    href="/area_chart",
+                    label="Area Chart",
+                    left_section=ui.icon("ChartArea"),
+                )
+                ui.nav_link(
+                    href="/bar_chart",
+                    label="Bar Chart",
+                    left_section=ui.icon("ChartBar"),
+                )
+                ui.nav_link(
+                    href="/line_chart",
+                    label="Line Chart",
+                    left_section=ui.icon("ChartLine"),
+                )
+                ui.nav_link(
+                    href="/composite_chart",
+                    label="Composite Chart",
+                    left_section=ui.icon("ChartAreaLine"),
+                )
+                ui.nav_link(
+                    href="/donut_chart",
+                    label="Donut Chart",
+                    left_section=ui.icon("ChartDonut"),
+                )
+                ui.nav_link(
+                    href="/funnel_chart",
+                    label="Funnel Chart",
+                    left_section=ui.icon("ChartFunnel"),
+                )
+                ui.nav_link(
+                    href="/pie_chart",
+                    label="Pie Chart",
+                    left_section=ui.icon("ChartPie"),
+                )
+                ui.nav_link(
+                    href="/radar_chart",
+                    label="Radar Chart",
+                    left_section=ui.icon("ChartRadar"),
+                )
+                ui.nav_link(
+                    href="/scatter_chart",
+                    label="Scatter Chart",
+                    left_section=ui.icon("ChartScatter"),
+                )
+                ui.nav_link(
+                    href="/bubble_chart",
+                    label="Bubble Chart",
+                    left_section=ui.icon("ChartBubble"),
+                )
+                ui.nav_link(
+                    href="/radial_bar_chart",
+                    label="Radial Bar Chart",
+                    left_section=ui.icon("ChartArcs"),
+                )
+                ui.nav_link(
+                    href="/sparkline_chart",
+                    label="Sparkline Chart",
+                    left_section=ui.icon("ChartLine"),
+                )
+                ui.nav_link(
+                    href="/heatmap",
+                    label="Heatmap",
+                    left_section=ui.icon("Matrix"),
+                )
+            with ui.nav_link(
+                href="#",
+                label="Search Engines",
                 is_external=True,
                 variant="gradient",
                 gradient={"from": "blue", "to": "red"},
-            )
-            # endregion search engines
-        ui.nav_link("#", label="About", left_section=ui.icon("InfoCircle"))
+                left_section=ui.icon("ListSearch"),
+                default_opened=False,
+            ):
+                # region search engines
+                ui.nav_link(
+                    href="https://www.google.com",
+                    label="Google",
+                    is_external=True,
+                    variant="gradient",
+                    gradient={"from": "blue", "to": "red"},
+                    left_section=ui.icon("BrandGoogle"),
+                )
+                ui.nav_link(
+                    href="https://www.bing.com",
+                    label="Bing",
+                    is_external=True,
+                    variant="gradient",
+                    gradient={"from": "blue", "to": "red"},
+                    right_section=ui.icon("ChevronRightPipe"),
+                )
+                ui.nav_link(
+                    href="https://www.duckduckgo.com",
+                    label="DuckDuckGo",
+                    is_external=True,
+                    variant="gradient",
+                    gradient={"from": "blue", "to": "red"},
+                )
+                ui.nav_link(
+                    href="https://www.yahoo.com",
+                    label="Yahoo",
+                    is_external=True,
+                    variant="gradient",
+                    gradient={"from": "blue", "to": "red"},
+                )
+                ui.nav_link(
+                    href="https://www.ask.com",
+                    label="Ask",
+                    is_external=True,
+                    variant="gradient",
+                    gradient={"from": "blue", "to": "red"},
+                )
+                ui.nav_link(
+                    href="https://www.aol.com",
+                    label="AOL",
+                    is_external=True,
+                    variant="gradient",
+                    gradient={"from": "blue", "to": "red"},
+                )
+                ui.nav_link(
+                    href="https://www.ask.com",
+                    label="Ask",
+                    is_external=True,
+                    variant="gradient",
+                    gradient={"from": "blue", "to": "red"},
+                )
+                # endregion search engines
+            ui.nav_link("#", label="About", left_section=ui.icon("InfoCircle"))
 
 
 def index_view(ui: RLBuilder) -> None:
@@ -1157,6 +1158,23 @@ def dates_view(ui: RLBuilder) -> None:
                 label="Date range picker input", value=(date.today(), date.today() + timedelta(days=1)), type="range"
             )
             ui.text(f"Date range picker input: {date_range2}")
+        with ui.container():
+            booking = ui.date_picker_input(
+                label="Booking (weekdays, closed over the holidays)",
+                availability={
+                    "weekdays": [1, 2, 3, 4, 5],
+                    "closed_ranges": [(date(date.today().year, 12, 24), date(date.today().year + 1, 1, 6))],
+                    "open_dates": [date(date.today().year, 12, 27)],
+                },
+            )
+            ui.text(f"Booking: {booking}")
+        with ui.container():
+            room = ui.date_picker_input(
+                label="Room 101 (loaded per month)",
+                availability_loader=lambda year, month: {"closed_dates": [date(year, month, d) for d in (3, 4, 17)]},
+                availability_resource="room-101",
+            )
+            ui.text(f"Room 101: {room}")
 
     ui.header("Time input")
     with ui.group():
@@ -1414,6 +1432,17 @@ def line_chart_view(ui: RLBuilder) -> None:
         y_axis_label="uv",
         right_y_axis_label="pv",
     )
+    ui.header("Resampled events")
+    start = datetime(2024, 1, 1, 8)
+    event_times = [start + timedelta(seconds=(i * 7919) % 14400) for i in range(2000)]
+    latencies = [20 + (i * 37) % 180 for i in range(2000)]
+    ui.line_chart(
+        data=resample(event_times, {"p95": latencies, "mean": latencies}, interval="15min", agg={"p95": "p95"}),
+        data_key="date",
+        series=[{"name": "p95", "color": "red.6"}, {"name": "mean", "color": "blue.6"}],
+        h=300,
+        unit="ms",
+    )
 
 
 def composite_chart_view(ui: RLBuilder) -> None:
@@ -1580,6 +1609,20 @@ def scatter_chart_view(ui: RLBuilder) -> None:
         h=300,
         with_legend=True,
     )
+    ui.header("Canvas renderer")
+    group_data = [
+        {
+            "color": "teal.5",
+            "name": "Samples",
+            "data": [{"x": random.gauss(0, 1), "y": random.gauss(0, 1)} for _ in range(50_000)],
+        },
+    ]
+    ui.scatter_chart(
+        data=group_data,
+        data_key={"x": "x", "y": "y"},
+        renderer="canvas",
+        h=400,
+    )
 
 
 def funnel_chart_view(ui: RLBuilder) -> None:
@@ -1679,6 +1722,13 @@ def sparkline_chart_view(ui: RLBuilder) -> None:
         h=60,
         trend_colors={"positive": "teal.6", "negative": "red.6", "neutral": "gray.6"},
     )
+    ui.header("Sparkline grid")
+    ui.sparkline_grid(
+        [positiveTrend, negativeTrend, neutralTrend] * 20,
+        labels=[f"KPI {i}" for i in range(60)],
+        cell_height=40,
+        trend_colors={"positive": "teal.6", "negative": "red.6", "neutral": "gray.6"},
+    )
 
 
 def heatmap_view(ui: RLBuilder) -> None:
@@ -1,8 +1,11 @@
 import { Anchor as MantineAnchor, AnchorProps as MantineAnchorProps } from "@mantine/core";
 import { useLinkClickHandler } from "routelit-client";
+import { beginNavigation } from "../utils/navigation";
+import { PrefetchMode, usePrefetch } from "../utils/prefetch";
 
 type AnchorProps = MantineAnchorProps & Parameters<typeof useLinkClickHandler>[0] & {
   text?: string;
+  prefetch?: PrefetchMode;
 };
 
 export const Anchor = ({
@@ -12,13 +15,22 @@ export const Anchor = ({
   children,
   id,
   replace,
+  prefetch,
   ...props
 }: AnchorProps) => {
-  const handleClick = useLinkClickHandler({ id, href, replace, isExternal});
+  const prefetchProps = usePrefetch<HTMLAnchorElement>(href, isExternal ? undefined : prefetch);
+  const linkClickHandler = useLinkClickHandler({ id, href, replace, isExternal });
+  const handleClick = (event: React.MouseEvent<HTMLAnchorElement>) => {
+    if (!isExternal && !event.defaultPrevented && event.button === 0 && !event.metaKey && !event.ctrlKey && !event.shiftKey && !event.altKey) {
+      beginNavigation(href);
+    }
+    linkClickHandler(event);
+  };
   return (
     <MantineAnchor
       href={href}
       {...props}
+      {...prefetchProps}
       onClick={handleClick}
     >
       {text || children}
@@ -0,0 +1,236 @@
+import { ReactNode, useEffect, useMemo, useRef, useState } from "react";
+import {
+  Box,
+  BoxProps,
+  Paper,
+  Text,
+  useComputedColorScheme,
+  useMantineTheme,
+} from "@mantine/core";
+import { extent, resolveColor, setupCanvas } from "../utils/canvas";
+
+const DAY = 86_400_000;
+const DEFAULT_COLORS = ["blue.3", "blue.5", "blue.7", "blue.9"];
+const DEFAULT_MONTH_LABELS = [
+  "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+  "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+];
+const DEFAULT_WEEKDAY_LABELS = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"];
+
+interface CanvasHeatmapProps extends BoxProps {
+  data: Record<string, number>;
+  domain?: [number, number];
+  colors?: string[];
+  startDate?: string | Date;
+  endDate?: string | Date;
+  firstDayOfWeek?: number;
+  fontSize?: number;
+  gap?: number;
+  rectSize?: number;
+  rectRadius?: number;
+  monthLabels?: string[];
+  monthsLabelsHeight?: number;
+  weekdayLabels?: string[];
+  weekdaysLabelsWidth?: number;
+  withMonthLabels?: boolean;
+  withWeekdayLabels?: boolean;
+  withOutsideDates?: boolean;
+  withTooltip?: boolean;
+  getTooltipLabel?: (input: { date: string; value: number | null }) => ReactNode;
+}
+
+/** UTC midnight of a date or "YYYY-MM-DD..." string, or `fallback`. */
+function utcDay(value: string | Date | undefined, fallback: number): number {
+  if (value instanceof Date) {
+    return Date.UTC(value.getFullYear(), value.getMonth(), value.getDate());
+  }
+  const time = value ? Date.parse(`${value.slice(0, 10)}T00:00:00Z`) : NaN;
+  return Number.isNaN(time) ? fallback : time;
+}
+
+function isoDay(time: number): string {
+  return new Date(time).toISOString().slice(0, 10);
+}
+
+/**
+ * Calendar heatmap drawn on a single canvas, laid out like Mantine's
+ * `Heatmap`: one column per week and one row per weekday. Tooltips find the
+ * hovered cell arithmetically instead of attaching a node to each day.
+ */
+export function CanvasHeatmap({
+  data,
+  domain,
+  colors = DEFAULT_COLORS,
+  startDate,
+  endDate,
+  firstDayOfWeek = 1,
+  fontSize = 12,
+  gap = 1,
+  rectSize = 10,
+  rectRadius = 2,
+  monthLabels = DEFAULT_MONTH_LABELS,
+  monthsLabelsHeight = 14,
+  weekdayLabels = DEFAULT_WEEKDAY_LABELS,
+  weekdaysLabelsWidth = 30,
+  withMonthLabels = false,
+  withWeekdayLabels = false,
+  withOutsideDates = true,
+  withTooltip = false,
+  getTooltipLabel,
+  ...props
+}: CanvasHeatmapProps) {
+  const theme = useMantineTheme();
+  const colorScheme = useComputedColorScheme("light");
+  const canvasRef = useRef<HTMLCanvasElement>(null);
+  const [hovered, setHovered] = useState<{
+    date: string;
+    value: number | null;
+    left: number;
+    top: number;
+  } | null>(null);
+
+  const grid = useMemo(() => {
+    const now = new Date();
+    const end = utcDay(endDate, Date.UTC(now.getFullYear(), now.getMonth(), now.getDate()));
+    const endDay = new Date(end);
+    const start = utcDay(
+      startDate,
+      Date.UTC(endDay.getUTCFullYear() - 1, endDay.getUTCMonth(), endDay.getUTCDate() + 1)
+    );
+    const gridStart = start - ((new Date(start).getUTCDay() - firstDayOfWeek + 7) % 7) * DAY;
+    const weeks = Math.max(Math.ceil(((end - gridStart) / DAY + 1) / 7), 0);
+    return { start, end, gridStart, weeks };
+  }, [startDate, endDate, firstDayOfWeek]);
+
+  const valueDomain = useMemo(
+    () => domain ?? extent(Object.values(data)) ?? [0, 0],
+    [data, domain]
+  );
+
+  const step = rectSize + gap;
+  const left = withWeekdayLabels ? weekdaysLabelsWidth : 0;
+  const top = withMonthLabels ? monthsLabelsHeight : 0;
+  const width = left + grid.weeks * step;
+  const height = top + 7 * step;
+
+  useEffect(() => {
+    const canvas = canvasRef.current;
+    if (!canvas) return;
+    const ctx = setupCanvas(canvas, width, height);
+    if (!ctx) return;
+    const [min, max] = valueDomain;
+    const span = max - min;
+    // One path per color, so the whole grid is drawn in a few fill calls.
+    const paths = colors.map(() => new Path2D());
+    const empty = new Path2D();
+    const addCell = (path: Path2D, x: number, y: number) => {
+      if (rectRadius > 0 && path.roundRect) path.roundRect(x, y, rectSize, rectSize, rectRadius);
+      else path.rect(x, y, rectSize, rectSize);
+    };
+    for (let week = 0; week < grid.weeks; week++) {
+      for (let day = 0; day < 7; day++) {
+        const time = grid.gridStart + (week * 7 + day) * DAY;
+        if (!withOutsideDates && (time < grid.start || time > grid.end)) continue;
+        const value = data[isoDay(time)];
+        const x = left + week * step;
+        const y = top + day * step;
+        if (value === undefined || value === null) {
+          addCell(empty, x, y);
+        } else {
+          const level = span > 0 ? Math.floor(((value - min) / span) * colors.length) : colors.length - 1;
+          addCell(paths[Math.min(Math.max(level, 0), colors.length - 1)], x, y);
+        }
+      }
+    }
+    ctx.fillStyle = resolveColor(colorScheme === "dark" ? "dark.5" : "gray.1", theme, canvas);
+    ctx.fill(empty);
+    paths.forEach((path, i) => {
+      ctx.fillStyle = resolveColor(colors[i], theme, canvas);
+      ctx.fill(path);
+    });
+
+    ctx.fillStyle = resolveColor("dimmed", theme, canvas);
+    ctx.font = `${fontSize}px ${theme.fontFamily}`;
+    ctx.textBaseline = "top";
+    if (withMonthLabels) {
+      for (let week = 0; week < grid.weeks; week++) {
+        for (let day = 0; day < 7; day++) {
+          const date = new Date(grid.gridStart + (week * 7 + day) * DAY);
+          if (date.getUTCDate() === 1) {
+            ctx.fillText(monthLabels[date.getUTCMonth()] ?? "", left + week * step, 0);
+          }
+        }
+      }
+    }
+    if (withWeekdayLabels) {
+      ctx.textBaseline = "middle";
+      for (let day = 1; day < 7; day += 2) {
+        const label = weekdayLabels[(day + firstDayOfWeek) % 7] ?? "";
+        ctx.fillText(label, 0, top + day * step + rectSize / 2);
+      }
+    }
+  }, [
+    data,
+    grid,
+    valueDomain,
+    colors,
+    colorScheme,
+    theme,
+    width,
+    height,
+    left,
+    top,
+    step,
+    rectSize,
+    rectRadius,
+    fontSize,
+    firstDayOfWeek,
+    monthLabels,
+    weekdayLabels,
+    withMonthLabels,
+    withWeekdayLabels,
+    withOutsideDates,
+  ]);
+
+  const handleMove = (event: React.MouseEvent<HTMLCanvasElement>) => {
+    if (!withTooltip) return;
+    const rect = event.currentTarget.getBoundingClientRect();
+    const x = event.clientX - rect.left - left;
+    const y = event.clientY - rect.top - top;
+    const week = Math.floor(x / step);
+    const day = Math.floor(y / step);
+    const time = grid.gridStart + (week * 7 + day) * DAY;
+    const onCell =
+      x >= 0 && y >= 0 && week < grid.weeks && day < 7 && x % step < rectSize && y % step < rectSize;
+    if (!onCell || (!withOutsideDates && (time < grid.start || time > grid.end))) {
+      setHovered(null);
+      return;
+    }
+    const date = isoDay(time);
+    setHovered({ date, value: data[date] ?? null, left: x + left, top: y + top });
+  };
+
+  return (
+    <Box pos="relative" w="fit-content" {...props}>
+      <canvas ref={canvasRef} onMouseMove={handleMove} onMouseLeave={() => setHovered(null)} />
+      {hovered && (
+        <Paper
+          withBorder
+          shadow="md"
+          px="xs"
+          py={4}
+          pos="absolute"
+          left={hovered.left + 12}
+          top={hovered.top + 12}
+          style={{ pointerEvents: "none", whiteSpace: "nowrap" }}
+        >
+          <Text size="xs">
+            {getTooltipLabel
+              ? getTooltipLabel({ date: hovered.date, value: hovered.value })
+              : `${hovered.date} | ${hovered.value ?? ""}`}
+          </Text>
+        </Paper>
+      )}
+    </Box>
+  );
+}
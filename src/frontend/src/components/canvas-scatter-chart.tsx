@@ -0,0 +1,417 @@
+import { useEffect, useMemo, useRef, useState } from "react";
+import {
+  Box,
+  BoxProps,
+  ColorSwatch,
+  Group,
+  Paper,
+  Text,
+  useMantineTheme,
+} from "@mantine/core";
+import { useElementSize } from "@mantine/hooks";
+import { niceTicks, resolveColor, setupCanvas } from "../utils/canvas";
+import {
+  ChartTask,
+  DensityBins,
+  Point,
+  PreparedPoints,
+  ScatterSeries,
+} from "../utils/chart-prep";
+import { usePreparedChartData } from "../utils/chart-workers";
+
+interface AxisProps {
+  domain?: [number, number];
+}
+
+interface CanvasChartBaseProps extends BoxProps {
+  labels?: { x?: string; y?: string };
+  unit?: { x?: string; y?: string; z?: string };
+  withXAxis?: boolean;
+  withYAxis?: boolean;
+  withTooltip?: boolean;
+  withLegend?: boolean;
+  xAxisLabel?: string;
+  yAxisLabel?: string;
+  xAxisProps?: AxisProps;
+  yAxisProps?: AxisProps;
+  gridColor?: string;
+  textColor?: string;
+  pointSize?: number;
+}
+
+interface CanvasScatterChartProps extends CanvasChartBaseProps {
+  data?: ScatterSeries[];
+  bins?: DensityBins;
+  dataKey: { x: string; y: string };
+}
+
+interface CanvasBubbleChartProps extends CanvasChartBaseProps {
+  data: Point[];
+  dataKey: { x: string; y: string; z: string };
+  range: [number, number];
+  color?: string;
+  label?: string;
+}
+
+const HIT_CELL = 8;
+const TICK_FONT = 11;
+
+// Hexagon vertices in cell units, as in matplotlib's hexbin.
+const HEX_VERTICES: Array<[number, number]> = [
+  [0.5, -0.5 / 3],
+  [0.5, 0.5 / 3],
+  [0, 1 / 3],
+  [-0.5, 0.5 / 3],
+  [-0.5, -0.5 / 3],
+  [0, -1 / 3],
+];
+
+function formatValue(value: number, unit?: string): string {
+  const text = Number.isInteger(value) ? String(value) : value.toFixed(2);
+  return unit ? `${text}${unit}` : text;
+}
+
+/**
+ * Canvas renderer shared by the scatter and bubble charts.
+ * It draws every point of a series in a single path and answers tooltips by
+ * hit-testing a spatial hash instead of attaching DOM nodes to each point.
+ */
+function CanvasPointsChart({
+  points,
+  labels,
+  unit,
+  withXAxis = true,
+  withYAxis = true,
+  withTooltip = true,
+  withLegend = false,
+  xAxisLabel,
+  yAxisLabel,
+  xAxisProps,
+  yAxisProps,
+  gridColor = "gray.3",
+  textColor = "gray.6",
+  pointSize = 3,
+  h = 300,
+  ...props
+}: CanvasChartBaseProps & { points: PreparedPoints }) {
+  const theme = useMantineTheme();
+  const canvasRef = useRef<HTMLCanvasElement>(null);
+  const hitIndex = useRef<Map<number, number[]>>(new Map());
+  const hitCell = useRef(HIT_CELL);
+  const screen = useRef<{ xs: Float32Array; ys: Float32Array } | null>(null);
+  const { ref, width, height } = useElementSize();
+  const [hovered, setHovered] = useState<{
+    index: number;
+    left: number;
+    top: number;
+  } | null>(null);
+
+  const xDomain = xAxisProps?.domain ?? points.xDomain;
+  const yDomain = yAxisProps?.domain ?? points.yDomain;
+
+  useEffect(() => {
+    const canvas = canvasRef.current;
+    if (!canvas || width <= 0 || height <= 0) {
+      return;
+    }
+    const ctx = setupCanvas(canvas, width, height);
+    if (!ctx) {
+      return;
+    }
+    const margin = {
+      top: 10,
+      right: 10,
+      bottom: (withXAxis ? 24 : 4) + (xAxisLabel ? 16 : 0),
+      left: (withYAxis ? 48 : 4) + (yAxisLabel ? 16 : 0),
+    };
+    const plotWidth = Math.max(1, width - margin.left - margin.right);
+    const plotHeight = Math.max(1, height - margin.top - margin.bottom);
+    const [x0, x1] = xDomain;
+    const [y0, y1] = yDomain;
+    const sx = plotWidth / (x1 - x0 || 1);
+    const sy = plotHeight / (y1 - y0 || 1);
+    const toX = (x: number) => margin.left + (x - x0) * sx;
+    const toY = (y: number) => margin.top + plotHeight - (y - y0) * sy;
+
+    const grid = resolveColor(gridColor, theme, canvas);
+    const text = resolveColor(textColor, theme, canvas);
+    ctx.font = `${TICK_FONT}px ${theme.fontFamily}`;
+    ctx.fillStyle = text;
+    ctx.strokeStyle = grid;
+    ctx.lineWidth = 1;
+    ctx.setLineDash([5, 5]);
+    ctx.beginPath();
+    const categories = points.xCategories;
+    const xTicks = categories
+      ? categories
+          .map((_, i) => i)
+          .filter(
+            (i) =>
+              i % Math.ceil((categories.length * 80) / plotWidth || 1) === 0
+          )
+      : niceTicks(x0, x1, Math.max(2, Math.floor(plotWidth / 80)));
+    const yTicks = niceTicks(y0, y1, Math.max(2, Math.floor(plotHeight / 50)));
+    for (const tick of xTicks) {
+      ctx.moveTo(toX(tick), margin.top);
+      ctx.lineTo(toX(tick), margin.top + plotHeight);
+    }
+    for (const tick of yTicks) {
+      ctx.moveTo(margin.left, toY(tick));
+      ctx.lineTo(margin.left + plotWidth, toY(tick));
+    }
+    ctx.stroke();
+    ctx.setLineDash([]);
+
+    if (withXAxis) {
+      ctx.textAlign = "center";
+      ctx.textBaseline = "top";
+      for (const tick of xTicks) {
+        ctx.fillText(
+          categories ? categories[tick] : formatValue(tick, unit?.x),
+          toX(tick),
+          margin.top + plotHeight + 6
+        );
+      }
+    }
+    if (withYAxis) {
+      ctx.textAlign = "right";
+      ctx.textBaseline = "middle";
+      for (const tick of yTicks) {
+        ctx.fillText(formatValue(tick, unit?.y), margin.left - 6, toY(tick));
+      }
+    }
+    if (xAxisLabel) {
+      ctx.textAlign = "center";
+      ctx.textBaseline = "bottom";
+      ctx.fillText(xAxisLabel, margin.left + plotWidth / 2, height);
+    }
+    if (yAxisLabel) {
+      ctx.save();
+      ctx.translate(TICK_FONT, margin.top + plotHeight / 2);
+      ctx.rotate(-Math.PI / 2);
+      ctx.textAlign = "center";
+      ctx.textBaseline = "middle";
+      ctx.fillText(yAxisLabel, 0, 0);
+      ctx.restore();
+    }
+
+    const { xs, ys, zs, radii, seriesIndex, series, cells } = points;
+    const screenXs = new Float32Array(xs.length);
+    const screenYs = new Float32Array(ys.length);
+    const index = new Map<number, number[]>();
+    const cellWidth = cells ? cells.size[0] * sx : 0;
+    const cellHeight = cells ? cells.size[1] * sy : 0;
+    const hashSize = Math.max(
+      HIT_CELL,
+      Math.ceil(Math.max(cellWidth, cellHeight))
+    );
+    const addToIndex = (i: number, px: number, py: number) => {
+      const cell =
+        Math.floor(px / hashSize) * 100003 + Math.floor(py / hashSize);
+      const bucket = index.get(cell);
+      if (bucket) bucket.push(i);
+      else index.set(cell, [i]);
+    };
+    ctx.save();
+    ctx.beginPath();
+    ctx.rect(margin.left, margin.top, plotWidth, plotHeight);
+    ctx.clip();
+    if (cells && zs) {
+      // Density map: one shape per non-empty cell, opacity scaled by count.
+      for (let i = 0; i < xs.length; i++) {
+        const s = seriesIndex[i];
+        const px = toX(xs[i]);
+        const py = toY(ys[i]);
+        screenXs[i] = px;
+        screenYs[i] = py;
+        ctx.fillStyle = resolveColor(series[s].color, theme, canvas);
+        ctx.globalAlpha = 0.15 + (0.85 * zs[i]) / (cells.max[s] || 1);
+        ctx.beginPath();
+        if (cells.type === "grid") {
+          ctx.rect(
+            px - cellWidth / 2,
+            py - cellHeight / 2,
+            cellWidth,
+            cellHeight
+          );
+        } else {
+          HEX_VERTICES.forEach(([vx, vy], v) => {
+            const hx = px + vx * cellWidth;
+            const hy = py - vy * cellHeight;
+            if (v === 0) ctx.moveTo(hx, hy);
+            else ctx.lineTo(hx, hy);
+          });
+          ctx.closePath();
+        }
+        ctx.fill();
+        if (withTooltip) addToIndex(i, px, py);
+      }
+    }
+    let current = -1;
+    for (let i = 0; !cells && i <= xs.length; i++) {
+      if (i === xs.length || seriesIndex[i] !== current) {
+        if (current >= 0) {
+          ctx.fill();
+        }
+        if (i === xs.length) break;
+        current = seriesIndex[i];
+        ctx.fillStyle = resolveColor(series[current].color, theme, canvas);
+        ctx.globalAlpha = radii ? 0.7 : 1;
+        ctx.beginPath();
+      }
+      if (!Number.isFinite(xs[i]) || !Number.isFinite(ys[i])) {
+        screenXs[i] = NaN;
+        continue;
+      }
+      const px = toX(xs[i]);
+      const py = toY(ys[i]);
+      const r = radii ? radii[i] : pointSize;
+      screenXs[i] = px;
+      screenYs[i] = py;
+      ctx.moveTo(px + r, py);
+      ctx.arc(px, py, r, 0, Math.PI * 2);
+      if (withTooltip) addToIndex(i, px, py);
+    }
+    ctx.restore();
+    screen.current = { xs: screenXs, ys: screenYs };
+    hitIndex.current = index;
+    hitCell.current = hashSize;
+  }, [
+    points,
+    width,
+    height,
+    xDomain,
+    yDomain,
+    withXAxis,
+    withYAxis,
+    withTooltip,
+    xAxisLabel,
+    yAxisLabel,
+    unit,
+    gridColor,
+    textColor,
+    pointSize,
+    theme,
+  ]);
+
+  const handleMove = (event: React.MouseEvent<HTMLCanvasElement>) => {
+    if (!withTooltip || !screen.current) {
+      return;
+    }
+    const rect = event.currentTarget.getBoundingClientRect();
+    const mx = event.clientX - rect.left;
+    const my = event.clientY - rect.top;
+    const size = hitCell.current;
+    const cx = Math.floor(mx / size);
+    const cy = Math.floor(my / size);
+    let best = -1;
+    let bestDistance = (size * 1.5) ** 2;
+    for (let dx = -1; dx <= 1; dx++) {
+      for (let dy = -1; dy <= 1; dy++) {
+        const bucket = hitIndex.current.get((cx + dx) * 100003 + cy + dy);
+        if (!bucket) continue;
+        for (const i of bucket) {
+          const distance =
+            (screen.current.xs[i] - mx) ** 2 + (screen.current.ys[i] - my) ** 2;
+          if (distance < bestDistance) {
+            best = i;
+            bestDistance = distance;
+          }
+        }
+      }
+    }
+    setHovered(best >= 0 ? { index: best, left: mx, top: my } : null);
+  };
+
+  const hoveredSeries =
+    hovered !== null ? points.series[points.seriesIndex[hovered.index]] : null;
+
+  return (
+    <Box {...props}>
+      <Box ref={ref} h={h} pos="relative">
+        <canvas
+          ref={canvasRef}
+          onMouseMove={handleMove}
+          onMouseLeave={() => setHovered(null)}
+        />
+        {hovered && hoveredSeries && (
+          <Paper
+            withBorder
+            shadow="md"
+            px="xs"
+            py={4}
+            pos="absolute"
+            left={hovered.left + 12}
+            top={hovered.top + 12}
+            style={{ pointerEvents: "none" }}
+          >
+            <Group gap={6}>
+              <ColorSwatch color={hoveredSeries.color} size={10} />
+              <Text size="xs" fw={500}>
+                {hoveredSeries.name}
+              </Text>
+            </Group>
+            <Text size="xs">
+              {labels?.x ?? "x"}:{" "}
+              {points.xCategories
+                ? points.xCategories[points.xs[hovered.index]]
+                : formatValue(points.xs[hovered.index], unit?.x)}
+            </Text>
+            <Text size="xs">
+              {labels?.y ?? "y"}:{" "}
+              {formatValue(points.ys[hovered.index], unit?.y)}
+            </Text>
+            {points.zs && (
+              <Text size="xs">
+                {points.cells ? "count" : "z"}:{" "}
+                {formatValue(points.zs[hovered.index], unit?.z)}
+              </Text>
+            )}
+          </Paper>
+        )}
+      </Box>
+      {withLegend && (
+        <Group justify="center" gap="md" mt="xs">
+          {points.series.map((series) => (
+            <Group key={series.name} gap={6}>
+              <ColorSwatch color={series.color} size={12} />
+              <Text size="sm">{series.name}</Text>
+            </Group>
+          ))}
+        </Group>
+      )}
+    </Box>
+  );
+}
+
+export function CanvasScatterChart({
+  data = [],
+  bins,
+  dataKey,
+  ...props
+}: CanvasScatterChartProps) {
+  const points = usePreparedChartData<PreparedPoints>(
+    useMemo<ChartTask>(
+      () => (bins ? { type: "bins", bins } : { type: "scatter", data, dataKey }),
+      [bins, data, dataKey]
+    )
+  );
+  return points ? <CanvasPointsChart points={points} {...props} /> : null;
+}
+
+export function CanvasBubbleChart({
+  data,
+  dataKey,
+  range,
+  color = "blue.6",
+  label = "",
+  ...props
+}: CanvasBubbleChartProps) {
+  const points = usePreparedChartData<PreparedPoints>(
+    useMemo<ChartTask>(
+      () => ({ type: "bubble", data, dataKey, range, color, label }),
+      [data, dataKey, range, color, label]
+    )
+  );
+  return points ? <CanvasPointsChart points={points} {...props} /> : null;
+}
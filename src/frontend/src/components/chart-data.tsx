@@ -0,0 +1,68 @@
+import { ComponentType, useEffect, useMemo } from "react";
+import { useDispatcherWith } from "routelit-client";
+import { ColumnarData, expandColumns } from "../utils/chart-prep";
+import { LRUCache } from "../utils/lru";
+
+// Larger than the server's per-session cache (RLBuilder.chart_data_cache_size)
+// so a dataset the server assumes is held here is rarely evicted.
+const CHART_DATA_CACHE_SIZE = 64;
+
+interface ChartDataEntry {
+  data: unknown;
+  encoding?: "columns";
+}
+
+const chartDataCache = new LRUCache<string, ChartDataEntry>(CHART_DATA_CACHE_SIZE);
+
+interface ChartDataProps {
+  id: string;
+  data?: unknown;
+  dataHash?: string;
+  dataEncoding?: "columns";
+}
+
+/**
+ * Resolves `dataHash` props against the datasets already received, so the
+ * server only sends a chart's data when its content changes. On a cache miss
+ * a "datamiss" event asks the server to send the data again.
+ * Data sent column by column (`dataEncoding: "columns"`) is expanded into the
+ * rows the charts take once per dataset; copying rows back from a worker would
+ * cost as much as building them.
+ */
+export function withChartData<P extends object>(Component: ComponentType<P>) {
+  const Chart = Component as unknown as ComponentType<Record<string, unknown>>;
+  function ChartWithData({
+    id,
+    data,
+    dataHash,
+    dataEncoding,
+    ...props
+  }: ChartDataProps & Omit<P, "data" | "id">) {
+    const dispatchMiss = useDispatcherWith(id, "datamiss");
+    if (dataHash !== undefined && data !== undefined) {
+      chartDataCache.set(dataHash, { data, encoding: dataEncoding });
+    }
+    const entry =
+      data !== undefined || dataHash === undefined
+        ? { data, encoding: dataEncoding }
+        : chartDataCache.get(dataHash);
+    const missing = dataHash !== undefined && entry === undefined;
+    const columns = entry?.encoding === "columns" ? (entry.data as ColumnarData) : undefined;
+    const rows = useMemo(() => columns && expandColumns(columns), [columns]);
+
+    useEffect(() => {
+      if (missing) {
+        dispatchMiss({ dataHash });
+      }
+    }, [missing, dataHash, dispatchMiss]);
+
+    if (missing) {
+      return null;
+    }
+    return <Chart {...props} id={id} data={columns ? rows : entry?.data} />;
+  }
+  ChartWithData.displayName = `withChartData(${
+    Component.displayName || Component.name
+  })`;
+  return ChartWithData;
+}
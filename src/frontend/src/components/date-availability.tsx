@@ -0,0 +1,151 @@
+import { ComponentType, useCallback, useEffect, useMemo, useRef } from "react";
+import { useDispatcherWith } from "routelit-client";
+
+interface DateAvailability {
+  weekdays?: number[];
+  closedRanges?: Array<[string, string]>;
+  closedDates?: string[];
+  openDates?: string[];
+}
+
+type ExcludeDate = (date: string) => boolean;
+
+interface AvailabilityProps {
+  id: string;
+  rlAvailability?: DateAvailability;
+  rlMonthAvailability?: Record<string, DateAvailability>;
+  excludeDate?: ExcludeDate;
+  onDateChange?: (date: string) => void;
+}
+
+// Wait for the user to stop paging through months before asking the server.
+const MONTH_CHANGE_DELAY = 150;
+
+/**
+ * Compiles availability rules into an `excludeDate` predicate: O(1) lookups
+ * for single dates and a binary search over the closed ranges.
+ */
+export function compileAvailability(rules: DateAvailability): ExcludeDate {
+  const weekdays = rules.weekdays ? new Set(rules.weekdays) : null;
+  const closedDates = new Set(rules.closedDates ?? []);
+  const openDates = new Set(rules.openDates ?? []);
+  const ranges = [...(rules.closedRanges ?? [])].sort((a, b) =>
+    a[0] < b[0] ? -1 : a[0] > b[0] ? 1 : 0
+  );
+  // furthest end among ranges starting at or before each index, so one
+  // binary search on the start dates is enough for overlapping ranges
+  const reach: string[] = [];
+  ranges.forEach(([, end], i) => {
+    reach.push(i > 0 && reach[i - 1] > end ? reach[i - 1] : end);
+  });
+
+  const inClosedRange = (day: string) => {
+    let lo = 0;
+    let hi = ranges.length - 1;
+    let found = -1;
+    while (lo <= hi) {
+      const mid = (lo + hi) >> 1;
+      if (ranges[mid][0] <= day) {
+        found = mid;
+        lo = mid + 1;
+      } else {
+        hi = mid - 1;
+      }
+    }
+    return found >= 0 && reach[found] >= day;
+  };
+
+  return (date: string) => {
+    // dates may come as "YYYY-MM-DD" or "YYYY-MM-DD HH:mm:ss"
+    const day = date.slice(0, 10);
+    if (openDates.has(day)) return false;
+    if (closedDates.has(day)) return true;
+    if (inClosedRange(day)) return true;
+    if (weekdays) {
+      const [year, month, dayOfMonth] = day.split("-").map(Number);
+      return !weekdays.has(new Date(year, month - 1, dayOfMonth).getDay());
+    }
+    return false;
+  };
+}
+
+/**
+ * Builds a predicate over per-month rules ("YYYY-MM" -> rules). Dates of
+ * months that have not been loaded yet are excluded.
+ */
+export function compileMonthAvailability(
+  months: Record<string, DateAvailability>
+): ExcludeDate {
+  const compiled = new Map(
+    Object.entries(months).map(([month, rules]) => [
+      month,
+      compileAvailability(rules),
+    ])
+  );
+  return (date: string) => {
+    const rules = compiled.get(date.slice(0, 7));
+    return rules ? rules(date) : true;
+  };
+}
+
+/**
+ * Evaluates `rlAvailability` rules on the client and passes them to the
+ * wrapped date component as `excludeDate`, combined with any existing one.
+ * With `rlMonthAvailability`, the month being displayed is sent back as a
+ * "monthchange" event so the server can load the rules of that month.
+ */
+export function withDateAvailability<P extends object>(
+  Component: ComponentType<P>
+) {
+  const Picker = Component as unknown as ComponentType<
+    Record<string, unknown>
+  >;
+  function DateWithAvailability({
+    id,
+    rlAvailability,
+    rlMonthAvailability,
+    excludeDate,
+    onDateChange,
+    ...props
+  }: AvailabilityProps & P) {
+    const dispatchMonth = useDispatcherWith(id, "monthchange");
+    const timer = useRef<ReturnType<typeof setTimeout>>(undefined);
+    const compiled = useMemo(() => {
+      const predicates = [
+        rlAvailability && compileAvailability(rlAvailability),
+        rlMonthAvailability && compileMonthAvailability(rlMonthAvailability),
+        excludeDate,
+      ].filter((p): p is ExcludeDate => !!p);
+      if (predicates.length < 2) return predicates[0];
+      return (date: string) => predicates.some((p) => p(date));
+    }, [rlAvailability, rlMonthAvailability, excludeDate]);
+
+    const handleDateChange = useCallback(
+      (date: string) => {
+        onDateChange?.(date);
+        const month = date.slice(0, 7);
+        if (!rlMonthAvailability || month in rlMonthAvailability) return;
+        clearTimeout(timer.current);
+        timer.current = setTimeout(
+          () => dispatchMonth({ month }),
+          MONTH_CHANGE_DELAY
+        );
+      },
+      [onDateChange, rlMonthAvailability, dispatchMonth]
+    );
+    useEffect(() => () => clearTimeout(timer.current), []);
+
+    return (
+      <Picker
+        {...props}
+        id={id}
+        excludeDate={compiled}
+        onDateChange={rlMonthAvailability ? handleDateChange : onDateChange}
+      />
+    );
+  }
+  DateWithAvailability.displayName = `withDateAvailability(${
+    Component.displayName || Component.name
+  })`;
+  return DateWithAvailability;
+}
@@ -0,0 +1,8 @@
+import type { ReactNode } from "react";
+
+/**
+ * Renders the children of a `ui.memo` block, a `ui.each` row or a `ui.parallel` slot without adding any markup.
+ */
+export const Memo = ({ children }: { children?: ReactNode }) => <>{children}</>;
+
+export default Memo;
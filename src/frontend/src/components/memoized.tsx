@@ -0,0 +1,99 @@
+import { ComponentType, memo } from "react";
+
+// Nodes compared before two props values are considered different, so a
+// large structure never costs more to compare than to render.
+const COMPARE_BUDGET = 1000;
+
+type Props = Record<string, unknown>;
+
+function isPlainObject(value: unknown): value is Props {
+  if (value === null || typeof value !== "object") return false;
+  const proto = Object.getPrototypeOf(value);
+  return proto === Object.prototype || proto === null;
+}
+
+function structurallyEqual(a: unknown, b: unknown, budget: { left: number }): boolean {
+  if (Object.is(a, b)) return true;
+  if (--budget.left < 0) return false;
+  if (Array.isArray(a) && Array.isArray(b)) {
+    if (a.length !== b.length) return false;
+    for (let i = 0; i < a.length; i++) {
+      if (!structurallyEqual(a[i], b[i], budget)) return false;
+    }
+    return true;
+  }
+  if (isPlainObject(a) && isPlainObject(b)) {
+    if ("$$typeof" in a) return false; // React elements are compared by identity
+    const keys = Object.keys(a);
+    if (keys.length !== Object.keys(b).length) return false;
+    for (const key of keys) {
+      if (!(key in b) || !structurallyEqual(a[key], b[key], budget)) return false;
+    }
+    return true;
+  }
+  return false;
+}
+
+/**
+ * Props equality used to skip re-rendering elements a patch did not touch.
+ * Props from the server are compared by structure; `data` is compared by its
+ * `dataHash` version stamp when the server sent one.
+ */
+export function propsEqual(prev: Props, next: Props): boolean {
+  const keys = Object.keys(prev);
+  if (keys.length !== Object.keys(next).length) return false;
+  const budget = { left: COMPARE_BUDGET };
+  for (const key of keys) {
+    if (!(key in next)) return false;
+    if (key === "data" && prev.dataHash !== undefined && prev.dataHash === next.dataHash) continue;
+    if (!structurallyEqual(prev[key], next[key], budget)) return false;
+  }
+  return true;
+}
+
+interface RenderCounts {
+  byComponent: Record<string, number>;
+  byElement: Record<string, number>;
+  reset(): void;
+}
+
+declare global {
+  interface Window {
+    __routelitRenderCounts?: RenderCounts;
+  }
+}
+
+function renderCounts(): RenderCounts {
+  if (!window.__routelitRenderCounts) {
+    const counts: RenderCounts = {
+      byComponent: {},
+      byElement: {},
+      reset() {
+        counts.byComponent = {};
+        counts.byElement = {};
+      },
+    };
+    window.__routelitRenderCounts = counts;
+  }
+  return window.__routelitRenderCounts;
+}
+
+/**
+ * Wraps a registered component so it only re-renders when its props change.
+ * Development builds count renders per component and per element id in
+ * `window.__routelitRenderCounts`.
+ */
+export function withMemo<P extends object>(Component: ComponentType<P>, name: string) {
+  const Inner = Component as unknown as ComponentType<Props>;
+  function Counted(props: Props) {
+    const counts = renderCounts();
+    counts.byComponent[name] = (counts.byComponent[name] ?? 0) + 1;
+    if (typeof props.id === "string") {
+      counts.byElement[props.id] = (counts.byElement[props.id] ?? 0) + 1;
+    }
+    return <Inner {...props} />;
+  }
+  const Memoized = memo(import.meta.env.DEV ? Counted : Inner, propsEqual);
+  Memoized.displayName = `withMemo(${Component.displayName || Component.name || name})`;
+  return Memoized as unknown as ComponentType<P>;
+}
@@ -3,11 +3,14 @@ import {
   NavLinkProps as MantineNavLinkProps,
 } from "@mantine/core";
 import { useLinkClickHandler } from "routelit-client";
+import { beginNavigation } from "../utils/navigation";
+import { PrefetchMode, usePrefetch } from "../utils/prefetch";
 
 type NavLinkProps = MantineNavLinkProps &
   Parameters<typeof useLinkClickHandler>[0] & {
     text?: string;
     exact?: boolean;
+    prefetch?: PrefetchMode;
   };
 
 export const NavLink = ({
@@ -16,12 +19,20 @@ export const NavLink = ({
   id,
   replace,
   exact,
+  prefetch,
   ...props
 }: NavLinkProps) => {
-  const handleClick = useLinkClickHandler({ id, href, replace, isExternal });
+  const prefetchProps = usePrefetch<HTMLAnchorElement>(href, isExternal ? undefined : prefetch);
+  const linkClickHandler = useLinkClickHandler({ id, href, replace, isExternal });
+  const handleClick = (event: React.MouseEvent<HTMLAnchorElement>) => {
+    if (!isExternal && !event.defaultPrevented && event.button === 0 && !event.metaKey && !event.ctrlKey && !event.shiftKey && !event.altKey) {
+      beginNavigation(href);
+    }
+    linkClickHandler(event);
+  };
   const isActive = exact ? href === window.location.pathname : window.location.pathname.startsWith(href);
   return (
-    <MantineNavLink id={id} href={href} {...props} onClick={isExternal ? undefined : handleClick} active={isActive} />
+    <MantineNavLink id={id} href={href} {...props} {...prefetchProps} onClick={isExternal ? undefined : handleClick} active={isActive} />
   );
 };
 
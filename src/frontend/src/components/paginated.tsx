@@ -0,0 +1,25 @@
+import { ReactNode } from "react";
+import { MantineSpacing, Pagination, PaginationProps, Stack } from "@mantine/core";
+import { useDispatcherWith } from "routelit-client";
+
+interface PaginatedProps extends Omit<PaginationProps, "onChange"> {
+  id: string;
+  children?: ReactNode;
+  gap?: MantineSpacing;
+}
+
+/**
+ * The body of the current page above a pagination control. Changing page
+ * sends a "change" event and the server answers with the body of the new page.
+ */
+export function Paginated({ id, children, gap = "md", ...props }: PaginatedProps) {
+  const dispatchChange = useDispatcherWith(id, "change");
+  return (
+    <Stack gap={gap}>
+      {children}
+      <Pagination {...props} onChange={(value) => dispatchChange({ value })} />
+    </Stack>
+  );
+}
+
+export default Paginated;
@@ -0,0 +1,81 @@
+import { ComponentType, ReactNode, useEffect, useRef, useSyncExternalStore } from "react";
+import { LRUCache } from "../utils/lru";
+import { getNavigation, routeKey, subscribeNavigation } from "../utils/navigation";
+
+interface CachedRoute {
+  children: ReactNode;
+  storedAt: number;
+}
+
+interface RouteCacheProps {
+  children?: ReactNode;
+  routeCacheSize?: number;
+  routeCacheTtl?: number;
+  cacheRoute?: boolean;
+}
+
+let routes = new LRUCache<string, CachedRoute>(0);
+let routesSize = 0;
+
+function routeCache(size: number): LRUCache<string, CachedRoute> {
+  if (size !== routesSize) {
+    routes = new LRUCache(size);
+    routesSize = size;
+  }
+  return routes;
+}
+
+/**
+ * Keeps the content of recently visited pages. On navigation to one of them
+ * the cached content is shown, inert, until the server's update for the new
+ * page arrives and replaces it. Pages rendered with `cacheRoute: false` are
+ * never kept.
+ */
+export function withRouteCache<P extends { children?: ReactNode }>(Component: ComponentType<P>) {
+  function RouteCached({
+    routeCacheSize = 16,
+    routeCacheTtl = 300,
+    cacheRoute = true,
+    ...props
+  }: P & RouteCacheProps) {
+    const { children } = props;
+    const navigation = useSyncExternalStore(subscribeNavigation, getNavigation, () => null);
+    const handled = useRef(0);
+    const rendered = useRef(routeKey(window.location.href));
+    const stale = useRef<{ route: string; from: ReactNode } | null>(null);
+
+    if (navigation && navigation.id > handled.current) {
+      handled.current = navigation.id;
+      stale.current = navigation.route !== rendered.current ? { route: navigation.route, from: children } : null;
+    }
+    if (stale.current && children !== stale.current.from) {
+      stale.current = null;
+    }
+    const cached = stale.current ? routeCache(routeCacheSize).get(stale.current.route) : undefined;
+    const showCached = cached !== undefined && Date.now() - cached.storedAt <= routeCacheTtl * 1000;
+
+    useEffect(() => {
+      if (stale.current) return;
+      const route = routeKey(window.location.href);
+      rendered.current = route;
+      const cache = routeCache(routeCacheSize);
+      if (cacheRoute && routeCacheSize > 0) cache.set(route, { children, storedAt: Date.now() });
+      else cache.delete(route);
+    }, [children, cacheRoute, routeCacheSize]);
+
+    const Inner = Component as unknown as ComponentType<Record<string, unknown>>;
+    return (
+      <Inner {...props}>
+        {showCached ? (
+          <div inert style={{ display: "contents" }}>
+            {cached.children}
+          </div>
+        ) : (
+          children
+        )}
+      </Inner>
+    );
+  }
+  RouteCached.displayName = `withRouteCache(${Component.displayName || Component.name})`;
+  return RouteCached;
+}
@@ -0,0 +1,171 @@
+import { useEffect, useRef } from "react";
+import { Box, BoxProps, useMantineTheme } from "@mantine/core";
+import { useElementSize } from "@mantine/hooks";
+import { extent, resolveColor, setupCanvas } from "../utils/canvas";
+
+interface TrendColors {
+  positive?: string;
+  negative?: string;
+  neutral?: string;
+}
+
+interface SparklineGridProps extends BoxProps {
+  data: Array<Array<number | null>>;
+  labels?: string[];
+  columns?: number;
+  cellHeight?: number;
+  gap?: number;
+  color?: string;
+  trendColors?: TrendColors;
+  fillOpacity?: number;
+  strokeWidth?: number;
+  connectNulls?: boolean;
+}
+
+const LABEL_HEIGHT = 16;
+const MIN_CELL_WIDTH = 120;
+
+function trendColor(
+  row: Array<number | null>,
+  color: string,
+  trendColors?: TrendColors
+): string {
+  if (!trendColors) {
+    return color;
+  }
+  const values = row.filter((v): v is number => v !== null);
+  const delta = values.length > 1 ? values[values.length - 1] - values[0] : 0;
+  if (delta > 0) return trendColors.positive ?? color;
+  if (delta < 0) return trendColors.negative ?? color;
+  return trendColors.neutral ?? color;
+}
+
+/**
+ * Renders many sparklines on a single canvas, so hundreds of trends cost
+ * one element, one resize observer and one layout pass.
+ */
+function SparklineGrid({
+  data,
+  labels,
+  columns,
+  cellHeight = 40,
+  gap = 8,
+  color = "blue",
+  trendColors,
+  fillOpacity = 0.6,
+  strokeWidth = 2,
+  connectNulls = true,
+  ...props
+}: SparklineGridProps) {
+  const theme = useMantineTheme();
+  const canvasRef = useRef<HTMLCanvasElement>(null);
+  const { ref, width } = useElementSize();
+
+  const count = data.length;
+  const cols = Math.max(
+    1,
+    columns ?? Math.floor((width + gap) / (MIN_CELL_WIDTH + gap))
+  );
+  const rows = Math.ceil(count / cols);
+  const labelHeight = labels ? LABEL_HEIGHT : 0;
+  const rowHeight = cellHeight + labelHeight;
+  const height = rows > 0 ? rows * rowHeight + (rows - 1) * gap : 0;
+
+  useEffect(() => {
+    const canvas = canvasRef.current;
+    if (!canvas || width <= 0) {
+      return;
+    }
+    const ctx = setupCanvas(canvas, width, height);
+    if (!ctx) {
+      return;
+    }
+    const cellWidth = (width - (cols - 1) * gap) / cols;
+    const textColor = theme.colors.gray[6];
+    ctx.font = `12px ${theme.fontFamily}`;
+    ctx.textBaseline = "top";
+    ctx.lineJoin = "round";
+    ctx.lineWidth = strokeWidth;
+
+    data.forEach((row, index) => {
+      const x0 = (index % cols) * (cellWidth + gap);
+      const y0 = Math.floor(index / cols) * (rowHeight + gap);
+      if (labels?.[index] !== undefined) {
+        ctx.fillStyle = textColor;
+        ctx.fillText(labels[index], x0, y0, cellWidth);
+      }
+      const domain = extent(row);
+      if (!domain || row.length === 0) {
+        return;
+      }
+      const [min, max] = domain;
+      const span = max - min || 1;
+      const top = y0 + labelHeight + strokeWidth;
+      const bottom = y0 + labelHeight + cellHeight;
+      const plotHeight = bottom - top;
+      const step = row.length > 1 ? cellWidth / (row.length - 1) : 0;
+      const stroke = resolveColor(
+        trendColor(row, color, trendColors),
+        theme,
+        canvas
+      );
+
+      ctx.beginPath();
+      let started = false;
+      let firstX = x0;
+      let lastX = x0;
+      row.forEach((value, i) => {
+        if (value === null || !Number.isFinite(value)) {
+          if (!connectNulls) started = false;
+          return;
+        }
+        const x = x0 + i * step;
+        const y = bottom - ((value - min) / span) * plotHeight;
+        if (!started) {
+          ctx.moveTo(x, y);
+          if (firstX === x0) firstX = x;
+          started = true;
+        } else {
+          ctx.lineTo(x, y);
+        }
+        lastX = x;
+      });
+      ctx.strokeStyle = stroke;
+      ctx.stroke();
+
+      if (fillOpacity > 0 && connectNulls) {
+        ctx.lineTo(lastX, bottom);
+        ctx.lineTo(firstX, bottom);
+        ctx.closePath();
+        ctx.globalAlpha = fillOpacity * 0.3;
+        ctx.fillStyle = stroke;
+        ctx.fill();
+        ctx.globalAlpha = 1;
+      }
+    });
+  }, [
+    data,
+    labels,
+    width,
+    height,
+    cols,
+    gap,
+    rowHeight,
+    labelHeight,
+    cellHeight,
+    color,
+    trendColors,
+    fillOpacity,
+    strokeWidth,
+    connectNulls,
+    theme,
+  ]);
+
+  return (
+    <Box ref={ref} {...props}>
+      <canvas ref={canvasRef} role="img" aria-label={labels?.join(", ")} />
+    </Box>
+  );
+}
+
+export default SparklineGrid;
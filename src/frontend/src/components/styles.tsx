@@ -0,0 +1,184 @@
+import { ComponentType, useInsertionEffect } from "react";
+import { onPrefetch } from "../utils/prefetch";
+
+export type StyleFamily = "core" | "dates" | "charts";
+
+type Loader = () => Promise<{ default: string }>;
+
+// Mantine stylesheets loaded as separate chunks the first time a component
+// using them renders. Core components have one stylesheet each; the dates and
+// charts packages ship a single one.
+const SHEETS = {
+  Accordion: () => import("@mantine/core/styles/Accordion.css?inline"),
+  ActionIcon: () => import("@mantine/core/styles/ActionIcon.css?inline"),
+  Affix: () => import("@mantine/core/styles/Affix.css?inline"),
+  Alert: () => import("@mantine/core/styles/Alert.css?inline"),
+  Button: () => import("@mantine/core/styles/Button.css?inline"),
+  Checkbox: () => import("@mantine/core/styles/Checkbox.css?inline"),
+  Chip: () => import("@mantine/core/styles/Chip.css?inline"),
+  CloseButton: () => import("@mantine/core/styles/CloseButton.css?inline"),
+  ColorInput: () => import("@mantine/core/styles/ColorInput.css?inline"),
+  ColorPicker: () => import("@mantine/core/styles/ColorPicker.css?inline"),
+  ColorSwatch: () => import("@mantine/core/styles/ColorSwatch.css?inline"),
+  Combobox: () => import("@mantine/core/styles/Combobox.css?inline"),
+  Dialog: () => import("@mantine/core/styles/Dialog.css?inline"),
+  Drawer: () => import("@mantine/core/styles/Drawer.css?inline"),
+  Fieldset: () => import("@mantine/core/styles/Fieldset.css?inline"),
+  FloatingIndicator: () => import("@mantine/core/styles/FloatingIndicator.css?inline"),
+  Image: () => import("@mantine/core/styles/Image.css?inline"),
+  InlineInput: () => import("@mantine/core/styles/InlineInput.css?inline"),
+  Input: () => import("@mantine/core/styles/Input.css?inline"),
+  Loader: () => import("@mantine/core/styles/Loader.css?inline"),
+  Modal: () => import("@mantine/core/styles/Modal.css?inline"),
+  ModalBase: () => import("@mantine/core/styles/ModalBase.css?inline"),
+  Notification: () => import("@mantine/core/styles/Notification.css?inline"),
+  NumberInput: () => import("@mantine/core/styles/NumberInput.css?inline"),
+  Overlay: () => import("@mantine/core/styles/Overlay.css?inline"),
+  Pagination: () => import("@mantine/core/styles/Pagination.css?inline"),
+  PasswordInput: () => import("@mantine/core/styles/PasswordInput.css?inline"),
+  Pill: () => import("@mantine/core/styles/Pill.css?inline"),
+  PillsInput: () => import("@mantine/core/styles/PillsInput.css?inline"),
+  Popover: () => import("@mantine/core/styles/Popover.css?inline"),
+  Progress: () => import("@mantine/core/styles/Progress.css?inline"),
+  Radio: () => import("@mantine/core/styles/Radio.css?inline"),
+  Rating: () => import("@mantine/core/styles/Rating.css?inline"),
+  SegmentedControl: () => import("@mantine/core/styles/SegmentedControl.css?inline"),
+  Slider: () => import("@mantine/core/styles/Slider.css?inline"),
+  Spoiler: () => import("@mantine/core/styles/Spoiler.css?inline"),
+  Switch: () => import("@mantine/core/styles/Switch.css?inline"),
+  Table: () => import("@mantine/core/styles/Table.css?inline"),
+  Tabs: () => import("@mantine/core/styles/Tabs.css?inline"),
+  dates: () => import("@mantine/dates/styles.css?inline"),
+  charts: () => import("@mantine/charts/styles.css?inline"),
+} satisfies Record<string, Loader>;
+
+export type StyleSheet = keyof typeof SHEETS;
+
+// Stylesheets a sheet builds on, injected before it.
+const SHEET_DEPS: Partial<Record<StyleSheet, StyleSheet[]>> = {
+  ActionIcon: ["Loader"],
+  Button: ["Loader"],
+  Checkbox: ["InlineInput"],
+  ColorInput: ["Input", "ColorPicker", "ColorSwatch", "Popover"],
+  Combobox: ["Popover"],
+  Dialog: ["CloseButton"],
+  Drawer: ["ModalBase", "Overlay", "CloseButton"],
+  Modal: ["ModalBase", "Overlay", "CloseButton"],
+  Notification: ["CloseButton", "Loader"],
+  NumberInput: ["Input"],
+  PasswordInput: ["Input", "ActionIcon"],
+  PillsInput: ["Input", "Pill"],
+  Radio: ["InlineInput"],
+  SegmentedControl: ["FloatingIndicator"],
+  Switch: ["InlineInput"],
+  dates: ["Input", "Popover", "CloseButton"],
+};
+
+// Stylesheets of each registered core component; components missing here
+// only use the critical styles of the package stylesheet.
+const COMPONENT_SHEETS: Record<string, StyleSheet[]> = {
+  accordion: ["Accordion"],
+  accordionitem: ["Accordion"],
+  accordionpanel: ["Accordion"],
+  accordioncontrol: ["Accordion"],
+  actionicon: ["ActionIcon"],
+  actionicongroup: ["ActionIcon"],
+  actionicongroupsection: ["ActionIcon"],
+  affix: ["Affix"],
+  alert: ["Alert", "CloseButton"],
+  autocomplete: ["Input", "Combobox"],
+  button: ["Button"],
+  checkbox: ["Checkbox"],
+  checkboxgroup: ["Input", "Checkbox"],
+  chip: ["Chip"],
+  chipgroup: ["Chip"],
+  colorinput: ["ColorInput"],
+  dialog: ["Dialog"],
+  drawer: ["Drawer"],
+  fieldset: ["Fieldset"],
+  image: ["Image"],
+  modal: ["Modal"],
+  multiselect: ["Combobox", "PillsInput", "CloseButton"],
+  nativeselect: ["Input"],
+  notification: ["Notification"],
+  numberinput: ["NumberInput"],
+  paginated: ["Pagination"],
+  passwordinput: ["PasswordInput"],
+  progress: ["Progress"],
+  radiogroup: ["Input", "Radio"],
+  rangeslider: ["Slider"],
+  rating: ["Rating"],
+  segmentedcontrol: ["SegmentedControl"],
+  select: ["Input", "Combobox", "CloseButton"],
+  slider: ["Slider"],
+  spoiler: ["Spoiler"],
+  switch: ["Switch"],
+  switchgroup: ["Input", "Switch"],
+  tab: ["Tabs"],
+  table: ["Table"],
+  tablist: ["Tabs"],
+  tabpanel: ["Tabs"],
+  tabs: ["Tabs"],
+  tagsinput: ["Combobox", "PillsInput", "CloseButton"],
+  textarea: ["Input"],
+  textinput: ["Input"],
+};
+
+const loading = new Map<StyleSheet, Promise<void>>();
+const componentSheets = new Map<string, StyleSheet[]>();
+let lastInjected: HTMLStyleElement | null = null;
+
+function inject(sheet: StyleSheet, css: string) {
+  const style = document.createElement("style");
+  style.dataset.routelitStyles = sheet;
+  style.textContent = css;
+  // Ahead of the page stylesheets, so app styles still override Mantine's.
+  if (lastInjected) lastInjected.after(style);
+  else document.head.prepend(style);
+  lastInjected = style;
+}
+
+/**
+ * Loads and injects a stylesheet, once, after the sheets it depends on.
+ */
+export function loadStyles(sheet: StyleSheet): Promise<void> {
+  let promise = loading.get(sheet);
+  if (!promise) {
+    const deps = SHEET_DEPS[sheet] ?? [];
+    promise = Promise.all([Promise.all(deps.map(loadStyles)), SHEETS[sheet]()])
+      .then(([, { default: css }]) => inject(sheet, css))
+      .catch((error) => console.error(`routelit-mantine: failed to load ${sheet} styles`, error));
+    loading.set(sheet, promise);
+  }
+  return promise;
+}
+
+/**
+ * Stylesheets of a component registered in `family`, recorded so that pages
+ * prefetched by links load them ahead of navigation.
+ */
+export function registerStyles(name: string, family: StyleFamily): StyleSheet[] {
+  const sheets = family === "core" ? COMPONENT_SHEETS[name] ?? [] : [family];
+  componentSheets.set(name, sheets);
+  return sheets;
+}
+
+onPrefetch((names) => {
+  names.forEach((name) => componentSheets.get(name)?.forEach(loadStyles));
+});
+
+/**
+ * Loads the stylesheets of `Component` when it first renders, so that pages
+ * only download the styles of the components they show. The component renders
+ * right away and picks up its styles once they are injected.
+ */
+export function withStyles<P extends object>(Component: ComponentType<P>, sheets: StyleSheet[]) {
+  function Styled(props: P) {
+    useInsertionEffect(() => {
+      sheets.forEach(loadStyles);
+    }, []);
+    return <Component {...props} />;
+  }
+  Styled.displayName = `withStyles(${Component.displayName || Component.name})`;
+  return Styled;
+}
@@ -0,0 +1,87 @@
+import { ComponentType, useMemo } from "react";
+
+interface TimePresetRange {
+  start: number;
+  end: number;
+  step: number;
+  exclude?: Array<[number, number]>;
+  label?: string;
+}
+
+type TimePresets = string[] | Array<{ label: string; values: string[] }>;
+
+const pad = (value: number) => String(value).padStart(2, "0");
+
+function formatTime(seconds: number): string {
+  return `${pad(Math.floor(seconds / 3600))}:${pad(
+    Math.floor((seconds % 3600) / 60)
+  )}:${pad(seconds % 60)}`;
+}
+
+/**
+ * Expands preset generators (times in seconds since midnight) into the
+ * presets format of Mantine's TimePicker, grouped when labels are set.
+ */
+export function expandTimePresets(ranges: TimePresetRange[]): TimePresets {
+  const groups = new Map<string, string[]>();
+  for (const { start, end, step, exclude = [], label = "" } of ranges) {
+    const values = groups.get(label) ?? [];
+    for (let t = start; t <= end; t += Math.max(step, 1)) {
+      if (!exclude.some(([from, to]) => from <= t && t < to)) {
+        values.push(formatTime(t));
+      }
+    }
+    groups.set(label, values);
+  }
+  if (groups.size === 1 && groups.has("")) {
+    return groups.get("") as string[];
+  }
+  return [...groups].map(([label, values]) => ({ label, values }));
+}
+
+interface TimePresetsProps {
+  rlPresetRanges?: TimePresetRange[];
+  rlTimePresetRanges?: TimePresetRange[];
+  presets?: unknown;
+  timePickerProps?: Record<string, unknown>;
+}
+
+/**
+ * Expands `rlPresetRanges` into `presets` (TimePicker) and
+ * `rlTimePresetRanges` into `timePickerProps.presets` (DateTimePicker).
+ */
+export function withTimePresets<P extends object>(Component: ComponentType<P>) {
+  const Picker = Component as unknown as ComponentType<
+    Record<string, unknown>
+  >;
+  function PickerWithPresets({
+    rlPresetRanges,
+    rlTimePresetRanges,
+    presets,
+    timePickerProps,
+    ...props
+  }: TimePresetsProps & P) {
+    const expanded = useMemo(
+      () => rlPresetRanges && expandTimePresets(rlPresetRanges),
+      [rlPresetRanges]
+    );
+    const pickerProps = useMemo(
+      () =>
+        rlTimePresetRanges
+          ? {
+              ...timePickerProps,
+              presets: expandTimePresets(rlTimePresetRanges),
+            }
+          : timePickerProps,
+      [rlTimePresetRanges, timePickerProps]
+    );
+    const extra: Record<string, unknown> = {};
+    if (expanded ?? presets) extra.presets = expanded ?? presets;
+    if (pickerProps) extra.timePickerProps = pickerProps;
+    return <Picker {...props} {...extra} />;
+  }
+  PickerWithPresets.displayName = `withTimePresets(${
+    Component.displayName || Component.name
+  })`;
+  return PickerWithPresets;
+}
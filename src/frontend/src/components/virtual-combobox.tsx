@@ -0,0 +1,483 @@
+import {
+  ComponentType,
+  KeyboardEvent,
+  ReactNode,
+  useEffect,
+  useMemo,
+  useState,
+} from "react";
+import {
+  CheckIcon,
+  Combobox,
+  ComboboxItem,
+  ComboboxProps,
+  Group,
+  InputBase,
+  Pill,
+  PillsInput,
+  ScrollArea,
+  Text,
+  useCombobox,
+} from "@mantine/core";
+import { useUncontrolled } from "@mantine/hooks";
+import {
+  filterOptions,
+  flattenOptions,
+  OptionInput,
+  OptionItem,
+  OptionRow,
+} from "../utils/options";
+import { useViewport } from "./virtual-list";
+
+const OPTION_HEIGHT = 34;
+const DEFAULT_MAX_DROPDOWN_HEIGHT = 250;
+const OVERSCAN = 8;
+
+interface VirtualOptionListProps {
+  rows: OptionRow[];
+  active: number;
+  isSelected: (value: string) => boolean;
+  maxDropdownHeight?: number | string;
+  nothingFoundMessage?: ReactNode;
+  withCheckIcon?: boolean;
+  onActiveChange: (index: number) => void;
+}
+
+/**
+ * Dropdown options of fixed height, of which only those in view are mounted.
+ */
+function VirtualOptionList({
+  rows,
+  active,
+  isSelected,
+  maxDropdownHeight = DEFAULT_MAX_DROPDOWN_HEIGHT,
+  nothingFoundMessage,
+  withCheckIcon = true,
+  onActiveChange,
+}: VirtualOptionListProps) {
+  const [viewport, setViewport] = useState<HTMLDivElement | null>(null);
+  const { scrollTop, height } = useViewport(viewport);
+
+  useEffect(() => {
+    if (!viewport || active < 0) return;
+    const top = active * OPTION_HEIGHT;
+    if (top < viewport.scrollTop) {
+      viewport.scrollTop = top;
+    } else if (top + OPTION_HEIGHT > viewport.scrollTop + viewport.clientHeight) {
+      viewport.scrollTop = top + OPTION_HEIGHT - viewport.clientHeight;
+    }
+  }, [active, viewport]);
+
+  if (rows.length === 0) {
+    return nothingFoundMessage ? <Combobox.Empty>{nothingFoundMessage}</Combobox.Empty> : null;
+  }
+  const visible = Math.ceil((height || DEFAULT_MAX_DROPDOWN_HEIGHT) / OPTION_HEIGHT);
+  const start = Math.max(Math.floor(scrollTop / OPTION_HEIGHT) - OVERSCAN, 0);
+  const end = Math.min(start + visible + 2 * OVERSCAN, rows.length);
+  const items = [];
+  for (let i = start; i < end; i++) {
+    const row = rows[i];
+    if (row.kind === "group") {
+      items.push(
+        <Text key={`group:${row.label}:${i}`} size="xs" c="dimmed" fw={500} px="sm" pt="xs" h={OPTION_HEIGHT}>
+          {row.label}
+        </Text>
+      );
+      continue;
+    }
+    const selected = isSelected(row.value);
+    items.push(
+      <Combobox.Option
+        key={row.value}
+        value={row.value}
+        disabled={row.disabled}
+        active={i === active}
+        selected={selected}
+        h={OPTION_HEIGHT}
+        onMouseEnter={() => onActiveChange(i)}
+      >
+        <Group gap="xs" wrap="nowrap">
+          {withCheckIcon && selected && <CheckIcon size={12} />}
+          <span>{row.label}</span>
+        </Group>
+      </Combobox.Option>
+    );
+  }
+  return (
+    <Combobox.Options>
+      <ScrollArea.Autosize mah={maxDropdownHeight} type="scroll" viewportRef={setViewport}>
+        <div style={{ position: "relative", height: rows.length * OPTION_HEIGHT }}>
+          <div style={{ position: "absolute", left: 0, right: 0, top: start * OPTION_HEIGHT }}>{items}</div>
+        </div>
+      </ScrollArea.Autosize>
+    </Combobox.Options>
+  );
+}
+
+/**
+ * Keyboard navigation over the option rows, which Mantine's own navigation
+ * cannot do because it only sees the mounted options.
+ */
+function useOptionNavigation(
+  rows: OptionRow[],
+  combobox: ReturnType<typeof useCombobox>,
+  onSubmit: (value: string) => void
+) {
+  const [active, setActive] = useState(-1);
+  useEffect(() => setActive(-1), [rows]);
+
+  const move = (step: number) => {
+    let index = active;
+    for (let n = 0; n < rows.length; n++) {
+      index = (index + step + rows.length) % rows.length;
+      const row = rows[index];
+      if (row.kind === "option" && !row.disabled) {
+        setActive(index);
+        return;
+      }
+    }
+  };
+
+  const onKeyDown = (event: KeyboardEvent<HTMLInputElement>): boolean => {
+    switch (event.key) {
+      case "ArrowDown":
+      case "ArrowUp":
+        event.preventDefault();
+        combobox.openDropdown();
+        move(event.key === "ArrowDown" ? 1 : -1);
+        return true;
+      case "Enter": {
+        const row = rows[active];
+        if (combobox.dropdownOpened && row?.kind === "option") {
+          event.preventDefault();
+          onSubmit(row.value);
+          return true;
+        }
+        return false;
+      }
+      case "Escape":
+        combobox.closeDropdown();
+        return true;
+    }
+    return false;
+  };
+
+  return { active, setActive, onKeyDown };
+}
+
+interface VirtualComboboxProps {
+  data?: OptionInput[];
+  limit?: number;
+  maxDropdownHeight?: number | string;
+  nothingFoundMessage?: ReactNode;
+  searchable?: boolean;
+  withCheckIcon?: boolean;
+  comboboxProps?: ComboboxProps;
+  placeholder?: string;
+  disabled?: boolean;
+  readOnly?: boolean;
+  clearable?: boolean;
+  rightSection?: ReactNode;
+  [prop: string]: unknown;
+}
+
+// Props of the Mantine combobox inputs that are not input props.
+const COMBOBOX_ONLY_PROPS = [
+  "allowDeselect",
+  "autoSelectOnBlur",
+  "checkIconPosition",
+  "chevronColor",
+  "clearButtonProps",
+  "defaultDropdownOpened",
+  "defaultSearchValue",
+  "dropdownOpened",
+  "filter",
+  "hiddenInputProps",
+  "hiddenInputValuesDivider",
+  "hidePickedOptions",
+  "maxTags",
+  "maxValues",
+  "onClear",
+  "onDropdownClose",
+  "onDropdownOpen",
+  "onMaxTags",
+  "onOptionSubmit",
+  "onSearchChange",
+  "onRemove",
+  "renderOption",
+  "scrollAreaProps",
+  "searchValue",
+  "selectFirstOptionOnChange",
+  "splitChars",
+  "withScrollArea",
+];
+
+function inputProps(props: Record<string, unknown>): Record<string, unknown> {
+  const rest = { ...props };
+  for (const prop of COMBOBOX_ONLY_PROPS) delete rest[prop];
+  return rest;
+}
+
+function useOptions(data: OptionInput[] | undefined) {
+  const options = useMemo(() => flattenOptions(data ?? []), [data]);
+  const byValue = useMemo(() => new Map(options.map((o) => [o.value, o])), [options]);
+  return { options, byValue };
+}
+
+function comboboxItem(option: OptionItem | undefined): ComboboxItem | null {
+  return option ? { value: option.value, label: option.label, disabled: option.disabled } : null;
+}
+
+interface VirtualSelectProps extends VirtualComboboxProps {
+  value?: string | null;
+  defaultValue?: string | null;
+  onChange?: (value: string | null, option: ComboboxItem | null) => void;
+  allowDeselect?: boolean;
+}
+
+/**
+ * `Select` with a virtualized dropdown, for option lists too long to mount.
+ */
+export function VirtualSelect({
+  data,
+  value,
+  defaultValue,
+  onChange,
+  limit,
+  maxDropdownHeight,
+  nothingFoundMessage,
+  searchable,
+  withCheckIcon,
+  comboboxProps,
+  clearable,
+  disabled,
+  readOnly,
+  rightSection,
+  allowDeselect = true,
+  ...props
+}: VirtualSelectProps) {
+  const { options, byValue } = useOptions(data);
+  const [current, setCurrent] = useUncontrolled<string | null>({
+    value,
+    defaultValue,
+    finalValue: null,
+    onChange: (next) => onChange?.(next, comboboxItem(next === null ? undefined : byValue.get(next))),
+  });
+  const selectedLabel = current === null ? "" : byValue.get(current)?.label ?? "";
+  const [search, setSearch] = useState(selectedLabel);
+  useEffect(() => setSearch(selectedLabel), [selectedLabel]);
+  const combobox = useCombobox({ onDropdownClose: () => setSearch(selectedLabel) });
+
+  const query = searchable && search !== selectedLabel ? search : "";
+  const rows = useMemo(() => filterOptions(options, query, limit), [options, query, limit]);
+  const submit = (next: string) => {
+    setCurrent(allowDeselect && next === current ? null : next);
+    combobox.closeDropdown();
+  };
+  const navigation = useOptionNavigation(rows, combobox, submit);
+
+  return (
+    <Combobox store={combobox} onOptionSubmit={submit} disabled={disabled} readOnly={readOnly} {...comboboxProps}>
+      <Combobox.Target withKeyboardNavigation={false}>
+        <InputBase
+          {...inputProps(props)}
+          disabled={disabled}
+          readOnly={readOnly || !searchable}
+          pointer={!searchable}
+          value={search}
+          onChange={(event) => {
+            setSearch(event.currentTarget.value);
+            combobox.openDropdown();
+          }}
+          onClick={() => combobox.toggleDropdown()}
+          onFocus={() => searchable && combobox.openDropdown()}
+          onBlur={() => combobox.closeDropdown()}
+          onKeyDown={navigation.onKeyDown}
+          rightSection={
+            rightSection ??
+            (clearable && current !== null && !readOnly ? (
+              <Combobox.ClearButton onClear={() => setCurrent(null)} />
+            ) : (
+              <Combobox.Chevron />
+            ))
+          }
+          rightSectionPointerEvents={clearable && current !== null ? "all" : "none"}
+        />
+      </Combobox.Target>
+      <Combobox.Dropdown>
+        <VirtualOptionList
+          rows={rows}
+          active={navigation.active}
+          isSelected={(v) => v === current}
+          maxDropdownHeight={maxDropdownHeight}
+          nothingFoundMessage={nothingFoundMessage}
+          withCheckIcon={withCheckIcon}
+          onActiveChange={navigation.setActive}
+        />
+      </Combobox.Dropdown>
+    </Combobox>
+  );
+}
+
+interface VirtualPillsProps extends VirtualComboboxProps {
+  value?: string[];
+  defaultValue?: string[];
+  onChange?: (value: string[]) => void;
+  hidePickedOptions?: boolean;
+  maxValues?: number;
+  maxTags?: number;
+  splitChars?: string[];
+}
+
+function VirtualPillsCombobox({
+  data,
+  value,
+  defaultValue,
+  onChange,
+  limit,
+  maxDropdownHeight,
+  nothingFoundMessage,
+  searchable,
+  withCheckIcon,
+  comboboxProps,
+  clearable,
+  disabled,
+  readOnly,
+  rightSection,
+  placeholder,
+  hidePickedOptions,
+  maxValues,
+  creatable,
+  splitChars = [","],
+  ...props
+}: VirtualPillsProps & { creatable: boolean }) {
+  const { options, byValue } = useOptions(data);
+  const [current, setCurrent] = useUncontrolled<string[]>({ value, defaultValue, finalValue: [], onChange });
+  const [search, setSearch] = useState("");
+  const combobox = useCombobox({ onDropdownClose: () => setSearch("") });
+  const picked = useMemo(() => new Set(current), [current]);
+
+  const rows = useMemo(
+    () => filterOptions(options, searchable || creatable ? search : "", limit, hidePickedOptions ? picked : undefined),
+    [options, search, searchable, creatable, limit, hidePickedOptions, picked]
+  );
+  const add = (values: string[]) => {
+    const next = [...current];
+    for (const v of values) {
+      if (v && !next.includes(v) && (maxValues === undefined || next.length < maxValues)) next.push(v);
+    }
+    setCurrent(next);
+  };
+  const submit = (v: string) => {
+    if (picked.has(v)) setCurrent(current.filter((x) => x !== v));
+    else add([v]);
+    setSearch("");
+  };
+  const navigation = useOptionNavigation(rows, combobox, submit);
+
+  const onKeyDown = (event: KeyboardEvent<HTMLInputElement>) => {
+    if (event.key === "Backspace" && search.length === 0 && current.length > 0) {
+      setCurrent(current.slice(0, -1));
+    } else if (!navigation.onKeyDown(event) && creatable && event.key === "Enter" && search.trim()) {
+      event.preventDefault();
+      add([search.trim()]);
+      setSearch("");
+    }
+  };
+  const onSearchChange = (text: string) => {
+    const parts = creatable ? text.split(new RegExp(`[${splitChars.map((c) => `\\${c}`).join("")}]`)) : [text];
+    if (parts.length > 1) {
+      add(parts.slice(0, -1).map((p) => p.trim()));
+    }
+    setSearch(parts[parts.length - 1]);
+    combobox.openDropdown();
+  };
+
+  return (
+    <Combobox store={combobox} onOptionSubmit={submit} disabled={disabled} readOnly={readOnly} {...comboboxProps}>
+      <Combobox.DropdownTarget>
+        <PillsInput
+          {...inputProps(props)}
+          disabled={disabled}
+          pointer={!searchable && !creatable}
+          onClick={() => combobox.openDropdown()}
+          rightSection={
+            rightSection ??
+            (clearable && current.length > 0 && !readOnly ? (
+              <Combobox.ClearButton onClear={() => setCurrent([])} />
+            ) : creatable ? null : (
+              <Combobox.Chevron />
+            ))
+          }
+          rightSectionPointerEvents={clearable && current.length > 0 ? "all" : "none"}
+        >
+          <Pill.Group>
+            {current.map((v) => (
+              <Pill
+                key={v}
+                withRemoveButton={!readOnly && !disabled}
+                onRemove={() => setCurrent(current.filter((x) => x !== v))}
+              >
+                {byValue.get(v)?.label ?? v}
+              </Pill>
+            ))}
+            <Combobox.EventsTarget withKeyboardNavigation={false}>
+              <PillsInput.Field
+                value={search}
+                placeholder={current.length ? undefined : placeholder}
+                readOnly={readOnly || (!searchable && !creatable)}
+                disabled={disabled}
+                onChange={(event) => onSearchChange(event.currentTarget.value)}
+                onFocus={() => combobox.openDropdown()}
+                onBlur={() => combobox.closeDropdown()}
+                onKeyDown={onKeyDown}
+              />
+            </Combobox.EventsTarget>
+          </Pill.Group>
+        </PillsInput>
+      </Combobox.DropdownTarget>
+      <Combobox.Dropdown hidden={creatable && rows.length === 0}>
+        <VirtualOptionList
+          rows={rows}
+          active={navigation.active}
+          isSelected={(v) => picked.has(v)}
+          maxDropdownHeight={maxDropdownHeight}
+          nothingFoundMessage={nothingFoundMessage}
+          withCheckIcon={withCheckIcon}
+          onActiveChange={navigation.setActive}
+        />
+      </Combobox.Dropdown>
+    </Combobox>
+  );
+}
+
+/**
+ * `MultiSelect` with a virtualized dropdown.
+ */
+export function VirtualMultiSelect(props: VirtualPillsProps) {
+  return <VirtualPillsCombobox {...props} creatable={false} />;
+}
+
+/**
+ * `TagsInput` with a virtualized dropdown; `maxTags` caps the tags.
+ */
+export function VirtualTagsInput({ maxTags, ...props }: VirtualPillsProps) {
+  return <VirtualPillsCombobox {...props} maxValues={maxTags} searchable creatable />;
+}
+
+/**
+ * Renders `Virtual` instead of the Mantine combobox input only when the
+ * element sets `virtualize`, since the virtual inputs leave out some props
+ * such as `searchValue`, `onSearchChange` and the dropdown open callbacks.
+ */
+export function withVirtualOptions<P extends object>(
+  Component: ComponentType<P>,
+  Virtual: ComponentType<P>
+) {
+  function VirtualOptions({ virtualize, ...props }: P & { virtualize?: boolean }) {
+    const Target = virtualize ? Virtual : Component;
+    return <Target {...(props as P)} />;
+  }
+  VirtualOptions.displayName = `withVirtualOptions(${Component.displayName || Component.name})`;
+  return VirtualOptions;
+}
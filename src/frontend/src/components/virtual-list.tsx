@@ -0,0 +1,244 @@
+import {
+  Children,
+  ReactNode,
+  useEffect,
+  useMemo,
+  useRef,
+  useState,
+} from "react";
+import { ScrollArea, ScrollAreaProps } from "@mantine/core";
+import { useDispatcherWith } from "routelit-client";
+import { ItemOffsets } from "../utils/virtual";
+
+interface VirtualOptions {
+  estimateItemSize?: number;
+  measureItems?: boolean;
+  overscan?: number;
+  gap?: number;
+}
+
+interface ViewportState {
+  scrollTop: number;
+  height: number;
+}
+
+export function useViewport(viewport: HTMLElement | null): ViewportState {
+  const [state, setState] = useState<ViewportState>({ scrollTop: 0, height: 0 });
+  useEffect(() => {
+    if (!viewport) return;
+    let frame = 0;
+    const update = () => {
+      frame = 0;
+      setState((prev) =>
+        prev.scrollTop === viewport.scrollTop && prev.height === viewport.clientHeight
+          ? prev
+          : { scrollTop: viewport.scrollTop, height: viewport.clientHeight }
+      );
+    };
+    const schedule = () => {
+      if (!frame) frame = requestAnimationFrame(update);
+    };
+    const observer = new ResizeObserver(schedule);
+    observer.observe(viewport);
+    viewport.addEventListener("scroll", schedule, { passive: true });
+    update();
+    return () => {
+      cancelAnimationFrame(frame);
+      observer.disconnect();
+      viewport.removeEventListener("scroll", schedule);
+    };
+  }, [viewport]);
+  return state;
+}
+
+interface VirtualItemsProps extends Required<VirtualOptions>, ViewportState {
+  count: number;
+  renderItem: (index: number) => ReactNode;
+  onRangeChange?: (start: number, end: number) => void;
+}
+
+/**
+ * Lays out `count` items in a spacer as tall as the whole list and renders
+ * only those intersecting the viewport. Items keep their estimated size until
+ * measured when `measureItems` is set.
+ */
+function VirtualItems({
+  count,
+  renderItem,
+  estimateItemSize,
+  measureItems,
+  overscan,
+  gap,
+  scrollTop,
+  height,
+  onRangeChange,
+}: VirtualItemsProps) {
+  const offsets = useMemo(() => new ItemOffsets(count, estimateItemSize, gap), []); // eslint-disable-line react-hooks/exhaustive-deps
+  offsets.configure(count, estimateItemSize, gap);
+  const [, setLayoutVersion] = useState(0);
+
+  const observer = useMemo(() => {
+    if (!measureItems || typeof ResizeObserver === "undefined") return null;
+    let frame = 0;
+    return new ResizeObserver((entries) => {
+      let changed = false;
+      for (const entry of entries) {
+        const index = Number((entry.target as HTMLElement).dataset.index);
+        const size = entry.borderBoxSize?.[0]?.blockSize ?? entry.contentRect.height;
+        changed = offsets.measure(index, size) || changed;
+      }
+      if (changed && !frame) {
+        frame = requestAnimationFrame(() => {
+          frame = 0;
+          setLayoutVersion((v) => v + 1);
+        });
+      }
+    });
+  }, [measureItems, offsets]);
+  useEffect(() => () => observer?.disconnect(), [observer]);
+
+  const [start, end] = offsets.range(scrollTop, height || estimateItemSize * 10, overscan);
+  useEffect(() => {
+    onRangeChange?.(start, end);
+  }, [start, end, onRangeChange]);
+
+  const items = [];
+  for (let i = start; i < end; i++) {
+    items.push(
+      <div
+        key={i}
+        data-index={i}
+        style={measureItems ? undefined : { height: estimateItemSize, overflow: "hidden" }}
+        ref={
+          observer
+            ? (node: HTMLDivElement | null) => {
+                if (!node) return;
+                observer.observe(node);
+                return () => observer.unobserve(node);
+              }
+            : undefined
+        }
+      >
+        {renderItem(i)}
+      </div>
+    );
+  }
+  return (
+    <div style={{ position: "relative", height: offsets.total() }}>
+      <div
+        style={{
+          position: "absolute",
+          top: 0,
+          left: 0,
+          right: 0,
+          transform: `translateY(${offsets.offset(start)}px)`,
+          display: "flex",
+          flexDirection: "column",
+          gap,
+        }}
+      >
+        {items}
+      </div>
+    </div>
+  );
+}
+
+type VirtualScrollAreaProps = ScrollAreaProps & VirtualOptions;
+
+/**
+ * A scroll area that mounts only the children in view, for feeds and logs
+ * with thousands of elements.
+ */
+export function VirtualScrollArea({
+  children,
+  estimateItemSize = 48,
+  measureItems = true,
+  overscan = 5,
+  gap = 0,
+  ...props
+}: VirtualScrollAreaProps) {
+  const items = Children.toArray(children);
+  const [viewport, setViewport] = useState<HTMLDivElement | null>(null);
+  const state = useViewport(viewport);
+  return (
+    <ScrollArea {...props} viewportRef={setViewport}>
+      <VirtualItems
+        count={items.length}
+        renderItem={(i) => items[i]}
+        estimateItemSize={estimateItemSize}
+        measureItems={measureItems}
+        overscan={overscan}
+        gap={gap}
+        {...state}
+      />
+    </ScrollArea>
+  );
+}
+
+interface VirtualListProps extends Omit<ScrollAreaProps, "id">, VirtualOptions {
+  id: string;
+  count?: number;
+  start?: number;
+}
+
+const RANGE_CHANGE_DELAY = 100;
+
+/**
+ * A virtualized vertical list whose children cover the items from `start`.
+ * When the visible range leaves the loaded items, a "rangechange" event asks
+ * the server for the items around it.
+ */
+export function VirtualList({
+  id,
+  count,
+  start = 0,
+  children,
+  estimateItemSize = 48,
+  measureItems = true,
+  overscan = 5,
+  gap = 0,
+  ...props
+}: VirtualListProps) {
+  const items = Children.toArray(children);
+  const total = count ?? start + items.length;
+  const [viewport, setViewport] = useState<HTMLDivElement | null>(null);
+  const state = useViewport(viewport);
+  const dispatchRange = useDispatcherWith(id, "rangechange");
+  const loaded = useRef({ start, end: start + items.length });
+  loaded.current = { start, end: start + items.length };
+  const requested = useRef("");
+  const timer = useRef<ReturnType<typeof setTimeout>>(undefined);
+  useEffect(() => () => clearTimeout(timer.current), []);
+
+  const onRangeChange = useMemo(
+    () => (first: number, last: number) => {
+      clearTimeout(timer.current);
+      const { start: loadedStart, end: loadedEnd } = loaded.current;
+      if (first >= loadedStart && last <= loadedEnd) return;
+      timer.current = setTimeout(() => {
+        const range = `${first}:${last}`;
+        if (requested.current === range) return;
+        requested.current = range;
+        dispatchRange({ start: first, end: last });
+      }, RANGE_CHANGE_DELAY);
+    },
+    [dispatchRange]
+  );
+
+  return (
+    <ScrollArea {...props} viewportRef={setViewport}>
+      <VirtualItems
+        count={total}
+        renderItem={(i) =>
+          i >= start && i < start + items.length ? items[i - start] : null
+        }
+        estimateItemSize={estimateItemSize}
+        measureItems={measureItems}
+        overscan={overscan}
+        gap={gap}
+        onRangeChange={onRangeChange}
+        {...state}
+      />
+    </ScrollArea>
+  );
+}
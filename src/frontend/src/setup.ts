@@ -76,9 +76,26 @@ import {
   Sparkline,
   Heatmap
 } from "@mantine/charts";
-import "@mantine/core/styles.css";
-import "@mantine/dates/styles.css";
-import "@mantine/charts/styles.css";
+import type { ComponentType } from "react";
+// Critical styles of the app shell and layout components go in the package
+// stylesheet; other stylesheets are loaded when first rendered.
+import "@mantine/core/styles/baseline.css";
+import "@mantine/core/styles/default-css-variables.css";
+import "@mantine/core/styles/global.css";
+import "@mantine/core/styles/UnstyledButton.css";
+import "@mantine/core/styles/Burger.css";
+import "@mantine/core/styles/AppShell.css";
+import "@mantine/core/styles/Container.css";
+import "@mantine/core/styles/Grid.css";
+import "@mantine/core/styles/Group.css";
+import "@mantine/core/styles/SimpleGrid.css";
+import "@mantine/core/styles/Stack.css";
+import "@mantine/core/styles/Paper.css";
+import "@mantine/core/styles/ScrollArea.css";
+import "@mantine/core/styles/Text.css";
+import "@mantine/core/styles/Title.css";
+import "@mantine/core/styles/Anchor.css";
+import "@mantine/core/styles/NavLink.css";
 import "./lib.css";
 import { RLAppShell, RLProvider } from "./components";
 import ChipGroup from "./components/chip-group";
@@ -89,25 +106,67 @@ import { ActionIcon } from "./components/action-icon";
 import TablerIcon from "./components/icon";
 import Anchor from "./components/anchor";
 import NavLink from "./components/nav-link";
+import SparklineGrid from "./components/sparkline-grid";
+import Memo from "./components/memo";
+import {
+  CanvasBubbleChart,
+  CanvasScatterChart,
+} from "./components/canvas-scatter-chart";
+import { withChartData } from "./components/chart-data";
+import { CanvasHeatmap } from "./components/canvas-heatmap";
+import { withDateAvailability } from "./components/date-availability";
+import { withTimePresets } from "./components/time-presets";
+import { withMemo } from "./components/memoized";
+import { loadStyles, registerStyles, StyleFamily, withStyles } from "./components/styles";
+import { VirtualList, VirtualScrollArea } from "./components/virtual-list";
+import { Paginated } from "./components/paginated";
+import { withRouteCache } from "./components/route-cache";
+import {
+  VirtualMultiSelect,
+  VirtualSelect,
+  VirtualTagsInput,
+  withVirtualOptions,
+} from "./components/virtual-combobox";
 
 const idFn = (value: unknown) => value;
 
-componentStore.register("provider", RLProvider);
-componentStore.register("appshell", RLAppShell);
-componentStore.register(
+// Elements re-render only when their props change, so a patch to one element
+// does not re-render its unchanged siblings. Components of a style family
+// load their own stylesheets when first rendered.
+function registrar(family?: StyleFamily) {
+  return function register<P extends object>(name: string, Component: ComponentType<P>) {
+    const sheets = family ? registerStyles(name, family) : [];
+    componentStore.register(
+      name,
+      withMemo(sheets.length ? withStyles(Component, sheets) : Component, name)
+    );
+  };
+}
+
+const registerLayout = registrar();
+const register = registrar("core");
+const registerDates = registrar("dates");
+const registerCharts = registrar("charts");
+
+registerLayout("provider", RLProvider);
+registerLayout("appshell", RLAppShell);
+registerLayout(
   "navbar",
   withSimpleComponent(AppShell.Navbar, { p: "sm" })
 );
-componentStore.register("main", AppShell.Main);
-componentStore.register("container", Container);
-componentStore.register("flex", Flex);
-componentStore.register("grid", Grid);
-componentStore.register("gridcol", Grid.Col);
-componentStore.register("group", Group);
-componentStore.register("simplegrid", SimpleGrid);
-componentStore.register("space", Space);
-componentStore.register("stack", Stack);
-componentStore.register(
+registerLayout("main", withRouteCache(AppShell.Main));
+registerLayout("memo", Memo);
+registerLayout("eachitem", Memo);
+registerLayout("slot", Memo);
+registerLayout("container", Container);
+registerLayout("flex", Flex);
+registerLayout("grid", Grid);
+registerLayout("gridcol", Grid.Col);
+registerLayout("group", Group);
+registerLayout("simplegrid", SimpleGrid);
+registerLayout("space", Space);
+registerLayout("stack", Stack);
+register(
   "checkbox",
   withValueEventDispatcher(Checkbox, {
     rlValueAttr: "checked",
@@ -115,13 +174,13 @@ componentStore.register(
       e.currentTarget.checked,
   })
 );
-componentStore.register(
+register(
   "checkboxgroup",
   withValueEventDispatcher(CheckboxGroup, {
     rlEventValueGetter: idFn,
   })
 );
-componentStore.register(
+register(
   "chip",
   withValueEventDispatcher(Chip, {
     rlValueAttr: "checked",
@@ -129,75 +188,75 @@ componentStore.register(
     rlInlineElementsAttrs: ["icon"],
   })
 );
-componentStore.register(
+register(
   "chipgroup",
   withValueEventDispatcher(ChipGroup, {
     rlEventValueGetter: idFn,
   })
 );
-componentStore.register(
+register(
   "colorinput",
   withValueEventDispatcher(ColorInput, {
     rlEventAttr: "onChangeEnd",
     rlEventValueGetter: idFn,
   })
 );
-componentStore.register("fieldset", Fieldset);
-componentStore.register(
+register("fieldset", Fieldset);
+register(
   "textinput",
   withInputValueEventDispatcher(TextInput, {
     rlInlineElementsAttrs: ["leftSection", "rightSection"],
   })
 );
-componentStore.register(
+register(
   "nativeselect",
   withValueEventDispatcher(NativeSelect, {
     rlInlineElementsAttrs: ["leftSection", "rightSection"],
   })
 );
-componentStore.register(
+register(
   "numberinput",
   withInputValueEventDispatcher(NumberInput, {
     rlInlineElementsAttrs: ["leftSection", "rightSection"],
   })
 );
-componentStore.register(
+register(
   "passwordinput",
   withInputValueEventDispatcher(PasswordInput)
 );
-componentStore.register(
+register(
   "radiogroup",
   withValueEventDispatcher(RadioGroup, {
     rlEventValueGetter: idFn,
   })
 );
-componentStore.register(
+register(
   "rangeslider",
   withValueEventDispatcher(RangeSlider, {
     rlEventAttr: "onChangeEnd",
     rlEventValueGetter: idFn,
   })
 );
-componentStore.register(
+register(
   "rating",
   withValueEventDispatcher(Rating, {
     rlEventValueGetter: idFn,
   })
 );
-componentStore.register(
+register(
   "segmentedcontrol",
   withValueEventDispatcher(SegmentedControl, {
     rlEventValueGetter: idFn,
   })
 );
-componentStore.register(
+register(
   "slider",
   withValueEventDispatcher(Slider, {
     rlEventAttr: "onChangeEnd",
     rlEventValueGetter: idFn,
   })
 );
-componentStore.register(
+register(
   "switch",
   withValueEventDispatcher(Switch, {
     rlValueAttr: "checked",
@@ -206,71 +265,71 @@ componentStore.register(
     rlInlineElementsAttrs: ["thumbIcon"],
   })
 );
-componentStore.register(
+register(
   "switchgroup",
   withValueEventDispatcher(SwitchGroup, {
     rlEventValueGetter: idFn,
   })
 );
-componentStore.register("textarea", withInputValueEventDispatcher(Textarea));
-componentStore.register(
+register("textarea", withInputValueEventDispatcher(Textarea));
+register(
   "autocomplete",
   withInputValueEventDispatcher(Autocomplete, {
     rlInlineElementsAttrs: ["leftSection", "rightSection"],
   })
 );
-componentStore.register(
+register(
   "multiselect",
-  withValueEventDispatcher(MultiSelect, {
+  withValueEventDispatcher(withVirtualOptions(MultiSelect, VirtualMultiSelect), {
     rlEventValueGetter: idFn,
     rlInlineElementsAttrs: ["leftSection", "rightSection"],
   })
 );
-componentStore.register(
+register(
   "select",
-  withValueEventDispatcher(Select, {
+  withValueEventDispatcher(withVirtualOptions(Select, VirtualSelect), {
     rlEventValueGetter: idFn,
     rlInlineElementsAttrs: ["leftSection", "rightSection"],
   })
 );
-componentStore.register(
+register(
   "tagsinput",
-  withValueEventDispatcher(TagsInput, {
+  withValueEventDispatcher(withVirtualOptions(TagsInput, VirtualTagsInput), {
     rlEventValueGetter: idFn,
     rlInlineElementsAttrs: ["leftSection", "rightSection"],
   })
 );
-componentStore.register("actionicon", withEventDispatcher(ActionIcon));
-componentStore.register("actionicongroup", MantineActionIcon.Group);
-componentStore.register(
+register("actionicon", withEventDispatcher(ActionIcon));
+register("actionicongroup", MantineActionIcon.Group);
+register(
   "actionicongroupsection",
   MantineActionIcon.GroupSection
 );
-componentStore.register("icon", TablerIcon);
-componentStore.register(
+registerLayout("icon", TablerIcon);
+register(
   "button",
   withEventDispatcher(Button, {
     rlInlineElementsAttrs: ["leftSection", "rightSection"],
   })
 );
-componentStore.register("anchor", Anchor);
-componentStore.register("link", Anchor);
-componentStore.register(
+registerLayout("anchor", Anchor);
+registerLayout("link", Anchor);
+registerLayout(
   "navlink",
   withSimpleComponent(NavLink, {
     rlInlineElementsAttrs: ["leftSection", "rightSection"],
   })
 );
-componentStore.register("tabs", Tabs);
-componentStore.register(
+register("tabs", Tabs);
+register(
   "tab",
   withSimpleComponent(Tabs.Tab, {
     rlInlineElementsAttrs: ["leftSection", "rightSection"],
   })
 );
-componentStore.register("tablist", Tabs.List);
-componentStore.register("tabpanel", Tabs.Panel);
-componentStore.register(
+register("tablist", Tabs.List);
+register("tabpanel", Tabs.Panel);
+register(
   "alert",
   withEventDispatcher(Alert, {
     rlEventName: "close",
@@ -278,7 +337,7 @@ componentStore.register(
     rlInlineElementsAttrs: ["icon"],
   })
 );
-componentStore.register(
+register(
   "notification",
   withEventDispatcher(Notification, {
     rlEventName: "close",
@@ -286,112 +345,134 @@ componentStore.register(
     rlInlineElementsAttrs: ["icon"],
   })
 );
-componentStore.register("progress", Progress);
-componentStore.register(
+register("progress", Progress);
+register(
   "dialog",
   withEventDispatcher(Dialog, {
     rlEventName: "close",
     rlEventAttr: "onClose",
   })
 );
-componentStore.register(
+register(
   "drawer",
   withEventDispatcher(Drawer, {
     rlEventName: "close",
     rlEventAttr: "onClose",
   })
 );
-componentStore.register(
+register(
   "modal",
   withEventDispatcher(Modal, {
     rlEventName: "close",
     rlEventAttr: "onClose",
   })
 );
-componentStore.register("affix", Affix);
-componentStore.register("image", Image);
-componentStore.register("numberformatter", NumberFormatter);
-componentStore.register("spoiler", Spoiler);
-componentStore.register("text", Text);
-componentStore.register("title", Title);
-componentStore.register("table", Table);
-componentStore.register("tablehead", Table.Thead);
-componentStore.register("tablebody", Table.Tbody);
-componentStore.register("tablefoot", Table.Tfoot);
-componentStore.register("tablerow", Table.Tr);
-componentStore.register("tablecell", Table.Td);
-componentStore.register("tableheader", Table.Th);
-componentStore.register("tablecaption", Table.Caption);
-componentStore.register("tablescrollcontainer", Table.ScrollContainer);
-componentStore.register("box", Box);
-componentStore.register("paper", Paper);
-componentStore.register("scrollarea", ScrollArea);
-componentStore.register(
+register("affix", Affix);
+register("image", Image);
+register("numberformatter", NumberFormatter);
+register("spoiler", Spoiler);
+registerLayout("text", Text);
+registerLayout("title", Title);
+register("table", Table);
+register("tablehead", Table.Thead);
+register("tablebody", Table.Tbody);
+register("tablefoot", Table.Tfoot);
+register("tablerow", Table.Tr);
+register("tablecell", Table.Td);
+register("tableheader", Table.Th);
+register("tablecaption", Table.Caption);
+register("tablescrollcontainer", Table.ScrollContainer);
+registerLayout("box", Box);
+registerLayout("paper", Paper);
+registerLayout("scrollarea", ScrollArea);
+registerLayout("virtualscrollarea", VirtualScrollArea);
+registerLayout("virtuallist", VirtualList);
+register("paginated", Paginated);
+registerDates(
   "datepicker",
-  withValueEventDispatcher(DatePicker, {
-    rlEventValueGetter: idFn,
-    rlInlineElementsAttrs: ["leftSection", "rightSection"],
-  })
-);
-componentStore.register("timeinput",  withValueEventDispatcher(TimeInput, {
+  withDateAvailability(
+    withValueEventDispatcher(DatePicker, {
+      rlEventValueGetter: idFn,
+      rlInlineElementsAttrs: ["leftSection", "rightSection"],
+    })
+  )
+);
+registerDates("timeinput",  withValueEventDispatcher(TimeInput, {
   rlInlineElementsAttrs: [
     "leftSection",
     "rightSection",
   ],
 }));
-componentStore.register("timepicker", withValueEventDispatcher(TimePicker, {
+registerDates("timepicker", withTimePresets(withValueEventDispatcher(TimePicker, {
   rlEventValueGetter: idFn,
   rlInlineElementsAttrs: [
     "leftSection",
     "rightSection",
   ],
-}));
-componentStore.register(
+})));
+registerDates(
   "datetimepicker",
-  withValueEventDispatcher(DateTimePicker, {
-    rlEventValueGetter: idFn,
-    rlInlineElementsAttrs: [
-      "leftSection",
-      "rightSection",
-      "nextIcon",
-      "previousIcon",
-    ],
-  })
-);
-componentStore.register(
+  withTimePresets(
+    withDateAvailability(
+      withValueEventDispatcher(DateTimePicker, {
+        rlEventValueGetter: idFn,
+        rlInlineElementsAttrs: [
+          "leftSection",
+          "rightSection",
+          "nextIcon",
+          "previousIcon",
+        ],
+      })
+    )
+  )
+);
+registerDates(
   "datepickerinput",
-  withValueEventDispatcher(DatePickerInput, {
-    rlEventValueGetter: idFn,
-    rlInlineElementsAttrs: [
-      "leftSection",
-      "rightSection",
-      "nextIcon",
-      "previousIcon",
-    ],
-  })
-);
-componentStore.register("accordion", withSimpleComponent(Accordion, {
+  withDateAvailability(
+    withValueEventDispatcher(DatePickerInput, {
+      rlEventValueGetter: idFn,
+      rlInlineElementsAttrs: [
+        "leftSection",
+        "rightSection",
+        "nextIcon",
+        "previousIcon",
+      ],
+    })
+  )
+);
+register("accordion", withSimpleComponent(Accordion, {
   rlInlineElementsAttrs: ["chevron"],
 }));
-componentStore.register("accordionitem", Accordion.Item);
-componentStore.register("accordionpanel", Accordion.Panel);
-componentStore.register("accordioncontrol", withSimpleComponent(Accordion.Control, {
+register("accordionitem", Accordion.Item);
+register("accordionpanel", Accordion.Panel);
+register("accordioncontrol", withSimpleComponent(Accordion.Control, {
   rlInlineElementsAttrs: ["chevron", "icon"],
 }));
-componentStore.register("areachart", AreaChart);
-componentStore.register("barchart", BarChart);
-componentStore.register("linechart", LineChart);
-componentStore.register("compositechart", CompositeChart);
-componentStore.register("donutchart", DonutChart);
-componentStore.register("funnelchart", FunnelChart);
-componentStore.register("piechart", PieChart);
-componentStore.register("radarchart", RadarChart);
-componentStore.register("scatterchart", ScatterChart);
-componentStore.register("bubblechart", BubbleChart);
-componentStore.register("radialbarchart", RadialBarChart);
-componentStore.register("sparkline", Sparkline);
-componentStore.register("heatmap", withCallbackAttributes(Heatmap, {
+registerCharts("areachart", withChartData(AreaChart));
+registerCharts("barchart", withChartData(BarChart));
+registerCharts("linechart", withChartData(LineChart));
+registerCharts("compositechart", withChartData(CompositeChart));
+registerCharts("donutchart", withChartData(DonutChart));
+registerCharts("funnelchart", withChartData(FunnelChart));
+registerCharts("piechart", withChartData(PieChart));
+registerCharts("radarchart", withChartData(RadarChart));
+registerCharts("scatterchart", withChartData(ScatterChart));
+registerCharts("canvasscatterchart", withChartData(CanvasScatterChart));
+registerCharts("bubblechart", withChartData(BubbleChart));
+registerCharts("canvasbubblechart", withChartData(CanvasBubbleChart));
+registerCharts("radialbarchart", withChartData(RadialBarChart));
+registerCharts("sparkline", withChartData(Sparkline));
+registerCharts("sparklinegrid", withChartData(SparklineGrid));
+registerCharts("heatmap", withChartData(withCallbackAttributes(Heatmap, {
   rlCallbackAttrs: ["getTooltipLabel"],
   getTooltipLabel: ({ date, value }) => `${date} | ${value}`,
-}));
+})));
+registerCharts("canvasheatmap", withChartData(withCallbackAttributes(CanvasHeatmap, {
+  rlCallbackAttrs: ["getTooltipLabel"],
+  getTooltipLabel: ({ date, value }) => `${date} | ${value}`,
+})));
 componentStore.forceUpdate();
+// Most pages show inputs and buttons: start loading their styles now,
+// without blocking the first paint.
+loadStyles("Input");
+loadStyles("Button");
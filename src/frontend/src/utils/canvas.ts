@@ -0,0 +1,85 @@
+import { MantineTheme, parseThemeColor } from "@mantine/core";
+
+/**
+ * Resolves a Mantine color (e.g. "blue", "indigo.6", "var(--mantine-color-red-4)" or "#fff")
+ * into a concrete CSS color that can be used by a 2D canvas context.
+ */
+export function resolveColor(
+  color: string,
+  theme: MantineTheme,
+  element?: Element | null
+): string {
+  const parsed = parseThemeColor({ color, theme });
+  const value = parsed.value;
+  if (value.startsWith("var(") && element) {
+    const name = value.slice(4, -1).split(",")[0].trim();
+    const resolved = getComputedStyle(element).getPropertyValue(name).trim();
+    return resolved || value;
+  }
+  return value;
+}
+
+/**
+ * Sizes the canvas backing store for the current device pixel ratio and
+ * returns a context already scaled to CSS pixels.
+ */
+export function setupCanvas(
+  canvas: HTMLCanvasElement,
+  width: number,
+  height: number
+): CanvasRenderingContext2D | null {
+  const ratio = window.devicePixelRatio || 1;
+  canvas.width = Math.max(1, Math.floor(width * ratio));
+  canvas.height = Math.max(1, Math.floor(height * ratio));
+  canvas.style.width = `${width}px`;
+  canvas.style.height = `${height}px`;
+  const ctx = canvas.getContext("2d");
+  if (!ctx) {
+    return null;
+  }
+  ctx.setTransform(ratio, 0, 0, ratio, 0, 0);
+  ctx.clearRect(0, 0, width, height);
+  return ctx;
+}
+
+/**
+ * Returns the [min, max] of the finite values, or undefined when there is none.
+ */
+export function extent(
+  values: ArrayLike<number | null | undefined>
+): [number, number] | undefined {
+  let min = Infinity;
+  let max = -Infinity;
+  for (let i = 0; i < values.length; i++) {
+    const value = values[i];
+    if (value === null || value === undefined || !Number.isFinite(value)) {
+      continue;
+    }
+    if (value < min) min = value;
+    if (value > max) max = value;
+  }
+  return min <= max ? [min, max] : undefined;
+}
+
+/**
+ * Returns round tick values covering [min, max], roughly `count` of them.
+ */
+export function niceTicks(min: number, max: number, count = 5): number[] {
+  if (!Number.isFinite(min) || !Number.isFinite(max)) {
+    return [];
+  }
+  if (min === max) {
+    return [min];
+  }
+  const rawStep = (max - min) / Math.max(1, count);
+  const magnitude = Math.pow(10, Math.floor(Math.log10(rawStep)));
+  const residual = rawStep / magnitude;
+  const step =
+    (residual > 5 ? 10 : residual > 2 ? 5 : residual > 1 ? 2 : 1) *
+    magnitude;
+  const ticks: number[] = [];
+  for (let tick = Math.ceil(min / step) * step; tick <= max; tick += step) {
+    ticks.push(Number(tick.toPrecision(12)));
+  }
+  return ticks;
+}
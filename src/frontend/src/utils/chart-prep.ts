@@ -0,0 +1,240 @@
+import { extent } from "./canvas";
+
+export type Point = Record<string, number | string | null>;
+
+export interface ScatterSeries {
+  name: string;
+  color: string;
+  data: Point[];
+}
+
+export interface DensityBins {
+  type: "hex" | "grid";
+  origin: [number, number];
+  size: [number, number];
+  series: Array<{ name: string; color: string; cells: number[][] }>;
+}
+
+export interface PreparedPoints {
+  xs: Float64Array;
+  ys: Float64Array;
+  zs?: Float64Array;
+  radii?: Float32Array;
+  seriesIndex: Uint16Array;
+  series: Array<{ name: string; color: string }>;
+  xCategories?: string[];
+  cells?: { type: "hex" | "grid"; size: [number, number]; max: number[] };
+  xDomain: [number, number];
+  yDomain: [number, number];
+}
+
+type Points = Omit<PreparedPoints, "xDomain" | "yDomain">;
+
+/** Rows sent column by column: `columns[key][i]` is the `key` of row `i`. */
+export interface ColumnarData {
+  columns: Record<string, unknown[]>;
+  length: number;
+}
+
+export type ChartTask =
+  | { type: "scatter"; data: ScatterSeries[]; dataKey: { x: string; y: string } }
+  | {
+      type: "bubble";
+      data: Point[];
+      dataKey: { x: string; y: string; z: string };
+      range: [number, number];
+      color: string;
+      label: string;
+    }
+  | { type: "bins"; bins: DensityBins };
+
+function toNumber(value: unknown): number {
+  return typeof value === "number" ? value : Number(value);
+}
+
+/**
+ * Encodes x values as numbers; non-numeric values (e.g. "08:00") become
+ * category positions, like recharts' category axis.
+ */
+function encodeX(values: unknown[]): {
+  xs: Float64Array;
+  categories?: string[];
+} {
+  const xs = new Float64Array(values.length);
+  const isCategorical = values.some(
+    (value) => typeof value === "string" && Number.isNaN(Number(value))
+  );
+  if (!isCategorical) {
+    values.forEach((value, i) => (xs[i] = toNumber(value)));
+    return { xs };
+  }
+  const positions = new Map<string, number>();
+  values.forEach((value, i) => {
+    const category = String(value);
+    if (!positions.has(category)) positions.set(category, positions.size);
+    xs[i] = positions.get(category)!;
+  });
+  return { xs, categories: [...positions.keys()] };
+}
+
+function prepareScatter(
+  data: ScatterSeries[],
+  dataKey: { x: string; y: string }
+): Points {
+  const total = data.reduce((acc, series) => acc + series.data.length, 0);
+  const xValues: unknown[] = new Array(total);
+  const ys = new Float64Array(total);
+  const seriesIndex = new Uint16Array(total);
+  let offset = 0;
+  data.forEach((series, index) => {
+    for (const point of series.data) {
+      xValues[offset] = point[dataKey.x];
+      ys[offset] = toNumber(point[dataKey.y]);
+      seriesIndex[offset] = index;
+      offset++;
+    }
+  });
+  const { xs, categories } = encodeX(xValues);
+  return {
+    xs,
+    ys,
+    seriesIndex,
+    series: data.map(({ name, color }) => ({ name, color })),
+    xCategories: categories,
+  };
+}
+
+function prepareBubble(
+  data: Point[],
+  dataKey: { x: string; y: string; z: string },
+  range: [number, number],
+  color: string,
+  label: string
+): Points {
+  const { xs, categories } = encodeX(data.map((point) => point[dataKey.x]));
+  const ys = new Float64Array(data.length);
+  const zs = new Float64Array(data.length);
+  data.forEach((point, i) => {
+    ys[i] = toNumber(point[dataKey.y]);
+    zs[i] = toNumber(point[dataKey.z]);
+  });
+  // Same semantics as recharts' ZAxis: `range` is the bubble area in px².
+  const [zMin, zMax] = extent(zs) ?? [0, 0];
+  const zSpan = zMax - zMin || 1;
+  const radii = new Float32Array(data.length);
+  zs.forEach((z, i) => {
+    const area = range[0] + ((z - zMin) / zSpan) * (range[1] - range[0]);
+    radii[i] = Math.sqrt(Math.max(area, 0) / Math.PI);
+  });
+  return {
+    xs,
+    ys,
+    zs,
+    radii,
+    seriesIndex: new Uint16Array(data.length),
+    series: [{ name: label, color }],
+    xCategories: categories,
+  };
+}
+
+function prepareBins(bins: DensityBins): Points {
+  const total = bins.series.reduce((acc, s) => acc + s.cells.length, 0);
+  const xs = new Float64Array(total);
+  const ys = new Float64Array(total);
+  const zs = new Float64Array(total);
+  const seriesIndex = new Uint16Array(total);
+  const [ox, oy] = bins.origin;
+  const [sx, sy] = bins.size;
+  const max: number[] = [];
+  let offset = 0;
+  bins.series.forEach((series, index) => {
+    let seriesMax = 0;
+    for (const [hx, hy, count] of series.cells) {
+      xs[offset] = ox + (hx * sx) / 2;
+      ys[offset] = oy + (hy * sy) / 2;
+      zs[offset] = count;
+      seriesIndex[offset] = index;
+      seriesMax = Math.max(seriesMax, count);
+      offset++;
+    }
+    max.push(seriesMax);
+  });
+  return {
+    xs,
+    ys,
+    zs,
+    seriesIndex,
+    series: bins.series.map(({ name, color }) => ({ name, color })),
+    cells: { type: bins.type, size: bins.size, max },
+  };
+}
+
+function extentWithCells(
+  values: Float64Array,
+  halfCell: number
+): [number, number] | undefined {
+  const domain = extent(values);
+  return domain && [domain[0] - halfCell, domain[1] + halfCell];
+}
+
+function withDomains(points: Points): PreparedPoints {
+  const xDomain =
+    (points.cells
+      ? extentWithCells(points.xs, points.cells.size[0] / 2)
+      : undefined) ??
+    (points.xCategories
+      ? [-0.5, points.xCategories.length - 0.5]
+      : extent(points.xs)) ?? [0, 1];
+  const yDomain =
+    (points.cells
+      ? extentWithCells(points.ys, points.cells.size[1] / 2)
+      : extent(points.ys)) ?? [0, 1];
+  return { ...points, xDomain, yDomain };
+}
+
+/** Expands columnar data back into the row objects the charts take. */
+export function expandColumns({ columns, length }: ColumnarData): Point[] {
+  const keys = Object.keys(columns);
+  const rows: Point[] = new Array(length);
+  for (let i = 0; i < length; i++) {
+    const row: Point = {};
+    for (const key of keys) {
+      row[key] = columns[key][i] as Point[string];
+    }
+    rows[i] = row;
+  }
+  return rows;
+}
+
+/** Runs a preparation task; the same code runs in the chart workers. */
+export function runChartTask(task: ChartTask): PreparedPoints {
+  switch (task.type) {
+    case "scatter":
+      return withDomains(prepareScatter(task.data, task.dataKey));
+    case "bubble":
+      return withDomains(
+        prepareBubble(task.data, task.dataKey, task.range, task.color, task.label)
+      );
+    case "bins":
+      return withDomains(prepareBins(task.bins));
+  }
+}
+
+/** Rough count of values a task processes, to decide whether a worker is worth it. */
+export function taskSize(task: ChartTask): number {
+  switch (task.type) {
+    case "scatter":
+      return task.data.reduce((acc, series) => acc + series.data.length, 0);
+    case "bubble":
+      return task.data.length;
+    case "bins":
+      return task.bins.series.reduce((acc, s) => acc + s.cells.length, 0);
+  }
+}
+
+/** Buffers of the typed arrays of a result, moved to the main thread without copying. */
+export function transferables(result: PreparedPoints): ArrayBuffer[] {
+  return [result.xs, result.ys, result.zs, result.radii, result.seriesIndex]
+    .filter((array) => array !== undefined)
+    .map((array) => array.buffer as ArrayBuffer);
+}
@@ -0,0 +1,11 @@
+import { ChartTask, runChartTask, transferables } from "./chart-prep";
+
+self.onmessage = (event: MessageEvent<{ id: number; task: ChartTask }>) => {
+  const { id, task } = event.data;
+  try {
+    const result = runChartTask(task);
+    self.postMessage({ id, result }, { transfer: transferables(result) });
+  } catch (error) {
+    self.postMessage({ id, error: String(error) });
+  }
+};
@@ -0,0 +1,131 @@
+import { useEffect, useMemo, useState } from "react";
+import ChartPrepWorker from "./chart-prep.worker?worker&inline";
+import { ChartTask, runChartTask, taskSize } from "./chart-prep";
+
+// Tasks over fewer values than this run on the main thread, where they cost
+// less than copying them to a worker.
+const WORKER_MIN_SIZE = 20_000;
+const MAX_WORKERS = 4;
+
+interface Slot {
+  worker: Worker;
+  busy: number;
+}
+
+interface Pending {
+  task: ChartTask;
+  slot: Slot;
+  resolve: (result: unknown) => void;
+  reject: (reason: unknown) => void;
+}
+
+/**
+ * Chart workers, started on demand up to `size`. Each task goes to an idle
+ * worker, or the least busy one. When workers cannot run (e.g. a CSP without
+ * `worker-src blob:`), tasks run on the main thread instead.
+ */
+class ChartWorkerPool {
+  private slots: Slot[] = [];
+  private pending = new Map<number, Pending>();
+  private nextId = 0;
+  private disabled = typeof Worker === "undefined";
+
+  constructor(private readonly size: number) {}
+
+  run<T>(task: ChartTask): Promise<T> {
+    const slot = this.disabled ? undefined : this.slot();
+    if (!slot) {
+      return Promise.resolve().then(() => runChartTask(task) as T);
+    }
+    const id = this.nextId++;
+    slot.busy++;
+    return new Promise<T>((resolve, reject) => {
+      this.pending.set(id, { task, slot, resolve: resolve as (result: unknown) => void, reject });
+      slot.worker.postMessage({ id, task });
+    });
+  }
+
+  private slot(): Slot | undefined {
+    const idle = this.slots.find((slot) => slot.busy === 0);
+    if (idle || this.slots.length >= this.size) {
+      return idle ?? this.slots.reduce((a, b) => (a.busy <= b.busy ? a : b));
+    }
+    try {
+      const slot = { worker: new ChartPrepWorker(), busy: 0 };
+      slot.worker.onmessage = (event) => this.settle(event.data);
+      slot.worker.onerror = () => this.fail(slot);
+      this.slots.push(slot);
+      return slot;
+    } catch {
+      this.disabled = true;
+      return undefined;
+    }
+  }
+
+  private settle({ id, result, error }: { id: number; result?: unknown; error?: string }) {
+    const pending = this.pending.get(id);
+    if (!pending) return;
+    this.pending.delete(id);
+    pending.slot.busy--;
+    if (error === undefined) pending.resolve(result);
+    else pending.reject(new Error(error));
+  }
+
+  private fail(slot: Slot) {
+    slot.worker.terminate();
+    this.slots = this.slots.filter((s) => s !== slot);
+    this.disabled = true;
+    for (const [id, pending] of this.pending) {
+      if (pending.slot !== slot) continue;
+      this.pending.delete(id);
+      try {
+        pending.resolve(runChartTask(pending.task));
+      } catch (error) {
+        pending.reject(error);
+      }
+    }
+  }
+}
+
+let pool: ChartWorkerPool | undefined;
+
+function chartWorkers(): ChartWorkerPool {
+  pool ??= new ChartWorkerPool(
+    Math.min(MAX_WORKERS, Math.max((navigator.hardwareConcurrency ?? 2) - 1, 1))
+  );
+  return pool;
+}
+
+/**
+ * Result of a preparation task, computed in a chart worker for large inputs
+ * and inline for small ones or when the worker fails. Undefined until the
+ * first result is ready; while a newer task is being prepared, the previous
+ * result is kept.
+ */
+export function usePreparedChartData<T>(task: ChartTask | undefined): T | undefined {
+  const inline = task !== undefined && taskSize(task) < WORKER_MIN_SIZE;
+  const inlineResult = useMemo(
+    () => (task && inline ? (runChartTask(task) as T) : undefined),
+    [task, inline]
+  );
+  const [prepared, setPrepared] = useState<T>();
+
+  useEffect(() => {
+    if (!task || inline) return;
+    let current = true;
+    chartWorkers()
+      .run<T>(task)
+      .then(
+        (result) => current && setPrepared(() => result),
+        (error) => {
+          console.warn("routelit-mantine: chart worker failed, preparing inline", error);
+          if (current) setPrepared(() => runChartTask(task) as T);
+        }
+      );
+    return () => {
+      current = false;
+    };
+  }, [task, inline]);
+
+  return inline ? inlineResult : prepared;
+}
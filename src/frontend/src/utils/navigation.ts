@@ -0,0 +1,35 @@
+/**
+ * Client-side navigations started by links or history traversal, so that
+ * components can react before the server answers.
+ */
+export interface Navigation {
+  id: number;
+  route: string;
+}
+
+let current: Navigation | null = null;
+const listeners = new Set<() => void>();
+
+/** The cache key of a page: its path and query string. */
+export function routeKey(href: string): string {
+  const url = new URL(href, window.location.href);
+  return url.pathname + url.search;
+}
+
+export function beginNavigation(href: string): void {
+  current = { id: (current?.id ?? 0) + 1, route: routeKey(href) };
+  listeners.forEach((listener) => listener());
+}
+
+export function getNavigation(): Navigation | null {
+  return current;
+}
+
+export function subscribeNavigation(listener: () => void): () => void {
+  listeners.add(listener);
+  return () => listeners.delete(listener);
+}
+
+if (typeof window !== "undefined") {
+  window.addEventListener("popstate", () => beginNavigation(window.location.href));
+}
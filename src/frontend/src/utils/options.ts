@@ -0,0 +1,62 @@
+export type OptionInput =
+  | string
+  | { value: string; label?: string; disabled?: boolean }
+  | { group: string; items: OptionInput[] };
+
+export interface OptionItem {
+  value: string;
+  label: string;
+  disabled?: boolean;
+  group?: string;
+  search: string;
+}
+
+export type OptionRow =
+  | ({ kind: "option" } & OptionItem)
+  | { kind: "group"; label: string };
+
+function isGroup(option: OptionInput): option is { group: string; items: OptionInput[] } {
+  return typeof option === "object" && "group" in option;
+}
+
+/** Flattens a Mantine `data` prop into options carrying their group and lowercase label. */
+export function flattenOptions(data: OptionInput[], group?: string, out: OptionItem[] = []): OptionItem[] {
+  for (const option of data) {
+    if (isGroup(option)) {
+      flattenOptions(option.items, option.group, out);
+    } else if (typeof option === "string") {
+      out.push({ value: option, label: option, group, search: option.toLowerCase() });
+    } else {
+      const label = option.label ?? option.value;
+      out.push({ value: option.value, label, disabled: option.disabled, group, search: label.toLowerCase() });
+    }
+  }
+  return out;
+}
+
+/**
+ * Rows of the options whose label contains `query`, with a header row where
+ * the group changes. Scanning stops after `limit` matches.
+ */
+export function filterOptions(
+  options: OptionItem[],
+  query: string,
+  limit?: number,
+  exclude?: Set<string>
+): OptionRow[] {
+  const needle = query.trim().toLowerCase();
+  const rows: OptionRow[] = [];
+  let matches = 0;
+  let group: string | undefined;
+  for (const option of options) {
+    if (limit !== undefined && matches >= limit) break;
+    if (exclude?.has(option.value) || (needle && !option.search.includes(needle))) continue;
+    if (option.group !== undefined && option.group !== group) {
+      rows.push({ kind: "group", label: option.group });
+    }
+    group = option.group;
+    rows.push({ kind: "option", ...option });
+    matches++;
+  }
+  return rows;
+}
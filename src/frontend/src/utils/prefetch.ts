@@ -0,0 +1,208 @@
+import { useEffect, useRef } from "react";
+import { routeKey, subscribeNavigation } from "./navigation";
+
+export type PrefetchMode = "hover" | "viewport";
+
+const MAX_CONCURRENT = 2;
+// A route prefetched this recently is not requested again.
+const PREFETCH_TTL = 30_000;
+// Links scrolled past quickly are not prefetched: a link must stay visible
+// this long, then the request waits for the browser to be idle.
+const VIEWPORT_DWELL = 500;
+
+interface Job {
+  route: string;
+  href: string;
+  controller: AbortController;
+  waiters: number;
+  started: boolean;
+}
+
+type PrefetchHandler = (names: Set<string>) => void;
+
+const queue: Job[] = [];
+const jobs = new Map<string, Job>();
+const done = new Map<string, number>();
+const handlers = new Set<PrefetchHandler>();
+let running = 0;
+
+/**
+ * Component names of a routelit response: listed by the "prefetch" action of
+ * `routelit_mantine.RouteLit`, or read from the elements of a full render.
+ */
+function collectNames(actions: unknown[], names: Set<string>) {
+  const visit = (element: unknown) => {
+    if (!element || typeof element !== "object") return;
+    const { name, children } = element as { name?: unknown; children?: unknown };
+    if (typeof name === "string") names.add(name);
+    if (Array.isArray(children)) children.forEach(visit);
+  };
+  for (const action of actions) {
+    if (!action || typeof action !== "object") continue;
+    const { type, components, element } = action as { type?: unknown; components?: unknown; element?: unknown };
+    if (type === "prefetch" && Array.isArray(components)) {
+      components.forEach((name) => typeof name === "string" && names.add(name));
+    } else {
+      visit(element);
+    }
+  }
+}
+
+function parseActions(body: string): unknown[] {
+  try {
+    const { actions } = JSON.parse(body) as { actions?: unknown[] };
+    return actions ?? [];
+  } catch {
+    // streamed responses send one JSON action per line
+    return body
+      .split("\n")
+      .filter((line) => line.trim())
+      .flatMap((line) => {
+        try {
+          return [JSON.parse(line)];
+        } catch {
+          return [];
+        }
+      });
+  }
+}
+
+async function run(job: Job) {
+  job.started = true;
+  running++;
+  try {
+    const response = await fetch(job.href, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ uiEvent: { type: "prefetch", componentId: "", data: {} } }),
+      signal: job.controller.signal,
+    });
+    if (!response.ok) return;
+    const names = new Set<string>();
+    collectNames(parseActions(await response.text()), names);
+    done.set(job.route, Date.now());
+    handlers.forEach((handler) => handler(names));
+  } catch {
+    // aborted or offline: the navigation itself will fetch the page
+  } finally {
+    running--;
+    if (jobs.get(job.route) === job) jobs.delete(job.route);
+    next();
+  }
+}
+
+function next() {
+  while (running < MAX_CONCURRENT && queue.length) {
+    run(queue.shift()!);
+  }
+}
+
+// A request already sent is left to complete, so the server's work is used.
+function release(job: Job) {
+  if (--job.waiters > 0 || job.started || jobs.get(job.route) !== job) return;
+  jobs.delete(job.route);
+  queue.splice(queue.indexOf(job), 1);
+}
+
+/**
+ * Requests the page at `href` ahead of navigation, at most `MAX_CONCURRENT`
+ * at a time. The returned function cancels the request if it is still queued
+ * and no other caller waits for it.
+ */
+export function prefetchRoute(href: string): () => void {
+  const route = routeKey(href);
+  const fetchedAt = done.get(route);
+  if (route === routeKey(window.location.href) || (fetchedAt && Date.now() - fetchedAt < PREFETCH_TTL)) {
+    return () => {};
+  }
+  let job = jobs.get(route);
+  if (!job) {
+    job = { route, href, controller: new AbortController(), waiters: 0, started: false };
+    jobs.set(route, job);
+    queue.push(job);
+  }
+  job.waiters++;
+  const current = job;
+  let released = false;
+  next();
+  return () => {
+    if (released) return;
+    released = true;
+    release(current);
+  };
+}
+
+/** Calls `handler` with the element names of every prefetched page. */
+export function onPrefetch(handler: PrefetchHandler): () => void {
+  handlers.add(handler);
+  return () => handlers.delete(handler);
+}
+
+// Leave the connections to the navigation request.
+subscribeNavigation(() => {
+  for (const job of jobs.values()) job.controller.abort();
+  jobs.clear();
+  queue.length = 0;
+});
+
+function whenIdle(callback: () => void): () => void {
+  if (typeof requestIdleCallback === "function") {
+    const handle = requestIdleCallback(callback, { timeout: 2_000 });
+    return () => cancelIdleCallback(handle);
+  }
+  const handle = setTimeout(callback, 0);
+  return () => clearTimeout(handle);
+}
+
+/**
+ * Prefetches `href` while the link is hovered or focused ("hover"), or once
+ * it has stayed in the viewport for `VIEWPORT_DWELL` ms and the browser is
+ * idle ("viewport"). Returns the ref and the handlers to attach to the link.
+ */
+export function usePrefetch<T extends HTMLElement>(href: string, mode: PrefetchMode | undefined) {
+  const ref = useRef<T>(null);
+  const cancel = useRef<(() => void) | null>(null);
+
+  const start = () => {
+    if (mode && !cancel.current) cancel.current = prefetchRoute(href);
+  };
+  const stop = () => {
+    cancel.current?.();
+    cancel.current = null;
+  };
+
+  useEffect(() => {
+    const element = ref.current;
+    if (mode !== "viewport" || !element || typeof IntersectionObserver === "undefined") return;
+    let timer: ReturnType<typeof setTimeout> | undefined;
+    let cancelIdle: (() => void) | undefined;
+    const leave = () => {
+      clearTimeout(timer);
+      timer = undefined;
+      cancelIdle?.();
+      cancelIdle = undefined;
+      cancel.current?.();
+      cancel.current = null;
+    };
+    const observer = new IntersectionObserver(([entry]) => {
+      if (!entry.isIntersecting) return leave();
+      if (cancel.current || cancelIdle || timer !== undefined) return;
+      timer = setTimeout(() => {
+        timer = undefined;
+        cancelIdle = whenIdle(() => {
+          cancelIdle = undefined;
+          cancel.current ??= prefetchRoute(href);
+        });
+      }, VIEWPORT_DWELL);
+    });
+    observer.observe(element);
+    return () => {
+      observer.disconnect();
+      leave();
+    };
+  }, [href, mode]);
+
+  return mode === "hover"
+    ? { ref, onMouseEnter: start, onMouseLeave: stop, onFocus: start, onBlur: stop }
+    : { ref };
+}
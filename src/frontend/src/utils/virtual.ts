@@ -0,0 +1,72 @@
+/**
+ * Item offsets of a virtualized list whose items have an estimated size
+ * until they are measured.
+ */
+export class ItemOffsets {
+  private sizes = new Map<number, number>();
+  private offsets = new Float64Array(1);
+  private dirty = true;
+
+  constructor(
+    private count: number,
+    private estimate: number,
+    private gap: number
+  ) {}
+
+  configure(count: number, estimate: number, gap: number): void {
+    if (count !== this.count || estimate !== this.estimate || gap !== this.gap) {
+      this.count = count;
+      this.estimate = estimate;
+      this.gap = gap;
+      this.dirty = true;
+    }
+  }
+
+  /** Records a measured size; returns whether it changed the layout. */
+  measure(index: number, size: number): boolean {
+    if (this.sizes.get(index) === size) return false;
+    this.sizes.set(index, size);
+    this.dirty = true;
+    return true;
+  }
+
+  private update(): Float64Array {
+    if (this.dirty) {
+      const offsets = new Float64Array(this.count + 1);
+      for (let i = 0; i < this.count; i++) {
+        offsets[i + 1] = offsets[i] + (this.sizes.get(i) ?? this.estimate) + this.gap;
+      }
+      this.offsets = offsets;
+      this.dirty = false;
+    }
+    return this.offsets;
+  }
+
+  offset(index: number): number {
+    return this.update()[Math.min(Math.max(index, 0), this.count)];
+  }
+
+  total(): number {
+    return Math.max(this.offset(this.count) - (this.count > 0 ? this.gap : 0), 0);
+  }
+
+  /** The first item ending after `position`, by binary search. */
+  indexAt(position: number): number {
+    const offsets = this.update();
+    let lo = 0;
+    let hi = this.count;
+    while (lo < hi) {
+      const mid = (lo + hi) >>> 1;
+      if (offsets[mid + 1] <= position) lo = mid + 1;
+      else hi = mid;
+    }
+    return lo;
+  }
+
+  /** Items intersecting `[scrollTop, scrollTop + height)`, widened by `overscan` on each side. */
+  range(scrollTop: number, height: number, overscan: number): [number, number] {
+    const start = this.indexAt(scrollTop);
+    const end = Math.min(this.indexAt(scrollTop + height) + 1, this.count);
+    return [Math.max(start - overscan, 0), Math.min(end + overscan, this.count)];
+  }
+}
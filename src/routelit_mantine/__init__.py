@@ -1,4 +1,18 @@
+from .app import RouteLit
 from .builder import RLBuilder
+from .pagination import Page, PageSource
+from .parallel import uses_session_state
+from .state import session_state_summary
+from .timeseries import resample
 from .utils import create_drawer_decorator
 
-__all__ = ["RLBuilder", "create_drawer_decorator"]
+__all__ = [
+    "Page",
+    "PageSource",
+    "RLBuilder",
+    "RouteLit",
+    "create_drawer_decorator",
+    "resample",
+    "session_state_summary",
+    "uses_session_state",
+]
@@ -0,0 +1,112 @@
+import copy
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field
+from typing import Any, Literal, Optional
+
+import routelit
+from routelit import PropertyDict, RouteLitElement, RouteLitRequest
+from routelit.domain import Action, ActionGenerator, ActionsResponse, ViewFn
+from routelit.exceptions import EmptyReturnException, RerunException, StopException
+
+from .builder import RLBuilder
+
+
+@dataclass
+class PrefetchAction(Action):
+    """
+    The names of the components a prefetched page uses, sent instead of its elements.
+    """
+
+    components: list[str] = field(default_factory=list)
+    type: Literal["prefetch"] = "prefetch"
+
+
+def _is_prefetch(request: RouteLitRequest) -> bool:
+    event = request.ui_event
+    return event is not None and event.get("type") == "prefetch"
+
+
+def _element_names(element: RouteLitElement) -> Iterator[str]:
+    yield element.name
+    for child in element.get_children():
+        yield from _element_names(child)
+
+
+class RouteLit(routelit.RouteLit[RLBuilder]):
+    """
+    `routelit.RouteLit` that answers the prefetch requests sent by links with `prefetch` set.
+
+    The view runs against a copy of the session state and the session is left untouched: neither its state, UI tree
+    nor fragment arguments are stored. The response only lists the names of the components the page uses, so that
+    the browser can load their styles ahead of navigation.
+
+    Example:
+    ```python
+    from routelit_mantine import RLBuilder, RouteLit
+
+    rl = RouteLit(BuilderClass=RLBuilder)
+    ```
+    """
+
+    def handle_prefetch_request(
+        self,
+        view_fn: ViewFn,
+        request: RouteLitRequest,
+        inject_builder: Optional[bool] = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> PrefetchAction:
+        """
+        Run `view_fn` for a prefetch request without touching the session.
+
+        Returns:
+            PrefetchAction: The sorted names of the components rendered by the view.
+        """
+        inject_builder = self.inject_builder if inject_builder is None else inject_builder
+        session_keys = request.get_session_keys()
+        # fragments store their arguments while the view runs
+        fragment_params = self.session_storage.get(session_keys.fragment_params_key)
+        builder = self.BuilderClass(
+            request,
+            session_state=PropertyDict(copy.deepcopy(self.session_storage.get(session_keys.state_key, {}))),
+            fragments=dict(self.session_storage.get(session_keys.fragment_addresses_key, {})),
+        )
+        new_args = (builder, *args) if inject_builder else args
+        try:
+            with self._set_builder_context(builder):
+                view_fn(*new_args, **kwargs)
+        except (RerunException, StopException, EmptyReturnException):
+            pass  # the components rendered so far are enough to warm styles
+        finally:
+            if fragment_params is None:
+                self.session_storage.pop(session_keys.fragment_params_key, None)
+            else:
+                self.session_storage[session_keys.fragment_params_key] = fragment_params
+        return PrefetchAction(address=None, target="app", components=sorted(set(_element_names(builder.root_element))))
+
+    def handle_post_request(
+        self,
+        view_fn: ViewFn,
+        request: RouteLitRequest,
+        inject_builder: Optional[bool] = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        if _is_prefetch(request):
+            action = self.handle_prefetch_request(view_fn, request, inject_builder, *args, **kwargs)
+            return asdict(ActionsResponse(actions=[action], target="app"))
+        return super().handle_post_request(view_fn, request, inject_builder, *args, **kwargs)
+
+    async def handle_post_request_async_stream(
+        self,
+        view_fn: ViewFn,
+        request: RouteLitRequest,
+        inject_builder: Optional[bool] = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> ActionGenerator:
+        if _is_prefetch(request):
+            yield self.handle_prefetch_request(view_fn, request, inject_builder, *args, **kwargs)
+            return
+        async for action in super().handle_post_request_async_stream(view_fn, request, inject_builder, *args, **kwargs):
+            yield action
@@ -0,0 +1,176 @@
+import math
+from collections import Counter
+from collections.abc import Mapping, Sequence
+from typing import Any, Literal, Optional, TypedDict
+
+from .lazy import LazyModule
+
+np: Any = LazyModule("numpy")
+
+BinKind = Literal["hex", "grid"]
+
+
+class DensitySeries(TypedDict):
+    """
+    The non-empty cells of one scatter series.
+    """
+
+    name: str
+    color: str
+    cells: list[list[int]]
+
+
+class DensityBins(TypedDict):
+    """
+    Binned scatter data sent to the client instead of the raw points.
+
+    Cell centers are stored in half-cell units: a cell `[hx, hy, count]` is centered at
+    `origin[0] + hx * size[0] / 2`, `origin[1] + hy * size[1] / 2`.
+    """
+
+    type: BinKind
+    origin: tuple[float, float]
+    size: tuple[float, float]
+    series: list[DensitySeries]
+
+
+class BinRangeError(ValueError):
+    def __init__(self, axis: str, bounds: tuple[float, float]) -> None:
+        super().__init__(f"bin_points needs a finite {axis}_range with low <= high, got {bounds!r}")
+
+
+def _columns(series_data: Any, x_key: str, y_key: str) -> tuple[Any, Any]:
+    if isinstance(series_data, Mapping):
+        return series_data[x_key], series_data[y_key]
+    return [p[x_key] for p in series_data], [p[y_key] for p in series_data]
+
+
+def _extent(columns: Sequence[Any]) -> tuple[float, float]:
+    lo, hi = math.inf, -math.inf
+    for column in columns:
+        if len(column) == 0:
+            continue
+        if np:
+            arr = np.asarray(column, dtype=float)
+            arr = arr[np.isfinite(arr)]
+            if arr.size:
+                lo, hi = min(lo, float(arr.min())), max(hi, float(arr.max()))
+        else:
+            values = [v for v in column if v is not None and math.isfinite(v)]
+            if values:
+                lo, hi = min(lo, min(values)), max(hi, max(values))
+    if lo > hi:
+        return 0.0, 1.0
+    return _widen(lo, hi)
+
+
+def _widen(lo: float, hi: float) -> tuple[float, float]:
+    """
+    A range of non-zero width, centered on a single value.
+    """
+    return (lo, hi) if hi > lo else (lo - 0.5, hi + 0.5)
+
+
+def _range(axis: str, bounds: tuple[float, float]) -> tuple[float, float]:
+    lo, hi = float(bounds[0]), float(bounds[1])
+    if not (math.isfinite(lo) and math.isfinite(hi)) or lo > hi:
+        raise BinRangeError(axis, bounds)
+    return _widen(lo, hi)
+
+
+def _count_numpy(xs: Any, ys: Any, kind: BinKind, nx: int, ny: int) -> list[list[int]]:
+    x = np.asarray(xs, dtype=float)
+    y = np.asarray(ys, dtype=float)
+    # None becomes NaN; points outside the range are dropped rather than counted in edge cells
+    keep = (x >= 0) & (x <= nx) & (y >= 0) & (y <= ny)
+    x, y = x[keep], y[keep]
+    if kind == "grid":
+        hx = 2 * np.clip(np.floor(x), 0, nx - 1).astype(np.int64) + 1
+        hy = 2 * np.clip(np.floor(y), 0, ny - 1).astype(np.int64) + 1
+    else:
+        ix1, iy1 = np.rint(x), np.rint(y)
+        ix2, iy2 = np.floor(x), np.floor(y)
+        d1 = (x - ix1) ** 2 + 3.0 * (y - iy1) ** 2
+        d2 = (x - ix2 - 0.5) ** 2 + 3.0 * (y - iy2 - 0.5) ** 2
+        first = d1 < d2
+        hx = np.where(first, 2 * ix1, 2 * ix2 + 1).astype(np.int64)
+        hy = np.where(first, 2 * iy1, 2 * iy2 + 1).astype(np.int64)
+    width = 2 * nx + 2
+    codes, counts = np.unique(hy * width + hx, return_counts=True)
+    return np.stack([codes % width, codes // width, counts], axis=1).tolist()  # type: ignore[no-any-return]
+
+
+def _count_python(
+    xs: Sequence[Optional[float]], ys: Sequence[Optional[float]], kind: BinKind, nx: int, ny: int
+) -> list[list[int]]:
+    counter: Counter[tuple[int, int]] = Counter()
+    for x, y in zip(xs, ys):
+        if x is None or y is None or not (0 <= x <= nx and 0 <= y <= ny):
+            continue
+        if kind == "grid":
+            counter[2 * min(max(math.floor(x), 0), nx - 1) + 1, 2 * min(max(math.floor(y), 0), ny - 1) + 1] += 1
+            continue
+        ix1, iy1 = round(x), round(y)
+        ix2, iy2 = math.floor(x), math.floor(y)
+        if (x - ix1) ** 2 + 3.0 * (y - iy1) ** 2 < (x - ix2 - 0.5) ** 2 + 3.0 * (y - iy2 - 0.5) ** 2:
+            counter[2 * ix1, 2 * iy1] += 1
+        else:
+            counter[2 * ix2 + 1, 2 * iy2 + 1] += 1
+    return [[hx, hy, count] for (hx, hy), count in sorted(counter.items(), key=lambda item: (item[0][1], item[0][0]))]
+
+
+def bin_points(
+    data: list[dict[str, Any]],
+    data_key: Mapping[str, str],
+    kind: BinKind = "hex",
+    bins: int = 50,
+    x_range: Optional[tuple[float, float]] = None,
+    y_range: Optional[tuple[float, float]] = None,
+) -> DensityBins:
+    """
+    Aggregate scatter series into 2D bins, keeping only non-empty cells.
+
+    Uses NumPy when it is installed and falls back to a pure Python counter otherwise.
+    The hexagonal layout follows matplotlib's `hexbin`: `bins` hexagons across the x axis and
+    `bins / sqrt(3)` rows, so the hexagons look regular on a roughly square plot.
+
+    Args:
+        data (list[dict[str, Any]]): Scatter series (`{"name", "color", "data"}`), where `data` is a list of
+            points or a mapping of columns (e.g. NumPy arrays) keyed by `data_key` values.
+        data_key (Mapping[str, str]): Mapping for x/y keys.
+        kind (Literal["hex", "grid"]): Bin shape.
+        bins (int): Number of bins along the x axis.
+        x_range (Optional[tuple[float, float]]): X extent, computed from the data if not set. Points outside
+            the ranges are dropped, as are points with a missing or non-finite coordinate. A range of zero width
+            is widened by 0.5 on each side.
+        y_range (Optional[tuple[float, float]]): Y extent, computed from the data if not set.
+
+    Returns:
+        DensityBins: Bin geometry and the non-empty cells of each series.
+
+    Raises:
+        BinRangeError: If a range is not finite or its low bound exceeds its high bound.
+    """
+    x_key, y_key = data_key["x"], data_key["y"]
+    columns = [_columns(series.get("data", []), x_key, y_key) for series in data]
+    x0, x1 = _range("x", x_range) if x_range is not None else _extent([xs for xs, _ in columns])
+    y0, y1 = _range("y", y_range) if y_range is not None else _extent([ys for _, ys in columns])
+    nx = max(1, bins)
+    ny = max(1, nx if kind == "grid" else int(nx / math.sqrt(3)))
+    sx, sy = (x1 - x0) / nx, (y1 - y0) / ny
+    series: list[DensitySeries] = []
+    for source, (xs, ys) in zip(data, columns):
+        if np:
+            cells = _count_numpy(
+                (np.asarray(xs, dtype=float) - x0) / sx, (np.asarray(ys, dtype=float) - y0) / sy, kind, nx, ny
+            )
+        else:
+            cells = _count_python(
+                [None if x is None else (x - x0) / sx for x in xs],
+                [None if y is None else (y - y0) / sy for y in ys],
+                kind,
+                nx,
+                ny,
+            )
+        series.append({"name": source.get("name", ""), "color": source.get("color", "blue"), "cells": cells})
+    return {"type": kind, "origin": (x0, y0), "size": (sx, sy), "series": series}
@@ -1,7 +1,45 @@
-import datetime
-from typing import Any, Callable, ClassVar, Literal, Optional, TypedDict, Union, cast
+import contextlib
+import copy
+import functools
+import threading
+from collections.abc import Hashable, Iterable, Iterator, Sequence
+from concurrent.futures import wait
+from typing import Any, Callable, ClassVar, Literal, Optional, TypedDict, TypeVar, Union, cast
 
-from routelit import AssetTarget, RLOption, RouteLitBuilder, RouteLitElement
+from routelit import AssetTarget, RLOption, RouteLitBuilder, RouteLitElement, RouteLitEvent
+
+from .cache import LRUCache, fingerprint
+from .dates import DateAvailability as DateAvailability
+from .mixins.charts import ChartsMixin
+from .mixins.dates import DatesMixin
+from .mixins.overlays import OverlaysMixin
+from .mixins.tables import TablesMixin
+from .pagination import Page, PageSource, PrefetchToken, SequenceSource, prefetch_page, take_prefetched
+from .parallel import in_worker, is_serial, submit
+from .state import session_state_registry, track_widget_state
+
+_MEMO_SUBTREES_KEY = "__memo_subtrees"
+_MEMO_STATS_KEY = "__memo_stats"
+_static_subtrees: LRUCache[tuple[str, Hashable], tuple[RouteLitElement, ...]] = LRUCache(128)
+_static_subtrees_lock = threading.Lock()
+_WIDGET_COMPANION_KEYS = ("__{}_default", "__availability_month_{}", "__paginated_{}", "__virtual_range_{}")
+
+T = TypeVar("T")
+
+
+class DuplicateItemKeyError(ValueError):
+    def __init__(self, key: Hashable) -> None:
+        super().__init__(f"Duplicate item key {key!r} in ui.each")
+
+
+class StaticWidgetError(TypeError):
+    def __init__(self, key: str, block: str) -> None:
+        super().__init__(f"Widget {key!r} inside static block {block!r} would share its value across sessions")
+
+
+class VirtualListCountError(TypeError):
+    def __init__(self) -> None:
+        super().__init__("virtual_list needs count when render_item is set")
 
 
 class GroupOption(TypedDict):
@@ -13,6 +51,24 @@ class GroupOption(TypedDict):
     items: list[str]
 
 
+def _replay_elements(builder: RouteLitBuilder, elements: Sequence[RouteLitElement], copy_props: bool = False) -> None:
+    """
+    Append copies of a previously built subtree, so that its addresses and diff actions match the current run.
+    With `copy_props`, the props are copied too, for subtrees shared with other sessions.
+    """
+    for element in elements:
+        replayed = RouteLitElement(
+            name=element.name,
+            props=copy.deepcopy(element.props) if copy_props else element.props,
+            key=element.key,
+            address=builder._get_next_address() if element.name == "fragment" else None,
+            virtual=element.virtual,
+        )
+        builder._append_element(replayed)
+        if element.children:
+            _replay_elements(builder._build_nested_builder(replayed), element.children, copy_props)
+
+
 class MTTab(TypedDict, total=False):
     """
     A tab for a tablist.
@@ -30,10 +86,12 @@ class MTTab(TypedDict, total=False):
     rightSection: Optional[RouteLitElement]  # For internal use
 
 
-class RLBuilder(RouteLitBuilder):
+class RLBuilder(ChartsMixin, DatesMixin, OverlaysMixin, TablesMixin, RouteLitBuilder):
     """
     A builder for a RouteLit application.
     This Builder template serves as example on how to create a RouteLit custom components.
+
+    Chart, date, table and overlay methods are defined in `routelit_mantine.mixins`.
     """
 
     static_assets_targets: ClassVar[list[AssetTarget]] = [
@@ -42,6 +100,343 @@ class RLBuilder(RouteLitBuilder):
             "path": "static",
         }
     ]
+    chart_data_cache_size: ClassVar[int] = 32
+    """
+    Number of chart datasets per session the client is assumed to keep.
+    Charts whose data is unchanged since it was last sent receive only its hash. Set to 0 to always send the data.
+    """
+    chart_columnar_min_rows: ClassVar[Optional[int]] = None
+    """
+    Row count from which chart rows sharing the same scalar keys are sent column by column, a smaller payload the
+    browser expands back into rows. Rows are always sent if not set.
+    """
+    widget_state_max_idle_runs: ClassVar[Optional[int]] = None
+    """
+    Drop the session value of a widget after it has not rendered for this many runs, e.g. the inputs of a closed
+    drawer or an old tab. Values are kept forever if not set.
+    """
+    widget_state_max_bytes: ClassVar[Optional[int]] = None
+    """
+    Cap on the widget values of a session, in pickled bytes. The values of the least recently rendered widgets are
+    dropped first. Unbounded if not set.
+    """
+    widget_state_metrics: ClassVar[bool] = False
+    """
+    Record the widget-state bytes of each session for `routelit_mantine.session_state_summary` even without limits.
+    """
+    availability_cache_size: ClassVar[int] = 256
+    """
+    Number of (resource, month) results of date picker `availability_loader` callables kept in the process.
+    """
+    memo_cache_size: ClassVar[int] = 64
+    """
+    Number of `memo` subtrees kept per session.
+    """
+    static_cache_size: ClassVar[int] = 128
+    """
+    Number of (key, variant) `static` subtrees kept in the process.
+    """
+    parallel_workers: ClassVar[int] = 8
+    """
+    Threads of the process-wide pool used by `parallel`, fixed when the pool is first used.
+    """
+    route_cache_size: ClassVar[int] = 16
+    """
+    Number of recently visited pages the browser keeps to show instantly on `nav_link` and `anchor` navigation,
+    until the server's update for the page arrives. Set to 0 to disable.
+    """
+    route_cache_ttl: ClassVar[float] = 300
+    """
+    Seconds a page kept by the browser may still be shown on navigation.
+    """
+    paginated_cache_pages: ClassVar[int] = 8
+    """
+    Number of pages of each `paginated` source kept per session. Pages of sequences are sliced on each run instead.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        parent = kwargs.get("parent_builder")
+        # data fingerprints computed during this run, shared with nested builders
+        self._data_fingerprints: dict[int, tuple[Any, str]] = (
+            parent._data_fingerprints if isinstance(parent, RLBuilder) else {}
+        )
+        # keys of the elements rendered during this run, shared with nested builders
+        self._rendered_keys: set[str] = parent._rendered_keys if isinstance(parent, RLBuilder) else set()
+        # guards the session caches of this run, which fragments run by `parallel` share
+        self._session_lock: threading.RLock = (
+            parent._session_lock if isinstance(parent, RLBuilder) else threading.RLock()
+        )
+        # key of the `static` block being built through this builder, inherited by the builders nested in it
+        self._static_block: Optional[str] = parent._static_block if isinstance(parent, RLBuilder) else None
+        # set once the widget state of this run is accounted, as the streaming handler ends a run twice
+        self._run_ended = False
+        super().__init__(*args, **kwargs)
+
+    def _maybe_get_event(self, component_id: str) -> Optional[RouteLitEvent]:
+        if self._static_block is not None:
+            raise StaticWidgetError(component_id, self._static_block)
+        return super()._maybe_get_event(component_id)
+
+    def _append_element(self, element: RouteLitElement) -> None:
+        self._rendered_keys.add(element.key)
+        super()._append_element(element)
+
+    def on_end(self) -> None:
+        super().on_end()
+        if self.parent_builder is not None or self.initial_fragment_id is not None:
+            return  # fragment runs only render part of the page
+        if self.should_rerun_event and self.should_rerun_event.is_set():
+            return
+        if self.is_prefetch:
+            return  # the session of a prefetch run is not stored
+        if self._run_ended:
+            return
+        self._run_ended = True
+        if (
+            self.widget_state_max_idle_runs is None
+            and self.widget_state_max_bytes is None
+            and not self.widget_state_metrics
+        ):
+            return
+        nbytes = track_widget_state(
+            self.session_state,
+            self._rendered_keys,
+            max_idle_runs=self.widget_state_max_idle_runs,
+            max_bytes=self.widget_state_max_bytes,
+            companions=_WIDGET_COMPANION_KEYS,
+        )
+        session_id = self.request.get_session_id()
+        page_key = self.request.get_session_keys().state_key
+        event = self.request.ui_event
+        if event and event["type"] == "navigate":
+            # routelit cleared the state of the page navigated from
+            prev_page_key = self.request.get_session_keys(use_referer=True).state_key
+            if prev_page_key != page_key:
+                session_state_registry.discard(session_id, prev_page_key)
+        session_state_registry.record(session_id, page_key, nbytes)
+
+    @contextlib.contextmanager
+    def memo(self, key: str, deps: Any = ()) -> Iterator[bool]:
+        """
+        Reuse the elements built by a block while its dependencies are unchanged.
+
+        The context yields whether a stored subtree matching `deps` was found. In that case it has already been
+        added to the page and the block should skip building it. Otherwise the elements built inside the block are
+        stored for later runs of the session. Widgets inside a memoized block do not process events on hits,
+        so keep them outside or include their values in `deps`.
+
+        Args:
+            key (str): The key of the memoized block, unique within the page.
+            deps (Any): The values the block depends on. Compared by content, so they must be JSON-like
+                or have a stable `repr`.
+
+        Returns:
+            Iterator[bool]: Whether the stored subtree was reused.
+
+        Example:
+        ```python
+        with ui.memo("products", deps=(category, page)) as cached:
+            if not cached:
+                for product in load_products(category, page):
+                    ui.card(...)
+        ```
+        """
+        digest = fingerprint(deps)
+        with self._session_lock:
+            subtrees = self._session_lru(_MEMO_SUBTREES_KEY, self.memo_cache_size)
+            stats = self.session_state.get(_MEMO_STATS_KEY)
+            if stats is None:
+                stats = {"hits": 0, "misses": 0}
+                self.session_state[_MEMO_STATS_KEY] = stats
+            stored = subtrees.get(key)
+            is_hit = stored is not None and stored[0] == digest
+            stats["hits" if is_hit else "misses"] += 1
+        element = self._create_element(name="memo", key=key, virtual=True)
+        builder = self._build_nested_builder(element)
+        if stored is not None and is_hit:
+            _replay_elements(builder, stored[1])
+            yield True
+            return
+        with builder:
+            yield False
+        if not (self.should_rerun_event and self.should_rerun_event.is_set()):
+            with self._session_lock:
+                subtrees[key] = (digest, element.get_children())
+
+    def _session_lru(self, key: str, maxsize: int) -> LRUCache[Any, Any]:
+        """
+        The LRU cache stored in the session state at `key`, replaced by an empty one if missing or resized.
+        """
+        with self._session_lock:
+            cache = self.session_state.get(key)
+            if not isinstance(cache, LRUCache) or cache.maxsize != maxsize:
+                cache = LRUCache[Any, Any](maxsize)
+                self.session_state[key] = cache
+            return cache
+
+    @contextlib.contextmanager
+    def static(self, key: str, variant: Optional[Hashable] = None) -> Iterator[bool]:
+        """
+        Build a block once per process and reuse it in every session, e.g. navigation, footers or help panels.
+
+        Works like `memo`, but the stored elements are shared by all sessions and only dropped by
+        `RLBuilder.clear_static_cache`. The block must not depend on session data other than `variant`, and
+        widgets inside it raise `StaticWidgetError`, as their value would be shared too. Each session gets its own
+        copy of the stored elements.
+
+        Args:
+            key (str): The key of the static block, unique within the page.
+            variant (Optional[Hashable]): A version of the block, e.g. a locale or a role.
+
+        Returns:
+            Iterator[bool]: Whether the stored subtree was reused.
+
+        Example:
+        ```python
+        with ui.sidebar.static("nav", variant=locale) as cached:
+            if not cached:
+                ui.sidebar.nav_link("/", label=translate("Home", locale))
+        ```
+        """
+        cache_key = (key, variant)
+        with _static_subtrees_lock:
+            _static_subtrees.maxsize = self.static_cache_size
+            stored = _static_subtrees.get(cache_key)
+        element = self._create_element(name="memo", key=key, virtual=True)
+        builder = self._build_nested_builder(element)
+        if stored is not None:
+            _replay_elements(builder, stored, copy_props=True)
+            yield True
+            return
+        outer_block, self._static_block = self._static_block, key
+        try:
+            with builder:
+                yield False
+        finally:
+            self._static_block = outer_block
+        if not (self.should_rerun_event and self.should_rerun_event.is_set()):
+            # a snapshot, so that this session changing its elements later does not leak into others
+            subtree = copy.deepcopy(tuple(element.get_children()))
+            with _static_subtrees_lock:
+                _static_subtrees[cache_key] = subtree
+
+    @classmethod
+    def clear_static_cache(cls, key: Optional[str] = None) -> None:
+        """
+        Drop stored `static` blocks, e.g. after the navigation changed.
+
+        Args:
+            key (Optional[str]): Only drop the variants of this block; all blocks if not set.
+        """
+        with _static_subtrees_lock:
+            if key is None:
+                _static_subtrees.clear()
+                return
+            for cache_key in [k for k in _static_subtrees if k[0] == key]:
+                _static_subtrees.pop(cache_key)
+
+    def each(
+        self,
+        items: Iterable[T],
+        key: Callable[[T], Hashable],
+        *,
+        prefix: Optional[str] = None,
+    ) -> Iterator[tuple[T, "RLBuilder"]]:
+        """
+        Render a list with one keyed row per item.
+
+        Each row is built in its own builder whose key comes from `key(item)`, so the elements of a row keep their
+        keys when items are inserted, removed or reordered, and only the affected rows are sent to the client.
+
+        Args:
+            items (Iterable[T]): The items to render.
+            key (Callable[[T], Hashable]): Returns the stable, unique key of an item, e.g. its id.
+            prefix (Optional[str]): The key prefix of the rows; generated if not set.
+
+        Returns:
+            Iterator[tuple[T, RLBuilder]]: Each item with the builder of its row.
+
+        Example:
+        ```python
+        with ui.stack():
+            for todo, row in ui.each(todos, key=lambda todo: todo.id):
+                row.checkbox(todo.title, value=todo.done)
+        ```
+        """
+        prefix = prefix or self._new_text_id("each")
+        seen: set[Hashable] = set()
+        for item in items:
+            item_key = key(item)
+            if item_key in seen:
+                raise DuplicateItemKeyError(item_key)
+            seen.add(item_key)
+            element = self._create_element(name="eachitem", key=f"{prefix}_{item_key}", virtual=True)
+            yield item, cast(RLBuilder, self._build_nested_builder(element))
+
+    def parallel(self, *fragments: Callable[["RLBuilder"], Any]) -> list[Any]:
+        """
+        Run independent fragments concurrently, e.g. blocks waiting on different APIs or databases.
+
+        Each fragment receives its own builder and runs on a bounded thread pool; their elements are placed in the
+        order the fragments are given. Fragments must take the builder as their first argument and should not use
+        `rl.ui`. Fragments marked with `routelit_mantine.uses_session_state` run one after another on the calling
+        thread once the others have finished. The session state kept by `memo`, charts, date pickers,
+        `paginated` and `virtual_list` is locked; other session state needs the marker.
+
+        Args:
+            fragments (Callable[[RLBuilder], Any]): The fragments or plain functions to run.
+
+        Returns:
+            list[Any]: The return values of the fragments, in order.
+
+        Example:
+        ```python
+        @rl.fragment("orders")
+        def orders(ui: RLBuilder) -> None:
+            ui.table(load_orders())
+
+        @rl.fragment("stock")
+        def stock(ui: RLBuilder) -> None:
+            ui.bar_chart(load_stock(), "item", [{"name": "count"}])
+
+        ui.parallel(orders, stock)
+        ```
+        """
+        # `rl.fragment` may lose the stored arguments of a fragment registering at the same time, which are empty
+        # here as fragments only receive their builder
+        tasks = []
+        for fragment in fragments:
+            element = self._create_element(name="slot", key=self._new_text_id("slot"), virtual=True)
+            tasks.append(functools.partial(fragment, cast(RLBuilder, self._build_nested_builder(element))))
+        if in_worker():
+            # waiting on the pool from one of its threads could deadlock
+            return [task() for task in tasks]
+        futures = {
+            i: submit(task, self.parallel_workers) for i, task in enumerate(tasks) if not is_serial(fragments[i])
+        }
+        wait(futures.values())
+        results: list[Any] = [None] * len(tasks)
+        for i, future in futures.items():
+            results[i] = future.result()
+        # fragments using the session state run once no other fragment can touch it
+        for i, task in enumerate(tasks):
+            if i not in futures:
+                results[i] = task()
+        return results
+
+    @property
+    def memo_stats(self) -> dict[str, int]:
+        """
+        Hits, misses and stored subtrees of `memo` blocks in the current session.
+        """
+        with self._session_lock:
+            stats = dict(self.session_state.get(_MEMO_STATS_KEY, {}))
+            subtrees = self.session_state.get(_MEMO_SUBTREES_KEY)
+        return {
+            "hits": stats.get("hits", 0),
+            "misses": stats.get("misses", 0),
+            "size": len(subtrees) if isinstance(subtrees, LRUCache) else 0,
+        }
 
     def _init_root(self) -> "RLBuilder":
         new_element = self._create_element(
@@ -79,7 +474,7 @@ class RLBuilder(RouteLitBuilder):
         new_element = self._create_element(
             name="main",
             key="__main__",
-            props={},
+            props={"routeCacheSize": self.route_cache_size, "routeCacheTtl": self.route_cache_ttl},
             virtual=True,
         )
         return cast(RLBuilder, self._build_nested_builder(new_element))
@@ -133,6 +528,37 @@ class RLBuilder(RouteLitBuilder):
         if default_opened_navbar is not None:
             self._app_shell.root_element.props["defaultOpenedNavbar"] = default_opened_navbar
 
+    def set_route_cacheable(self, cacheable: bool = True) -> None:
+        """
+        Set whether the browser may keep this page to show it instantly when navigating back to it.
+        Disable it for pages whose content must never be shown out of date, even briefly.
+
+        Args:
+            cacheable (bool): Whether the page may be kept.
+
+        Example:
+        ```python
+        ui.set_route_cacheable(False)
+        ```
+        """
+        self._main.root_element.props["cacheRoute"] = cacheable
+
+    @property
+    def is_prefetch(self) -> bool:
+        """
+        Whether this run prefetches the page for a link with `prefetch` set. The browser only reads which components
+        the page uses, so views may skip slow or side-effecting work during it. With `routelit_mantine.RouteLit`, the
+        view runs against a copy of the session state, nothing is stored and only the component names are sent.
+
+        Example:
+        ```python
+        if not ui.is_prefetch:
+            audit_log.record("report viewed")
+        ```
+        """
+        event = self.request.ui_event
+        return event is not None and event.get("type") == "prefetch"
+
     @property
     def sidebar(self) -> "RLBuilder":
         """
@@ -1729,6 +2155,7 @@ class RLBuilder(RouteLitBuilder):
         with_check_icon: Optional[bool] = None,
         with_error_styles: Optional[bool] = None,
         with_scroll_area: Optional[bool] = None,
+        virtualize: Optional[bool] = None,
         **kwargs: Any,
     ) -> list[str]:
         """
@@ -1780,6 +2207,8 @@ class RLBuilder(RouteLitBuilder):
             with_check_icon (Optional[bool]): Show check icon next to selected options.
             with_error_styles (Optional[bool]): Apply error styles.
             with_scroll_area (Optional[bool]): Wrap dropdown with scroll area.
+            virtualize (Optional[bool]): Mount only the visible dropdown options, for lists of thousands of options.
+                The virtualized dropdown ignores the search value and dropdown open props and `check_icon_position`.
             kwargs: Additional props to set.
 
         Returns:
@@ -1833,6 +2262,7 @@ class RLBuilder(RouteLitBuilder):
             withCheckIcon=with_check_icon,
             withErrorStyles=with_error_styles,
             withScrollArea=with_scroll_area,
+            virtualize=virtualize,
             **kwargs,
         )
 
@@ -1876,6 +2306,7 @@ class RLBuilder(RouteLitBuilder):
         with_asterisk: Optional[bool] = None,
         with_error_styles: Optional[bool] = None,
         with_scroll_area: Optional[bool] = None,
+        virtualize: Optional[bool] = None,
         **kwargs: Any,
     ) -> Any:
         """
@@ -1919,6 +2350,8 @@ class RLBuilder(RouteLitBuilder):
             with_asterisk (Optional[bool]): Show required asterisk.
             with_error_styles (Optional[bool]): Apply error styles.
             with_scroll_area (Optional[bool]): Wrap dropdown with scroll area.
+            virtualize (Optional[bool]): Mount only the visible dropdown options, for lists of thousands of options.
+                The virtualized dropdown ignores the search value and dropdown open props and `check_icon_position`.
             kwargs: Additional props to set.
 
         Returns:
@@ -1964,6 +2397,7 @@ class RLBuilder(RouteLitBuilder):
             withAsterisk=with_asterisk,
             withErrorStyles=with_error_styles,
             withScrollArea=with_scroll_area,
+            virtualize=virtualize,
             **kwargs,
         )
 
@@ -2013,6 +2447,7 @@ class RLBuilder(RouteLitBuilder):
         with_asterisk: Optional[bool] = None,
         with_error_styles: Optional[bool] = None,
         with_scroll_area: Optional[bool] = None,
+        virtualize: Optional[bool] = None,
         **kwargs: Any,
     ) -> list[str]:
         """
@@ -2065,6 +2500,8 @@ class RLBuilder(RouteLitBuilder):
             with_asterisk (Optional[bool]): Show required asterisk.
             with_error_styles (Optional[bool]): Apply error styles when error is set.
             with_scroll_area (Optional[bool]): Wrap dropdown list in a scroll area.
+            virtualize (Optional[bool]): Mount only the visible dropdown options, for lists of thousands of options.
+                The virtualized dropdown ignores the search value and dropdown open props.
             kwargs: Additional props to set.
 
         Returns:
@@ -2118,6 +2555,7 @@ class RLBuilder(RouteLitBuilder):
                 withAsterisk=with_asterisk,
                 withErrorStyles=with_error_styles,
                 withScrollArea=with_scroll_area,
+                virtualize=virtualize,
                 **kwargs,
             ),
         )
@@ -2319,6 +2757,7 @@ class RLBuilder(RouteLitBuilder):
         inline: Optional[bool] = None,
         is_external: bool = False,
         line_clamp: Optional[int] = None,
+        prefetch: Optional[Literal["hover", "viewport"]] = None,
         replace: bool = False,
         size: Optional[str] = None,
         truncate: Optional[str] = None,
@@ -2338,6 +2777,8 @@ class RLBuilder(RouteLitBuilder):
             inline (Optional[bool]): Render inline.
             is_external (bool): Open in a new tab/window if true.
             line_clamp (Optional[int]): Clamp to a number of lines.
+            prefetch (Optional[Literal["hover", "viewport"]]): Request the destination page, and the stylesheets
+                of its components, while the link is hovered or visible. The destination view runs on prefetch.
             replace (bool): Replace history entry when routing.
             size (Optional[str]): Text size.
             truncate (Optional[str]): Truncate overflow.
@@ -2358,6 +2799,7 @@ class RLBuilder(RouteLitBuilder):
             inherit=inherit,
             inline=inline,
             lineClamp=line_clamp,
+            prefetch=prefetch,
             replace=replace,
             size=size,
             truncate=truncate,
@@ -2383,6 +2825,7 @@ class RLBuilder(RouteLitBuilder):
         is_external: bool = False,
         left_section: Optional[RouteLitElement] = None,
         no_wrap: Optional[bool] = None,
+        prefetch: Optional[Literal["hover", "viewport"]] = None,
         right_section: Optional[RouteLitElement] = None,
         **kwargs: Any,
     ) -> "RLBuilder":
@@ -2404,6 +2847,8 @@ class RLBuilder(RouteLitBuilder):
             is_external (bool): Treat as external link.
             left_section (Optional[RouteLitElement]): Left adornment.
             no_wrap (Optional[bool]): Prevent label wrapping.
+            prefetch (Optional[Literal["hover", "viewport"]]): Request the destination page, and the stylesheets
+                of its components, while the link is hovered or visible. The destination view runs on prefetch.
             right_section (Optional[RouteLitElement]): Right adornment.
             kwargs: Additional props to set.
 
@@ -2425,6 +2870,7 @@ class RLBuilder(RouteLitBuilder):
             is_external=is_external,
             leftSection=left_section,
             noWrap=no_wrap,
+            prefetch=prefetch,
             rightSection=right_section,
             rl_element_type="navlink",
             rl_text_attr="label",
@@ -2751,159 +3197,6 @@ class RLBuilder(RouteLitBuilder):
             },
         )
 
-    def dialog(
-        self,
-        key: Optional[str] = None,
-        *,
-        with_close_button: Optional[bool] = None,
-        **kwargs: Any,
-    ) -> "RLBuilder":
-        """
-        Open a dialog container for arbitrary content.
-
-        Args:
-            key (Optional[str]): Explicit element key.
-            with_close_button (Optional[bool]): Show close button.
-            kwargs: Additional props to set.
-
-        Returns:
-            RLBuilder: A nested builder scoped to the dialog element.
-        """
-        return super()._x_dialog(  # type: ignore[return-value]
-            "dialog",
-            key or self._new_text_id("dialog"),
-            opened=True,
-            withCloseButton=with_close_button,
-            **kwargs,
-        )
-
-    def drawer(
-        self,
-        key: Optional[str] = None,
-        *,
-        close_button_props: Optional[dict] = None,
-        close_on_click_outside: Optional[bool] = None,
-        close_on_escape: Optional[bool] = None,
-        on_close: Optional[Callable[[], bool]] = None,
-        keep_mounted: Optional[bool] = None,
-        lock_scroll: Optional[bool] = None,
-        offset: Optional[Union[str, int]] = None,
-        overlay_props: Optional[dict] = None,
-        padding: Optional[Union[str, int]] = None,
-        portal_props: Optional[dict] = None,
-        position: Optional[str] = None,
-        radius: Optional[Union[str, int]] = None,
-        remove_scroll_props: Optional[dict] = None,
-        return_focus: Optional[bool] = None,
-        scroll_area_component: Optional[str] = None,
-        shadow: Optional[str] = None,
-        size: Optional[Union[str, int]] = None,
-        stack_id: Optional[str] = None,
-        title: Optional[str] = None,
-        transition_props: Optional[dict] = None,
-        trap_focus: Optional[bool] = None,
-        with_close_button: Optional[bool] = None,
-        with_overlay: Optional[bool] = None,
-        within_portal: Optional[bool] = None,
-        z_index: Optional[Union[str, int]] = None,
-        **kwargs: Any,
-    ) -> "RLBuilder":
-        """
-        Drawer component that slides from screen edges.
-
-        Args:
-            key (Optional[str]): Explicit element key.
-            close_button_props (Optional[dict]): Close button props.
-            close_on_click_outside (Optional[bool]): Close when clicking outside.
-            close_on_escape (Optional[bool]): Close on Escape key.
-            on_close (Optional[Callable[[], bool]]): Close handler.
-            keep_mounted (Optional[bool]): Keep in DOM when closed.
-            lock_scroll (Optional[bool]): Lock document scroll when opened.
-            offset (Optional[Union[str, int]]): Offset from viewport edges.
-            overlay_props (Optional[dict]): Overlay props.
-            padding (Optional[Union[str, int]]): Content padding.
-            portal_props (Optional[dict]): Portal props.
-            position (Optional[str]): Edge position.
-            radius (Optional[Union[str, int]]): Corner radius.
-            remove_scroll_props (Optional[dict]): Remove scroll props.
-            return_focus (Optional[bool]): Return focus to trigger on close.
-            scroll_area_component (Optional[str]): Custom scroll area component.
-            shadow (Optional[str]): Shadow preset.
-            size (Optional[Union[str, int]]): Drawer size.
-            stack_id (Optional[str]): Stack identifier.
-            title (Optional[str]): Header title.
-            transition_props (Optional[dict]): Transition props.
-            trap_focus (Optional[bool]): Trap focus inside drawer.
-            with_close_button (Optional[bool]): Show close button.
-            with_overlay (Optional[bool]): Show overlay.
-            within_portal (Optional[bool]): Render within portal.
-            z_index (Optional[Union[str, int]]): CSS z-index.
-            kwargs: Additional props to set.
-
-        Returns:
-            RLBuilder: A nested builder scoped to the drawer element.
-        """
-        return super()._x_dialog(  # type: ignore[return-value]
-            "drawer",
-            key or self._new_text_id("drawer"),
-            opened=True,
-            closeButtonProps=close_button_props,
-            closeOnClickOutside=close_on_click_outside,
-            closeOnEscape=close_on_escape,
-            keepMounted=keep_mounted,
-            lockScroll=lock_scroll,
-            offset=offset,
-            on_close=on_close,
-            overlayProps=overlay_props,
-            padding=padding,
-            portalProps=portal_props,
-            position=position,
-            radius=radius,
-            removeScrollProps=remove_scroll_props,
-            returnFocus=return_focus,
-            scrollAreaComponent=scroll_area_component,
-            shadow=shadow,
-            size=size,
-            stackId=stack_id,
-            title=title,
-            transitionProps=transition_props,
-            trapFocus=trap_focus,
-            withCloseButton=with_close_button,
-            withOverlay=with_overlay,
-            withinPortal=within_portal,
-            zIndex=z_index,
-            **kwargs,
-        )
-
-    def modal(
-        self,
-        key: Optional[str] = None,
-        *,
-        title: Optional[str] = None,
-        with_close_button: Optional[bool] = None,
-        **kwargs: Any,
-    ) -> "RLBuilder":
-        """
-        Centered modal dialog.
-
-        Args:
-            key (Optional[str]): Explicit element key.
-            title (Optional[str]): Header title.
-            with_close_button (Optional[bool]): Show close button.
-            kwargs: Additional props to set.
-
-        Returns:
-            RLBuilder: A nested builder scoped to the modal element.
-        """
-        return super()._x_dialog(  # type: ignore[return-value]
-            "modal",
-            key or self._new_text_id("modal"),
-            opened=True,
-            title=title,
-            withCloseButton=with_close_button,
-            **kwargs,
-        )
-
     # override _dialog to use modal instead of dialog
     def _dialog(
         self,
@@ -3060,342 +3353,349 @@ class RLBuilder(RouteLitBuilder):
             props={"children": text, "order": order, **kwargs},
         )
 
-    def table(
+    def box(
         self,
         key: Optional[str] = None,
-        *,
-        body: Optional[list[list[Any]]] = None,
-        caption: Optional[str] = None,
-        head: Optional[list[str]] = None,
-        foot: Optional[list[str]] = None,
-        sticky_header: Optional[bool] = None,
         **kwargs: Any,
     ) -> "RLBuilder":
         """
-        Data table with optional head, body, foot and caption.
+        Generic layout container.
 
         Args:
             key (Optional[str]): Explicit element key.
-            body (Optional[list[list[Any]]]): Table body rows.
-            caption (Optional[str]): Table caption.
-            head (Optional[list[str]]): Header row cells.
-            foot (Optional[list[str]]): Footer row cells.
-            sticky_header (Optional[bool]): Make header sticky when scrolling.
             kwargs: Additional props to set.
 
         Returns:
-            RLBuilder: A nested builder scoped to the table element.
+            RLBuilder: A nested builder scoped to the box element.
         """
-        data = {
-            "body": body,
-            "caption": caption,
-            "head": head,
-            "foot": foot,
-        }
         return self._create_builder_element(  # type: ignore[return-value]
-            name="table",
-            key=key or self._new_text_id("table"),
-            props={"data": data, "stickyHeader": sticky_header, **kwargs},
-        )
-
-    def table_caption(
-        self,
-        text: str,
-        *,
-        key: Optional[str] = None,
-        **kwargs: Any,
-    ) -> None:
-        """
-        Add a caption to the current table.
-
-        Args:
-            text (str): Caption text.
-            key (Optional[str]): Explicit element key.
-            kwargs: Additional props to set.
-        """
-        self._create_element(
-            name="tablecaption",
-            key=key or self._new_text_id("tablecaption"),
-            props={"children": text, **kwargs},
+            name="box",
+            key=key or self._new_text_id("box"),
+            props=kwargs,
             virtual=True,
         )
 
-    def table_head(
+    def paper(
         self,
+        *,
         key: Optional[str] = None,
+        radius: Optional[Union[str, int]] = None,
+        shadow: Optional[str] = None,
+        with_border: Optional[bool] = None,
         **kwargs: Any,
     ) -> "RLBuilder":
         """
-        Create a table head section.
+        Container with background, border, and shadow.
 
         Args:
             key (Optional[str]): Explicit element key.
+            radius (Optional[Union[str, int]]): Corner radius.
+            shadow (Optional[str]): Shadow preset.
+            with_border (Optional[bool]): Show border.
             kwargs: Additional props to set.
 
         Returns:
-            RLBuilder: A nested builder scoped to the head section.
+            RLBuilder: A nested builder scoped to the paper element.
         """
         return self._create_builder_element(  # type: ignore[return-value]
-            name="tablehead",
-            key=key or self._new_text_id("tablehead"),
-            props=kwargs,
+            name="paper",
+            key=key or self._new_text_id("paper"),
+            props={
+                "radius": radius,
+                "shadow": shadow,
+                "withBorder": with_border,
+                **kwargs,
+            },
             virtual=True,
         )
 
-    def table_foot(
+    def scroll_area(
         self,
+        *,
         key: Optional[str] = None,
+        offset_scrollbars: Optional[Union[bool, Literal["x", "y", "present"]]] = None,
+        overscroll_behavior: Optional[str] = None,
+        scroll_hide_delay: Optional[int] = None,
+        scrollbar_size: Optional[Union[str, int]] = None,
+        scrollbars: Optional[Union[bool, Literal["x", "y", "xy"]]] = None,
+        type: Optional[Literal["auto", "scroll", "always", "hover", "never"]] = None,  # noqa: A002
+        viewport_props: Optional[dict[str, Any]] = None,
+        virtualize: bool = False,
+        estimate_item_size: Optional[int] = None,
+        measure_items: Optional[bool] = None,
+        overscan: Optional[int] = None,
         **kwargs: Any,
     ) -> "RLBuilder":
         """
-        Create a table foot section.
+        Scrollable area with configurable scrollbars and behavior.
+
+        With `virtualize=True` only the children in view, plus `overscan` on each side, are mounted in the browser,
+        which keeps long feeds and logs responsive. The children are still all sent; use `virtual_list` to also
+        build them on demand.
 
         Args:
             key (Optional[str]): Explicit element key.
+            offset_scrollbars (Optional[Union[bool, Literal["x", "y", "present"]]): Offset scrollbars from content.
+            overscroll_behavior (Optional[str]): CSS overscroll behavior.
+            scroll_hide_delay (Optional[int]): Delay before hiding scrollbars.
+            scrollbar_size (Optional[Union[str, int]]): Scrollbar size.
+            scrollbars (Optional[Union[bool, Literal["x", "y", "xy"]]): Which axes show scrollbars.
+            type (Optional[Literal["auto", "scroll", "always", "hover", "never"]]): Scrollbar visibility policy.
+            viewport_props (Optional[dict[str, Any]]): Viewport element props.
+            virtualize (bool): Mount only the visible children.
+            estimate_item_size (Optional[int]): Estimated child height in pixels when virtualized; defaults to 48.
+            measure_items (Optional[bool]): Measure the rendered children instead of fixing them to the estimate.
+            overscan (Optional[int]): Children mounted beyond each edge of the viewport when virtualized.
             kwargs: Additional props to set.
 
         Returns:
-            RLBuilder: A nested builder scoped to the foot section.
+            RLBuilder: A nested builder scoped to the scroll area.
         """
-        return self._create_builder_element(  # type: ignore[return-value]
-            name="tablefoot",
-            key=key or self._new_text_id("tablefoot"),
-            props=kwargs,
-            virtual=True,
+        virtual_props = (
+            {"estimateItemSize": estimate_item_size, "measureItems": measure_items, "overscan": overscan}
+            if virtualize
+            else {}
         )
-
-    def table_row(
-        self,
-        key: Optional[str] = None,
-        **kwargs: Any,
-    ) -> "RLBuilder":
-        """
-        Create a table row.
-
-        Args:
-            key (Optional[str]): Explicit element key.
-            kwargs: Additional props to set.
-
-        Returns:
-            RLBuilder: A nested builder scoped to the row.
-        """
-        return self._create_builder_element(  # type: ignore[return-value]
-            name="tablerow",
-            key=key or self._new_text_id("tablerow"),
-            props=kwargs,
-            virtual=True,
-        )
-
-    def table_cell(
-        self,
-        text: Optional[str] = None,
-        *,
-        key: Optional[str] = None,
-        **kwargs: Any,
-    ) -> "RLBuilder":
-        """
-        Create a table cell.
-
-        Args:
-            text (Optional[str]): Cell text content.
-            key (Optional[str]): Explicit element key.
-            kwargs: Additional props to set.
-
-        Returns:
-            RLBuilder: A nested builder scoped to the cell.
-        """
         return self._create_builder_element(  # type: ignore[return-value]
-            name="tablecell",
-            key=key or self._new_text_id("tablecell"),
-            props={"children": text, **kwargs},
+            name="virtualscrollarea" if virtualize else "scrollarea",
+            key=key or self._new_text_id("scrollarea"),
+            props={
+                "offsetScrollbars": offset_scrollbars,
+                "overscrollBehavior": overscroll_behavior,
+                "scrollHideDelay": scroll_hide_delay,
+                "scrollbarSize": scrollbar_size,
+                "scrollbars": scrollbars,
+                "type": type,
+                "viewportProps": viewport_props,
+                **virtual_props,
+                **kwargs,
+            },
             virtual=True,
         )
 
-    def table_header(
+    def virtual_list(
         self,
-        text: Optional[str] = None,
+        count: Optional[int] = None,
+        render_item: Optional[Callable[["RLBuilder", int], Any]] = None,
         *,
+        estimate_item_size: int = 48,
+        gap: Optional[int] = None,
+        h: Optional[Union[str, int]] = 400,
         key: Optional[str] = None,
+        measure_items: bool = True,
+        overscan: int = 5,
+        page_size: int = 100,
         **kwargs: Any,
     ) -> "RLBuilder":
         """
-        Create a table header cell.
-
-        Args:
-            text (Optional[str]): Header text content.
-            key (Optional[str]): Explicit element key.
-            kwargs: Additional props to set.
-
-        Returns:
-            RLBuilder: A nested builder scoped to the header cell.
-        """
-        return self._create_builder_element(  # type: ignore[return-value]
-            name="tableheader",
-            key=key or self._new_text_id("tableheader"),
-            props={"children": text, **kwargs},
-            virtual=True,
-        )
+        Vertical list that mounts only the items in view, for lists of thousands of rows.
 
-    def table_body(
-        self,
-        key: Optional[str] = None,
-        **kwargs: Any,
-    ) -> "RLBuilder":
-        """
-        Create a table body section.
+        With `render_item`, only a window of the `count` items is built: the pages around the range the browser
+        shows, plus one page ahead. Scrolling past the window sends a "rangechange" event and the server builds the
+        items around the new range. Without `render_item`, children added to the returned builder are all sent and
+        only virtualized in the browser.
 
         Args:
+            count (Optional[int]): Number of items; required with `render_item`.
+            render_item (Optional[Callable[[RLBuilder, int], Any]]): Builds the item at an index in the given builder.
+            estimate_item_size (int): Estimated item height in pixels, used until an item is measured.
+            gap (Optional[int]): Space between items in pixels.
+            h (Optional[Union[str, int]]): Height of the scrollable viewport.
             key (Optional[str]): Explicit element key.
+            measure_items (bool): Measure the rendered items instead of fixing them to the estimate.
+            overscan (int): Items mounted beyond each edge of the viewport.
+            page_size (int): Items built per page with `render_item`.
             kwargs: Additional props to set.
 
         Returns:
-            RLBuilder: A nested builder scoped to the body section.
-        """
-        return self._create_builder_element(  # type: ignore[return-value]
-            name="tablebody",
-            key=key or self._new_text_id("tablebody"),
-            props=kwargs,
-            virtual=True,
-        )
-
-    def table_scroll_container(
-        self,
-        *,
-        key: Optional[str] = None,
-        max_height: Optional[Union[str, int]] = None,
-        max_width: Optional[Union[str, int]] = None,
-        min_height: Optional[Union[str, int]] = None,
-        min_width: Optional[Union[str, int]] = None,
-        **kwargs: Any,
-    ) -> "RLBuilder":
-        """
-        Scrollable container for large tables.
-
-        Args:
-            key (Optional[str]): Explicit element key.
-            max_height (Optional[Union[str, int]]): Maximum height.
-            max_width (Optional[Union[str, int]]): Maximum width.
-            min_height (Optional[Union[str, int]]): Minimum height.
-            min_width (Optional[Union[str, int]]): Minimum width.
-            kwargs: Additional props to set.
+            RLBuilder: A nested builder scoped to the list.
 
-        Returns:
-            RLBuilder: A nested builder scoped to the scroll container.
+        Example:
+        ```python
+        ui.virtual_list(len(logs), lambda row, i: row.text(logs[i]), estimate_item_size=24)
+        ```
         """
-        return self._create_builder_element(  # type: ignore[return-value]
-            name="tablescrollcontainer",
-            key=key or self._new_text_id("tablescrollcontainer"),
-            props={
-                "maxHeight": max_height,
-                "maxWidth": max_width,
-                "minHeight": min_height,
-                "minWidth": min_width,
-                **kwargs,
-            },
-            virtual=True,
+        if render_item is not None and count is None:
+            raise VirtualListCountError()
+        key = key or self._new_text_id("virtuallist")
+        start, end = (0, count) if render_item is None else self._virtual_window(key, cast(int, count), page_size)
+        builder = cast(
+            RLBuilder,
+            self._create_builder_element(
+                name="virtuallist",
+                key=key,
+                props={
+                    "count": count,
+                    "start": start if render_item is not None else None,
+                    "estimateItemSize": estimate_item_size,
+                    "gap": gap,
+                    "h": h,
+                    "measureItems": measure_items,
+                    "overscan": overscan,
+                    **kwargs,
+                },
+            ),
         )
+        if render_item is not None:
+            for index in range(start, cast(int, end)):
+                element = builder._create_element(name="eachitem", key=f"{key}_{index}", virtual=True)
+                render_item(cast(RLBuilder, builder._build_nested_builder(element)), index)
+        return builder
 
-    def box(
-        self,
-        key: Optional[str] = None,
-        **kwargs: Any,
-    ) -> "RLBuilder":
+    def _virtual_window(self, key: str, count: int, page_size: int) -> tuple[int, int]:
         """
-        Generic layout container.
-
-        Args:
-            key (Optional[str]): Explicit element key.
-            kwargs: Additional props to set.
-
-        Returns:
-            RLBuilder: A nested builder scoped to the box element.
+        Page-aligned window of a virtual list covering the range last shown by the browser, plus one page ahead.
         """
-        return self._create_builder_element(  # type: ignore[return-value]
-            name="box",
-            key=key or self._new_text_id("box"),
-            props=kwargs,
-            virtual=True,
-        )
+        state_key = f"__virtual_range_{key}"
+        has_event, shown = self._get_event_value(key, "rangechange")
+        with self._session_lock:
+            if has_event and isinstance(shown, dict):
+                self.session_state[state_key] = [int(shown.get("start", 0)), int(shown.get("end", 0))]
+            shown_start, shown_end = self.session_state.get(state_key) or (0, 0)
+        page_size = max(page_size, 1)
+        start = min(max(shown_start, 0) // page_size * page_size, max(count - 1, 0) // page_size * page_size)
+        end = -(-max(shown_end, start) // page_size) * page_size + page_size
+        return start, min(max(end, start + page_size), count)
 
-    def paper(
+    def paginated(
         self,
+        source: Union[Sequence[Any], PageSource],
         *,
+        page_size: int = 20,
+        boundaries: Optional[int] = None,
+        deps: Any = (),
         key: Optional[str] = None,
-        radius: Optional[Union[str, int]] = None,
-        shadow: Optional[str] = None,
-        with_border: Optional[bool] = None,
+        prefetch_next: bool = True,
+        siblings: Optional[int] = None,
+        size: Optional[Union[str, int]] = None,
+        with_edges: Optional[bool] = None,
         **kwargs: Any,
-    ) -> "RLBuilder":
-        """
-        Container with background, border, and shadow.
-
-        Args:
-            key (Optional[str]): Explicit element key.
-            radius (Optional[Union[str, int]]): Corner radius.
-            shadow (Optional[str]): Shadow preset.
-            with_border (Optional[bool]): Show border.
-            kwargs: Additional props to set.
-
-        Returns:
-            RLBuilder: A nested builder scoped to the paper element.
+    ) -> tuple[list[Any], "RLBuilder"]:
         """
-        return self._create_builder_element(  # type: ignore[return-value]
-            name="paper",
-            key=key or self._new_text_id("paper"),
-            props={
-                "radius": radius,
-                "shadow": shadow,
-                "withBorder": with_border,
-                **kwargs,
-            },
-            virtual=True,
-        )
+        Show one page of items at a time, above a pagination control.
 
-    def scroll_area(
-        self,
-        *,
-        key: Optional[str] = None,
-        offset_scrollbars: Optional[Union[bool, Literal["x", "y", "present"]]] = None,
-        overscroll_behavior: Optional[str] = None,
-        scroll_hide_delay: Optional[int] = None,
-        scrollbar_size: Optional[Union[str, int]] = None,
-        scrollbars: Optional[Union[bool, Literal["x", "y", "xy"]]] = None,
-        type: Optional[Literal["auto", "scroll", "always", "hover", "never"]] = None,  # noqa: A002
-        viewport_props: Optional[dict[str, Any]] = None,
-        **kwargs: Any,
-    ) -> "RLBuilder":
-        """
-        Scrollable area with configurable scrollbars and behavior.
+        Returns the items of the current page and the builder of the page body. Moving to another page builds
+        only a new body; the control is updated in place. Pages of a `PageSource` are kept in the session while
+        `deps` are unchanged, and the next page is fetched on a background thread so it is ready when the user
+        moves to it. Strings and bytes are not accepted as the items.
 
         Args:
+            source (Union[Sequence[Any], PageSource]): The items, or a source fetching them one page at a time.
+            page_size (int): Items per page.
+            boundaries (Optional[int]): Page numbers shown at each end of the control.
+            deps (Any): The values the source depends on, e.g. its filters. A change drops the kept pages and
+                returns to the first page.
             key (Optional[str]): Explicit element key.
-            offset_scrollbars (Optional[Union[bool, Literal["x", "y", "present"]]): Offset scrollbars from content.
-            overscroll_behavior (Optional[str]): CSS overscroll behavior.
-            scroll_hide_delay (Optional[int]): Delay before hiding scrollbars.
-            scrollbar_size (Optional[Union[str, int]]): Scrollbar size.
-            scrollbars (Optional[Union[bool, Literal["x", "y", "xy"]]): Which axes show scrollbars.
-            type (Optional[Literal["auto", "scroll", "always", "hover", "never"]]): Scrollbar visibility policy.
-            viewport_props (Optional[dict[str, Any]]): Viewport element props.
-            kwargs: Additional props to set.
+            prefetch_next (bool): Fetch the page after the current one in the background.
+            siblings (Optional[int]): Page numbers shown on each side of the current one.
+            size (Optional[Union[str, int]]): Size of the control.
+            with_edges (Optional[bool]): Show first and last page buttons.
+            kwargs: Additional props of the pagination control.
 
         Returns:
-            RLBuilder: A nested builder scoped to the scroll area.
+            tuple[list[Any], RLBuilder]: The items of the current page and the builder of its body.
+
+        Example:
+        ```python
+        orders, body = ui.paginated(OrdersSource(db, status), page_size=25, deps=status)
+        with body:
+            for order in orders:
+                ui.text(order.title)
+        ```
         """
-        return self._create_builder_element(  # type: ignore[return-value]
-            name="scrollarea",
-            key=key or self._new_text_id("scrollarea"),
-            props={
-                "offsetScrollbars": offset_scrollbars,
-                "overscrollBehavior": overscroll_behavior,
-                "scrollHideDelay": scroll_hide_delay,
-                "scrollbarSize": scrollbar_size,
-                "scrollbars": scrollbars,
-                "type": type,
-                "viewportProps": viewport_props,
-                **kwargs,
-            },
-            virtual=True,
+        key = key or self._new_text_id("paginated")
+        page_size = max(page_size, 1)
+        has_event, requested = self._get_event_value(key, "change", "value")
+        if has_event:
+            with self._session_lock:
+                self.session_state[key] = requested
+        if isinstance(source, Sequence):
+            source = SequenceSource(source)
+        if isinstance(source, SequenceSource):
+            page = self._paginated_page_number(key, source.count(), page_size)
+            current = source.fetch_page((page - 1) * page_size, page_size)
+            total = -(-source.count() // page_size)
+        else:
+            page, current, total = self._paginated_source_page(key, source, page_size, deps, prefetch_next)
+        builder = cast(
+            RLBuilder,
+            self._create_builder_element(
+                name="paginated",
+                key=key,
+                props={
+                    "value": page,
+                    "total": max(total, 1),
+                    "boundaries": boundaries,
+                    "siblings": siblings,
+                    "size": size,
+                    "withEdges": with_edges,
+                    **kwargs,
+                },
+            ),
         )
+        body = builder._create_element(name="eachitem", key=f"{key}_page_{page}", virtual=True)
+        return current.items, cast(RLBuilder, builder._build_nested_builder(body))
+
+    def _paginated_page_number(self, key: str, count: Optional[int], page_size: int) -> int:
+        with self._session_lock:
+            try:
+                page = max(int(self.session_state.get(key) or 1), 1)
+            except (TypeError, ValueError):
+                page = 1
+            if count is not None:
+                page = min(page, max(-(-count // page_size), 1))
+            self.session_state[key] = page
+        return page
+
+    def _paginated_source_page(
+        self, key: str, source: PageSource, page_size: int, deps: Any, prefetch_next: bool
+    ) -> tuple[int, Page, int]:
+        """
+        The current page number of a source, the page and the number of pages: from the count of the source, or
+        those known to exist when it has none. Pages before the current one are fetched as needed to find its cursor.
+        The session state is not locked while pages are fetched.
+        """
+        digest = fingerprint((deps, page_size))
+        with self._session_lock:
+            state = self.session_state.get(f"__paginated_{key}")
+            if not isinstance(state, dict) or state.get("deps") != digest:
+                state = {"deps": digest, "count": source.count(), "cursors": {1: None}}
+                self.session_state[key] = 1
+            pages = state.get("pages")
+            if not isinstance(pages, LRUCache) or pages.maxsize != self.paginated_cache_pages:
+                pages = state["pages"] = LRUCache[int, Page](self.paginated_cache_pages)
+            self.session_state[f"__paginated_{key}"] = state
+            cursors: dict[int, Any] = state["cursors"]
+            count = state["count"]
+            page = self._paginated_page_number(key, count, page_size)
+            number = max(n for n in cursors if n <= page)
+        session_key = self.request.get_session_keys().state_key
+
+        def token(number: int) -> PrefetchToken:
+            return (session_key, key, digest, number)
+
+        while True:
+            with self._session_lock:
+                current = pages.get(number)
+            current = current or take_prefetched(token(number))
+            if current is None:
+                current = Page(*source.fetch_page(cursors[number], page_size))
+            with self._session_lock:
+                pages[number] = current
+                if current.next_cursor is not None and number != page:
+                    number += 1
+                    cursors[number] = current.next_cursor
+                    continue
+            break
+        with self._session_lock:
+            prefetch = False
+            if current.next_cursor is not None:
+                cursors[number + 1] = current.next_cursor
+                prefetch = prefetch_next and number + 1 not in pages
+            self.session_state[key] = number
+        if prefetch:
+            prefetch_page(token(number + 1), source, current.next_cursor, page_size)
+        return number, current, -(-count // page_size) if count is not None else max(cursors)
 
     def accordion(
         self,
@@ -3566,2192 +3866,3 @@ class RLBuilder(RouteLitBuilder):
                 icon=icon,
             )
             return item
-
-    def _format_datetime(self, value: Any) -> Optional[datetime.datetime]:
-        if isinstance(value, datetime.datetime):
-            return value
-        if isinstance(value, str):
-            return datetime.datetime.fromisoformat(value)
-        return None
-
-    def date_time_picker(
-        self,
-        label: str,
-        value: Optional[Union[datetime.datetime, str]] = None,
-        *,
-        clearable: Optional[bool] = None,
-        columns_to_scroll: Optional[int] = None,
-        description: Optional[str] = None,
-        disabled: Optional[bool] = None,
-        dropdown_type: Optional[Literal["modal", "popover"]] = None,
-        error: Optional[str] = None,
-        first_day_of_week: Optional[Literal[0, 1, 2, 3, 4, 5, 6]] = None,
-        header_controls_order: Optional[list[Literal["level", "next", "previous"]]] = None,
-        hide_outside_dates: Optional[bool] = None,
-        hide_weekdays: Optional[bool] = None,
-        highlight_today: Optional[bool] = None,
-        input_size: Optional[str] = None,
-        input_wrapper_order: Optional[list[str]] = None,
-        label_props: Optional[dict[str, Any]] = None,
-        label_separator: Optional[str] = None,
-        left_section: Optional[RouteLitElement] = None,
-        left_section_props: Optional[dict[str, Any]] = None,
-        left_section_width: Optional[str] = None,
-        level: Optional[Literal["month", "year", "decade"]] = None,
-        locale: Optional[str] = None,
-        max_date: Optional[Union[datetime.datetime, str]] = None,
-        max_level: Optional[Literal["month", "year", "decade"]] = None,
-        min_date: Optional[Union[datetime.datetime, str]] = None,
-        months_list_format: Optional[str] = None,
-        number_of_columns: Optional[int] = None,
-        next_label: Optional[str] = None,
-        next_icon: Optional[RouteLitElement] = None,
-        on_change: Optional[Callable[[datetime.datetime], None]] = None,
-        popover_props: Optional[dict[str, Any]] = None,
-        presets: Optional[list[dict[str, Any]]] = None,
-        previous_icon: Optional[RouteLitElement] = None,
-        previous_label: Optional[str] = None,
-        placeholder: Optional[str] = None,
-        radius: Optional[Union[str, int]] = None,
-        read_only: Optional[bool] = None,
-        required: Optional[bool] = None,
-        right_section: Optional[RouteLitElement] = None,
-        right_section_pointer_events: Optional[str] = None,
-        right_section_props: Optional[dict[str, Any]] = None,
-        right_section_width: Optional[str] = None,
-        size: Optional[str] = None,
-        sort_dates: Optional[bool] = None,
-        submit_button_props: Optional[dict[str, Any]] = None,
-        time_picker_props: Optional[dict[str, Any]] = None,
-        value_format: Optional[str] = None,
-        weekday_format: Optional[str] = None,
-        weekend_days: Optional[list[Literal[0, 1, 2, 3, 4, 5, 6]]] = None,
-        with_asterisk: Optional[bool] = None,
-        with_cell_spacing: Optional[bool] = None,
-        with_error_styles: Optional[bool] = None,
-        with_seconds: Optional[bool] = None,
-        with_week_numbers: Optional[bool] = None,
-        wrapper_props: Optional[dict[str, Any]] = None,
-        year_label_format: Optional[str] = None,
-        years_list_format: Optional[str] = None,
-        pointer: Optional[bool] = None,
-        key: Optional[str] = None,
-        **kwargs: Any,
-    ) -> Optional[datetime.datetime]:
-        """
-        Date-time picker input with calendar and time selection.
-
-        Args:
-            label (str): Field label.
-            value (Optional[Union[datetime.datetime, str]]): Current value.
-            clearable (Optional[bool]): Show clear button.
-            columns_to_scroll (Optional[int]): Number of months to scroll.
-            description (Optional[str]): Helper text under the label.
-            disabled (Optional[bool]): Disable interaction.
-            dropdown_type (Optional[Literal["modal", "popover"]]): Dropdown type.
-            error (Optional[str]): Error message.
-            first_day_of_week (Optional[Literal[0,1,2,3,4,5,6]]): First day of week.
-            header_controls_order (Optional[list[Literal["level", "next", "previous"]]]): Header controls order.
-            hide_outside_dates (Optional[bool]): Hide outside month dates.
-            hide_weekdays (Optional[bool]): Hide weekday labels.
-            highlight_today (Optional[bool]): Highlight current date.
-            input_size (Optional[str]): Control size.
-            input_wrapper_order (Optional[list[str]]): Input wrapper parts order.
-            label_props (Optional[dict[str, Any]]): Label props.
-            label_separator (Optional[str]): Separator between date and time.
-            left_section (Optional[RouteLitElement]): Left adornment.
-            left_section_props (Optional[dict[str, Any]]): Left adornment props.
-            left_section_width (Optional[str]): Left adornment width.
-            level (Optional[Literal["month", "year", "decade"]]): Initial calendar level.
-            locale (Optional[str]): Locale code.
-            max_date (Optional[Union[datetime.datetime, str]]): Max date.
-            max_level (Optional[Literal["month", "year", "decade"]]): Max calendar level.
-            min_date (Optional[Union[datetime.datetime, str]]): Min date.
-            months_list_format (Optional[str]): Months list format.
-            number_of_columns (Optional[int]): Number of months displayed.
-            next_label (Optional[str]): Next button label.
-            next_icon (Optional[RouteLitElement]): Next button icon.
-            on_change (Optional[Callable[[datetime.datetime], None]]): Change handler.
-            popover_props (Optional[dict[str, Any]]): Popover props.
-            presets (Optional[list[dict[str, Any]]]): Presets configuration.
-            previous_icon (Optional[RouteLitElement]): Previous button icon.
-            previous_label (Optional[str]): Previous button label.
-            placeholder (Optional[str]): Input placeholder.
-            radius (Optional[Union[str, int]]): Corner radius.
-            read_only (Optional[bool]): Read-only state.
-            required (Optional[bool]): Mark as required.
-            right_section (Optional[RouteLitElement]): Right adornment.
-            right_section_pointer_events (Optional[str]): Pointer events for right section.
-            right_section_props (Optional[dict[str, Any]]): Right adornment props.
-            right_section_width (Optional[str]): Right adornment width.
-            size (Optional[str]): Control size.
-            sort_dates (Optional[bool]): Sort selected dates.
-            submit_button_props (Optional[dict[str, Any]]): Submit button props.
-            time_picker_props (Optional[dict[str, Any]]): Time picker props.
-            value_format (Optional[str]): Output value format.
-            weekday_format (Optional[str]): Weekday label format.
-            weekend_days (Optional[list[Literal[0,1,2,3,4,5,6]]]): Weekend days indices.
-            with_asterisk (Optional[bool]): Show required asterisk.
-            with_cell_spacing (Optional[bool]): Add spacing between cells.
-            with_error_styles (Optional[bool]): Apply error styles.
-            with_seconds (Optional[bool]): Include seconds selector.
-            with_week_numbers (Optional[bool]): Show week numbers.
-            wrapper_props (Optional[dict[str, Any]]): Wrapper props.
-            year_label_format (Optional[str]): Year label format.
-            years_list_format (Optional[str]): Years list format.
-            pointer (Optional[bool]): Use pointer cursor.
-            key (Optional[str]): Explicit element key.
-            kwargs: Additional props to set.
-
-        Returns:
-            Optional[datetime.datetime]: Current value.
-        """
-        return cast(
-            Optional[datetime.datetime],
-            self._x_input(
-                "datetimepicker",
-                key or self._new_widget_id("datetimepicker", label),
-                clearable=clearable,
-                columnsToScroll=columns_to_scroll,
-                description=description,
-                disabled=disabled,
-                dropdownType=dropdown_type,
-                error=error,
-                firstDayOfWeek=first_day_of_week,
-                headerControlsOrder=header_controls_order,
-                hideOutsideDates=hide_outside_dates,
-                hideWeekdays=hide_weekdays,
-                highlightToday=highlight_today,
-                inputSize=input_size,
-                inputWrapperOrder=input_wrapper_order,
-                label=label,
-                labelProps=label_props,
-                labelSeparator=label_separator,
-                value=value,
-                leftSection=left_section,
-                leftSectionProps=left_section_props,
-                leftSectionWidth=left_section_width,
-                level=level,
-                locale=locale,
-                maxDate=max_date,
-                maxLevel=max_level,
-                minDate=min_date,
-                monthsListFormat=months_list_format,
-                nextIcon=next_icon,
-                nextLabel=next_label,
-                numberOfColumns=number_of_columns,
-                on_change=on_change,
-                popoverProps=popover_props,
-                presets=presets,
-                previousIcon=previous_icon,
-                previousLabel=previous_label,
-                placeholder=placeholder,
-                radius=radius,
-                readOnly=read_only,
-                required=required,
-                rightSection=right_section,
-                rightSectionPointerEvents=right_section_pointer_events,
-                rightSectionProps=right_section_props,
-                rightSectionWidth=right_section_width,
-                rl_format_func=self._format_datetime,
-                size=size,
-                sortDates=sort_dates,
-                submitButtonProps=submit_button_props,
-                timePickerProps=time_picker_props,
-                valueFormat=value_format,
-                weekdayFormat=weekday_format,
-                weekendDays=weekend_days,
-                withAsterisk=with_asterisk,
-                withCellSpacing=with_cell_spacing,
-                withErrorStyles=with_error_styles,
-                withSeconds=with_seconds,
-                withWeekNumbers=with_week_numbers,
-                wrapperProps=wrapper_props,
-                yearLabelFormat=year_label_format,
-                yearsListFormat=years_list_format,
-                pointer=pointer,
-                **kwargs,
-            ),
-        )
-
-    def _format_date_picker(
-        self, value: Any
-    ) -> Optional[Union[datetime.date, list[datetime.date], tuple[datetime.date, datetime.date]]]:
-        if isinstance(value, datetime.date):
-            return value
-        if isinstance(value, str):
-            return datetime.date.fromisoformat(value)
-        if isinstance(value, list):
-            return [datetime.date.fromisoformat(x) if isinstance(x, str) else x for x in value]
-        return None
-
-    def date_picker(
-        self,
-        label: str,
-        value: Optional[
-            Union[
-                datetime.date,
-                str,
-                list[str],
-                list[datetime.date],
-                tuple[str, str],
-                tuple[datetime.date, datetime.date],
-            ]
-        ] = None,
-        *,
-        allow_deselect: Optional[bool] = None,
-        allow_single_date_in_range: Optional[bool] = None,
-        aria_labels: Optional[dict] = None,
-        columns_to_scroll: Optional[int] = None,
-        decade_label_format: Optional[str] = None,
-        default_level: Optional[Literal["month", "year", "decade"]] = None,
-        description: Optional[str] = None,
-        enable_keyboard_navigation: Optional[bool] = None,
-        first_day_of_week: Optional[Literal[0, 1, 2, 3, 4, 5, 6]] = None,
-        header_controls_order: Optional[list[Literal["level", "next", "previous"]]] = None,
-        hide_outside_dates: Optional[bool] = None,
-        hide_weekdays: Optional[bool] = None,
-        highlight_today: Optional[bool] = None,
-        key: Optional[str] = None,
-        level: Optional[str] = None,
-        locale: Optional[str] = None,
-        max_date: Optional[Union[str, datetime.date]] = None,
-        max_level: Optional[str] = None,
-        min_date: Optional[Union[str, datetime.date]] = None,
-        month_label_format: Optional[str] = None,
-        months_list_format: Optional[str] = None,
-        next_icon: Optional[RouteLitElement] = None,
-        next_label: Optional[str] = None,
-        number_of_columns: Optional[int] = None,
-        on_change: Optional[
-            Callable[
-                [
-                    Union[
-                        datetime.date,
-                        list[datetime.date],
-                        tuple[datetime.date, datetime.date],
-                    ]
-                ],
-                None,
-            ]
-        ] = None,
-        presets: Optional[list] = None,
-        previous_icon: Optional[RouteLitElement] = None,
-        previous_label: Optional[str] = None,
-        size: Optional[str] = None,
-        type: Optional[Literal["default", "range", "multiple"]] = None,  # noqa: A002
-        weekday_format: Optional[str] = None,
-        weekend_days: Optional[list[Literal[0, 1, 2, 3, 4, 5, 6]]] = None,
-        with_cell_spacing: Optional[bool] = None,
-        with_week_numbers: Optional[bool] = None,
-        year_label_format: Optional[str] = None,
-        years_list_format: Optional[str] = None,
-        **kwargs: Any,
-    ) -> Optional[Union[datetime.date, list[datetime.date], tuple[datetime.date, datetime.date]]]:
-        """
-        Calendar date picker supporting single, range, and multiple modes.
-
-        Args:
-            label (str): Field label.
-            value (Optional[...]): Current value in the selected mode.
-            allow_deselect (Optional[bool]): Allow clearing selection.
-            allow_single_date_in_range (Optional[bool]): Allow single date in range mode.
-            aria_labels (Optional[dict]): ARIA labels.
-            columns_to_scroll (Optional[int]): Months to scroll.
-            decade_label_format (Optional[str]): Decade label format.
-            default_level (Optional[Literal["month", "year", "decade"]]): Initial calendar level.
-            description (Optional[str]): Helper text under the label.
-            enable_keyboard_navigation (Optional[bool]): Enable keyboard navigation.
-            first_day_of_week (Optional[Literal[0,1,2,3,4,5,6]]): First day of week.
-            header_controls_order (Optional[list[...]]): Header controls order.
-            hide_outside_dates (Optional[bool]): Hide outside month dates.
-            hide_weekdays (Optional[bool]): Hide weekday labels.
-            highlight_today (Optional[bool]): Highlight current date.
-            key (Optional[str]): Explicit element key.
-            level (Optional[str]): Current level.
-            locale (Optional[str]): Locale code.
-            max_date (Optional[Union[str, datetime.date]]): Max date.
-            max_level (Optional[str]): Max level.
-            min_date (Optional[Union[str, datetime.date]]): Min date.
-            month_label_format (Optional[str]): Month label format.
-            months_list_format (Optional[str]): Months list format.
-            next_icon (Optional[RouteLitElement]): Next button icon.
-            next_label (Optional[str]): Next button label.
-            number_of_columns (Optional[int]): Months displayed.
-            on_change (Optional[Callable[[...], None]]): Change handler.
-            presets (Optional[list]): Preset ranges.
-            previous_icon (Optional[RouteLitElement]): Previous button icon.
-            previous_label (Optional[str]): Previous button label.
-            size (Optional[str]): Control size.
-            type (Optional[Literal["default", "range", "multiple"]]): Picker mode.
-            weekday_format (Optional[str]): Weekday label format.
-            weekend_days (Optional[list[...]]): Weekend days indices.
-            with_cell_spacing (Optional[bool]): Add spacing between cells.
-            with_week_numbers (Optional[bool]): Show week numbers.
-            year_label_format (Optional[str]): Year label format.
-            years_list_format (Optional[str]): Years list format.
-            kwargs: Additional props to set.
-
-        Returns:
-            Optional[Union[datetime.date, list[datetime.date], tuple[datetime.date, datetime.date]]]: Current value.
-        """
-        return cast(
-            Optional[
-                Union[
-                    datetime.date,
-                    list[datetime.date],
-                    tuple[datetime.date, datetime.date],
-                ]
-            ],
-            self._x_input(
-                "datepicker",
-                key or self._new_widget_id("datepicker", label),
-                label=label,
-                description=description,
-                value=value,
-                allowDeselect=allow_deselect,
-                allowSingleDateInRange=allow_single_date_in_range,
-                ariaLabels=aria_labels,
-                columnsToScroll=columns_to_scroll,
-                decadeLabelFormat=decade_label_format,
-                defaultLevel=default_level,
-                enableKeyboardNavigation=enable_keyboard_navigation,
-                firstDayOfWeek=first_day_of_week,
-                headerControlsOrder=header_controls_order,
-                hideOutsideDates=hide_outside_dates,
-                hideWeekdays=hide_weekdays,
-                highlightToday=highlight_today,
-                level=level,
-                locale=locale,
-                maxDate=max_date,
-                maxLevel=max_level,
-                minDate=min_date,
-                monthLabelFormat=month_label_format,
-                monthsListFormat=months_list_format,
-                nextIcon=next_icon,
-                nextLabel=next_label,
-                numberOfColumns=number_of_columns,
-                onChange=on_change,
-                presets=presets,
-                previousIcon=previous_icon,
-                previousLabel=previous_label,
-                size=size,
-                type=type,
-                weekdayFormat=weekday_format,
-                weekendDays=weekend_days,
-                withCellSpacing=with_cell_spacing,
-                withWeekNumbers=with_week_numbers,
-                yearLabelFormat=year_label_format,
-                yearsListFormat=years_list_format,
-                rl_format_func=self._format_date_picker,
-                **kwargs,
-            ),
-        )
-
-    def date_picker_input(
-        self,
-        label: str,
-        value: Optional[
-            Union[
-                datetime.date,
-                str,
-                list[str],
-                list[datetime.date],
-                tuple[str, str],
-                tuple[datetime.date, datetime.date],
-            ]
-        ] = None,
-        *,
-        key: Optional[str] = None,
-        description: Optional[str] = None,
-        on_change: Optional[Callable[[Any], None]] = None,
-        allow_deselect: Optional[bool] = None,
-        allow_single_date_in_range: Optional[bool] = None,
-        aria_labels: Optional[dict] = None,
-        clear_button_props: Optional[dict] = None,
-        clearable: Optional[bool] = None,
-        close_on_change: Optional[bool] = None,
-        columns_to_scroll: Optional[int] = None,
-        decade_label_format: Optional[str] = None,
-        default_level: Optional[Literal["month", "year", "decade"]] = None,
-        description_props: Optional[dict] = None,
-        disabled: Optional[bool] = None,
-        dropdown_type: Optional[Literal["modal", "popover"]] = None,
-        enable_keyboard_navigation: Optional[bool] = None,
-        error: Optional[str] = None,
-        error_props: Optional[dict] = None,
-        first_day_of_week: Optional[Literal[0, 1, 2, 3, 4, 5, 6]] = None,
-        header_controls_order: Optional[list[Literal["level", "next", "previous"]]] = None,
-        hide_outside_dates: Optional[bool] = None,
-        hide_weekdays: Optional[bool] = None,
-        highlight_today: Optional[bool] = None,
-        input_size: Optional[str] = None,
-        input_wrapper_order: Optional[list[Literal["input", "label", "description", "error"]]] = None,
-        label_props: Optional[dict] = None,
-        label_separator: Optional[str] = None,
-        left_section: Optional[RouteLitElement] = None,
-        left_section_pointer_events: Optional[str] = None,
-        left_section_props: Optional[dict] = None,
-        left_section_width: Optional[str] = None,
-        level: Optional[Literal["month", "year", "decade"]] = None,
-        locale: Optional[str] = None,
-        max_date: Optional[Union[str, datetime.date]] = None,
-        max_level: Optional[Literal["month", "year", "decade"]] = None,
-        min_date: Optional[Union[str, datetime.date]] = None,
-        modal_props: Optional[dict] = None,
-        month_label_format: Optional[str] = None,
-        months_list_format: Optional[str] = None,
-        next_icon: Optional[RouteLitElement] = None,
-        next_label: Optional[str] = None,
-        number_of_columns: Optional[int] = None,
-        placeholder: Optional[str] = None,
-        pointer: Optional[bool] = None,
-        popover_props: Optional[dict] = None,
-        presets: Optional[list] = None,
-        previous_icon: Optional[RouteLitElement] = None,
-        previous_label: Optional[str] = None,
-        radius: Optional[Union[str, int]] = None,
-        read_only: Optional[bool] = None,
-        required: Optional[bool] = None,
-        right_section: Optional[RouteLitElement] = None,
-        right_section_pointer_events: Optional[str] = None,
-        right_section_props: Optional[dict] = None,
-        right_section_width: Optional[str] = None,
-        size: Optional[str] = None,
-        sort_dates: Optional[bool] = None,
-        type: Optional[str] = None,  # noqa: A002
-        value_format: Optional[str] = None,
-        weekday_format: Optional[str] = None,
-        weekend_days: Optional[list] = None,
-        with_asterisk: Optional[bool] = None,
-        with_cell_spacing: Optional[bool] = None,
-        with_error_styles: Optional[bool] = None,
-        with_week_numbers: Optional[bool] = None,
-        wrapper_props: Optional[dict] = None,
-        year_label_format: Optional[str] = None,
-        years_list_format: Optional[str] = None,
-        **kwargs: Any,
-    ) -> Optional[Union[datetime.date, list[datetime.date], tuple[datetime.date, datetime.date]]]:
-        """
-        Text input with integrated date picker dropdown.
-
-        Args:
-            label (str): Field label.
-            value (Optional[...]): Current value in the selected mode.
-            key (Optional[str]): Explicit element key.
-            description (Optional[str]): Helper text.
-            on_change (Optional[Callable[[Any], None]]): Change handler.
-            allow_deselect (Optional[bool]): Allow clearing selection.
-            allow_single_date_in_range (Optional[bool]): Allow single date in range mode.
-            aria_labels (Optional[dict]): ARIA labels.
-            clear_button_props (Optional[dict]): Clear button props.
-            clearable (Optional[bool]): Enable clear button.
-            close_on_change (Optional[bool]): Close dropdown on change.
-            columns_to_scroll (Optional[int]): Months to scroll.
-            decade_label_format (Optional[str]): Decade label format.
-            default_level (Optional[Literal["month", "year", "decade"]]): Initial calendar level.
-            description_props (Optional[dict]): Description props.
-            disabled (Optional[bool]): Disable interaction.
-            dropdown_type (Optional[Literal["modal", "popover"]]): Dropdown type.
-            enable_keyboard_navigation (Optional[bool]): Enable keyboard navigation.
-            error (Optional[str]): Error message.
-            error_props (Optional[dict]): Error props.
-            first_day_of_week (Optional[Literal[0,1,2,3,4,5,6]]): First day of week.
-            header_controls_order (Optional[list[...]]): Header controls order.
-            hide_outside_dates (Optional[bool]): Hide outside month dates.
-            hide_weekdays (Optional[bool]): Hide weekday labels.
-            highlight_today (Optional[bool]): Highlight current date.
-            input_size (Optional[str]): Control size.
-            input_wrapper_order (Optional[list[Literal["input","label","description","error"]]]): Wrapper parts order.
-            label_props (Optional[dict]): Label props.
-            label_separator (Optional[str]): Separator for range values.
-            left_section (Optional[RouteLitElement]): Left adornment.
-            left_section_pointer_events (Optional[str]): Pointer events for left section.
-            left_section_props (Optional[dict]): Left adornment props.
-            left_section_width (Optional[str]): Left adornment width.
-            level (Optional[Literal["month", "year", "decade"]]): Initial calendar level.
-            locale (Optional[str]): Locale code.
-            max_date (Optional[Union[str, datetime.date]]): Max date.
-            max_level (Optional[Literal["month", "year", "decade"]]): Max calendar level.
-            min_date (Optional[Union[str, datetime.date]]): Min date.
-            modal_props (Optional[dict]): Modal props.
-            month_label_format (Optional[str]): Month label format.
-            months_list_format (Optional[str]): Months list format.
-            next_icon (Optional[RouteLitElement]): Next button icon.
-            next_label (Optional[str]): Next button label.
-            number_of_columns (Optional[int]): Months displayed.
-            placeholder (Optional[str]): Input placeholder.
-            pointer (Optional[bool]): Use pointer cursor.
-            popover_props (Optional[dict]): Popover props.
-            presets (Optional[list]): Preset ranges.
-            previous_icon (Optional[RouteLitElement]): Previous button icon.
-            previous_label (Optional[str]): Previous button label.
-            radius (Optional[Union[str, int]]): Corner radius.
-            read_only (Optional[bool]): Read-only state.
-            required (Optional[bool]): Mark as required.
-            right_section (Optional[RouteLitElement]): Right adornment.
-            right_section_pointer_events (Optional[str]): Pointer events for right section.
-            right_section_props (Optional[dict]): Right adornment props.
-            right_section_width (Optional[str]): Right adornment width.
-            size (Optional[str]): Control size.
-            sort_dates (Optional[bool]): Sort selected dates.
-            type (Optional[str]): Picker mode.
-            value_format (Optional[str]): Output value format.
-            weekday_format (Optional[str]): Weekday label format.
-            weekend_days (Optional[list]): Weekend days indices.
-            with_asterisk (Optional[bool]): Show required asterisk.
-            with_cell_spacing (Optional[bool]): Add spacing between cells.
-            with_error_styles (Optional[bool]): Apply error styles.
-            with_week_numbers (Optional[bool]): Show week numbers.
-            wrapper_props (Optional[dict]): Wrapper props.
-            year_label_format (Optional[str]): Year label format.
-            years_list_format (Optional[str]): Years list format.
-            kwargs: Additional props to set.
-
-        Returns:
-            Optional[Union[datetime.date, list[datetime.date], tuple[datetime.date, datetime.date]]]: Current value.
-        """
-        return cast(
-            Optional[
-                Union[
-                    datetime.date,
-                    list[datetime.date],
-                    tuple[datetime.date, datetime.date],
-                ]
-            ],
-            self._x_input(
-                "datepickerinput",
-                key or self._new_widget_id("datepickerinput", label),
-                label=label,
-                description=description,
-                value=value,
-                allowDeselect=allow_deselect,
-                allowSingleDateInRange=allow_single_date_in_range,
-                ariaLabels=aria_labels,
-                clearButtonProps=clear_button_props,
-                clearable=clearable,
-                closeOnChange=close_on_change,
-                columnsToScroll=columns_to_scroll,
-                decadeLabelFormat=decade_label_format,
-                defaultLevel=default_level,
-                descriptionProps=description_props,
-                disabled=disabled,
-                dropdownType=dropdown_type,
-                enableKeyboardNavigation=enable_keyboard_navigation,
-                error=error,
-                errorProps=error_props,
-                firstDayOfWeek=first_day_of_week,
-                headerControlsOrder=header_controls_order,
-                hideOutsideDates=hide_outside_dates,
-                hideWeekdays=hide_weekdays,
-                highlightToday=highlight_today,
-                inputSize=input_size,
-                inputWrapperOrder=input_wrapper_order,
-                labelProps=label_props,
-                labelSeparator=label_separator,
-                leftSection=left_section,
-                leftSectionPointerEvents=left_section_pointer_events,
-                leftSectionProps=left_section_props,
-                leftSectionWidth=left_section_width,
-                level=level,
-                locale=locale,
-                maxDate=max_date,
-                maxLevel=max_level,
-                minDate=min_date,
-                modalProps=modal_props,
-                monthLabelFormat=month_label_format,
-                monthsListFormat=months_list_format,
-                nextIcon=next_icon,
-                nextLabel=next_label,
-                numberOfColumns=number_of_columns,
-                on_change=on_change,
-                placeholder=placeholder,
-                pointer=pointer,
-                popoverProps=popover_props,
-                presets=presets,
-                previousIcon=previous_icon,
-                previousLabel=previous_label,
-                radius=radius,
-                readOnly=read_only,
-                required=required,
-                rightSection=right_section,
-                rightSectionPointerEvents=right_section_pointer_events,
-                rightSectionProps=right_section_props,
-                rightSectionWidth=right_section_width,
-                size=size,
-                sortDates=sort_dates,
-                type=type,
-                valueFormat=value_format,
-                weekdayFormat=weekday_format,
-                weekendDays=weekend_days,
-                withAsterisk=with_asterisk,
-                withCellSpacing=with_cell_spacing,
-                withErrorStyles=with_error_styles,
-                withWeekNumbers=with_week_numbers,
-                wrapperProps=wrapper_props,
-                yearLabelFormat=year_label_format,
-                yearsListFormat=years_list_format,
-                rl_format_func=self._format_date_picker,
-                **kwargs,
-            ),
-        )
-
-    def _format_time(self, value: Optional[Union[datetime.time, str]]) -> Optional[datetime.time]:
-        if value is None:
-            return None
-        if isinstance(value, str):
-            return datetime.time.fromisoformat(value)
-        return value
-
-    def time_input(
-        self,
-        label: str,
-        value: Optional[Union[datetime.time, str]] = None,
-        *,
-        key: Optional[str] = None,
-        on_change: Optional[Callable[[Any], None]] = None,
-        description: Optional[Any] = None,
-        description_props: Optional[dict[str, Any]] = None,
-        disabled: Optional[bool] = None,
-        error: Optional[Any] = None,
-        error_props: Optional[dict[str, Any]] = None,
-        input_size: Optional[str] = None,
-        input_wrapper_order: Optional[list[str]] = None,
-        label_props: Optional[dict[str, Any]] = None,
-        left_section: Optional[Any] = None,
-        left_section_pointer_events: Optional[str] = None,
-        left_section_props: Optional[dict[str, Any]] = None,
-        left_section_width: Optional[Union[str, int]] = None,
-        max_time: Optional[str] = None,
-        min_time: Optional[str] = None,
-        pointer: Optional[bool] = None,
-        radius: Optional[Union[str, int]] = None,
-        required: Optional[bool] = None,
-        right_section: Optional[Any] = None,
-        right_section_pointer_events: Optional[str] = None,
-        right_section_props: Optional[dict[str, Any]] = None,
-        right_section_width: Optional[Union[str, int]] = None,
-        size: Optional[str] = None,
-        with_asterisk: Optional[bool] = None,
-        with_error_styles: Optional[bool] = None,
-        with_seconds: Optional[bool] = None,
-        wrapper_props: Optional[dict[str, Any]] = None,
-        **kwargs: Any,
-    ) -> Optional[datetime.time]:
-        """
-        Time input with support for parsing from string.
-
-        Args:
-            label (str): Field label.
-            value (Optional[Union[datetime.time, str]]): Current value.
-            key (Optional[str]): Explicit element key.
-            on_change (Optional[Callable[[Any], None]]): Change handler.
-            description (Optional[Any]): Contents of Input.Description component.
-            description_props (Optional[dict[str, Any]]): Props passed to Input.Description component.
-            disabled (Optional[bool]): Sets disabled attribute on input element.
-            error (Optional[Any]): Contents of Input.Error component.
-            error_props (Optional[dict[str, Any]]): Props passed to Input.Error component.
-            input_size (Optional[str]): Size attribute for input element.
-            input_wrapper_order (Optional[list[str]]): Controls order of elements.
-            label_props (Optional[dict[str, Any]]): Props passed to Input.Label component.
-            left_section (Optional[Any]): Content displayed on left side of input.
-            left_section_pointer_events (Optional[str]): Pointer events style for left section.
-            left_section_props (Optional[dict[str, Any]]): Props for left section element.
-            left_section_width (Optional[Union[str, int]]): Width of left section.
-            max_time (Optional[str]): Maximum possible time value.
-            min_time (Optional[str]): Minimum possible time value.
-            pointer (Optional[bool]): Whether input should have pointer cursor.
-            radius (Optional[Union[str, int]]): Border radius value.
-            required (Optional[bool]): Whether input is required.
-            right_section (Optional[Any]): Content displayed on right side of input.
-            right_section_pointer_events (Optional[str]): Pointer events style for right section.
-            right_section_props (Optional[dict[str, Any]]): Props for right section element.
-            right_section_width (Optional[Union[str, int]]): Width of right section.
-            size (Optional[str]): Controls input height and padding.
-            with_asterisk (Optional[bool]): Whether to show required asterisk.
-            with_error_styles (Optional[bool]): Whether to show error styling.
-            with_seconds (Optional[bool]): Whether to show seconds input.
-            wrapper_props (Optional[dict[str, Any]]): Props for root element.
-            kwargs: Additional props to set.
-
-        Returns:
-            Optional[datetime.time]: Current value.
-        """
-        return cast(
-            Optional[datetime.time],
-            self._x_input(
-                "timeinput",
-                key=key or self._new_widget_id("timeinput", label),
-                label=label,
-                value=value,
-                description=description,
-                descriptionProps=description_props,
-                disabled=disabled,
-                error=error,
-                errorProps=error_props,
-                inputSize=input_size,
-                inputWrapperOrder=input_wrapper_order,
-                labelProps=label_props,
-                leftSection=left_section,
-                leftSectionPointerEvents=left_section_pointer_events,
-                leftSectionProps=left_section_props,
-                leftSectionWidth=left_section_width,
-                maxTime=max_time,
-                minTime=min_time,
-                pointer=pointer,
-                radius=radius,
-                required=required,
-                rightSection=right_section,
-                rightSectionPointerEvents=right_section_pointer_events,
-                rightSectionProps=right_section_props,
-                rightSectionWidth=right_section_width,
-                size=size,
-                withAsterisk=with_asterisk,
-                withErrorStyles=with_error_styles,
-                withSeconds=with_seconds,
-                wrapperProps=wrapper_props,
-                rl_format_func=self._format_time,
-                on_change=on_change,
-                **kwargs,
-            ),
-        )
-
-    def time_picker(
-        self,
-        label: str,
-        value: Optional[Union[datetime.time, str]] = None,
-        *,
-        key: Optional[str] = None,
-        on_change: Optional[Callable[[Any], None]] = None,
-        am_pm_input_label: Optional[str] = None,
-        am_pm_labels: Optional[dict[str, str]] = None,
-        am_pm_select_props: Optional[dict[str, Any]] = None,
-        clear_button_props: Optional[dict[str, Any]] = None,
-        clearable: Optional[bool] = None,
-        description: Optional[Any] = None,
-        description_props: Optional[dict[str, Any]] = None,
-        disabled: Optional[bool] = None,
-        error: Optional[Any] = None,
-        error_props: Optional[dict[str, Any]] = None,
-        form: Optional[str] = None,
-        format: Optional[str] = None,  # noqa: A002
-        hidden_input_props: Optional[dict[str, Any]] = None,
-        hours_input_label: Optional[str] = None,
-        hours_input_props: Optional[dict[str, Any]] = None,
-        hours_step: Optional[int] = None,
-        input_size: Optional[str] = None,
-        input_wrapper_order: Optional[list[str]] = None,
-        label_props: Optional[dict[str, Any]] = None,
-        left_section: Optional[Any] = None,
-        left_section_pointer_events: Optional[str] = None,
-        left_section_props: Optional[dict[str, Any]] = None,
-        left_section_width: Optional[Union[str, int]] = None,
-        max: Optional[str] = None,  # noqa: A002
-        max_dropdown_content_height: Optional[int] = None,
-        min: Optional[str] = None,  # noqa: A002
-        minutes_input_label: Optional[str] = None,
-        minutes_input_props: Optional[dict[str, Any]] = None,
-        minutes_step: Optional[int] = None,
-        name: Optional[str] = None,
-        pointer: Optional[bool] = None,
-        popover_props: Optional[dict[str, Any]] = None,
-        presets: Optional[Any] = None,
-        radius: Optional[Union[str, int]] = None,
-        read_only: Optional[bool] = None,
-        required: Optional[bool] = None,
-        right_section: Optional[Any] = None,
-        right_section_pointer_events: Optional[str] = None,
-        right_section_props: Optional[dict[str, Any]] = None,
-        right_section_width: Optional[Union[str, int]] = None,
-        scroll_area_props: Optional[dict[str, Any]] = None,
-        seconds_input_label: Optional[str] = None,
-        seconds_input_props: Optional[dict[str, Any]] = None,
-        seconds_step: Optional[int] = None,
-        size: Optional[str] = None,
-        with_asterisk: Optional[bool] = None,
-        with_dropdown: Optional[bool] = None,
-        with_error_styles: Optional[bool] = None,
-        with_seconds: Optional[bool] = None,
-        wrapper_props: Optional[dict[str, Any]] = None,
-        **kwargs: Any,
-    ) -> Optional[datetime.time]:
-        """
-        Time picker with support for parsing from string.
-
-        Args:
-            label (str): Label text.
-            value (Optional[Union[datetime.time, str]]): Current value.
-            key (Optional[str]): Unique key for the widget.
-            on_change (Optional[Callable[[Any], None]]): Called when value changes.
-            am_pm_input_label (Optional[str]): aria-label of am/pm input.
-            am_pm_labels (Optional[dict[str, str]]): Labels used for am/pm values.
-            am_pm_select_props (Optional[dict[str, Any]]): Props for am/pm select.
-            clear_button_props (Optional[dict[str, Any]]): Props for clear button.
-            clearable (Optional[bool]): Whether clear button should be displayed.
-            description (Optional[Any]): Description content.
-            description_props (Optional[dict[str, Any]]): Props for description.
-            disabled (Optional[bool]): Whether component is disabled.
-            error (Optional[Any]): Error content.
-            error_props (Optional[dict[str, Any]]): Props for error.
-            form (Optional[str]): Form prop for hidden input.
-            format (Optional[str]): Time format ('12h' or '24h').
-            hidden_input_props (Optional[dict[str, Any]]): Props for hidden input.
-            hours_input_label (Optional[str]): aria-label of hours input.
-            hours_input_props (Optional[dict[str, Any]]): Props for hours input.
-            hours_step (Optional[int]): Hours increment/decrement step.
-            input_size (Optional[str]): Size attribute for input element.
-            input_wrapper_order (Optional[list[str]]): Order of elements.
-            label_props (Optional[dict[str, Any]]): Props for label.
-            left_section (Optional[Any]): Left section content.
-            left_section_pointer_events (Optional[str]): Left section pointer events.
-            left_section_props (Optional[dict[str, Any]]): Props for left section.
-            left_section_width (Optional[Union[str, int]]): Left section width.
-            max (Optional[str]): Max time value (hh:mm:ss).
-            max_dropdown_content_height (Optional[int]): Max dropdown height in px.
-            min (Optional[str]): Min time value (hh:mm:ss).
-            minutes_input_label (Optional[str]): aria-label of minutes input.
-            minutes_input_props (Optional[dict[str, Any]]): Props for minutes input.
-            minutes_step (Optional[int]): Minutes increment/decrement step.
-            name (Optional[str]): Name prop for hidden input.
-            pointer (Optional[bool]): Whether to show pointer cursor.
-            popover_props (Optional[dict[str, Any]]): Props for popover.
-            presets (Optional[Any]): Time presets for dropdown.
-            radius (Optional[Union[str, int]]): Border radius.
-            read_only (Optional[bool]): Whether value is read-only.
-            required (Optional[bool]): Whether field is required.
-            right_section (Optional[Any]): Right section content.
-            right_section_pointer_events (Optional[str]): Right section pointer events.
-            right_section_props (Optional[dict[str, Any]]): Props for right section.
-            right_section_width (Optional[Union[str, int]]): Right section width.
-            scroll_area_props (Optional[dict[str, Any]]): Props for scroll areas.
-            seconds_input_label (Optional[str]): aria-label of seconds input.
-            seconds_input_props (Optional[dict[str, Any]]): Props for seconds input.
-            seconds_step (Optional[int]): Seconds increment/decrement step.
-            size (Optional[str]): Controls input height and padding.
-            value (Optional[Union[datetime.time, str]]): Current value.
-            with_asterisk (Optional[bool]): Whether to show required asterisk.
-            with_dropdown (Optional[bool]): Whether to show dropdown.
-            with_error_styles (Optional[bool]): Whether to show error styling.
-            with_seconds (Optional[bool]): Whether to show seconds input.
-            wrapper_props (Optional[dict[str, Any]]): Props for root element.
-            kwargs: Additional props to set.
-
-        Returns:
-            Optional[datetime.time]: Current value.
-        """
-        return cast(
-            Optional[datetime.time],
-            self._x_input(
-                "timepicker",
-                key=key or self._new_widget_id("timepicker", label),
-                label=label,
-                value=value,
-                amPmInputLabel=am_pm_input_label,
-                amPmLabels=am_pm_labels,
-                amPmSelectProps=am_pm_select_props,
-                clearButtonProps=clear_button_props,
-                clearable=clearable,
-                description=description,
-                descriptionProps=description_props,
-                disabled=disabled,
-                error=error,
-                errorProps=error_props,
-                form=form,
-                format=format,
-                hiddenInputProps=hidden_input_props,
-                hoursInputLabel=hours_input_label,
-                hoursInputProps=hours_input_props,
-                hoursStep=hours_step,
-                inputSize=input_size,
-                inputWrapperOrder=input_wrapper_order,
-                labelProps=label_props,
-                leftSection=left_section,
-                leftSectionPointerEvents=left_section_pointer_events,
-                leftSectionProps=left_section_props,
-                leftSectionWidth=left_section_width,
-                max=max,
-                maxDropdownContentHeight=max_dropdown_content_height,
-                min=min,
-                minutesInputLabel=minutes_input_label,
-                minutesInputProps=minutes_input_props,
-                minutesStep=minutes_step,
-                name=name,
-                pointer=pointer,
-                popoverProps=popover_props,
-                presets=presets,
-                radius=radius,
-                readOnly=read_only,
-                required=required,
-                rightSection=right_section,
-                rightSectionPointerEvents=right_section_pointer_events,
-                rightSectionProps=right_section_props,
-                rightSectionWidth=right_section_width,
-                scrollAreaProps=scroll_area_props,
-                secondsInputLabel=seconds_input_label,
-                secondsInputProps=seconds_input_props,
-                secondsStep=seconds_step,
-                size=size,
-                withAsterisk=with_asterisk,
-                withDropdown=with_dropdown,
-                withErrorStyles=with_error_styles,
-                withSeconds=with_seconds,
-                wrapperProps=wrapper_props,
-                rl_format_func=self._format_time,
-                on_change=on_change,
-                **kwargs,
-            ),
-        )
-
-    def area_chart(
-        self,
-        data: list,
-        data_key: str,
-        series: list[dict[str, Any]],
-        *,
-        key: Optional[str] = None,
-        active_dot_props: Optional[dict[str, Any]] = None,
-        area_chart_props: Optional[dict[str, Any]] = None,
-        area_props: Optional[dict[str, Any]] = None,
-        connect_nulls: Optional[bool] = None,
-        curve_type: Optional[str] = None,
-        dot_props: Optional[dict[str, Any]] = None,
-        fill_opacity: float = 0.2,
-        grid_axis: Optional[str] = None,
-        grid_color: Optional[str] = None,
-        grid_props: Optional[dict[str, Any]] = None,
-        legend_props: Optional[dict[str, Any]] = None,
-        orientation: Optional[str] = None,
-        reference_lines: Optional[list[dict[str, Any]]] = None,
-        right_y_axis_label: Optional[str] = None,
-        right_y_axis_props: Optional[dict[str, Any]] = None,
-        split_colors: Optional[list[str]] = None,
-        split_offset: Optional[float] = None,
-        stroke_dasharray: Optional[Union[str, int]] = None,
-        stroke_width: Optional[int] = None,
-        text_color: Optional[str] = None,
-        tick_line: Optional[str] = None,
-        tooltip_animation_duration: int = 0,
-        tooltip_props: Optional[dict[str, Any]] = None,
-        type: Optional[str] = None,  # noqa: A002
-        unit: Optional[str] = None,
-        with_dots: Optional[bool] = None,
-        with_gradient: Optional[bool] = None,
-        with_legend: Optional[bool] = None,
-        with_point_labels: Optional[bool] = None,
-        with_right_y_axis: Optional[bool] = None,
-        with_tooltip: Optional[bool] = None,
-        with_x_axis: Optional[bool] = None,
-        with_y_axis: Optional[bool] = None,
-        x_axis_label: Optional[str] = None,
-        x_axis_props: Optional[dict[str, Any]] = None,
-        y_axis_label: Optional[str] = None,
-        y_axis_props: Optional[dict[str, Any]] = None,
-        **kwargs: Any,
-    ) -> "RLBuilder":
-        """
-        Area chart for time series or continuous data.
-
-        Args:
-            data (list): Dataset.
-            data_key (str): X-axis data key.
-            series (list[dict[str, Any]]): Series configuration.
-            key (Optional[str]): Explicit element key.
-            active_dot_props (Optional[dict[str, Any]]): Active dot props.
-            area_chart_props (Optional[dict[str, Any]]): Chart container props.
-            area_props (Optional[dict[str, Any]]): Area props.
-            connect_nulls (Optional[bool]): Connect across null values.
-            curve_type (Optional[str]): Curve interpolation type.
-            dot_props (Optional[dict[str, Any]]): Dot props.
-            fill_opacity (float): Fill opacity for area.
-            grid_axis (Optional[str]): Grid axis.
-            grid_color (Optional[str]): Grid color.
-            grid_props (Optional[dict[str, Any]]): Grid props.
-            legend_props (Optional[dict[str, Any]]): Legend props.
-            orientation (Optional[str]): Chart orientation.
-            reference_lines (Optional[list[dict[str, Any]]]): Reference lines.
-            right_y_axis_label (Optional[str]): Secondary Y axis label.
-            right_y_axis_props (Optional[dict[str, Any]]): Secondary Y axis props.
-            split_colors (Optional[list[str]]): Split area colors.
-            split_offset (Optional[float]): Split offset value.
-            stroke_dasharray (Optional[Union[str, int]]): Stroke dash pattern.
-            stroke_width (Optional[int]): Line width.
-            text_color (Optional[str]): Text color.
-            tick_line (Optional[str]): Tick line display.
-            tooltip_animation_duration (int): Tooltip animation duration.
-            tooltip_props (Optional[dict[str, Any]]): Tooltip props.
-            type (Optional[str]): Chart type variant.
-            unit (Optional[str]): Unit suffix.
-            with_dots (Optional[bool]): Show dots.
-            with_gradient (Optional[bool]): Fill with gradient.
-            with_legend (Optional[bool]): Show legend.
-            with_point_labels (Optional[bool]): Show point labels.
-            with_right_y_axis (Optional[bool]): Enable right Y axis.
-            with_tooltip (Optional[bool]): Show tooltip.
-            with_x_axis (Optional[bool]): Show X axis.
-            with_y_axis (Optional[bool]): Show Y axis.
-            x_axis_label (Optional[str]): X axis label.
-            x_axis_props (Optional[dict[str, Any]]): X axis props.
-            y_axis_label (Optional[str]): Y axis label.
-            y_axis_props (Optional[dict[str, Any]]): Y axis props.
-            kwargs: Additional props to set.
-
-        Returns:
-            RLBuilder: A nested builder scoped to the area chart element.
-        """
-        return self._create_builder_element(  # type: ignore[return-value]
-            name="areachart",
-            key=key or self._new_text_id("areachart"),
-            props={
-                "data": data,
-                "dataKey": data_key,
-                "series": series,
-                "activeDotProps": active_dot_props,
-                "areaChartProps": area_chart_props,
-                "areaProps": area_props,
-                "connectNulls": connect_nulls,
-                "curveType": curve_type,
-                "dotProps": dot_props,
-                "fillOpacity": fill_opacity,
-                "gridAxis": grid_axis,
-                "gridColor": grid_color,
-                "gridProps": grid_props,
-                "legendProps": legend_props,
-                "orientation": orientation,
-                "referenceLines": reference_lines,
-                "rightYAxisLabel": right_y_axis_label,
-                "rightYAxisProps": right_y_axis_props,
-                "splitColors": split_colors,
-                "splitOffset": split_offset,
-                "strokeDasharray": stroke_dasharray,
-                "strokeWidth": stroke_width,
-                "textColor": text_color,
-                "tickLine": tick_line,
-                "tooltipAnimationDuration": tooltip_animation_duration,
-                "tooltipProps": tooltip_props,
-                "type": type,
-                "unit": unit,
-                "withDots": with_dots,
-                "withGradient": with_gradient,
-                "withLegend": with_legend,
-                "withPointLabels": with_point_labels,
-                "withRightYAxis": with_right_y_axis,
-                "withTooltip": with_tooltip,
-                "withXAxis": with_x_axis,
-                "withYAxis": with_y_axis,
-                "xAxisLabel": x_axis_label,
-                "xAxisProps": x_axis_props,
-                "yAxisLabel": y_axis_label,
-                "yAxisProps": y_axis_props,
-                **kwargs,
-            },
-        )
-
-    def bar_chart(
-        self,
-        data: list,
-        data_key: str,
-        series: list[dict[str, Any]],
-        *,
-        bar_chart_props: Optional[dict[str, Any]] = None,
-        bar_label_color: Optional[str] = None,
-        bar_props: Optional[dict[str, Any]] = None,
-        cursor_fill: Optional[str] = None,
-        fill_opacity: Optional[float] = None,
-        get_bar_color: Optional[Callable[[float, dict[str, Any]], str]] = None,
-        grid_axis: Optional[Literal["none", "x", "y", "xy"]] = None,
-        grid_color: Optional[str] = None,
-        grid_props: Optional[dict[str, Any]] = None,
-        key: Optional[str] = None,
-        legend_props: Optional[dict[str, Any]] = None,
-        max_bar_width: Optional[int] = None,
-        min_bar_size: Optional[int] = None,
-        orientation: Optional[Literal["horizontal", "vertical"]] = None,
-        reference_lines: Optional[list[dict[str, Any]]] = None,
-        right_y_axis_label: Optional[str] = None,
-        right_y_axis_props: Optional[dict[str, Any]] = None,
-        stroke_dasharray: Optional[Union[str, int]] = None,
-        text_color: Optional[str] = None,
-        tick_line: Optional[Literal["none", "x", "y", "xy"]] = None,
-        tooltip_animation_duration: Optional[int] = None,
-        tooltip_props: Optional[dict[str, Any]] = None,
-        type: Optional[str] = None,  # noqa: A002
-        unit: Optional[str] = None,
-        value_label_props: Optional[dict[str, Any]] = None,
-        with_bar_value_label: Optional[bool] = None,
-        with_legend: Optional[bool] = None,
-        with_right_y_axis: Optional[bool] = None,
-        with_tooltip: Optional[bool] = None,
-        with_x_axis: Optional[bool] = None,
-        with_y_axis: Optional[bool] = None,
-        x_axis_label: Optional[str] = None,
-        x_axis_props: Optional[dict[str, Any]] = None,
-        y_axis_label: Optional[str] = None,
-        y_axis_props: Optional[dict[str, Any]] = None,
-        **kwargs: Any,
-    ) -> "RLBuilder":
-        """
-        Bar chart for categorical or time series data.
-
-        Args:
-            data (list): Dataset.
-            data_key (str): X-axis data key.
-            series (list[dict[str, Any]]): Series configuration.
-            bar_chart_props (Optional[dict[str, Any]]): Chart container props.
-            bar_label_color (Optional[str]): Value label color.
-            bar_props (Optional[dict[str, Any]]): Bar props.
-            cursor_fill (Optional[str]): Cursor overlay color.
-            fill_opacity (Optional[float]): Bar fill opacity.
-            get_bar_color (Optional[Callable[[float, dict[str, Any]], str]]): Dynamic color callback.
-            grid_axis (Optional[Literal["none","x","y","xy"]]): Grid axis.
-            grid_color (Optional[str]): Grid color.
-            grid_props (Optional[dict[str, Any]]): Grid props.
-            key (Optional[str]): Explicit element key.
-            legend_props (Optional[dict[str, Any]]): Legend props.
-            max_bar_width (Optional[int]): Max bar width.
-            min_bar_size (Optional[int]): Min bar size.
-            orientation (Optional[Literal["horizontal","vertical"]]): Orientation.
-            reference_lines (Optional[list[dict[str, Any]]]): Reference lines.
-            right_y_axis_label (Optional[str]): Secondary Y axis label.
-            right_y_axis_props (Optional[dict[str, Any]]): Secondary Y axis props.
-            stroke_dasharray (Optional[Union[str, int]]): Border dash pattern.
-            text_color (Optional[str]): Text color.
-            tick_line (Optional[Literal["none","x","y","xy"]]): Tick line display.
-            tooltip_animation_duration (Optional[int]): Tooltip animation duration.
-            tooltip_props (Optional[dict[str, Any]]): Tooltip props.
-            type (Optional[str]): Chart type variant.
-            unit (Optional[str]): Unit suffix.
-            value_label_props (Optional[dict[str, Any]]): Value label props.
-            with_bar_value_label (Optional[bool]): Show value labels above bars.
-            with_legend (Optional[bool]): Show legend.
-            with_right_y_axis (Optional[bool]): Enable right Y axis.
-            with_tooltip (Optional[bool]): Show tooltip.
-            with_x_axis (Optional[bool]): Show X axis.
-            with_y_axis (Optional[bool]): Show Y axis.
-            x_axis_label (Optional[str]): X axis label.
-            x_axis_props (Optional[dict[str, Any]]): X axis props.
-            y_axis_label (Optional[str]): Y axis label.
-            y_axis_props (Optional[dict[str, Any]]): Y axis props.
-            kwargs: Additional props to set.
-
-        Returns:
-            RLBuilder: A nested builder scoped to the bar chart element.
-        """
-        return self._create_builder_element(  # type: ignore[return-value]
-            name="barchart",
-            key=key or self._new_text_id("barchart"),
-            props={
-                "data": data,
-                "dataKey": data_key,
-                "series": series,
-                "barChartProps": bar_chart_props,
-                "barLabelColor": bar_label_color,
-                "barProps": bar_props,
-                "cursorFill": cursor_fill,
-                "fillOpacity": fill_opacity,
-                "getBarColor": get_bar_color,
-                "gridAxis": grid_axis,
-                "gridColor": grid_color,
-                "gridProps": grid_props,
-                "legendProps": legend_props,
-                "maxBarWidth": max_bar_width,
-                "minBarSize": min_bar_size,
-                "orientation": orientation,
-                "referenceLines": reference_lines,
-                "rightYAxisLabel": right_y_axis_label,
-                "rightYAxisProps": right_y_axis_props,
-                "strokeDasharray": stroke_dasharray,
-                "textColor": text_color,
-                "tickLine": tick_line,
-                "tooltipAnimationDuration": tooltip_animation_duration,
-                "tooltipProps": tooltip_props,
-                "type": type,
-                "unit": unit,
-                "valueLabelProps": value_label_props,
-                "withBarValueLabel": with_bar_value_label,
-                "withLegend": with_legend,
-                "withRightYAxis": with_right_y_axis,
-                "withTooltip": with_tooltip,
-                "withXAxis": with_x_axis,
-                "withYAxis": with_y_axis,
-                "xAxisLabel": x_axis_label,
-                "xAxisProps": x_axis_props,
-                "yAxisLabel": y_axis_label,
-                "yAxisProps": y_axis_props,
-                **kwargs,
-            },
-        )
-
-    def line_chart(
-        self,
-        data: list,
-        data_key: str,
-        series: list[dict[str, Any]],
-        *,
-        key: Optional[str] = None,
-        active_dot_props: Optional[dict[str, Any]] = None,
-        connect_nulls: Optional[bool] = None,
-        curve_type: Optional[str] = None,
-        dot_props: Optional[dict[str, Any]] = None,
-        fill_opacity: Optional[float] = None,
-        gradient_stops: Optional[list[dict[str, Any]]] = None,
-        grid_axis: Optional[str] = None,
-        grid_color: Optional[str] = None,
-        grid_props: Optional[dict[str, Any]] = None,
-        legend_props: Optional[dict[str, Any]] = None,
-        line_chart_props: Optional[dict[str, Any]] = None,
-        line_props: Optional[dict[str, Any]] = None,
-        orientation: Optional[str] = None,
-        reference_lines: Optional[list[dict[str, Any]]] = None,
-        right_y_axis_label: Optional[str] = None,
-        right_y_axis_props: Optional[dict[str, Any]] = None,
-        stroke_dasharray: Optional[str] = None,
-        stroke_width: Optional[float] = None,
-        text_color: Optional[str] = None,
-        tick_line: Optional[str] = None,
-        tooltip_animation_duration: Optional[int] = None,
-        tooltip_props: Optional[dict[str, Any]] = None,
-        type: Optional[str] = None,  # noqa: A002
-        unit: Optional[str] = None,
-        with_dots: Optional[bool] = None,
-        with_legend: Optional[bool] = None,
-        with_point_labels: Optional[bool] = None,
-        with_right_y_axis: Optional[bool] = None,
-        with_tooltip: Optional[bool] = None,
-        with_x_axis: Optional[bool] = None,
-        with_y_axis: Optional[bool] = None,
-        x_axis_label: Optional[str] = None,
-        x_axis_props: Optional[dict[str, Any]] = None,
-        y_axis_label: Optional[str] = None,
-        y_axis_props: Optional[dict[str, Any]] = None,
-        **kwargs: Any,
-    ) -> "RLBuilder":
-        """
-        Line chart for continuous data.
-
-        Args:
-            data (list): Dataset.
-            data_key (str): X-axis data key.
-            series (list[dict[str, Any]]): Series configuration.
-            key (Optional[str]): Explicit element key.
-            active_dot_props (Optional[dict[str, Any]]): Active dot props.
-            connect_nulls (Optional[bool]): Connect across null values.
-            curve_type (Optional[str]): Curve interpolation type.
-            dot_props (Optional[dict[str, Any]]): Dot props.
-            fill_opacity (Optional[float]): Area fill opacity for gradients.
-            gradient_stops (Optional[list[dict[str, Any]]]): Gradient configuration.
-            grid_axis (Optional[str]): Grid axis.
-            grid_color (Optional[str]): Grid color.
-            grid_props (Optional[dict[str, Any]]): Grid props.
-            legend_props (Optional[dict[str, Any]]): Legend props.
-            line_chart_props (Optional[dict[str, Any]]): Chart container props.
-            line_props (Optional[dict[str, Any]]): Line props.
-            orientation (Optional[str]): Chart orientation.
-            reference_lines (Optional[list[dict[str, Any]]]): Reference lines.
-            right_y_axis_label (Optional[str]): Secondary Y axis label.
-            right_y_axis_props (Optional[dict[str, Any]]): Secondary Y axis props.
-            stroke_dasharray (Optional[str]): Line dash pattern.
-            stroke_width (Optional[float]): Line width.
-            text_color (Optional[str]): Text color.
-            tick_line (Optional[str]): Tick line display.
-            tooltip_animation_duration (Optional[int]): Tooltip animation duration.
-            tooltip_props (Optional[dict[str, Any]]): Tooltip props.
-            type (Optional[str]): Chart type variant.
-            unit (Optional[str]): Unit suffix.
-            with_dots (Optional[bool]): Show dots.
-            with_legend (Optional[bool]): Show legend.
-            with_point_labels (Optional[bool]): Show point labels.
-            with_right_y_axis (Optional[bool]): Enable right Y axis.
-            with_tooltip (Optional[bool]): Show tooltip.
-            with_x_axis (Optional[bool]): Show X axis.
-            with_y_axis (Optional[bool]): Show Y axis.
-            x_axis_label (Optional[str]): X axis label.
-            x_axis_props (Optional[dict[str, Any]]): X axis props.
-            y_axis_label (Optional[str]): Y axis label.
-            y_axis_props (Optional[dict[str, Any]]): Y axis props.
-            kwargs: Additional props to set.
-
-        Returns:
-            RLBuilder: A nested builder scoped to the line chart element.
-        """
-        return self._create_builder_element(  # type: ignore[return-value]
-            name="linechart",
-            key=key or self._new_text_id("linechart"),
-            props={
-                "data": data,
-                "dataKey": data_key,
-                "series": series,
-                "activeDotProps": active_dot_props,
-                "connectNulls": connect_nulls,
-                "curveType": curve_type,
-                "dotProps": dot_props,
-                "fillOpacity": fill_opacity,
-                "gradientStops": gradient_stops,
-                "gridAxis": grid_axis,
-                "gridColor": grid_color,
-                "gridProps": grid_props,
-                "legendProps": legend_props,
-                "lineChartProps": line_chart_props,
-                "lineProps": line_props,
-                "orientation": orientation,
-                "referenceLines": reference_lines,
-                "rightYAxisLabel": right_y_axis_label,
-                "rightYAxisProps": right_y_axis_props,
-                "strokeDasharray": stroke_dasharray,
-                "strokeWidth": stroke_width,
-                "textColor": text_color,
-                "tickLine": tick_line,
-                "tooltipAnimationDuration": tooltip_animation_duration,
-                "tooltipProps": tooltip_props,
-                "type": type,
-                "unit": unit,
-                "withDots": with_dots,
-                "withLegend": with_legend,
-                "withPointLabels": with_point_labels,
-                "withRightYAxis": with_right_y_axis,
-                "withTooltip": with_tooltip,
-                "withXAxis": with_x_axis,
-                "withYAxis": with_y_axis,
-                "xAxisLabel": x_axis_label,
-                "xAxisProps": x_axis_props,
-                "yAxisLabel": y_axis_label,
-                "yAxisProps": y_axis_props,
-                **kwargs,
-            },
-        )
-
-    def composite_chart(
-        self,
-        data: list,
-        data_key: str,
-        series: list[dict[str, Any]],
-        *,
-        key: Optional[str] = None,
-        active_dot_props: Optional[dict[str, Any]] = None,
-        area_props: Optional[dict[str, Any]] = None,
-        bar_props: Optional[dict[str, Any]] = None,
-        children: Optional[Any] = None,
-        composed_chart_props: Optional[dict[str, Any]] = None,
-        connect_nulls: Optional[bool] = None,
-        curve_type: Optional[str] = None,
-        dot_props: Optional[dict[str, Any]] = None,
-        grid_axis: Optional[str] = None,
-        grid_color: Optional[str] = None,
-        grid_props: Optional[dict[str, Any]] = None,
-        legend_props: Optional[dict[str, Any]] = None,
-        line_props: Optional[dict[str, Any]] = None,
-        max_bar_width: Optional[int] = None,
-        min_bar_size: Optional[int] = None,
-        reference_lines: Optional[list[dict[str, Any]]] = None,
-        right_y_axis_label: Optional[str] = None,
-        right_y_axis_props: Optional[dict[str, Any]] = None,
-        stroke_dasharray: Optional[str] = None,
-        stroke_width: Optional[int] = None,
-        text_color: Optional[str] = None,
-        tick_line: Optional[str] = None,
-        tooltip_animation_duration: Optional[int] = None,
-        tooltip_props: Optional[dict[str, Any]] = None,
-        unit: Optional[str] = None,
-        with_bar_value_label: Optional[bool] = None,
-        with_dots: Optional[bool] = None,
-        with_legend: Optional[bool] = None,
-        with_point_labels: Optional[bool] = None,
-        with_right_y_axis: Optional[bool] = None,
-        with_tooltip: Optional[bool] = None,
-        with_x_axis: Optional[bool] = None,
-        with_y_axis: Optional[bool] = None,
-        x_axis_label: Optional[str] = None,
-        x_axis_props: Optional[dict[str, Any]] = None,
-        y_axis_label: Optional[str] = None,
-        y_axis_props: Optional[dict[str, Any]] = None,
-        **kwargs: Any,
-    ) -> "RLBuilder":
-        """
-        Composite chart that can combine bars, lines, and areas.
-
-        Args:
-            data (list): Dataset.
-            data_key (str): X-axis data key.
-            series (list[dict[str, Any]]): Series configuration.
-            key (Optional[str]): Explicit element key.
-            active_dot_props (Optional[dict[str, Any]]): Active dot props.
-            area_props (Optional[dict[str, Any]]): Area props.
-            bar_props (Optional[dict[str, Any]]): Bar props.
-            children (Optional[Any]): Extra child elements.
-            composed_chart_props (Optional[dict[str, Any]]): Chart container props.
-            connect_nulls (Optional[bool]): Connect across null values.
-            curve_type (Optional[str]): Curve interpolation type.
-            dot_props (Optional[dict[str, Any]]): Dot props.
-            grid_axis (Optional[str]): Grid axis.
-            grid_color (Optional[str]): Grid color.
-            grid_props (Optional[dict[str, Any]]): Grid props.
-            legend_props (Optional[dict[str, Any]]): Legend props.
-            line_props (Optional[dict[str, Any]]): Line props.
-            max_bar_width (Optional[int]): Max bar width.
-            min_bar_size (Optional[int]): Min bar size.
-            reference_lines (Optional[list[dict[str, Any]]]): Reference lines.
-            right_y_axis_label (Optional[str]): Secondary Y axis label.
-            right_y_axis_props (Optional[dict[str, Any]]): Secondary Y axis props.
-            stroke_dasharray (Optional[str]): Stroke dash pattern.
-            stroke_width (Optional[int]): Line width.
-            text_color (Optional[str]): Text color.
-            tick_line (Optional[str]): Tick line display.
-            tooltip_animation_duration (Optional[int]): Tooltip animation duration.
-            tooltip_props (Optional[dict[str, Any]]): Tooltip props.
-            unit (Optional[str]): Unit suffix.
-            with_bar_value_label (Optional[bool]): Show value labels on bars.
-            with_dots (Optional[bool]): Show dots on lines.
-            with_legend (Optional[bool]): Show legend.
-            with_point_labels (Optional[bool]): Show point labels on lines.
-            with_right_y_axis (Optional[bool]): Enable right Y axis.
-            with_tooltip (Optional[bool]): Show tooltip.
-            with_x_axis (Optional[bool]): Show X axis.
-            with_y_axis (Optional[bool]): Show Y axis.
-            x_axis_label (Optional[str]): X axis label.
-            x_axis_props (Optional[dict[str, Any]]): X axis props.
-            y_axis_label (Optional[str]): Y axis label.
-            y_axis_props (Optional[dict[str, Any]]): Y axis props.
-            kwargs: Additional props to set.
-
-        Returns:
-            RLBuilder: A nested builder scoped to the composite chart element.
-        """
-        return self._create_builder_element(  # type: ignore[return-value]
-            name="compositechart",
-            key=key or self._new_text_id("compositechart"),
-            props={
-                "data": data,
-                "dataKey": data_key,
-                "series": series,
-                "activeDotProps": active_dot_props,
-                "areaProps": area_props,
-                "barProps": bar_props,
-                "children": children,
-                "composedChartProps": composed_chart_props,
-                "connectNulls": connect_nulls,
-                "curveType": curve_type,
-                "dotProps": dot_props,
-                "gridAxis": grid_axis,
-                "gridColor": grid_color,
-                "gridProps": grid_props,
-                "legendProps": legend_props,
-                "lineProps": line_props,
-                "maxBarWidth": max_bar_width,
-                "minBarSize": min_bar_size,
-                "referenceLines": reference_lines,
-                "rightYAxisLabel": right_y_axis_label,
-                "rightYAxisProps": right_y_axis_props,
-                "strokeDasharray": stroke_dasharray,
-                "strokeWidth": stroke_width,
-                "textColor": text_color,
-                "tickLine": tick_line,
-                "tooltipAnimationDuration": tooltip_animation_duration,
-                "tooltipProps": tooltip_props,
-                "unit": unit,
-                "withBarValueLabel": with_bar_value_label,
-                "withDots": with_dots,
-                "withLegend": with_legend,
-                "withPointLabels": with_point_labels,
-                "withRightYAxis": with_right_y_axis,
-                "withTooltip": with_tooltip,
-                "withXAxis": with_x_axis,
-                "withYAxis": with_y_axis,
-                "xAxisLabel": x_axis_label,
-                "xAxisProps": x_axis_props,
-                "yAxisLabel": y_axis_label,
-                "yAxisProps": y_axis_props,
-                **kwargs,
-            },
-        )
-
-    def donut_chart(
-        self,
-        data: list,
-        *,
-        chart_label: Optional[Union[str, int]] = None,
-        end_angle: Optional[int] = None,
-        key: Optional[str] = None,
-        label_color: Optional[str] = None,
-        labels_type: Optional[str] = None,
-        padding_angle: Optional[int] = None,
-        pie_chart_props: Optional[dict[str, Any]] = None,
-        pie_props: Optional[dict[str, Any]] = None,
-        size: Optional[int] = None,
-        start_angle: Optional[int] = None,
-        stroke_color: Optional[str] = None,
-        stroke_width: Optional[int] = None,
-        thickness: Optional[int] = None,
-        tooltip_animation_duration: Optional[int] = None,
-        tooltip_data_source: Optional[Literal["all", "segment"]] = None,
-        tooltip_props: Optional[dict[str, Any]] = None,
-        with_labels: Optional[bool] = None,
-        with_labels_line: Optional[bool] = None,
-        with_tooltip: Optional[bool] = None,
-        **kwargs: Any,
-    ) -> "RLBuilder":
-        """
-        Donut chart to visualize parts of a whole.
-
-        Args:
-            data (list): Dataset.
-            chart_label (Optional[Union[str, int]]): Center label.
-            end_angle (Optional[int]): End angle.
-            key (Optional[str]): Explicit element key.
-            label_color (Optional[str]): Label color.
-            labels_type (Optional[str]): Label content type.
-            padding_angle (Optional[int]): Angle between segments.
-            pie_chart_props (Optional[dict[str, Any]]): Chart container props.
-            pie_props (Optional[dict[str, Any]]): Pie props.
-            size (Optional[int]): Chart size.
-            start_angle (Optional[int]): Start angle.
-            stroke_color (Optional[str]): Segment border color.
-            stroke_width (Optional[int]): Segment border width.
-            thickness (Optional[int]): Ring thickness.
-            tooltip_animation_duration (Optional[int]): Tooltip animation duration.
-            tooltip_data_source (Optional[Literal["all","segment"]]): Tooltip data source.
-            tooltip_props (Optional[dict[str, Any]]): Tooltip props.
-            with_labels (Optional[bool]): Show labels.
-            with_labels_line (Optional[bool]): Show label connector lines.
-            with_tooltip (Optional[bool]): Show tooltip.
-            kwargs: Additional props to set.
-
-        Returns:
-            RLBuilder: A nested builder scoped to the donut chart element.
-        """
-        return self._create_builder_element(  # type: ignore[return-value]
-            name="donutchart",
-            key=key or self._new_text_id("donutchart"),
-            props={
-                "data": data,
-                "chartLabel": chart_label,
-                "endAngle": end_angle,
-                "labelColor": label_color,
-                "labelsType": labels_type,
-                "paddingAngle": padding_angle,
-                "pieChartProps": pie_chart_props,
-                "pieProps": pie_props,
-                "size": size,
-                "startAngle": start_angle,
-                "strokeColor": stroke_color,
-                "strokeWidth": stroke_width,
-                "thickness": thickness,
-                "tooltipAnimationDuration": tooltip_animation_duration,
-                "tooltipDataSource": tooltip_data_source,
-                "tooltipProps": tooltip_props,
-                "withLabels": with_labels,
-                "withLabelsLine": with_labels_line,
-                "withTooltip": with_tooltip,
-                **kwargs,
-            },
-        )
-
-    def funnel_chart(
-        self,
-        data: list,
-        *,
-        funnel_chart_props: Optional[dict[str, Any]] = None,
-        funnel_props: Optional[dict[str, Any]] = None,
-        key: Optional[str] = None,
-        label_color: Optional[str] = None,
-        labels_position: Optional[Literal["left", "right", "inside"]] = None,
-        size: Optional[int] = None,
-        stroke_color: Optional[str] = None,
-        stroke_width: Optional[int] = None,
-        tooltip_animation_duration: Optional[int] = None,
-        tooltip_data_source: Optional[Literal["all", "segment"]] = None,
-        tooltip_props: Optional[dict[str, Any]] = None,
-        value_formatter: Optional[Any] = None,
-        with_labels: Optional[bool] = None,
-        with_tooltip: Optional[bool] = None,
-        **kwargs: Any,
-    ) -> "RLBuilder":
-        """
-        Funnel chart for conversion or pipeline visualization.
-
-        Args:
-            data (list): Dataset.
-            funnel_chart_props (Optional[dict[str, Any]]): Chart container props.
-            funnel_props (Optional[dict[str, Any]]): Funnel props.
-            key (Optional[str]): Explicit element key.
-            label_color (Optional[str]): Label color.
-            labels_position (Optional[Literal["left","right","inside"]]): Labels position.
-            size (Optional[int]): Chart size.
-            stroke_color (Optional[str]): Border color.
-            stroke_width (Optional[int]): Border width.
-            tooltip_animation_duration (Optional[int]): Tooltip animation duration.
-            tooltip_data_source (Optional[Literal["all","segment"]]): Tooltip data source.
-            tooltip_props (Optional[dict[str, Any]]): Tooltip props.
-            value_formatter (Optional[Any]): Value formatter.
-            with_labels (Optional[bool]): Show labels.
-            with_tooltip (Optional[bool]): Show tooltip.
-            kwargs: Additional props to set.
-
-        Returns:
-            RLBuilder: A nested builder scoped to the funnel chart element.
-        """
-        return self._create_builder_element(  # type: ignore[return-value]
-            name="funnelchart",
-            key=key or self._new_text_id("funnelchart"),
-            props={
-                "data": data,
-                "funnelChartProps": funnel_chart_props,
-                "funnelProps": funnel_props,
-                "labelColor": label_color,
-                "labelsPosition": labels_position,
-                "size": size,
-                "strokeColor": stroke_color,
-                "strokeWidth": stroke_width,
-                "tooltipAnimationDuration": tooltip_animation_duration,
-                "tooltipDataSource": tooltip_data_source,
-                "tooltipProps": tooltip_props,
-                "valueFormatter": value_formatter,
-                "withLabels": with_labels,
-                "withTooltip": with_tooltip,
-                **kwargs,
-            },
-        )
-
-    def pie_chart(
-        self,
-        data: list,
-        *,
-        end_angle: Optional[int] = None,
-        key: Optional[str] = None,
-        label_color: Optional[str] = None,
-        labels_position: Optional[Literal["outside", "inside"]] = None,
-        labels_type: Optional[Literal["value", "percent"]] = None,
-        padding_angle: Optional[int] = None,
-        pie_chart_props: Optional[dict[str, Any]] = None,
-        pie_props: Optional[dict[str, Any]] = None,
-        size: Optional[int] = None,
-        start_angle: Optional[int] = None,
-        stroke_color: Optional[str] = None,
-        stroke_width: Optional[int] = None,
-        tooltip_animation_duration: Optional[int] = None,
-        tooltip_data_source: Optional[Literal["all", "segment"]] = None,
-        tooltip_props: Optional[dict[str, Any]] = None,
-        with_labels: Optional[bool] = None,
-        with_labels_line: Optional[bool] = None,
-        with_tooltip: Optional[bool] = None,
-        **kwargs: Any,
-    ) -> "RLBuilder":
-        """
-        Pie chart to visualize parts of a whole.
-
-        Args:
-            data (list): Dataset.
-            end_angle (Optional[int]): End angle.
-            key (Optional[str]): Explicit element key.
-            label_color (Optional[str]): Label color.
-            labels_position (Optional[Literal["outside","inside"]]): Labels position.
-            labels_type (Optional[Literal["value","percent"]]): Label content.
-            padding_angle (Optional[int]): Angle between segments.
-            pie_chart_props (Optional[dict[str, Any]]): Chart container props.
-            pie_props (Optional[dict[str, Any]]): Pie props.
-            size (Optional[int]): Chart size.
-            start_angle (Optional[int]): Start angle.
-            stroke_color (Optional[str]): Border color.
-            stroke_width (Optional[int]): Border width.
-            tooltip_animation_duration (Optional[int]): Tooltip animation duration.
-            tooltip_data_source (Optional[Literal["all","segment"]]): Tooltip data source.
-            tooltip_props (Optional[dict[str, Any]]): Tooltip props.
-            with_labels (Optional[bool]): Show labels.
-            with_labels_line (Optional[bool]): Show label connector lines.
-            with_tooltip (Optional[bool]): Show tooltip.
-            kwargs: Additional props to set.
-
-        Returns:
-            RLBuilder: A nested builder scoped to the pie chart element.
-        """
-        return self._create_builder_element(  # type: ignore[return-value]
-            name="piechart",
-            key=key or self._new_text_id("piechart"),
-            props={
-                "data": data,
-                "endAngle": end_angle,
-                "labelColor": label_color,
-                "labelsPosition": labels_position,
-                "labelsType": labels_type,
-                "paddingAngle": padding_angle,
-                "pieChartProps": pie_chart_props,
-                "pieProps": pie_props,
-                "size": size,
-                "startAngle": start_angle,
-                "strokeColor": stroke_color,
-                "strokeWidth": stroke_width,
-                "tooltipAnimationDuration": tooltip_animation_duration,
-                "tooltipDataSource": tooltip_data_source,
-                "tooltipProps": tooltip_props,
-                "withLabels": with_labels,
-                "withLabelsLine": with_labels_line,
-                "withTooltip": with_tooltip,
-                **kwargs,
-            },
-        )
-
-    def radar_chart(
-        self,
-        data: list,
-        data_key: str,
-        series: list[dict[str, Any]],
-        *,
-        active_dot_props: Optional[dict[str, Any]] = None,
-        dot_props: Optional[dict[str, Any]] = None,
-        grid_color: Optional[str] = None,
-        key: Optional[str] = None,
-        legend_props: Optional[dict[str, Any]] = None,
-        polar_angle_axis_props: Optional[dict[str, Any]] = None,
-        polar_grid_props: Optional[dict[str, Any]] = None,
-        polar_radius_axis_props: Optional[dict[str, Any]] = None,
-        radar_chart_props: Optional[dict[str, Any]] = None,
-        radar_props: Optional[dict[str, Any]] = None,
-        text_color: Optional[str] = None,
-        tooltip_animation_duration: Optional[int] = None,
-        tooltip_props: Optional[dict[str, Any]] = None,
-        with_dots: Optional[bool] = None,
-        with_legend: Optional[bool] = None,
-        with_polar_angle_axis: Optional[bool] = None,
-        with_polar_grid: Optional[bool] = None,
-        with_polar_radius_axis: Optional[bool] = None,
-        with_tooltip: Optional[bool] = None,
-        **kwargs: Any,
-    ) -> "RLBuilder":
-        """
-        Radar chart for multi-dimensional categorical data.
-
-        Args:
-            data (list): Dataset.
-            data_key (str): Key for category labels.
-            series (list[dict[str, Any]]): Series configuration.
-            active_dot_props (Optional[dict[str, Any]]): Active dot props.
-            dot_props (Optional[dict[str, Any]]): Dot props.
-            grid_color (Optional[str]): Grid color.
-            key (Optional[str]): Explicit element key.
-            legend_props (Optional[dict[str, Any]]): Legend props.
-            polar_angle_axis_props (Optional[dict[str, Any]]): Polar angle axis props.
-            polar_grid_props (Optional[dict[str, Any]]): Polar grid props.
-            polar_radius_axis_props (Optional[dict[str, Any]]): Polar radius axis props.
-            radar_chart_props (Optional[dict[str, Any]]): Chart container props.
-            radar_props (Optional[dict[str, Any]]): Radar area/line props.
-            text_color (Optional[str]): Text color.
-            tooltip_animation_duration (Optional[int]): Tooltip animation duration.
-            tooltip_props (Optional[dict[str, Any]]): Tooltip props.
-            with_dots (Optional[bool]): Show dots.
-            with_legend (Optional[bool]): Show legend.
-            with_polar_angle_axis (Optional[bool]): Show angle axis.
-            with_polar_grid (Optional[bool]): Show polar grid.
-            with_polar_radius_axis (Optional[bool]): Show radius axis.
-            with_tooltip (Optional[bool]): Show tooltip.
-            kwargs: Additional props to set.
-
-        Returns:
-            RLBuilder: A nested builder scoped to the radar chart element.
-        """
-        return self._create_builder_element(  # type: ignore[return-value]
-            name="radarchart",
-            key=key or self._new_text_id("radarchart"),
-            props={
-                "activeDotProps": active_dot_props,
-                "data": data,
-                "dataKey": data_key,
-                "dotProps": dot_props,
-                "gridColor": grid_color,
-                "legendProps": legend_props,
-                "polarAngleAxisProps": polar_angle_axis_props,
-                "polarGridProps": polar_grid_props,
-                "polarRadiusAxisProps": polar_radius_axis_props,
-                "radarChartProps": radar_chart_props,
-                "radarProps": radar_props,
-                "series": series,
-                "textColor": text_color,
-                "tooltipAnimationDuration": tooltip_animation_duration,
-                "tooltipProps": tooltip_props,
-                "withDots": with_dots,
-                "withLegend": with_legend,
-                "withPolarAngleAxis": with_polar_angle_axis,
-                "withPolarGrid": with_polar_grid,
-                "withPolarRadiusAxis": with_polar_radius_axis,
-                "withTooltip": with_tooltip,
-                **kwargs,
-            },
-        )
-
-    def scatter_chart(
-        self,
-        data: list,
-        data_key: dict[str, str],
-        *,
-        grid_axis: Optional[str] = None,
-        grid_color: Optional[str] = None,
-        grid_props: Optional[dict[str, Any]] = None,
-        labels: Optional[dict[str, str]] = None,
-        legend_props: Optional[dict[str, Any]] = None,
-        orientation: Optional[str] = None,
-        point_labels: Optional[str] = None,
-        reference_lines: Optional[list[dict[str, Any]]] = None,
-        right_y_axis_label: Optional[str] = None,
-        right_y_axis_props: Optional[dict[str, Any]] = None,
-        scatter_chart_props: Optional[dict[str, Any]] = None,
-        scatter_props: Optional[dict[str, Any]] = None,
-        stroke_dasharray: Optional[Union[str, int]] = None,
-        text_color: Optional[str] = None,
-        tick_line: Optional[str] = None,
-        tooltip_animation_duration: Optional[int] = None,
-        tooltip_props: Optional[dict[str, Any]] = None,
-        unit: Optional[dict[str, str]] = None,
-        value_formatter: Optional[Any] = None,
-        with_legend: Optional[bool] = None,
-        with_right_y_axis: Optional[bool] = None,
-        with_tooltip: Optional[bool] = None,
-        with_x_axis: Optional[bool] = None,
-        with_y_axis: Optional[bool] = None,
-        x_axis_label: Optional[str] = None,
-        x_axis_props: Optional[dict[str, Any]] = None,
-        y_axis_label: Optional[str] = None,
-        y_axis_props: Optional[dict[str, Any]] = None,
-        key: Optional[str] = None,
-        **kwargs: Any,
-    ) -> "RLBuilder":
-        """
-        Scatter chart for visualizing correlation between two variables.
-
-        Args:
-            data (list): Dataset.
-            data_key (dict[str, str]): Mapping for x/y keys.
-            grid_axis (Optional[str]): Grid axis.
-            grid_color (Optional[str]): Grid color.
-            grid_props (Optional[dict[str, Any]]): Grid props.
-            labels (Optional[dict[str, str]]): Axis labels.
-            legend_props (Optional[dict[str, Any]]): Legend props.
-            orientation (Optional[str]): Orientation.
-            point_labels (Optional[str]): Point labels key.
-            reference_lines (Optional[list[dict[str, Any]]]): Reference lines.
-            right_y_axis_label (Optional[str]): Secondary Y axis label.
-            right_y_axis_props (Optional[dict[str, Any]]): Secondary Y axis props.
-            scatter_chart_props (Optional[dict[str, Any]]): Chart container props.
-            scatter_props (Optional[dict[str, Any]]): Scatter props.
-            stroke_dasharray (Optional[Union[str, int]]): Stroke dash pattern.
-            text_color (Optional[str]): Text color.
-            tick_line (Optional[str]): Tick line display.
-            tooltip_animation_duration (Optional[int]): Tooltip animation duration.
-            tooltip_props (Optional[dict[str, Any]]): Tooltip props.
-            unit (Optional[dict[str, str]]): Axis units.
-            value_formatter (Optional[Any]): Value formatter.
-            with_legend (Optional[bool]): Show legend.
-            with_right_y_axis (Optional[bool]): Enable right Y axis.
-            with_tooltip (Optional[bool]): Show tooltip.
-            with_x_axis (Optional[bool]): Show X axis.
-            with_y_axis (Optional[bool]): Show Y axis.
-            x_axis_label (Optional[str]): X axis label.
-            x_axis_props (Optional[dict[str, Any]]): X axis props.
-            y_axis_label (Optional[str]): Y axis label.
-            y_axis_props (Optional[dict[str, Any]]): Y axis props.
-            key (Optional[str]): Explicit element key.
-            kwargs: Additional props to set.
-
-        Returns:
-            RLBuilder: A nested builder scoped to the scatter chart element.
-        """
-        return self._create_builder_element(  # type: ignore[return-value]
-            name="scatterchart",
-            key=key or self._new_text_id("scatterchart"),
-            props={
-                "data": data,
-                "dataKey": data_key,
-                "gridAxis": grid_axis,
-                "gridColor": grid_color,
-                "gridProps": grid_props,
-                "labels": labels,
-                "legendProps": legend_props,
-                "orientation": orientation,
-                "pointLabels": point_labels,
-                "referenceLines": reference_lines,
-                "rightYAxisLabel": right_y_axis_label,
-                "rightYAxisProps": right_y_axis_props,
-                "scatterChartProps": scatter_chart_props,
-                "scatterProps": scatter_props,
-                "strokeDasharray": stroke_dasharray,
-                "textColor": text_color,
-                "tickLine": tick_line,
-                "tooltipAnimationDuration": tooltip_animation_duration,
-                "tooltipProps": tooltip_props,
-                "unit": unit,
-                "valueFormatter": value_formatter,
-                "withLegend": with_legend,
-                "withRightYAxis": with_right_y_axis,
-                "withTooltip": with_tooltip,
-                "withXAxis": with_x_axis,
-                "withYAxis": with_y_axis,
-                "xAxisLabel": x_axis_label,
-                "xAxisProps": x_axis_props,
-                "yAxisLabel": y_axis_label,
-                "yAxisProps": y_axis_props,
-                **kwargs,
-            },
-        )
-
-    def bubble_chart(
-        self,
-        data: list[dict[str, Any]],
-        data_key: dict[str, str],
-        range: tuple[int, int],  # noqa: A002
-        *,
-        color: Optional[str] = None,
-        grid_color: Optional[str] = None,
-        key: Optional[str] = None,
-        label: Optional[str] = None,
-        scatter_props: Optional[dict[str, Any]] = None,
-        text_color: Optional[str] = None,
-        tooltip_props: Optional[dict[str, Any]] = None,
-        with_tooltip: Optional[bool] = None,
-        x_axis_props: Optional[dict[str, Any]] = None,
-        y_axis_props: Optional[dict[str, Any]] = None,
-        z_axis_props: Optional[dict[str, Any]] = None,
-        **kwargs: Any,
-    ) -> "RLBuilder":
-        """
-        Bubble chart for three-dimensional data (x, y, z-size).
-
-        Args:
-            data (list[dict[str, Any]]): Dataset with x, y, z.
-            data_key (dict[str, str]): Mapping for x/y/z keys.
-            range (tuple[int, int]): Bubble size range.
-            color (Optional[str]): Bubble color.
-            grid_color (Optional[str]): Grid color.
-            key (Optional[str]): Explicit element key.
-            label (Optional[str]): Series label.
-            scatter_props (Optional[dict[str, Any]]): Scatter props.
-            text_color (Optional[str]): Text color.
-            tooltip_props (Optional[dict[str, Any]]): Tooltip props.
-            with_tooltip (Optional[bool]): Show tooltip.
-            x_axis_props (Optional[dict[str, Any]]): X axis props.
-            y_axis_props (Optional[dict[str, Any]]): Y axis props.
-            z_axis_props (Optional[dict[str, Any]]): Z axis props.
-            kwargs: Additional props to set.
-
-        Returns:
-            RLBuilder: A nested builder scoped to the bubble chart element.
-        """
-        return self._create_builder_element(  # type: ignore[return-value]
-            name="bubblechart",
-            key=key or self._new_text_id("bubblechart"),
-            props={
-                "data": data,
-                "dataKey": data_key,
-                "range": range,
-                "color": color,
-                "gridColor": grid_color,
-                "label": label,
-                "scatterProps": scatter_props,
-                "textColor": text_color,
-                "tooltipProps": tooltip_props,
-                "withTooltip": with_tooltip,
-                "xAxisProps": x_axis_props,
-                "yAxisProps": y_axis_props,
-                "zAxisProps": z_axis_props,
-                **kwargs,
-            },
-        )
-
-    def radial_bar_chart(
-        self,
-        data: list[dict[str, Any]],
-        data_key: str,
-        *,
-        bar_size: Optional[int] = None,
-        empty_background_color: Optional[str] = None,
-        end_angle: Optional[int] = None,
-        key: Optional[str] = None,
-        legend_props: Optional[dict[str, Any]] = None,
-        radial_bar_chart_props: Optional[dict[str, Any]] = None,
-        radial_bar_props: Optional[dict[str, Any]] = None,
-        start_angle: Optional[int] = None,
-        tooltip_props: Optional[dict[str, Any]] = None,
-        with_background: Optional[bool] = None,
-        with_labels: Optional[bool] = None,
-        with_legend: Optional[bool] = None,
-        with_tooltip: Optional[bool] = None,
-        **kwargs: Any,
-    ) -> "RLBuilder":
-        """
-        Radial bar chart for circular bar visualizations.
-
-        Args:
-            data (list[dict[str, Any]]): Dataset.
-            data_key (str): Value key.
-            bar_size (Optional[int]): Bar thickness.
-            empty_background_color (Optional[str]): Empty background color.
-            end_angle (Optional[int]): End angle.
-            key (Optional[str]): Explicit element key.
-            legend_props (Optional[dict[str, Any]]): Legend props.
-            radial_bar_chart_props (Optional[dict[str, Any]]): Chart container props.
-            radial_bar_props (Optional[dict[str, Any]]): Bar props.
-            start_angle (Optional[int]): Start angle.
-            tooltip_props (Optional[dict[str, Any]]): Tooltip props.
-            with_background (Optional[bool]): Show circular background.
-            with_labels (Optional[bool]): Show labels.
-            with_legend (Optional[bool]): Show legend.
-            with_tooltip (Optional[bool]): Show tooltip.
-            kwargs: Additional props to set.
-
-        Returns:
-            RLBuilder: A nested builder scoped to the radial bar chart element.
-        """
-        return self._create_builder_element(  # type: ignore[return-value]
-            name="radialbarchart",
-            key=key or self._new_text_id("radialbarchart"),
-            props={
-                "data": data,
-                "dataKey": data_key,
-                "barSize": bar_size,
-                "emptyBackgroundColor": empty_background_color,
-                "endAngle": end_angle,
-                "legendProps": legend_props,
-                "radialBarChartProps": radial_bar_chart_props,
-                "radialBarProps": radial_bar_props,
-                "startAngle": start_angle,
-                "tooltipProps": tooltip_props,
-                "withBackground": with_background,
-                "withLabels": with_labels,
-                "withLegend": with_legend,
-                "withTooltip": with_tooltip,
-                **kwargs,
-            },
-        )
-
-    def sparkline_chart(
-        self,
-        data: list[Union[int, float, None]],
-        *,
-        area_props: Optional[dict[str, Any]] = None,
-        color: Optional[str] = None,
-        connect_nulls: Optional[bool] = None,
-        curve_type: Optional[str] = None,
-        fill_opacity: Optional[float] = None,
-        key: Optional[str] = None,
-        stroke_width: Optional[int] = None,
-        trend_colors: Optional[dict[str, Any]] = None,
-        with_gradient: Optional[bool] = None,
-        **kwargs: Any,
-    ) -> "RLBuilder":
-        """
-        Compact sparkline chart for trends.
-
-        Args:
-            data (list[Union[int, float, None]]): Dataset.
-            area_props (Optional[dict[str, Any]]): Area props.
-            color (Optional[str]): Line/area color.
-            connect_nulls (Optional[bool]): Connect across null values.
-            curve_type (Optional[str]): Curve interpolation type.
-            fill_opacity (Optional[float]): Area fill opacity.
-            key (Optional[str]): Explicit element key.
-            stroke_width (Optional[int]): Line width.
-            trend_colors (Optional[dict[str, Any]]): Trend color overrides.
-            with_gradient (Optional[bool]): Fill with gradient.
-            kwargs: Additional props to set.
-
-        Returns:
-            RLBuilder: A nested builder scoped to the sparkline element.
-        """
-        return self._create_builder_element(  # type: ignore[return-value]
-            name="sparkline",
-            key=key or self._new_text_id("sparkline"),
-            props={
-                "data": data,
-                "areaProps": area_props,
-                "color": color,
-                "connectNulls": connect_nulls,
-                "curveType": curve_type,
-                "fillOpacity": fill_opacity,
-                "strokeWidth": stroke_width,
-                "trendColors": trend_colors,
-                "withGradient": with_gradient,
-                **kwargs,
-            },
-        )
-
-    def heatmap(
-        self,
-        data: dict[str, Union[int, float]],
-        *,
-        colors: Optional[list[str]] = None,
-        domain: Optional[tuple[Union[int, float], Union[int, float]]] = None,
-        end_date: Optional[Union[str, Any]] = None,
-        first_day_of_week: Optional[int] = None,
-        font_size: Optional[int] = None,
-        gap: Optional[int] = None,
-        get_rect_props: Optional[Any] = None,
-        get_tooltip_label: Optional[Any] = None,
-        key: Optional[str] = None,
-        month_labels: Optional[list[str]] = None,
-        months_labels_height: Optional[int] = None,
-        rect_radius: Optional[int] = None,
-        rect_size: Optional[int] = None,
-        start_date: Optional[Union[str, Any]] = None,
-        tooltip_props: Optional[dict[str, Any]] = None,
-        weekday_labels: Optional[list[str]] = None,
-        weekdays_labels_width: Optional[int] = None,
-        with_month_labels: Optional[bool] = None,
-        with_outside_dates: Optional[bool] = None,
-        with_tooltip: Optional[bool] = None,
-        with_weekday_labels: Optional[bool] = None,
-        **kwargs: Any,
-    ) -> "RLBuilder":
-        """
-        Calendar heatmap for visualizing value intensity over dates.
-
-        Args:
-            data (dict[str, Union[int, float]]): Mapping of ISO date -> value.
-            colors (Optional[list[str]]): Color scale.
-            domain (Optional[tuple[Union[int, float], Union[int, float]]]): Min/max domain.
-            end_date (Optional[Union[str, Any]]): End date.
-            first_day_of_week (Optional[int]): First day of the week.
-            font_size (Optional[int]): Font size for labels.
-            gap (Optional[int]): Gap between cells.
-            get_rect_props (Optional[Any]): Custom rect props callback.
-            get_tooltip_label (Optional[Any]): Tooltip label callback.
-            key (Optional[str]): Explicit element key.
-            month_labels (Optional[list[str]]): Month labels.
-            months_labels_height (Optional[int]): Month labels height.
-            rect_radius (Optional[int]): Cell border radius.
-            rect_size (Optional[int]): Cell size.
-            start_date (Optional[Union[str, Any]]): Start date.
-            tooltip_props (Optional[dict[str, Any]]): Tooltip props.
-            weekday_labels (Optional[list[str]]): Weekday labels.
-            weekdays_labels_width (Optional[int]): Weekday labels width.
-            with_month_labels (Optional[bool]): Show month labels.
-            with_outside_dates (Optional[bool]): Show dates outside range.
-            with_tooltip (Optional[bool]): Show tooltip.
-            with_weekday_labels (Optional[bool]): Show weekday labels.
-            kwargs: Additional props to set.
-
-        Returns:
-            RLBuilder: A nested builder scoped to the heatmap element.
-        """
-        return self._create_builder_element(  # type: ignore[return-value]
-            name="heatmap",
-            key=key or self._new_text_id("heatmap"),
-            props={
-                "data": data,
-                "colors": colors,
-                "domain": domain,
-                "endDate": end_date,
-                "firstDayOfWeek": first_day_of_week,
-                "fontSize": font_size,
-                "gap": gap,
-                "getRectProps": get_rect_props,
-                "getTooltipLabel": get_tooltip_label,
-                "monthLabels": month_labels,
-                "monthsLabelsHeight": months_labels_height,
-                "rectRadius": rect_radius,
-                "rectSize": rect_size,
-                "startDate": start_date,
-                "tooltipProps": tooltip_props,
-                "weekdayLabels": weekday_labels,
-                "weekdaysLabelsWidth": weekdays_labels_width,
-                "withMonthLabels": with_month_labels,
-                "withOutsideDates": with_outside_dates,
-                "withTooltip": with_tooltip,
-                "withWeekdayLabels": with_weekday_labels,
-                **kwargs,
-            },
-        )
@@ -0,0 +1,82 @@
+import hashlib
+import json
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
+from typing import Any, Generic, Optional, TypeVar, Union, overload
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+D = TypeVar("D")
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A mapping with a fixed capacity that evicts the least recently used entry.
+
+    Lookups through `get` and `[]` mark the entry as recently used; `in` does not.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[K, V] = OrderedDict()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._data)
+
+    def __getitem__(self, key: K) -> V:
+        value = self._data[key]
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > max(self.maxsize, 0):
+            self._data.popitem(last=False)
+
+    @overload
+    def get(self, key: K) -> Optional[V]: ...
+
+    @overload
+    def get(self, key: K, default: D) -> Union[V, D]: ...
+
+    def get(self, key: K, default: Any = None) -> Any:
+        if key not in self._data:
+            return default
+        return self[key]
+
+    def pop(self, key: K, default: Any = None) -> Any:
+        return self._data.pop(key, default)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+def _encode(value: Any) -> Any:
+    if hasattr(value, "tobytes") and hasattr(value, "dtype"):
+        return [str(value.dtype), list(getattr(value, "shape", ())), hashlib.blake2b(value.tobytes()).hexdigest()]
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    return repr(value)
+
+
+def fingerprint(value: Any) -> str:
+    """
+    Content hash of a JSON-like value, used to tell whether a payload changed between reruns.
+
+    Args:
+        value (Any): Lists, dicts and scalars; NumPy arrays and other objects are hashed by content or `repr`.
+
+    Returns:
+        str: A short hexadecimal digest.
+    """
+    payload = json.dumps(value, separators=(",", ":"), default=_encode, allow_nan=True)
+    return hashlib.blake2b(payload.encode(), digest_size=12).hexdigest()
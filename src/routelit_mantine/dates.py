@@ -0,0 +1,72 @@
+import datetime
+import functools
+from collections.abc import Sequence
+from typing import Any, Literal, TypedDict, Union
+
+from .lazy import LazyModule
+
+np: Any = LazyModule("numpy")
+
+PARSE_CACHE_SIZE = 4096
+BULK_THRESHOLD = 32
+"""
+Lists with at least this many ISO date strings are converted in one NumPy call when NumPy is installed.
+"""
+
+
+class DateAvailability(TypedDict, total=False):
+    """
+    Declarative availability rules for date pickers, evaluated in the browser.
+
+    A date is available when it is in `open_dates`, or when it is not in `closed_dates`,
+    not inside any of `closed_ranges` and falls on one of `weekdays` (if set).
+    """
+
+    weekdays: list[Literal[0, 1, 2, 3, 4, 5, 6]]  # open weekdays, 0 is Sunday
+    closed_ranges: list[tuple[Union[datetime.date, str], Union[datetime.date, str]]]  # inclusive
+    closed_dates: list[Union[datetime.date, str]]
+    open_dates: list[Union[datetime.date, str]]
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_date(value: str) -> datetime.date:
+    """
+    Parse an ISO `YYYY-MM-DD` string, caching the result.
+    """
+    return datetime.date.fromisoformat(value)
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_datetime(value: str) -> datetime.datetime:
+    """
+    Parse an ISO date-time string (`T` or space separated, optional `Z`), caching the result.
+    """
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.datetime.fromisoformat(value)
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_time(value: str) -> datetime.time:
+    """
+    Parse an ISO `HH:mm[:ss]` string, caching the result.
+    """
+    return datetime.time.fromisoformat(value)
+
+
+def parse_dates(values: Sequence[Any]) -> list[Any]:
+    """
+    Parse a list of ISO date strings, leaving other items untouched.
+
+    Long lists of strings are converted in bulk through NumPy `datetime64[D]`; shorter or mixed lists go through
+    the `parse_date` cache.
+
+    Args:
+        values (Sequence[Any]): ISO date strings, dates or other values.
+
+    Returns:
+        list[Any]: The values with strings converted to `datetime.date`.
+    """
+    if np and len(values) >= BULK_THRESHOLD and all(isinstance(v, str) and len(v) == 10 for v in values):
+        return np.array(values, dtype="datetime64[D]").tolist()  # type: ignore[no-any-return]
+    return [parse_date(v) if isinstance(v, str) else v for v in values]
@@ -0,0 +1,30 @@
+import importlib
+import importlib.util
+from types import ModuleType
+from typing import Any, Optional
+
+
+class LazyModule:
+    """
+    An optional module imported on first attribute access.
+
+    It is falsy when the module is not installed, so `if np:` checks availability without importing it.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._module: Optional[ModuleType] = None
+        self._available: Optional[bool] = None
+
+    def __bool__(self) -> bool:
+        if self._available is None:
+            self._available = self._module is not None or importlib.util.find_spec(self._name) is not None
+        return self._available
+
+    def __getattr__(self, attr: str) -> Any:
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self) -> str:
+        return f"<lazy module {self._name!r}>"
@@ -0,0 +1,3 @@
+"""
+Method families of `RLBuilder`, which inherits them from the mixins defined here.
+"""
@@ -0,0 +1,1545 @@
+import datetime
+import itertools
+import operator
+import threading
+from collections.abc import Hashable
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Literal, Optional, Union
+
+from routelit import RouteLitBuilder
+
+from ..binning import BinKind, bin_points
+from ..cache import LRUCache, fingerprint
+
+if TYPE_CHECKING:
+    from ..builder import RLBuilder
+
+_CHART_DATA_HASHES_KEY = "__chart_data_hashes"
+_CHART_DATA_VERSIONS_KEY = "__chart_data_versions"
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None), datetime.date, datetime.datetime})
+
+# Digests of row datasets kept across runs and sessions, with the keys and values they were computed from.
+_row_digests: LRUCache[int, tuple[list[Any], list[Any], list[Any], str]] = LRUCache(64)
+_row_digests_lock = threading.Lock()
+
+
+def _row_contents(data: Any) -> Optional[tuple[list[Any], list[Any]]]:
+    """
+    The keys and values of rows held in plain dicts, or None for any other data.
+    """
+    if not isinstance(data, list) or not all(type(row) is dict for row in data):
+        return None
+    return list(itertools.chain.from_iterable(data)), list(itertools.chain.from_iterable(map(dict.values, data)))
+
+
+def _stored_row_digest(data: Any) -> Optional[str]:
+    """
+    The digest computed for `data` on an earlier run, if its rows still hold the very same keys and value objects.
+    Values are immutable scalars, so an unchanged identity means unchanged content; a row or value replaced or
+    mutated in place invalidates the digest.
+    """
+    with _row_digests_lock:
+        stored = _row_digests.get(id(data))
+    if stored is None or stored[0] is not data:
+        return None
+    contents = _row_contents(data)
+    if contents is None:
+        return None
+    keys, values = contents
+    if keys != stored[1] or len(values) != len(stored[2]) or not all(map(operator.is_, values, stored[2])):
+        return None
+    return stored[3]
+
+
+def _store_row_digest(data: Any, digest: str) -> None:
+    contents = _row_contents(data)
+    if contents is None or not set(map(type, contents[1])) <= _SCALAR_TYPES:
+        return
+    with _row_digests_lock:
+        _row_digests[id(data)] = (data, *contents, digest)
+
+
+def _columns(data: Any, min_rows: Optional[int]) -> Optional[dict[str, Any]]:
+    """
+    Columnar form `{"columns": {key: values}, "length": n}` of at least `min_rows` rows sharing the same keys and
+    holding scalar values, or None for any other data.
+    """
+    if min_rows is None or not isinstance(data, list) or len(data) < min_rows or not isinstance(data[0], dict):
+        return None
+    keys = list(data[0])
+    columns: dict[str, list[Any]] = {k: [] for k in keys}
+    try:
+        for row in data:
+            if len(row) != len(keys):
+                return None
+            for k in keys:
+                value = row[k]
+                if isinstance(value, (dict, list, tuple)):
+                    return None
+                columns[k].append(value)
+    except (KeyError, TypeError):
+        return None
+    return {"columns": columns, "length": len(data)}
+
+
+class ChartsMixin(RouteLitBuilder):
+    """
+    Chart methods of `RLBuilder`.
+    """
+
+    chart_data_cache_size: ClassVar[int]
+    chart_columnar_min_rows: ClassVar[Optional[int]]
+    _data_fingerprints: dict[int, tuple[Any, str]]
+    _session_lock: "threading.RLock"
+
+    if TYPE_CHECKING:
+
+        @property
+        def is_prefetch(self) -> bool: ...
+
+        def _session_lru(self, key: str, maxsize: int) -> LRUCache[Any, Any]: ...
+
+    def _chart_data(self, key: str, data: Any, version: Optional[Hashable] = None) -> dict[str, Any]:
+        """
+        Returns the data props of a chart: the data and its hash the first time it is sent,
+        only the hash while the client still holds a copy. Prefetch runs send no data.
+
+        Hashing serializes the data, once for the same object within a run. Rows of scalars keep their hash across
+        runs while the list and its values are the same objects. With a `version`, the hash is kept across runs and
+        the data is only hashed again when the version changes.
+        """
+        if self.is_prefetch:
+            return {}
+        if self.chart_data_cache_size <= 0 or data is None:
+            return self._encoded_chart_data(data)
+        digest = self._chart_data_digest(key, data, version)
+        is_miss, _ = self._get_event_value(key, "datamiss")
+        with self._session_lock:
+            sent = self._session_lru(_CHART_DATA_HASHES_KEY, self.chart_data_cache_size)
+            is_sent = not is_miss and sent.get(digest)
+            sent[digest] = True
+        if is_sent:
+            return {"dataHash": digest}
+        return {**self._encoded_chart_data(data), "dataHash": digest}
+
+    def _chart_data_digest(self, key: str, data: Any, version: Optional[Hashable]) -> str:
+        if version is not None:
+            with self._session_lock:
+                versions = self._session_lru(_CHART_DATA_VERSIONS_KEY, self.chart_data_cache_size)
+                stored: Optional[tuple[Hashable, str]] = versions.get(key)
+            if stored is not None and stored[0] == version:
+                return stored[1]
+        memo = self._data_fingerprints.get(id(data))
+        if memo is not None and memo[0] is data:
+            digest = memo[1]
+        else:
+            stored_digest = _stored_row_digest(data)
+            digest = fingerprint(data) if stored_digest is None else stored_digest
+            if stored_digest is None:
+                _store_row_digest(data, digest)
+            self._data_fingerprints[id(data)] = (data, digest)
+        if version is not None:
+            with self._session_lock:
+                versions[key] = (version, digest)
+        return digest
+
+    def _encoded_chart_data(self, data: Any) -> dict[str, Any]:
+        columns = _columns(data, self.chart_columnar_min_rows)
+        return {"data": data} if columns is None else {"data": columns, "dataEncoding": "columns"}
+
+    def area_chart(
+        self,
+        data: list,
+        data_key: str,
+        series: list[dict[str, Any]],
+        *,
+        key: Optional[str] = None,
+        data_version: Optional[Hashable] = None,
+        active_dot_props: Optional[dict[str, Any]] = None,
+        area_chart_props: Optional[dict[str, Any]] = None,
+        area_props: Optional[dict[str, Any]] = None,
+        connect_nulls: Optional[bool] = None,
+        curve_type: Optional[str] = None,
+        dot_props: Optional[dict[str, Any]] = None,
+        fill_opacity: float = 0.2,
+        grid_axis: Optional[str] = None,
+        grid_color: Optional[str] = None,
+        grid_props: Optional[dict[str, Any]] = None,
+        legend_props: Optional[dict[str, Any]] = None,
+        orientation: Optional[str] = None,
+        reference_lines: Optional[list[dict[str, Any]]] = None,
+        right_y_axis_label: Optional[str] = None,
+        right_y_axis_props: Optional[dict[str, Any]] = None,
+        split_colors: Optional[list[str]] = None,
+        split_offset: Optional[float] = None,
+        stroke_dasharray: Optional[Union[str, int]] = None,
+        stroke_width: Optional[int] = None,
+        text_color: Optional[str] = None,
+        tick_line: Optional[str] = None,
+        tooltip_animation_duration: int = 0,
+        tooltip_props: Optional[dict[str, Any]] = None,
+        type: Optional[str] = None,  # noqa: A002
+        unit: Optional[str] = None,
+        with_dots: Optional[bool] = None,
+        with_gradient: Optional[bool] = None,
+        with_legend: Optional[bool] = None,
+        with_point_labels: Optional[bool] = None,
+        with_right_y_axis: Optional[bool] = None,
+        with_tooltip: Optional[bool] = None,
+        with_x_axis: Optional[bool] = None,
+        with_y_axis: Optional[bool] = None,
+        x_axis_label: Optional[str] = None,
+        x_axis_props: Optional[dict[str, Any]] = None,
+        y_axis_label: Optional[str] = None,
+        y_axis_props: Optional[dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> "RLBuilder":
+        """
+        Area chart for time series or continuous data.
+
+        Args:
+            data (list): Dataset.
+            data_key (str): X-axis data key.
+            series (list[dict[str, Any]]): Series configuration.
+            key (Optional[str]): Explicit element key.
+            data_version (Optional[Hashable]): Changes whenever the data changes, e.g. a revision number or the
+                time the data was loaded. While it is unchanged, later runs skip hashing the data.
+            active_dot_props (Optional[dict[str, Any]]): Active dot props.
+            area_chart_props (Optional[dict[str, Any]]): Chart container props.
+            area_props (Optional[dict[str, Any]]): Area props.
+            connect_nulls (Optional[bool]): Connect across null values.
+            curve_type (Optional[str]): Curve interpolation type.
+            dot_props (Optional[dict[str, Any]]): Dot props.
+            fill_opacity (float): Fill opacity for area.
+            grid_axis (Optional[str]): Grid axis.
+            grid_color (Optional[str]): Grid color.
+            grid_props (Optional[dict[str, Any]]): Grid props.
+            legend_props (Optional[dict[str, Any]]): Legend props.
+            orientation (Optional[str]): Chart orientation.
+            reference_lines (Optional[list[dict[str, Any]]]): Reference lines.
+            right_y_axis_label (Optional[str]): Secondary Y axis label.
+            right_y_axis_props (Optional[dict[str, Any]]): Secondary Y axis props.
+            split_colors (Optional[list[str]]): Split area colors.
+            split_offset (Optional[float]): Split offset value.
+            stroke_dasharray (Optional[Union[str, int]]): Stroke dash pattern.
+            stroke_width (Optional[int]): Line width.
+            text_color (Optional[str]): Text color.
+            tick_line (Optional[str]): Tick line display.
+            tooltip_animation_duration (int): Tooltip animation duration.
+            tooltip_props (Optional[dict[str, Any]]): Tooltip props.
+            type (Optional[str]): Chart type variant.
+            unit (Optional[str]): Unit suffix.
+            with_dots (Optional[bool]): Show dots.
+            with_gradient (Optional[bool]): Fill with gradient.
+            with_legend (Optional[bool]): Show legend.
+            with_point_labels (Optional[bool]): Show point labels.
+            with_right_y_axis (Optional[bool]): Enable right Y axis.
+            with_tooltip (Optional[bool]): Show tooltip.
+            with_x_axis (Optional[bool]): Show X axis.
+            with_y_axis (Optional[bool]): Show Y axis.
+            x_axis_label (Optional[str]): X axis label.
+            x_axis_props (Optional[dict[str, Any]]): X axis props.
+            y_axis_label (Optional[str]): Y axis label.
+            y_axis_props (Optional[dict[str, Any]]): Y axis props.
+            kwargs: Additional props to set.
+
+        Returns:
+            RLBuilder: A nested builder scoped to the area chart element.
+        """
+        key = key or self._new_text_id("areachart")
+        return self._create_builder_element(  # type: ignore[return-value]
+            name="areachart",
+            key=key,
+            props={
+                **self._chart_data(key, data, data_version),
+                "dataKey": data_key,
+                "series": series,
+                "activeDotProps": active_dot_props,
+                "areaChartProps": area_chart_props,
+                "areaProps": area_props,
+                "connectNulls": connect_nulls,
+                "curveType": curve_type,
+                "dotProps": dot_props,
+                "fillOpacity": fill_opacity,
+                "gridAxis": grid_axis,
+                "gridColor": grid_color,
+                "gridProps": grid_props,
+                "legendProps": legend_props,
+                "orientation": orientation,
+                "referenceLines": reference_lines,
+                "rightYAxisLabel": right_y_axis_label,
+                "rightYAxisProps": right_y_axis_props,
+                "splitColors": split_colors,
+                "splitOffset": split_offset,
+                "strokeDasharray": stroke_dasharray,
+                "strokeWidth": stroke_width,
+                "textColor": text_color,
+                "tickLine": tick_line,
+                "tooltipAnimationDuration": tooltip_animation_duration,
+                "tooltipProps": tooltip_props,
+                "type": type,
+                "unit": unit,
+                "withDots": with_dots,
+                "withGradient": with_gradient,
+                "withLegend": with_legend,
+                "withPointLabels": with_point_labels,
+                "withRightYAxis": with_right_y_axis,
+                "withTooltip": with_tooltip,
+                "withXAxis": with_x_axis,
+                "withYAxis": with_y_axis,
+                "xAxisLabel": x_axis_label,
+                "xAxisProps": x_axis_props,
+                "yAxisLabel": y_axis_label,
+                "yAxisProps": y_axis_props,
+                **kwargs,
+            },
+        )
+
+    def bar_chart(
+        self,
+        data: list,
+        data_key: str,
+        series: list[dict[str, Any]],
+        *,
+        bar_chart_props: Optional[dict[str, Any]] = None,
+        bar_label_color: Optional[str] = None,
+        bar_props: Optional[dict[str, Any]] = None,
+        cursor_fill: Optional[str] = None,
+        fill_opacity: Optional[float] = None,
+        get_bar_color: Optional[Callable[[float, dict[str, Any]], str]] = None,
+        grid_axis: Optional[Literal["none", "x", "y", "xy"]] = None,
+        grid_color: Optional[str] = None,
+        grid_props: Optional[dict[str, Any]] = None,
+        key: Optional[str] = None,
+        data_version: Optional[Hashable] = None,
+        legend_props: Optional[dict[str, Any]] = None,
+        max_bar_width: Optional[int] = None,
+        min_bar_size: Optional[int] = None,
+        orientation: Optional[Literal["horizontal", "vertical"]] = None,
+        reference_lines: Optional[list[dict[str, Any]]] = None,
+        right_y_axis_label: Optional[str] = None,
+        right_y_axis_props: Optional[dict[str, Any]] = None,
+        stroke_dasharray: Optional[Union[str, int]] = None,
+        text_color: Optional[str] = None,
+        tick_line: Optional[Literal["none", "x", "y", "xy"]] = None,
+        tooltip_animation_duration: Optional[int] = None,
+        tooltip_props: Optional[dict[str, Any]] = None,
+        type: Optional[str] = None,  # noqa: A002
+        unit: Optional[str] = None,
+        value_label_props: Optional[dict[str, Any]] = None,
+        with_bar_value_label: Optional[bool] = None,
+        with_legend: Optional[bool] = None,
+        with_right_y_axis: Optional[bool] = None,
+        with_tooltip: Optional[bool] = None,
+        with_x_axis: Optional[bool] = None,
+        with_y_axis: Optional[bool] = None,
+        x_axis_label: Optional[str] = None,
+        x_axis_props: Optional[dict[str, Any]] = None,
+        y_axis_label: Optional[str] = None,
+        y_axis_props: Optional[dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> "RLBuilder":
+        """
+        Bar chart for categorical or time series data.
+
+        Args:
+            data (list): Dataset.
+            data_key (str): X-axis data key.
+            series (list[dict[str, Any]]): Series configuration.
+            bar_chart_props (Optional[dict[str, Any]]): Chart container props.
+            bar_label_color (Optional[str]): Value label color.
+            bar_props (Optional[dict[str, Any]]): Bar props.
+            cursor_fill (Optional[str]): Cursor overlay color.
+            fill_opacity (Optional[float]): Bar fill opacity.
+            get_bar_color (Optional[Callable[[float, dict[str, Any]], str]]): Dynamic color callback.
+            grid_axis (Optional[Literal["none","x","y","xy"]]): Grid axis.
+            grid_color (Optional[str]): Grid color.
+            grid_props (Optional[dict[str, Any]]): Grid props.
+            key (Optional[str]): Explicit element key.
+            data_version (Optional[Hashable]): Changes whenever the data changes, e.g. a revision number or the
+                time the data was loaded. While it is unchanged, later runs skip hashing the data.
+            legend_props (Optional[dict[str, Any]]): Legend props.
+            max_bar_width (Optional[int]): Max bar width.
+            min_bar_size (Optional[int]): Min bar size.
+            orientation (Optional[Literal["horizontal","vertical"]]): Orientation.
+            reference_lines (Optional[list[dict[str, Any]]]): Reference lines.
+            right_y_axis_label (Optional[str]): Secondary Y axis label.
+            right_y_axis_props (Optional[dict[str, Any]]): Secondary Y axis props.
+            stroke_dasharray (Optional[Union[str, int]]): Border dash pattern.
+            text_color (Optional[str]): Text color.
+            tick_line (Optional[Literal["none","x","y","xy"]]): Tick line display.
+            tooltip_animation_duration (Optional[int]): Tooltip animation duration.
+            tooltip_props (Optional[dict[str, Any]]): Tooltip props.
+            type (Optional[str]): Chart type variant.
+            unit (Optional[str]): Unit suffix.
+            value_label_props (Optional[dict[str, Any]]): Value label props.
+            with_bar_value_label (Optional[bool]): Show value labels above bars.
+            with_legend (Optional[bool]): Show legend.
+            with_right_y_axis (Optional[bool]): Enable right Y axis.
+            with_tooltip (Optional[bool]): Show tooltip.
+            with_x_axis (Optional[bool]): Show X axis.
+            with_y_axis (Optional[bool]): Show Y axis.
+            x_axis_label (Optional[str]): X axis label.
+            x_axis_props (Optional[dict[str, Any]]): X axis props.
+            y_axis_label (Optional[str]): Y axis label.
+            y_axis_props (Optional[dict[str, Any]]): Y axis props.
+            kwargs: Additional props to set.
+
+        Returns:
+            RLBuilder: A nested builder scoped to the bar chart element.
+        """
+        key = key or self._new_text_id("barchart")
+        return self._create_builder_element(  # type: ignore[return-value]
+            name="barchart",
+            key=key,
+            props={
+                **self._chart_data(key, data, data_version),
+                "dataKey": data_key,
+                "series": series,
+                "barChartProps": bar_chart_props,
+                "barLabelColor": bar_label_color,
+                "barProps": bar_props,
+                "cursorFill": cursor_fill,
+                "fillOpacity": fill_opacity,
+                "getBarColor": get_bar_color,
+                "gridAxis": grid_axis,
+                "gridColor": grid_color,
+                "gridProps": grid_props,
+                "legendProps": legend_props,
+                "maxBarWidth": max_bar_width,
+                "minBarSize": min_bar_size,
+                "orientation": orientation,
+                "referenceLines": reference_lines,
+                "rightYAxisLabel": right_y_axis_label,
+                "rightYAxisProps": right_y_axis_props,
+                "strokeDasharray": stroke_dasharray,
+                "textColor": text_color,
+                "tickLine": tick_line,
+                "tooltipAnimationDuration": tooltip_animation_duration,
+                "tooltipProps": tooltip_props,
+                "type": type,
+                "unit": unit,
+                "valueLabelProps": value_label_props,
+                "withBarValueLabel": with_bar_value_label,
+                "withLegend": with_legend,
+                "withRightYAxis": with_right_y_axis,
+                "withTooltip": with_tooltip,
+                "withXAxis": with_x_axis,
+                "withYAxis": with_y_axis,
+                "xAxisLabel": x_axis_label,
+                "xAxisProps": x_axis_props,
+                "yAxisLabel": y_axis_label,
+                "yAxisProps": y_axis_props,
+                **kwargs,
+            },
+        )
+
+    def line_chart(
+        self,
+        data: list,
+        data_key: str,
+        series: list[dict[str, Any]],
+        *,
+        key: Optional[str] = None,
+        data_version: Optional[Hashable] = None,
+        active_dot_props: Optional[dict[str, Any]] = None,
+        connect_nulls: Optional[bool] = None,
+        curve_type: Optional[str] = None,
+        dot_props: Optional[dict[str, Any]] = None,
+        fill_opacity: Optional[float] = None,
+        gradient_stops: Optional[list[dict[str, Any]]] = None,
+        grid_axis: Optional[str] = None,
+        grid_color: Optional[str] = None,
+        grid_props: Optional[dict[str, Any]] = None,
+        legend_props: Optional[dict[str, Any]] = None,
+        line_chart_props: Optional[dict[str, Any]] = None,
+        line_props: Optional[dict[str, Any]] = None,
+        orientation: Optional[str] = None,
+        reference_lines: Optional[list[dict[str, Any]]] = None,
+        right_y_axis_label: Optional[str] = None,
+        right_y_axis_props: Optional[dict[str, Any]] = None,
+        stroke_dasharray: Optional[str] = None,
+        stroke_width: Optional[float] = None,
+        text_color: Optional[str] = None,
+        tick_line: Optional[str] = None,
+        tooltip_animation_duration: Optional[int] = None,
+        tooltip_props: Optional[dict[str, Any]] = None,
+        type: Optional[str] = None,  # noqa: A002
+        unit: Optional[str] = None,
+        with_dots: Optional[bool] = None,
+        with_legend: Optional[bool] = None,
+        with_point_labels: Optional[bool] = None,
+        with_right_y_axis: Optional[bool] = None,
+        with_tooltip: Optional[bool] = None,
+        with_x_axis: Optional[bool] = None,
+        with_y_axis: Optional[bool] = None,
+        x_axis_label: Optional[str] = None,
+        x_axis_props: Optional[dict[str, Any]] = None,
+        y_axis_label: Optional[str] = None,
+        y_axis_props: Optional[dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> "RLBuilder":
+        """
+        Line chart for continuous data.
+
+        Args:
+            data (list): Dataset.
+            data_key (str): X-axis data key.
+            series (list[dict[str, Any]]): Series configuration.
+            key (Optional[str]): Explicit element key.
+            data_version (Optional[Hashable]): Changes whenever the data changes, e.g. a revision number or the
+                time the data was loaded. While it is unchanged, later runs skip hashing the data.
+            active_dot_props (Optional[dict[str, Any]]): Active dot props.
+            connect_nulls (Optional[bool]): Connect across null values.
+            curve_type (Optional[str]): Curve interpolation type.
+            dot_props (Optional[dict[str, Any]]): Dot props.
+            fill_opacity (Optional[float]): Area fill opacity for gradients.
+            gradient_stops (Optional[list[dict[str, Any]]]): Gradient configuration.
+            grid_axis (Optional[str]): Grid axis.
+            grid_color (Optional[str]): Grid color.
+            grid_props (Optional[dict[str, Any]]): Grid props.
+            legend_props (Optional[dict[str, Any]]): Legend props.
+            line_chart_props (Optional[dict[str, Any]]): Chart container props.
+            line_props (Optional[dict[str, Any]]): Line props.
+            orientation (Optional[str]): Chart orientation.
+            reference_lines (Optional[list[dict[str, Any]]]): Reference lines.
+            right_y_axis_label (Optional[str]): Secondary Y axis label.
+            right_y_axis_props (Optional[dict[str, Any]]): Secondary Y axis props.
+            stroke_dasharray (Optional[str]): Line dash pattern.
+            stroke_width (Optional[float]): Line width.
+            text_color (Optional[str]): Text color.
+            tick_line (Optional[str]): Tick line display.
+            tooltip_animation_duration (Optional[int]): Tooltip animation duration.
+            tooltip_props (Optional[dict[str, Any]]): Tooltip props.
+            type (Optional[str]): Chart type variant.
+            unit (Optional[str]): Unit suffix.
+            with_dots (Optional[bool]): Show dots.
+            with_legend (Optional[bool]): Show legend.
+            with_point_labels (Optional[bool]): Show point labels.
+            with_right_y_axis (Optional[bool]): Enable right Y axis.
+            with_tooltip (Optional[bool]): Show tooltip.
+            with_x_axis (Optional[bool]): Show X axis.
+            with_y_axis (Optional[bool]): Show Y axis.
+            x_axis_label (Optional[str]): X axis label.
+            x_axis_props (Optional[dict[str, Any]]): X axis props.
+            y_axis_label (Optional[str]): Y axis label.
+            y_axis_props (Optional[dict[str, Any]]): Y axis props.
+            kwargs: Additional props to set.
+
+        Returns:
+            RLBuilder: A nested builder scoped to the line chart element.
+        """
+        key = key or self._new_text_id("linechart")
+        return self._create_builder_element(  # type: ignore[return-value]
+            name="linechart",
+            key=key,
+            props={
+                **self._chart_data(key, data, data_version),
+                "dataKey": data_key,
+                "series": series,
+                "activeDotProps": active_dot_props,
+                "connectNulls": connect_nulls,
+                "curveType": curve_type,
+                "dotProps": dot_props,
+                "fillOpacity": fill_opacity,
+                "gradientStops": gradient_stops,
+                "gridAxis": grid_axis,
+                "gridColor": grid_color,
+                "gridProps": grid_props,
+                "legendProps": legend_props,
+                "lineChartProps": line_chart_props,
+                "lineProps": line_props,
+                "orientation": orientation,
+                "referenceLines": reference_lines,
+                "rightYAxisLabel": right_y_axis_label,
+                "rightYAxisProps": right_y_axis_props,
+                "strokeDasharray": stroke_dasharray,
+                "strokeWidth": stroke_width,
+                "textColor": text_color,
+                "tickLine": tick_line,
+                "tooltipAnimationDuration": tooltip_animation_duration,
+                "tooltipProps": tooltip_props,
+                "type": type,
+                "unit": unit,
+                "withDots": with_dots,
+                "withLegend": with_legend,
+                "withPointLabels": with_point_labels,
+                "withRightYAxis": with_right_y_axis,
+                "withTooltip": with_tooltip,
+                "withXAxis": with_x_axis,
+                "withYAxis": with_y_axis,
+                "xAxisLabel": x_axis_label,
+                "xAxisProps": x_axis_props,
+                "yAxisLabel": y_axis_label,
+                "yAxisProps": y_axis_props,
+                **kwargs,
+            },
+        )
+
+    def composite_chart(
+        self,
+        data: list,
+        data_key: str,
+        series: list[dict[str, Any]],
+        *,
+        key: Optional[str] = None,
+        data_version: Optional[Hashable] = None,
+        active_dot_props: Optional[dict[str, Any]] = None,
+        area_props: Optional[dict[str, Any]] = None,
+        bar_props: Optional[dict[str, Any]] = None,
+        children: Optional[Any] = None,
+        composed_chart_props: Optional[dict[str, Any]] = None,
+        connect_nulls: Optional[bool] = None,
+        curve_type: Optional[str] = None,
+        dot_props: Optional[dict[str, Any]] = None,
+        grid_axis: Optional[str] = None,
+        grid_color: Optional[str] = None,
+        grid_props: Optional[dict[str, Any]] = None,
+        legend_props: Optional[dict[str, Any]] = None,
+        line_props: Optional[dict[str, Any]] = None,
+        max_bar_width: Optional[int] = None,
+        min_bar_size: Optional[int] = None,
+        reference_lines: Optional[list[dict[str, Any]]] = None,
+        right_y_axis_label: Optional[str] = None,
+        right_y_axis_props: Optional[dict[str, Any]] = None,
+        stroke_dasharray: Optional[str] = None,
+        stroke_width: Optional[int] = None,
+        text_color: Optional[str] = None,
+        tick_line: Optional[str] = None,
+        tooltip_animation_duration: Optional[int] = None,
+        tooltip_props: Optional[dict[str, Any]] = None,
+        unit: Optional[str] = None,
+        with_bar_value_label: Optional[bool] = None,
+        with_dots: Optional[bool] = None,
+        with_legend: Optional[bool] = None,
+        with_point_labels: Optional[bool] = None,
+        with_right_y_axis: Optional[bool] = None,
+        with_tooltip: Optional[bool] = None,
+        with_x_axis: Optional[bool] = None,
+        with_y_axis: Optional[bool] = None,
+        x_axis_label: Optional[str] = None,
+        x_axis_props: Optional[dict[str, Any]] = None,
+        y_axis_label: Optional[str] = None,
+        y_axis_props: Optional[dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> "RLBuilder":
+        """
+        Composite chart that can combine bars, lines, and areas.
+
+        Args:
+            data (list): Dataset.
+            data_key (str): X-axis data key.
+            series (list[dict[str, Any]]): Series configuration.
+            key (Optional[str]): Explicit element key.
+            data_version (Optional[Hashable]): Changes whenever the data changes, e.g. a revision number or the
+                time the data was loaded. While it is unchanged, later runs skip hashing the data.
+            active_dot_props (Optional[dict[str, Any]]): Active dot props.
+            area_props (Optional[dict[str, Any]]): Area props.
+            bar_props (Optional[dict[str, Any]]): Bar props.
+            children (Optional[Any]): Extra child elements.
+            composed_chart_props (Optional[dict[str, Any]]): Chart container props.
+            connect_nulls (Optional[bool]): Connect across null values.
+            curve_type (Optional[str]): Curve interpolation type.
+            dot_props (Optional[dict[str, Any]]): Dot props.
+            grid_axis (Optional[str]): Grid axis.
+            grid_color (Optional[str]): Grid color.
+            grid_props (Optional[dict[str, Any]]): Grid props.
+            legend_props (Optional[dict[str, Any]]): Legend props.
+            line_props (Optional[dict[str, Any]]): Line props.
+            max_bar_width (Optional[int]): Max bar width.
+            min_bar_size (Optional[int]): Min bar size.
+            reference_lines (Optional[list[dict[str, Any]]]): Reference lines.
+            right_y_axis_label (Optional[str]): Secondary Y axis label.
+            right_y_axis_props (Optional[dict[str, Any]]): Secondary Y axis props.
+            stroke_dasharray (Optional[str]): Stroke dash pattern.
+            stroke_width (Optional[int]): Line width.
+            text_color (Optional[str]): Text color.
+            tick_line (Optional[str]): Tick line display.
+            tooltip_animation_duration (Optional[int]): Tooltip animation duration.
+            tooltip_props (Optional[dict[str, Any]]): Tooltip props.
+            unit (Optional[str]): Unit suffix.
+            with_bar_value_label (Optional[bool]): Show value labels on bars.
+            with_dots (Optional[bool]): Show dots on lines.
+            with_legend (Optional[bool]): Show legend.
+            with_point_labels (Optional[bool]): Show point labels on lines.
+            with_right_y_axis (Optional[bool]): Enable right Y axis.
+            with_tooltip (Optional[bool]): Show tooltip.
+            with_x_axis (Optional[bool]): Show X axis.
+            with_y_axis (Optional[bool]): Show Y axis.
+            x_axis_label (Optional[str]): X axis label.
+            x_axis_props (Optional[dict[str, Any]]): X axis props.
+            y_axis_label (Optional[str]): Y axis label.
+            y_axis_props (Optional[dict[str, Any]]): Y axis props.
+            kwargs: Additional props to set.
+
+        Returns:
+            RLBuilder: A nested builder scoped to the composite chart element.
+        """
+        key = key or self._new_text_id("compositechart")
+        return self._create_builder_element(  # type: ignore[return-value]
+            name="compositechart",
+            key=key,
+            props={
+                **self._chart_data(key, data, data_version),
+                "dataKey": data_key,
+                "series": series,
+                "activeDotProps": active_dot_props,
+                "areaProps": area_props,
+                "barProps": bar_props,
+                "children": children,
+                "composedChartProps": composed_chart_props,
+                "connectNulls": connect_nulls,
+                "curveType": curve_type,
+                "dotProps": dot_props,
+                "gridAxis": grid_axis,
+                "gridColor": grid_color,
+                "gridProps": grid_props,
+                "legendProps": legend_props,
+                "lineProps": line_props,
+                "maxBarWidth": max_bar_width,
+                "minBarSize": min_bar_size,
+                "referenceLines": reference_lines,
+                "rightYAxisLabel": right_y_axis_label,
+                "rightYAxisProps": right_y_axis_props,
+                "strokeDasharray": stroke_dasharray,
+                "strokeWidth": stroke_width,
+                "textColor": text_color,
+                "tickLine": tick_line,
+                "tooltipAnimationDuration": tooltip_animation_duration,
+                "tooltipProps": tooltip_props,
+                "unit": unit,
+                "withBarValueLabel": with_bar_value_label,
+                "withDots": with_dots,
+                "withLegend": with_legend,
+                "withPointLabels": with_point_labels,
+                "withRightYAxis": with_right_y_axis,
+                "withTooltip": with_tooltip,
+                "withXAxis": with_x_axis,
+                "withYAxis": with_y_axis,
+                "xAxisLabel": x_axis_label,
+                "xAxisProps": x_axis_props,
+                "yAxisLabel": y_axis_label,
+                "yAxisProps": y_axis_props,
+                **kwargs,
+            },
+        )
+
+    def donut_chart(
+        self,
+        data: list,
+        *,
+        chart_label: Optional[Union[str, int]] = None,
+        end_angle: Optional[int] = None,
+        key: Optional[str] = None,
+        data_version: Optional[Hashable] = None,
+        label_color: Optional[str] = None,
+        labels_type: Optional[str] = None,
+        padding_angle: Optional[int] = None,
+        pie_chart_props: Optional[dict[str, Any]] = None,
+        pie_props: Optional[dict[str, Any]] = None,
+        size: Optional[int] = None,
+        start_angle: Optional[int] = None,
+        stroke_color: Optional[str] = None,
+        stroke_width: Optional[int] = None,
+        thickness: Optional[int] = None,
+        tooltip_animation_duration: Optional[int] = None,
+        tooltip_data_source: Optional[Literal["all", "segment"]] = None,
+        tooltip_props: Optional[dict[str, Any]] = None,
+        with_labels: Optional[bool] = None,
+        with_labels_line: Optional[bool] = None,
+        with_tooltip: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> "RLBuilder":
+        """
+        Donut chart to visualize parts of a whole.
+
+        Args:
+            data (list): Dataset.
+            chart_label (Optional[Union[str, int]]): Center label.
+            end_angle (Optional[int]): End angle.
+            key (Optional[str]): Explicit element key.
+            data_version (Optional[Hashable]): Changes whenever the data changes, e.g. a revision number or the
+                time the data was loaded. While it is unchanged, later runs skip hashing the data.
+            label_color (Optional[str]): Label color.
+            labels_type (Optional[str]): Label content type.
+            padding_angle (Optional[int]): Angle between segments.
+            pie_chart_props (Optional[dict[str, Any]]): Chart container props.
+            pie_props (Optional[dict[str, Any]]): Pie props.
+            size (Optional[int]): Chart size.
+            start_angle (Optional[int]): Start angle.
+            stroke_color (Optional[str]): Segment border color.
+            stroke_width (Optional[int]): Segment border width.
+            thickness (Optional[int]): Ring thickness.
+            tooltip_animation_duration (Optional[int]): Tooltip animation duration.
+            tooltip_data_source (Optional[Literal["all","segment"]]): Tooltip data source.
+            tooltip_props (Optional[dict[str, Any]]): Tooltip props.
+            with_labels (Optional[bool]): Show labels.
+            with_labels_line (Optional[bool]): Show label connector lines.
+            with_tooltip (Optional[bool]): Show tooltip.
+            kwargs: Additional props to set.
+
+        Returns:
+            RLBuilder: A nested builder scoped to the donut chart element.
+        """
+        key = key or self._new_text_id("donutchart")
+        return self._create_builder_element(  # type: ignore[return-value]
+            name="donutchart",
+            key=key,
+            props={
+                **self._chart_data(key, data, data_version),
+                "chartLabel": chart_label,
+                "endAngle": end_angle,
+                "labelColor": label_color,
+                "labelsType": labels_type,
+                "paddingAngle": padding_angle,
+                "pieChartProps": pie_chart_props,
+                "pieProps": pie_props,
+                "size": size,
+                "startAngle": start_angle,
+                "strokeColor": stroke_color,
+                "strokeWidth": stroke_width,
+                "thickness": thickness,
+                "tooltipAnimationDuration": tooltip_animation_duration,
+                "tooltipDataSource": tooltip_data_source,
+                "tooltipProps": tooltip_props,
+                "withLabels": with_labels,
+                "withLabelsLine": with_labels_line,
+                "withTooltip": with_tooltip,
+                **kwargs,
+            },
+        )
+
+    def funnel_chart(
+        self,
+        data: list,
+        *,
+        funnel_chart_props: Optional[dict[str, Any]] = None,
+        funnel_props: Optional[dict[str, Any]] = None,
+        key: Optional[str] = None,
+        data_version: Optional[Hashable] = None,
+        label_color: Optional[str] = None,
+        labels_position: Optional[Literal["left", "right", "inside"]] = None,
+        size: Optional[int] = None,
+        stroke_color: Optional[str] = None,
+        stroke_width: Optional[int] = None,
+        tooltip_animation_duration: Optional[int] = None,
+        tooltip_data_source: Optional[Literal["all", "segment"]] = None,
+        tooltip_props: Optional[dict[str, Any]] = None,
+        value_formatter: Optional[Any] = None,
+        with_labels: Optional[bool] = None,
+        with_tooltip: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> "RLBuilder":
+        """
+        Funnel chart for conversion or pipeline visualization.
+
+        Args:
+            data (list): Dataset.
+            funnel_chart_props (Optional[dict[str, Any]]): Chart container props.
+            funnel_props (Optional[dict[str, Any]]): Funnel props.
+            key (Optional[str]): Explicit element key.
+            data_version (Optional[Hashable]): Changes whenever the data changes, e.g. a revision number or the
+                time the data was loaded. While it is unchanged, later runs skip hashing the data.
+            label_color (Optional[str]): Label color.
+            labels_position (Optional[Literal["left","right","inside"]]): Labels position.
+            size (Optional[int]): Chart size.
+            stroke_color (Optional[str]): Border color.
+            stroke_width (Optional[int]): Border width.
+            tooltip_animation_duration (Optional[int]): Tooltip animation duration.
+            tooltip_data_source (Optional[Literal["all","segment"]]): Tooltip data source.
+            tooltip_props (Optional[dict[str, Any]]): Tooltip props.
+            value_formatter (Optional[Any]): Value formatter.
+            with_labels (Optional[bool]): Show labels.
+            with_tooltip (Optional[bool]): Show tooltip.
+            kwargs: Additional props to set.
+
+        Returns:
+            RLBuilder: A nested builder scoped to the funnel chart element.
+        """
+        key = key or self._new_text_id("funnelchart")
+        return self._create_builder_element(  # type: ignore[return-value]
+            name="funnelchart",
+            key=key,
+            props={
+                **self._chart_data(key, data, data_version),
+                "funnelChartProps": funnel_chart_props,
+                "funnelProps": funnel_props,
+                "labelColor": label_color,
+                "labelsPosition": labels_position,
+                "size": size,
+                "strokeColor": stroke_color,
+                "strokeWidth": stroke_width,
+                "tooltipAnimationDuration": tooltip_animation_duration,
+                "tooltipDataSource": tooltip_data_source,
+                "tooltipProps": tooltip_props,
+                "valueFormatter": value_formatter,
+                "withLabels": with_labels,
+                "withTooltip": with_tooltip,
+                **kwargs,
+            },
+        )
+
+    def pie_chart(
+        self,
+        data: list,
+        *,
+        end_angle: Optional[int] = None,
+        key: Optional[str] = None,
+        data_version: Optional[Hashable] = None,
+        label_color: Optional[str] = None,
+        labels_position: Optional[Literal["outside", "inside"]] = None,
+        labels_type: Optional[Literal["value", "percent"]] = None,
+        padding_angle: Optional[int] = None,
+        pie_chart_props: Optional[dict[str, Any]] = None,
+        pie_props: Optional[dict[str, Any]] = None,
+        size: Optional[int] = None,
+        start_angle: Optional[int] = None,
+        stroke_color: Optional[str] = None,
+        stroke_width: Optional[int] = None,
+        tooltip_animation_duration: Optional[int] = None,
+        tooltip_data_source: Optional[Literal["all", "segment"]] = None,
+        tooltip_props: Optional[dict[str, Any]] = None,
+        with_labels: Optional[bool] = None,
+        with_labels_line: Optional[bool] = None,
+        with_tooltip: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> "RLBuilder":
+        """
+        Pie chart to visualize parts of a whole.
+
+        Args:
+            data (list): Dataset.
+            end_angle (Optional[int]): End angle.
+            key (Optional[str]): Explicit element key.
+            data_version (Optional[Hashable]): Changes whenever the data changes, e.g. a revision number or the
+                time the data was loaded. While it is unchanged, later runs skip hashing the data.
+            label_color (Optional[str]): Label color.
+            labels_position (Optional[Literal["outside","inside"]]): Labels position.
+            labels_type (Optional[Literal["value","percent"]]): Label content.
+            padding_angle (Optional[int]): Angle between segments.
+            pie_chart_props (Optional[dict[str, Any]]): Chart container props.
+            pie_props (Optional[dict[str, Any]]): Pie props.
+            size (Optional[int]): Chart size.
+            start_angle (Optional[int]): Start angle.
+            stroke_color (Optional[str]): Border color.
+            stroke_width (Optional[int]): Border width.
+            tooltip_animation_duration (Optional[int]): Tooltip animation duration.
+            tooltip_data_source (Optional[Literal["all","segment"]]): Tooltip data source.
+            tooltip_props (Optional[dict[str, Any]]): Tooltip props.
+            with_labels (Optional[bool]): Show labels.
+            with_labels_line (Optional[bool]): Show label connector lines.
+            with_tooltip (Optional[bool]): Show tooltip.
+            kwargs: Additional props to set.
+
+        Returns:
+            RLBuilder: A nested builder scoped to the pie chart element.
+        """
+        key = key or self._new_text_id("piechart")
+        return self._create_builder_element(  # type: ignore[return-value]
+            name="piechart",
+            key=key,
+            props={
+                **self._chart_data(key, data, data_version),
+                "endAngle": end_angle,
+                "labelColor": label_color,
+                "labelsPosition": labels_position,
+                "labelsType": labels_type,
+                "paddingAngle": padding_angle,
+                "pieChartProps": pie_chart_props,
+                "pieProps": pie_props,
+                "size": size,
+                "startAngle": start_angle,
+                "strokeColor": stroke_color,
+                "strokeWidth": stroke_width,
+                "tooltipAnimationDuration": tooltip_animation_duration,
+                "tooltipDataSource": tooltip_data_source,
+                "tooltipProps": tooltip_props,
+                "withLabels": with_labels,
+                "withLabelsLine": with_labels_line,
+                "withTooltip": with_tooltip,
+                **kwargs,
+            },
+        )
+
+    def radar_chart(
+        self,
+        data: list,
+        data_key: str,
+        series: list[dict[str, Any]],
+        *,
+        active_dot_props: Optional[dict[str, Any]] = None,
+        dot_props: Optional[dict[str, Any]] = None,
+        grid_color: Optional[str] = None,
+        key: Optional[str] = None,
+        data_version: Optional[Hashable] = None,
+        legend_props: Optional[dict[str, Any]] = None,
+        polar_angle_axis_props: Optional[dict[str, Any]] = None,
+        polar_grid_props: Optional[dict[str, Any]] = None,
+        polar_radius_axis_props: Optional[dict[str, Any]] = None,
+        radar_chart_props: Optional[dict[str, Any]] = None,
+        radar_props: Optional[dict[str, Any]] = None,
+        text_color: Optional[str] = None,
+        tooltip_animation_duration: Optional[int] = None,
+        tooltip_props: Optional[dict[str, Any]] = None,
+        with_dots: Optional[bool] = None,
+        with_legend: Optional[bool] = None,
+        with_polar_angle_axis: Optional[bool] = None,
+        with_polar_grid: Optional[bool] = None,
+        with_polar_radius_axis: Optional[bool] = None,
+        with_tooltip: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> "RLBuilder":
+        """
+        Radar chart for multi-dimensional categorical data.
+
+        Args:
+            data (list): Dataset.
+            data_key (str): Key for category labels.
+            series (list[dict[str, Any]]): Series configuration.
+            active_dot_props (Optional[dict[str, Any]]): Active dot props.
+            dot_props (Optional[dict[str, Any]]): Dot props.
+            grid_color (Optional[str]): Grid color.
+            key (Optional[str]): Explicit element key.
+            data_version (Optional[Hashable]): Changes whenever the data changes, e.g. a revision number or the
+                time the data was loaded. While it is unchanged, later runs skip hashing the data.
+            legend_props (Optional[dict[str, Any]]): Legend props.
+            polar_angle_axis_props (Optional[dict[str, Any]]): Polar angle axis props.
+            polar_grid_props (Optional[dict[str, Any]]): Polar grid props.
+            polar_radius_axis_props (Optional[dict[str, Any]]): Polar radius axis props.
+            radar_chart_props (Optional[dict[str, Any]]): Chart container props.
+            radar_props (Optional[dict[str, Any]]): Radar area/line props.
+            text_color (Optional[str]): Text color.
+            tooltip_animation_duration (Optional[int]): Tooltip animation duration.
+            tooltip_props (Optional[dict[str, Any]]): Tooltip props.
+            with_dots (Optional[bool]): Show dots.
+            with_legend (Optional[bool]): Show legend.
+            with_polar_angle_axis (Optional[bool]): Show angle axis.
+            with_polar_grid (Optional[bool]): Show polar grid.
+            with_polar_radius_axis (Optional[bool]): Show radius axis.
+            with_tooltip (Optional[bool]): Show tooltip.
+            kwargs: Additional props to set.
+
+        Returns:
+            RLBuilder: A nested builder scoped to the radar chart element.
+        """
+        key = key or self._new_text_id("radarchart")
+        return self._create_builder_element(  # type: ignore[return-value]
+            name="radarchart",
+            key=key,
+            props={
+                "activeDotProps": active_dot_props,
+                **self._chart_data(key, data, data_version),
+                "dataKey": data_key,
+                "dotProps": dot_props,
+                "gridColor": grid_color,
+                "legendProps": legend_props,
+                "polarAngleAxisProps": polar_angle_axis_props,
+                "polarGridProps": polar_grid_props,
+                "polarRadiusAxisProps": polar_radius_axis_props,
+                "radarChartProps": radar_chart_props,
+                "radarProps": radar_props,
+                "series": series,
+                "textColor": text_color,
+                "tooltipAnimationDuration": tooltip_animation_duration,
+                "tooltipProps": tooltip_props,
+                "withDots": with_dots,
+                "withLegend": with_legend,
+                "withPolarAngleAxis": with_polar_angle_axis,
+                "withPolarGrid": with_polar_grid,
+                "withPolarRadiusAxis": with_polar_radius_axis,
+                "withTooltip": with_tooltip,
+                **kwargs,
+            },
+        )
+
+    def scatter_chart(
+        self,
+        data: list,
+        data_key: dict[str, str],
+        *,
+        grid_axis: Optional[str] = None,
+        grid_color: Optional[str] = None,
+        grid_props: Optional[dict[str, Any]] = None,
+        labels: Optional[dict[str, str]] = None,
+        legend_props: Optional[dict[str, Any]] = None,
+        orientation: Optional[str] = None,
+        point_labels: Optional[str] = None,
+        reference_lines: Optional[list[dict[str, Any]]] = None,
+        right_y_axis_label: Optional[str] = None,
+        right_y_axis_props: Optional[dict[str, Any]] = None,
+        scatter_chart_props: Optional[dict[str, Any]] = None,
+        scatter_props: Optional[dict[str, Any]] = None,
+        stroke_dasharray: Optional[Union[str, int]] = None,
+        text_color: Optional[str] = None,
+        tick_line: Optional[str] = None,
+        tooltip_animation_duration: Optional[int] = None,
+        tooltip_props: Optional[dict[str, Any]] = None,
+        unit: Optional[dict[str, str]] = None,
+        value_formatter: Optional[Any] = None,
+        with_legend: Optional[bool] = None,
+        with_right_y_axis: Optional[bool] = None,
+        with_tooltip: Optional[bool] = None,
+        with_x_axis: Optional[bool] = None,
+        with_y_axis: Optional[bool] = None,
+        x_axis_label: Optional[str] = None,
+        x_axis_props: Optional[dict[str, Any]] = None,
+        y_axis_label: Optional[str] = None,
+        y_axis_props: Optional[dict[str, Any]] = None,
+        key: Optional[str] = None,
+        data_version: Optional[Hashable] = None,
+        renderer: Literal["svg", "canvas"] = "svg",
+        bin: Optional[BinKind] = None,  # noqa: A002
+        bins: int = 50,
+        **kwargs: Any,
+    ) -> "RLBuilder":
+        """
+        Scatter chart for visualizing correlation between two variables.
+
+        Args:
+            data (list): Dataset. With `bin`, each series `data` may also be a mapping of columns (e.g. NumPy arrays).
+            data_key (dict[str, str]): Mapping for x/y keys.
+            grid_axis (Optional[str]): Grid axis.
+            grid_color (Optional[str]): Grid color.
+            grid_props (Optional[dict[str, Any]]): Grid props.
+            labels (Optional[dict[str, str]]): Axis labels.
+            legend_props (Optional[dict[str, Any]]): Legend props.
+            orientation (Optional[str]): Orientation.
+            point_labels (Optional[str]): Point labels key.
+            reference_lines (Optional[list[dict[str, Any]]]): Reference lines.
+            right_y_axis_label (Optional[str]): Secondary Y axis label.
+            right_y_axis_props (Optional[dict[str, Any]]): Secondary Y axis props.
+            scatter_chart_props (Optional[dict[str, Any]]): Chart container props.
+            scatter_props (Optional[dict[str, Any]]): Scatter props.
+            stroke_dasharray (Optional[Union[str, int]]): Stroke dash pattern.
+            text_color (Optional[str]): Text color.
+            tick_line (Optional[str]): Tick line display.
+            tooltip_animation_duration (Optional[int]): Tooltip animation duration.
+            tooltip_props (Optional[dict[str, Any]]): Tooltip props.
+            unit (Optional[dict[str, str]]): Axis units.
+            value_formatter (Optional[Any]): Value formatter.
+            with_legend (Optional[bool]): Show legend.
+            with_right_y_axis (Optional[bool]): Enable right Y axis.
+            with_tooltip (Optional[bool]): Show tooltip.
+            with_x_axis (Optional[bool]): Show X axis.
+            with_y_axis (Optional[bool]): Show Y axis.
+            x_axis_label (Optional[str]): X axis label.
+            x_axis_props (Optional[dict[str, Any]]): X axis props.
+            y_axis_label (Optional[str]): Y axis label.
+            y_axis_props (Optional[dict[str, Any]]): Y axis props.
+            key (Optional[str]): Explicit element key.
+            data_version (Optional[Hashable]): Changes whenever the data changes, e.g. a revision number or the
+                time the data was loaded. While it is unchanged, later runs skip hashing the data.
+            renderer (Literal["svg", "canvas"]): Use "canvas" for large point counts; SVG-only props like `scatter_props` are ignored.
+            bin (Optional[Literal["hex", "grid"]]): Aggregate points into 2D bins on the server and render a density map.
+                Only the non-empty cells are sent; implies the canvas renderer.
+            bins (int): Number of bins along the x axis when `bin` is set.
+            kwargs: Additional props to set.
+
+        Returns:
+            RLBuilder: A nested builder scoped to the scatter chart element.
+
+        Example:
+        ```python
+        ui.scatter_chart(
+            [{"name": "events", "color": "blue.6", "data": {"x": xs, "y": ys}}],
+            data_key={"x": "x", "y": "y"},
+            bin="hex",
+            bins=80,
+        )
+        ```
+        """
+        density = bin_points(data, data_key, bin, bins) if bin is not None else None
+        key = key or self._new_text_id("scatterchart")
+        return self._create_builder_element(  # type: ignore[return-value]
+            name="canvasscatterchart" if renderer == "canvas" or density else "scatterchart",
+            key=key,
+            props={
+                **self._chart_data(key, None if density else data, data_version),
+                "bins": density,
+                "dataKey": data_key,
+                "gridAxis": grid_axis,
+                "gridColor": grid_color,
+                "gridProps": grid_props,
+                "labels": labels,
+                "legendProps": legend_props,
+                "orientation": orientation,
+                "pointLabels": point_labels,
+                "referenceLines": reference_lines,
+                "rightYAxisLabel": right_y_axis_label,
+                "rightYAxisProps": right_y_axis_props,
+                "scatterChartProps": scatter_chart_props,
+                "scatterProps": scatter_props,
+                "strokeDasharray": stroke_dasharray,
+                "textColor": text_color,
+                "tickLine": tick_line,
+                "tooltipAnimationDuration": tooltip_animation_duration,
+                "tooltipProps": tooltip_props,
+                "unit": unit,
+                "valueFormatter": value_formatter,
+                "withLegend": with_legend,
+                "withRightYAxis": with_right_y_axis,
+                "withTooltip": with_tooltip,
+                "withXAxis": with_x_axis,
+                "withYAxis": with_y_axis,
+                "xAxisLabel": x_axis_label,
+                "xAxisProps": x_axis_props,
+                "yAxisLabel": y_axis_label,
+                "yAxisProps": y_axis_props,
+                **kwargs,
+            },
+        )
+
+    def bubble_chart(
+        self,
+        data: list[dict[str, Any]],
+        data_key: dict[str, str],
+        range: tuple[int, int],  # noqa: A002
+        *,
+        color: Optional[str] = None,
+        grid_color: Optional[str] = None,
+        key: Optional[str] = None,
+        data_version: Optional[Hashable] = None,
+        label: Optional[str] = None,
+        scatter_props: Optional[dict[str, Any]] = None,
+        text_color: Optional[str] = None,
+        tooltip_props: Optional[dict[str, Any]] = None,
+        with_tooltip: Optional[bool] = None,
+        x_axis_props: Optional[dict[str, Any]] = None,
+        y_axis_props: Optional[dict[str, Any]] = None,
+        z_axis_props: Optional[dict[str, Any]] = None,
+        renderer: Literal["svg", "canvas"] = "svg",
+        **kwargs: Any,
+    ) -> "RLBuilder":
+        """
+        Bubble chart for three-dimensional data (x, y, z-size).
+
+        Args:
+            data (list[dict[str, Any]]): Dataset with x, y, z.
+            data_key (dict[str, str]): Mapping for x/y/z keys.
+            range (tuple[int, int]): Bubble size range.
+            color (Optional[str]): Bubble color.
+            grid_color (Optional[str]): Grid color.
+            key (Optional[str]): Explicit element key.
+            data_version (Optional[Hashable]): Changes whenever the data changes, e.g. a revision number or the
+                time the data was loaded. While it is unchanged, later runs skip hashing the data.
+            label (Optional[str]): Series label.
+            scatter_props (Optional[dict[str, Any]]): Scatter props.
+            text_color (Optional[str]): Text color.
+            tooltip_props (Optional[dict[str, Any]]): Tooltip props.
+            with_tooltip (Optional[bool]): Show tooltip.
+            x_axis_props (Optional[dict[str, Any]]): X axis props.
+            y_axis_props (Optional[dict[str, Any]]): Y axis props.
+            z_axis_props (Optional[dict[str, Any]]): Z axis props.
+            renderer (Literal["svg", "canvas"]): Use "canvas" for large point counts; SVG-only props like `scatter_props` are ignored.
+            kwargs: Additional props to set.
+
+        Returns:
+            RLBuilder: A nested builder scoped to the bubble chart element.
+        """
+        key = key or self._new_text_id("bubblechart")
+        return self._create_builder_element(  # type: ignore[return-value]
+            name="canvasbubblechart" if renderer == "canvas" else "bubblechart",
+            key=key,
+            props={
+                **self._chart_data(key, data, data_version),
+                "dataKey": data_key,
+                "range": range,
+                "color": color,
+                "gridColor": grid_color,
+                "label": label,
+                "scatterProps": scatter_props,
+                "textColor": text_color,
+                "tooltipProps": tooltip_props,
+                "withTooltip": with_tooltip,
+                "xAxisProps": x_axis_props,
+                "yAxisProps": y_axis_props,
+                "zAxisProps": z_axis_props,
+                **kwargs,
+            },
+        )
+
+    def radial_bar_chart(
+        self,
+        data: list[dict[str, Any]],
+        data_key: str,
+        *,
+        bar_size: Optional[int] = None,
+        empty_background_color: Optional[str] = None,
+        end_angle: Optional[int] = None,
+        key: Optional[str] = None,
+        data_version: Optional[Hashable] = None,
+        legend_props: Optional[dict[str, Any]] = None,
+        radial_bar_chart_props: Optional[dict[str, Any]] = None,
+        radial_bar_props: Optional[dict[str, Any]] = None,
+        start_angle: Optional[int] = None,
+        tooltip_props: Optional[dict[str, Any]] = None,
+        with_background: Optional[bool] = None,
+        with_labels: Optional[bool] = None,
+        with_legend: Optional[bool] = None,
+        with_tooltip: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> "RLBuilder":
+        """
+        Radial bar chart for circular bar visualizations.
+
+        Args:
+            data (list[dict[str, Any]]): Dataset.
+            data_key (str): Value key.
+            bar_size (Optional[int]): Bar thickness.
+            empty_background_color (Optional[str]): Empty background color.
+            end_angle (Optional[int]): End angle.
+            key (Optional[str]): Explicit element key.
+            data_version (Optional[Hashable]): Changes whenever the data changes, e.g. a revision number or the
+                time the data was loaded. While it is unchanged, later runs skip hashing the data.
+            legend_props (Optional[dict[str, Any]]): Legend props.
+            radial_bar_chart_props (Optional[dict[str, Any]]): Chart container props.
+            radial_bar_props (Optional[dict[str, Any]]): Bar props.
+            start_angle (Optional[int]): Start angle.
+            tooltip_props (Optional[dict[str, Any]]): Tooltip props.
+            with_background (Optional[bool]): Show circular background.
+            with_labels (Optional[bool]): Show labels.
+            with_legend (Optional[bool]): Show legend.
+            with_tooltip (Optional[bool]): Show tooltip.
+            kwargs: Additional props to set.
+
+        Returns:
+            RLBuilder: A nested builder scoped to the radial bar chart element.
+        """
+        key = key or self._new_text_id("radialbarchart")
+        return self._create_builder_element(  # type: ignore[return-value]
+            name="radialbarchart",
+            key=key,
+            props={
+                **self._chart_data(key, data, data_version),
+                "dataKey": data_key,
+                "barSize": bar_size,
+                "emptyBackgroundColor": empty_background_color,
+                "endAngle": end_angle,
+                "legendProps": legend_props,
+                "radialBarChartProps": radial_bar_chart_props,
+                "radialBarProps": radial_bar_props,
+                "startAngle": start_angle,
+                "tooltipProps": tooltip_props,
+                "withBackground": with_background,
+                "withLabels": with_labels,
+                "withLegend": with_legend,
+                "withTooltip": with_tooltip,
+                **kwargs,
+            },
+        )
+
+    def sparkline_chart(
+        self,
+        data: list[Union[int, float, None]],
+        *,
+        area_props: Optional[dict[str, Any]] = None,
+        color: Optional[str] = None,
+        connect_nulls: Optional[bool] = None,
+        curve_type: Optional[str] = None,
+        fill_opacity: Optional[float] = None,
+        key: Optional[str] = None,
+        data_version: Optional[Hashable] = None,
+        stroke_width: Optional[int] = None,
+        trend_colors: Optional[dict[str, Any]] = None,
+        with_gradient: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> "RLBuilder":
+        """
+        Compact sparkline chart for trends.
+
+        Args:
+            data (list[Union[int, float, None]]): Dataset.
+            area_props (Optional[dict[str, Any]]): Area props.
+            color (Optional[str]): Line/area color.
+            connect_nulls (Optional[bool]): Connect across null values.
+            curve_type (Optional[str]): Curve interpolation type.
+            fill_opacity (Optional[float]): Area fill opacity.
+            key (Optional[str]): Explicit element key.
+            data_version (Optional[Hashable]): Changes whenever the data changes, e.g. a revision number or the
+                time the data was loaded. While it is unchanged, later runs skip hashing the data.
+            stroke_width (Optional[int]): Line width.
+            trend_colors (Optional[dict[str, Any]]): Trend color overrides.
+            with_gradient (Optional[bool]): Fill with gradient.
+            kwargs: Additional props to set.
+
+        Returns:
+            RLBuilder: A nested builder scoped to the sparkline element.
+        """
+        key = key or self._new_text_id("sparkline")
+        return self._create_builder_element(  # type: ignore[return-value]
+            name="sparkline",
+            key=key,
+            props={
+                **self._chart_data(key, data, data_version),
+                "areaProps": area_props,
+                "color": color,
+                "connectNulls": connect_nulls,
+                "curveType": curve_type,
+                "fillOpacity": fill_opacity,
+                "strokeWidth": stroke_width,
+                "trendColors": trend_colors,
+                "withGradient": with_gradient,
+                **kwargs,
+            },
+        )
+
+    def sparkline_grid(
+        self,
+        data: list[list[Union[int, float, None]]],
+        *,
+        labels: Optional[list[str]] = None,
+        cell_height: Optional[int] = None,
+        color: Optional[str] = None,
+        columns: Optional[int] = None,
+        connect_nulls: Optional[bool] = None,
+        fill_opacity: Optional[float] = None,
+        gap: Optional[int] = None,
+        key: Optional[str] = None,
+        data_version: Optional[Hashable] = None,
+        stroke_width: Optional[int] = None,
+        trend_colors: Optional[dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> "RLBuilder":
+        """
+        Grid of sparklines rendered by a single element on a shared canvas.
+        Use it instead of many `sparkline_chart` calls on dashboards with hundreds of trends.
+
+        Args:
+            data (list[list[Union[int, float, None]]]): One row of values per sparkline. 2D arrays exposing `tolist()` are accepted.
+            labels (Optional[list[str]]): Label drawn above each sparkline.
+            cell_height (Optional[int]): Height of each sparkline in px.
+            color (Optional[str]): Line/area color.
+            columns (Optional[int]): Number of columns, computed from the width if not set.
+            connect_nulls (Optional[bool]): Connect across null values.
+            fill_opacity (Optional[float]): Area fill opacity.
+            gap (Optional[int]): Gap between cells in px.
+            key (Optional[str]): Explicit element key.
+            data_version (Optional[Hashable]): Changes whenever the data changes, e.g. a revision number or the
+                time the data was loaded. While it is unchanged, later runs skip hashing the data.
+            stroke_width (Optional[int]): Line width.
+            trend_colors (Optional[dict[str, Any]]): Trend color overrides.
+            kwargs: Additional props to set.
+
+        Returns:
+            RLBuilder: A nested builder scoped to the sparkline grid element.
+
+        Example:
+        ```python
+        ui.sparkline_grid(
+            [[10, 20, 15, 30], [30, 25, 20, 10]],
+            labels=["cpu", "memory"],
+            trend_colors={"positive": "teal.6", "negative": "red.6"},
+        )
+        ```
+        """
+        key = key or self._new_text_id("sparklinegrid")
+        return self._create_builder_element(  # type: ignore[return-value]
+            name="sparklinegrid",
+            key=key,
+            props={
+                **self._chart_data(key, data.tolist() if hasattr(data, "tolist") else data, data_version),
+                "labels": labels,
+                "cellHeight": cell_height,
+                "color": color,
+                "columns": columns,
+                "connectNulls": connect_nulls,
+                "fillOpacity": fill_opacity,
+                "gap": gap,
+                "strokeWidth": stroke_width,
+                "trendColors": trend_colors,
+                **kwargs,
+            },
+        )
+
+    def heatmap(
+        self,
+        data: dict[str, Union[int, float]],
+        *,
+        colors: Optional[list[str]] = None,
+        domain: Optional[tuple[Union[int, float], Union[int, float]]] = None,
+        end_date: Optional[Union[str, Any]] = None,
+        first_day_of_week: Optional[int] = None,
+        font_size: Optional[int] = None,
+        gap: Optional[int] = None,
+        get_rect_props: Optional[Any] = None,
+        get_tooltip_label: Optional[Any] = None,
+        key: Optional[str] = None,
+        data_version: Optional[Hashable] = None,
+        month_labels: Optional[list[str]] = None,
+        months_labels_height: Optional[int] = None,
+        rect_radius: Optional[int] = None,
+        rect_size: Optional[int] = None,
+        renderer: Literal["svg", "canvas"] = "svg",
+        start_date: Optional[Union[str, Any]] = None,
+        tooltip_props: Optional[dict[str, Any]] = None,
+        weekday_labels: Optional[list[str]] = None,
+        weekdays_labels_width: Optional[int] = None,
+        with_month_labels: Optional[bool] = None,
+        with_outside_dates: Optional[bool] = None,
+        with_tooltip: Optional[bool] = None,
+        with_weekday_labels: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> "RLBuilder":
+        """
+        Calendar heatmap for visualizing value intensity over dates.
+
+        Args:
+            data (dict[str, Union[int, float]]): Mapping of ISO date -> value.
+            colors (Optional[list[str]]): Color scale.
+            domain (Optional[tuple[Union[int, float], Union[int, float]]]): Min/max domain.
+            end_date (Optional[Union[str, Any]]): End date.
+            first_day_of_week (Optional[int]): First day of the week.
+            font_size (Optional[int]): Font size for labels.
+            gap (Optional[int]): Gap between cells.
+            get_rect_props (Optional[Any]): Custom rect props callback.
+            get_tooltip_label (Optional[Any]): Tooltip label callback.
+            key (Optional[str]): Explicit element key.
+            data_version (Optional[Hashable]): Changes whenever the data changes, e.g. a revision number or the
+                time the data was loaded. While it is unchanged, later runs skip hashing the data.
+            month_labels (Optional[list[str]]): Month labels.
+            months_labels_height (Optional[int]): Month labels height.
+            rect_radius (Optional[int]): Cell border radius.
+            rect_size (Optional[int]): Cell size.
+            renderer (Literal["svg", "canvas"]): Use "canvas" for multi-year ranges or many heatmaps; `get_rect_props`
+                is ignored.
+            start_date (Optional[Union[str, Any]]): Start date.
+            tooltip_props (Optional[dict[str, Any]]): Tooltip props.
+            weekday_labels (Optional[list[str]]): Weekday labels.
+            weekdays_labels_width (Optional[int]): Weekday labels width.
+            with_month_labels (Optional[bool]): Show month labels.
+            with_outside_dates (Optional[bool]): Show dates outside range.
+            with_tooltip (Optional[bool]): Show tooltip.
+            with_weekday_labels (Optional[bool]): Show weekday labels.
+            kwargs: Additional props to set.
+
+        Returns:
+            RLBuilder: A nested builder scoped to the heatmap element.
+        """
+        key = key or self._new_text_id("heatmap")
+        return self._create_builder_element(  # type: ignore[return-value]
+            name="canvasheatmap" if renderer == "canvas" else "heatmap",
+            key=key,
+            props={
+                **self._chart_data(key, data, data_version),
+                "colors": colors,
+                "domain": domain,
+                "endDate": end_date,
+                "firstDayOfWeek": first_day_of_week,
+                "fontSize": font_size,
+                "gap": gap,
+                "getRectProps": get_rect_props,
+                "getTooltipLabel": get_tooltip_label,
+                "monthLabels": month_labels,
+                "monthsLabelsHeight": months_labels_height,
+                "rectRadius": rect_radius,
+                "rectSize": rect_size,
+                "startDate": start_date,
+                "tooltipProps": tooltip_props,
+                "weekdayLabels": weekday_labels,
+                "weekdaysLabelsWidth": weekdays_labels_width,
+                "withMonthLabels": with_month_labels,
+                "withOutsideDates": with_outside_dates,
+                "withTooltip": with_tooltip,
+                "withWeekdayLabels": with_weekday_labels,
+                **kwargs,
+            },
+        )
@@ -0,0 +1,1128 @@
+import datetime
+import threading
+import weakref
+from collections.abc import Hashable
+from typing import Any, Callable, ClassVar, Literal, Optional, Union, cast
+
+from routelit import RouteLitBuilder, RouteLitElement
+
+from ..cache import LRUCache
+from ..dates import DateAvailability, parse_date, parse_dates, parse_datetime, parse_time
+from ..presets import TimePresetRange, is_time_preset_range, time_preset_props
+
+_month_availability_cache: LRUCache[tuple[Hashable, str], dict[str, Any]] = LRUCache(256)
+# Months loaded per (session, month) by loaders given without a resource, dropped with the loader, so loaders
+# created inline on each run are never reused.
+_loader_availability_cache: "weakref.WeakKeyDictionary[Callable[..., Any], LRUCache[tuple[str, str], dict[str, Any]]]" = weakref.WeakKeyDictionary()
+_month_availability_lock = threading.Lock()
+
+
+def _iso_date(value: Union[datetime.date, str]) -> str:
+    return value if isinstance(value, str) else value.isoformat()[:10]
+
+
+def _availability_props(availability: Optional[DateAvailability]) -> Optional[dict[str, Any]]:
+    if availability is None:
+        return None
+    props: dict[str, Any] = {}
+    if "weekdays" in availability:
+        props["weekdays"] = availability["weekdays"]
+    if "closed_ranges" in availability:
+        props["closedRanges"] = [[_iso_date(a), _iso_date(b)] for a, b in availability["closed_ranges"]]
+    if "closed_dates" in availability:
+        props["closedDates"] = [_iso_date(d) for d in availability["closed_dates"]]
+    if "open_dates" in availability:
+        props["openDates"] = [_iso_date(d) for d in availability["open_dates"]]
+    return props
+
+
+def _first_date(value: Any) -> Optional[datetime.date]:
+    if isinstance(value, (list, tuple)):
+        value = value[0] if value else None
+    if isinstance(value, datetime.date):
+        return value
+    if isinstance(value, str) and value:
+        return parse_date(value[:10])
+    return None
+
+
+class DatesMixin(RouteLitBuilder):
+    """
+    Date and time input methods of `RLBuilder`.
+    """
+
+    availability_cache_size: ClassVar[int]
+    _session_lock: "threading.RLock"
+
+    @classmethod
+    def clear_availability_cache(cls, resource: Optional[Hashable] = None) -> None:
+        """
+        Drop cached month availability, e.g. after a booking changed it.
+
+        Args:
+            resource (Optional[Hashable]): Only drop the months of this resource; all months if not set.
+        """
+        with _month_availability_lock:
+            if resource is None:
+                _month_availability_cache.clear()
+                _loader_availability_cache.clear()
+                return
+            for cache_key in [k for k in _month_availability_cache if k[0] == resource]:
+                _month_availability_cache.pop(cache_key)
+
+    def _month_availability(
+        self,
+        key: str,
+        loader: Optional[Callable[[int, int], DateAvailability]],
+        resource: Optional[Hashable],
+        value: Any,
+        months: Optional[int],
+    ) -> Optional[dict[str, Any]]:
+        """
+        Availability of the months shown by a date picker, keyed by "YYYY-MM".
+        The shown month comes from the picker's "monthchange" events and starts at the month of `value`.
+        Results are cached in the process per (resource, month) when `resource` is set. Otherwise they are cached
+        per (session, month) for as long as the loader object lives, so a module-level loader is called once per
+        month and session while an inline one, a new object on every run, is called on every run.
+        """
+        if loader is None:
+            return None
+        state_key = f"__availability_month_{key}"
+        has_event, shown = self._get_event_value(key, "monthchange", "month")
+        with self._session_lock:
+            if has_event and isinstance(shown, str):
+                self.session_state[state_key] = shown[:7]
+            first = self.session_state.get(state_key)
+        start = parse_date(f"{first}-01") if first else _first_date(value) or datetime.date.today()
+        result: dict[str, Any] = {}
+        for offset in range(max(months or 1, 1)):
+            year, month = divmod(start.year * 12 + start.month - 1 + offset, 12)
+            month_key = f"{year:04d}-{month + 1:02d}"
+            cache, cache_key = self._availability_cache(loader, resource, month_key)
+            with _month_availability_lock:
+                cached = None if cache is None else cache.get(cache_key)
+            if cached is None:
+                cached = _availability_props(loader(year, month + 1)) or {}
+                with _month_availability_lock:
+                    if cache is not None:
+                        cache[cache_key] = cached
+            result[month_key] = cached
+        return result
+
+    def _availability_cache(
+        self, loader: Callable[[int, int], DateAvailability], resource: Optional[Hashable], month_key: str
+    ) -> tuple[Optional[LRUCache[Any, dict[str, Any]]], tuple[Hashable, str]]:
+        with _month_availability_lock:
+            if resource is not None:
+                _month_availability_cache.maxsize = self.availability_cache_size
+                return _month_availability_cache, (resource, month_key)
+            cache_key = (self.request.get_session_id(), month_key)
+            try:
+                cache = _loader_availability_cache.get(loader)
+                if cache is None:
+                    cache = _loader_availability_cache[loader] = LRUCache(self.availability_cache_size)
+            except TypeError:  # not weakly referenceable
+                return None, cache_key
+            cache.maxsize = self.availability_cache_size
+            return cache, cache_key
+
+    def _format_datetime(self, value: Any) -> Optional[datetime.datetime]:
+        if isinstance(value, datetime.datetime):
+            return value
+        if isinstance(value, str):
+            return parse_datetime(value)
+        return None
+
+    def date_time_picker(
+        self,
+        label: str,
+        value: Optional[Union[datetime.datetime, str]] = None,
+        *,
+        availability: Optional[DateAvailability] = None,
+        availability_loader: Optional[Callable[[int, int], DateAvailability]] = None,
+        availability_resource: Optional[Hashable] = None,
+        clearable: Optional[bool] = None,
+        columns_to_scroll: Optional[int] = None,
+        description: Optional[str] = None,
+        disabled: Optional[bool] = None,
+        dropdown_type: Optional[Literal["modal", "popover"]] = None,
+        error: Optional[str] = None,
+        first_day_of_week: Optional[Literal[0, 1, 2, 3, 4, 5, 6]] = None,
+        header_controls_order: Optional[list[Literal["level", "next", "previous"]]] = None,
+        hide_outside_dates: Optional[bool] = None,
+        hide_weekdays: Optional[bool] = None,
+        highlight_today: Optional[bool] = None,
+        input_size: Optional[str] = None,
+        input_wrapper_order: Optional[list[str]] = None,
+        label_props: Optional[dict[str, Any]] = None,
+        label_separator: Optional[str] = None,
+        left_section: Optional[RouteLitElement] = None,
+        left_section_props: Optional[dict[str, Any]] = None,
+        left_section_width: Optional[str] = None,
+        level: Optional[Literal["month", "year", "decade"]] = None,
+        locale: Optional[str] = None,
+        max_date: Optional[Union[datetime.datetime, str]] = None,
+        max_level: Optional[Literal["month", "year", "decade"]] = None,
+        min_date: Optional[Union[datetime.datetime, str]] = None,
+        months_list_format: Optional[str] = None,
+        number_of_columns: Optional[int] = None,
+        next_label: Optional[str] = None,
+        next_icon: Optional[RouteLitElement] = None,
+        on_change: Optional[Callable[[datetime.datetime], None]] = None,
+        popover_props: Optional[dict[str, Any]] = None,
+        presets: Optional[list[dict[str, Any]]] = None,
+        previous_icon: Optional[RouteLitElement] = None,
+        previous_label: Optional[str] = None,
+        placeholder: Optional[str] = None,
+        radius: Optional[Union[str, int]] = None,
+        read_only: Optional[bool] = None,
+        required: Optional[bool] = None,
+        right_section: Optional[RouteLitElement] = None,
+        right_section_pointer_events: Optional[str] = None,
+        right_section_props: Optional[dict[str, Any]] = None,
+        right_section_width: Optional[str] = None,
+        size: Optional[str] = None,
+        sort_dates: Optional[bool] = None,
+        submit_button_props: Optional[dict[str, Any]] = None,
+        time_picker_props: Optional[dict[str, Any]] = None,
+        time_presets: Optional[Union[TimePresetRange, list[TimePresetRange]]] = None,
+        value_format: Optional[str] = None,
+        weekday_format: Optional[str] = None,
+        weekend_days: Optional[list[Literal[0, 1, 2, 3, 4, 5, 6]]] = None,
+        with_asterisk: Optional[bool] = None,
+        with_cell_spacing: Optional[bool] = None,
+        with_error_styles: Optional[bool] = None,
+        with_seconds: Optional[bool] = None,
+        with_week_numbers: Optional[bool] = None,
+        wrapper_props: Optional[dict[str, Any]] = None,
+        year_label_format: Optional[str] = None,
+        years_list_format: Optional[str] = None,
+        pointer: Optional[bool] = None,
+        key: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Optional[datetime.datetime]:
+        """
+        Date-time picker input with calendar and time selection.
+
+        Args:
+            label (str): Field label.
+            value (Optional[Union[datetime.datetime, str]]): Current value.
+            availability (Optional[DateAvailability]): Date availability rules, evaluated in the browser.
+            availability_loader (Optional[Callable[[int, int], DateAvailability]]): Loads the availability of a
+                (year, month) when the picker shows it. Results are cached per (resource, month) when `availability_resource` is set,
+                otherwise per (session, month) while the loader object lives, so pass a module-level function rather
+                than a lambda. Availability only applies to the day level; the year and decade levels show every
+                month and year.
+            availability_resource (Optional[Hashable]): Resource the loader answers for, e.g. a room id.
+            clearable (Optional[bool]): Show clear button.
+            columns_to_scroll (Optional[int]): Number of months to scroll.
+            description (Optional[str]): Helper text under the label.
+            disabled (Optional[bool]): Disable interaction.
+            dropdown_type (Optional[Literal["modal", "popover"]]): Dropdown type.
+            error (Optional[str]): Error message.
+            first_day_of_week (Optional[Literal[0,1,2,3,4,5,6]]): First day of week.
+            header_controls_order (Optional[list[Literal["level", "next", "previous"]]]): Header controls order.
+            hide_outside_dates (Optional[bool]): Hide outside month dates.
+            hide_weekdays (Optional[bool]): Hide weekday labels.
+            highlight_today (Optional[bool]): Highlight current date.
+            input_size (Optional[str]): Control size.
+            input_wrapper_order (Optional[list[str]]): Input wrapper parts order.
+            label_props (Optional[dict[str, Any]]): Label props.
+            label_separator (Optional[str]): Separator between date and time.
+            left_section (Optional[RouteLitElement]): Left adornment.
+            left_section_props (Optional[dict[str, Any]]): Left adornment props.
+            left_section_width (Optional[str]): Left adornment width.
+            level (Optional[Literal["month", "year", "decade"]]): Initial calendar level.
+            locale (Optional[str]): Locale code.
+            max_date (Optional[Union[datetime.datetime, str]]): Max date.
+            max_level (Optional[Literal["month", "year", "decade"]]): Max calendar level.
+            min_date (Optional[Union[datetime.datetime, str]]): Min date.
+            months_list_format (Optional[str]): Months list format.
+            number_of_columns (Optional[int]): Number of months displayed.
+            next_label (Optional[str]): Next button label.
+            next_icon (Optional[RouteLitElement]): Next button icon.
+            on_change (Optional[Callable[[datetime.datetime], None]]): Change handler.
+            popover_props (Optional[dict[str, Any]]): Popover props.
+            presets (Optional[list[dict[str, Any]]]): Presets configuration.
+            previous_icon (Optional[RouteLitElement]): Previous button icon.
+            previous_label (Optional[str]): Previous button label.
+            placeholder (Optional[str]): Input placeholder.
+            radius (Optional[Union[str, int]]): Corner radius.
+            read_only (Optional[bool]): Read-only state.
+            required (Optional[bool]): Mark as required.
+            right_section (Optional[RouteLitElement]): Right adornment.
+            right_section_pointer_events (Optional[str]): Pointer events for right section.
+            right_section_props (Optional[dict[str, Any]]): Right adornment props.
+            right_section_width (Optional[str]): Right adornment width.
+            size (Optional[str]): Control size.
+            sort_dates (Optional[bool]): Sort selected dates.
+            submit_button_props (Optional[dict[str, Any]]): Submit button props.
+            time_picker_props (Optional[dict[str, Any]]): Time picker props.
+            time_presets (Optional[Union[TimePresetRange, list[TimePresetRange]]]): Generated time picker presets,
+                expanded in the browser.
+            value_format (Optional[str]): Output value format.
+            weekday_format (Optional[str]): Weekday label format.
+            weekend_days (Optional[list[Literal[0,1,2,3,4,5,6]]]): Weekend days indices.
+            with_asterisk (Optional[bool]): Show required asterisk.
+            with_cell_spacing (Optional[bool]): Add spacing between cells.
+            with_error_styles (Optional[bool]): Apply error styles.
+            with_seconds (Optional[bool]): Include seconds selector.
+            with_week_numbers (Optional[bool]): Show week numbers.
+            wrapper_props (Optional[dict[str, Any]]): Wrapper props.
+            year_label_format (Optional[str]): Year label format.
+            years_list_format (Optional[str]): Years list format.
+            pointer (Optional[bool]): Use pointer cursor.
+            key (Optional[str]): Explicit element key.
+            kwargs: Additional props to set.
+
+        Returns:
+            Optional[datetime.datetime]: Current value.
+        """
+        key = key or self._new_widget_id("datetimepicker", label)
+        return cast(
+            Optional[datetime.datetime],
+            self._x_input(
+                "datetimepicker",
+                key,
+                rlAvailability=_availability_props(availability),
+                rlMonthAvailability=self._month_availability(
+                    key,
+                    availability_loader,
+                    availability_resource,
+                    self.session_state.get(key, value),
+                    number_of_columns,
+                ),
+                clearable=clearable,
+                columnsToScroll=columns_to_scroll,
+                description=description,
+                disabled=disabled,
+                dropdownType=dropdown_type,
+                error=error,
+                firstDayOfWeek=first_day_of_week,
+                headerControlsOrder=header_controls_order,
+                hideOutsideDates=hide_outside_dates,
+                hideWeekdays=hide_weekdays,
+                highlightToday=highlight_today,
+                inputSize=input_size,
+                inputWrapperOrder=input_wrapper_order,
+                label=label,
+                labelProps=label_props,
+                labelSeparator=label_separator,
+                value=value,
+                leftSection=left_section,
+                leftSectionProps=left_section_props,
+                leftSectionWidth=left_section_width,
+                level=level,
+                locale=locale,
+                maxDate=max_date,
+                maxLevel=max_level,
+                minDate=min_date,
+                monthsListFormat=months_list_format,
+                nextIcon=next_icon,
+                nextLabel=next_label,
+                numberOfColumns=number_of_columns,
+                on_change=on_change,
+                popoverProps=popover_props,
+                presets=presets,
+                previousIcon=previous_icon,
+                previousLabel=previous_label,
+                placeholder=placeholder,
+                radius=radius,
+                readOnly=read_only,
+                required=required,
+                rightSection=right_section,
+                rightSectionPointerEvents=right_section_pointer_events,
+                rightSectionProps=right_section_props,
+                rightSectionWidth=right_section_width,
+                rl_format_func=self._format_datetime,
+                size=size,
+                sortDates=sort_dates,
+                submitButtonProps=submit_button_props,
+                timePickerProps=time_picker_props,
+                rlTimePresetRanges=time_preset_props(time_presets) if time_presets else None,
+                valueFormat=value_format,
+                weekdayFormat=weekday_format,
+                weekendDays=weekend_days,
+                withAsterisk=with_asterisk,
+                withCellSpacing=with_cell_spacing,
+                withErrorStyles=with_error_styles,
+                withSeconds=with_seconds,
+                withWeekNumbers=with_week_numbers,
+                wrapperProps=wrapper_props,
+                yearLabelFormat=year_label_format,
+                yearsListFormat=years_list_format,
+                pointer=pointer,
+                **kwargs,
+            ),
+        )
+
+    def _format_date_picker(
+        self, value: Any
+    ) -> Optional[Union[datetime.date, list[datetime.date], tuple[datetime.date, datetime.date]]]:
+        if isinstance(value, datetime.date):
+            return value
+        if isinstance(value, str):
+            return parse_date(value)
+        if isinstance(value, list):
+            return parse_dates(value)
+        return None
+
+    def date_picker(
+        self,
+        label: str,
+        value: Optional[
+            Union[
+                datetime.date,
+                str,
+                list[str],
+                list[datetime.date],
+                tuple[str, str],
+                tuple[datetime.date, datetime.date],
+            ]
+        ] = None,
+        *,
+        allow_deselect: Optional[bool] = None,
+        allow_single_date_in_range: Optional[bool] = None,
+        aria_labels: Optional[dict] = None,
+        availability: Optional[DateAvailability] = None,
+        availability_loader: Optional[Callable[[int, int], DateAvailability]] = None,
+        availability_resource: Optional[Hashable] = None,
+        columns_to_scroll: Optional[int] = None,
+        decade_label_format: Optional[str] = None,
+        default_level: Optional[Literal["month", "year", "decade"]] = None,
+        description: Optional[str] = None,
+        enable_keyboard_navigation: Optional[bool] = None,
+        first_day_of_week: Optional[Literal[0, 1, 2, 3, 4, 5, 6]] = None,
+        header_controls_order: Optional[list[Literal["level", "next", "previous"]]] = None,
+        hide_outside_dates: Optional[bool] = None,
+        hide_weekdays: Optional[bool] = None,
+        highlight_today: Optional[bool] = None,
+        key: Optional[str] = None,
+        level: Optional[str] = None,
+        locale: Optional[str] = None,
+        max_date: Optional[Union[str, datetime.date]] = None,
+        max_level: Optional[str] = None,
+        min_date: Optional[Union[str, datetime.date]] = None,
+        month_label_format: Optional[str] = None,
+        months_list_format: Optional[str] = None,
+        next_icon: Optional[RouteLitElement] = None,
+        next_label: Optional[str] = None,
+        number_of_columns: Optional[int] = None,
+        on_change: Optional[
+            Callable[
+                [
+                    Union[
+                        datetime.date,
+                        list[datetime.date],
+                        tuple[datetime.date, datetime.date],
+                    ]
+                ],
+                None,
+            ]
+        ] = None,
+        presets: Optional[list] = None,
+        previous_icon: Optional[RouteLitElement] = None,
+        previous_label: Optional[str] = None,
+        size: Optional[str] = None,
+        type: Optional[Literal["default", "range", "multiple"]] = None,  # noqa: A002
+        weekday_format: Optional[str] = None,
+        weekend_days: Optional[list[Literal[0, 1, 2, 3, 4, 5, 6]]] = None,
+        with_cell_spacing: Optional[bool] = None,
+        with_week_numbers: Optional[bool] = None,
+        year_label_format: Optional[str] = None,
+        years_list_format: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Optional[Union[datetime.date, list[datetime.date], tuple[datetime.date, datetime.date]]]:
+        """
+        Calendar date picker supporting single, range, and multiple modes.
+
+        Args:
+            label (str): Field label.
+            value (Optional[...]): Current value in the selected mode.
+            allow_deselect (Optional[bool]): Allow clearing selection.
+            allow_single_date_in_range (Optional[bool]): Allow single date in range mode.
+            aria_labels (Optional[dict]): ARIA labels.
+            availability (Optional[DateAvailability]): Date availability rules, evaluated in the browser.
+            availability_loader (Optional[Callable[[int, int], DateAvailability]]): Loads the availability of a
+                (year, month) when the picker shows it. Results are cached per (resource, month) when `availability_resource` is set,
+                otherwise per (session, month) while the loader object lives, so pass a module-level function rather
+                than a lambda. Availability only applies to the day level; the year and decade levels show every
+                month and year.
+            availability_resource (Optional[Hashable]): Resource the loader answers for, e.g. a room id.
+            columns_to_scroll (Optional[int]): Months to scroll.
+            decade_label_format (Optional[str]): Decade label format.
+            default_level (Optional[Literal["month", "year", "decade"]]): Initial calendar level.
+            description (Optional[str]): Helper text under the label.
+            enable_keyboard_navigation (Optional[bool]): Enable keyboard navigation.
+            first_day_of_week (Optional[Literal[0,1,2,3,4,5,6]]): First day of week.
+            header_controls_order (Optional[list[...]]): Header controls order.
+            hide_outside_dates (Optional[bool]): Hide outside month dates.
+            hide_weekdays (Optional[bool]): Hide weekday labels.
+            highlight_today (Optional[bool]): Highlight current date.
+            key (Optional[str]): Explicit element key.
+            level (Optional[str]): Current level.
+            locale (Optional[str]): Locale code.
+            max_date (Optional[Union[str, datetime.date]]): Max date.
+            max_level (Optional[str]): Max level.
+            min_date (Optional[Union[str, datetime.date]]): Min date.
+            month_label_format (Optional[str]): Month label format.
+            months_list_format (Optional[str]): Months list format.
+            next_icon (Optional[RouteLitElement]): Next button icon.
+            next_label (Optional[str]): Next button label.
+            number_of_columns (Optional[int]): Months displayed.
+            on_change (Optional[Callable[[...], None]]): Change handler.
+            presets (Optional[list]): Preset ranges.
+            previous_icon (Optional[RouteLitElement]): Previous button icon.
+            previous_label (Optional[str]): Previous button label.
+            size (Optional[str]): Control size.
+            type (Optional[Literal["default", "range", "multiple"]]): Picker mode.
+            weekday_format (Optional[str]): Weekday label format.
+            weekend_days (Optional[list[...]]): Weekend days indices.
+            with_cell_spacing (Optional[bool]): Add spacing between cells.
+            with_week_numbers (Optional[bool]): Show week numbers.
+            year_label_format (Optional[str]): Year label format.
+            years_list_format (Optional[str]): Years list format.
+            kwargs: Additional props to set.
+
+        Returns:
+            Optional[Union[datetime.date, list[datetime.date], tuple[datetime.date, datetime.date]]]: Current value.
+        """
+        key = key or self._new_widget_id("datepicker", label)
+        return cast(
+            Optional[
+                Union[
+                    datetime.date,
+                    list[datetime.date],
+                    tuple[datetime.date, datetime.date],
+                ]
+            ],
+            self._x_input(
+                "datepicker",
+                key,
+                label=label,
+                description=description,
+                value=value,
+                allowDeselect=allow_deselect,
+                allowSingleDateInRange=allow_single_date_in_range,
+                ariaLabels=aria_labels,
+                rlAvailability=_availability_props(availability),
+                rlMonthAvailability=self._month_availability(
+                    key,
+                    availability_loader,
+                    availability_resource,
+                    self.session_state.get(key, value),
+                    number_of_columns,
+                ),
+                columnsToScroll=columns_to_scroll,
+                decadeLabelFormat=decade_label_format,
+                defaultLevel=default_level,
+                enableKeyboardNavigation=enable_keyboard_navigation,
+                firstDayOfWeek=first_day_of_week,
+                headerControlsOrder=header_controls_order,
+                hideOutsideDates=hide_outside_dates,
+                hideWeekdays=hide_weekdays,
+                highlightToday=highlight_today,
+                level=level,
+                locale=locale,
+                maxDate=max_date,
+                maxLevel=max_level,
+                minDate=min_date,
+                monthLabelFormat=month_label_format,
+                monthsListFormat=months_list_format,
+                nextIcon=next_icon,
+                nextLabel=next_label,
+                numberOfColumns=number_of_columns,
+                onChange=on_change,
+                presets=presets,
+                previousIcon=previous_icon,
+                previousLabel=previous_label,
+                size=size,
+                type=type,
+                weekdayFormat=weekday_format,
+                weekendDays=weekend_days,
+                withCellSpacing=with_cell_spacing,
+                withWeekNumbers=with_week_numbers,
+                yearLabelFormat=year_label_format,
+                yearsListFormat=years_list_format,
+                rl_format_func=self._format_date_picker,
+                **kwargs,
+            ),
+        )
+
+    def date_picker_input(
+        self,
+        label: str,
+        value: Optional[
+            Union[
+                datetime.date,
+                str,
+                list[str],
+                list[datetime.date],
+                tuple[str, str],
+                tuple[datetime.date, datetime.date],
+            ]
+        ] = None,
+        *,
+        key: Optional[str] = None,
+        description: Optional[str] = None,
+        on_change: Optional[Callable[[Any], None]] = None,
+        allow_deselect: Optional[bool] = None,
+        allow_single_date_in_range: Optional[bool] = None,
+        aria_labels: Optional[dict] = None,
+        availability: Optional[DateAvailability] = None,
+        availability_loader: Optional[Callable[[int, int], DateAvailability]] = None,
+        availability_resource: Optional[Hashable] = None,
+        clear_button_props: Optional[dict] = None,
+        clearable: Optional[bool] = None,
+        close_on_change: Optional[bool] = None,
+        columns_to_scroll: Optional[int] = None,
+        decade_label_format: Optional[str] = None,
+        default_level: Optional[Literal["month", "year", "decade"]] = None,
+        description_props: Optional[dict] = None,
+        disabled: Optional[bool] = None,
+        dropdown_type: Optional[Literal["modal", "popover"]] = None,
+        enable_keyboard_navigation: Optional[bool] = None,
+        error: Optional[str] = None,
+        error_props: Optional[dict] = None,
+        first_day_of_week: Optional[Literal[0, 1, 2, 3, 4, 5, 6]] = None,
+        header_controls_order: Optional[list[Literal["level", "next", "previous"]]] = None,
+        hide_outside_dates: Optional[bool] = None,
+        hide_weekdays: Optional[bool] = None,
+        highlight_today: Optional[bool] = None,
+        input_size: Optional[str] = None,
+        input_wrapper_order: Optional[list[Literal["input", "label", "description", "error"]]] = None,
+        label_props: Optional[dict] = None,
+        label_separator: Optional[str] = None,
+        left_section: Optional[RouteLitElement] = None,
+        left_section_pointer_events: Optional[str] = None,
+        left_section_props: Optional[dict] = None,
+        left_section_width: Optional[str] = None,
+        level: Optional[Literal["month", "year", "decade"]] = None,
+        locale: Optional[str] = None,
+        max_date: Optional[Union[str, datetime.date]] = None,
+        max_level: Optional[Literal["month", "year", "decade"]] = None,
+        min_date: Optional[Union[str, datetime.date]] = None,
+        modal_props: Optional[dict] = None,
+        month_label_format: Optional[str] = None,
+        months_list_format: Optional[str] = None,
+        next_icon: Optional[RouteLitElement] = None,
+        next_label: Optional[str] = None,
+        number_of_columns: Optional[int] = None,
+        placeholder: Optional[str] = None,
+        pointer: Optional[bool] = None,
+        popover_props: Optional[dict] = None,
+        presets: Optional[list] = None,
+        previous_icon: Optional[RouteLitElement] = None,
+        previous_label: Optional[str] = None,
+        radius: Optional[Union[str, int]] = None,
+        read_only: Optional[bool] = None,
+        required: Optional[bool] = None,
+        right_section: Optional[RouteLitElement] = None,
+        right_section_pointer_events: Optional[str] = None,
+        right_section_props: Optional[dict] = None,
+        right_section_width: Optional[str] = None,
+        size: Optional[str] = None,
+        sort_dates: Optional[bool] = None,
+        type: Optional[str] = None,  # noqa: A002
+        value_format: Optional[str] = None,
+        weekday_format: Optional[str] = None,
+        weekend_days: Optional[list] = None,
+        with_asterisk: Optional[bool] = None,
+        with_cell_spacing: Optional[bool] = None,
+        with_error_styles: Optional[bool] = None,
+        with_week_numbers: Optional[bool] = None,
+        wrapper_props: Optional[dict] = None,
+        year_label_format: Optional[str] = None,
+        years_list_format: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Optional[Union[datetime.date, list[datetime.date], tuple[datetime.date, datetime.date]]]:
+        """
+        Text input with integrated date picker dropdown.
+
+        Args:
+            label (str): Field label.
+            value (Optional[...]): Current value in the selected mode.
+            key (Optional[str]): Explicit element key.
+            description (Optional[str]): Helper text.
+            on_change (Optional[Callable[[Any], None]]): Change handler.
+            allow_deselect (Optional[bool]): Allow clearing selection.
+            allow_single_date_in_range (Optional[bool]): Allow single date in range mode.
+            aria_labels (Optional[dict]): ARIA labels.
+            availability (Optional[DateAvailability]): Date availability rules, evaluated in the browser.
+            availability_loader (Optional[Callable[[int, int], DateAvailability]]): Loads the availability of a
+                (year, month) when the picker shows it. Results are cached per (resource, month) when `availability_resource` is set,
+                otherwise per (session, month) while the loader object lives, so pass a module-level function rather
+                than a lambda. Availability only applies to the day level; the year and decade levels show every
+                month and year.
+            availability_resource (Optional[Hashable]): Resource the loader answers for, e.g. a room id.
+            clear_button_props (Optional[dict]): Clear button props.
+            clearable (Optional[bool]): Enable clear button.
+            close_on_change (Optional[bool]): Close dropdown on change.
+            columns_to_scroll (Optional[int]): Months to scroll.
+            decade_label_format (Optional[str]): Decade label format.
+            default_level (Optional[Literal["month", "year", "decade"]]): Initial calendar level.
+            description_props (Optional[dict]): Description props.
+            disabled (Optional[bool]): Disable interaction.
+            dropdown_type (Optional[Literal["modal", "popover"]]): Dropdown type.
+            enable_keyboard_navigation (Optional[bool]): Enable keyboard navigation.
+            error (Optional[str]): Error message.
+            error_props (Optional[dict]): Error props.
+            first_day_of_week (Optional[Literal[0,1,2,3,4,5,6]]): First day of week.
+            header_controls_order (Optional[list[...]]): Header controls order.
+            hide_outside_dates (Optional[bool]): Hide outside month dates.
+            hide_weekdays (Optional[bool]): Hide weekday labels.
+            highlight_today (Optional[bool]): Highlight current date.
+            input_size (Optional[str]): Control size.
+            input_wrapper_order (Optional[list[Literal["input","label","description","error"]]]): Wrapper parts order.
+            label_props (Optional[dict]): Label props.
+            label_separator (Optional[str]): Separator for range values.
+            left_section (Optional[RouteLitElement]): Left adornment.
+            left_section_pointer_events (Optional[str]): Pointer events for left section.
+            left_section_props (Optional[dict]): Left adornment props.
+            left_section_width (Optional[str]): Left adornment width.
+            level (Optional[Literal["month", "year", "decade"]]): Initial calendar level.
+            locale (Optional[str]): Locale code.
+            max_date (Optional[Union[str, datetime.date]]): Max date.
+            max_level (Optional[Literal["month", "year", "decade"]]): Max calendar level.
+            min_date (Optional[Union[str, datetime.date]]): Min date.
+            modal_props (Optional[dict]): Modal props.
+            month_label_format (Optional[str]): Month label format.
+            months_list_format (Optional[str]): Months list format.
+            next_icon (Optional[RouteLitElement]): Next button icon.
+            next_label (Optional[str]): Next button label.
+            number_of_columns (Optional[int]): Months displayed.
+            placeholder (Optional[str]): Input placeholder.
+            pointer (Optional[bool]): Use pointer cursor.
+            popover_props (Optional[dict]): Popover props.
+            presets (Optional[list]): Preset ranges.
+            previous_icon (Optional[RouteLitElement]): Previous button icon.
+            previous_label (Optional[str]): Previous button label.
+            radius (Optional[Union[str, int]]): Corner radius.
+            read_only (Optional[bool]): Read-only state.
+            required (Optional[bool]): Mark as required.
+            right_section (Optional[RouteLitElement]): Right adornment.
+            right_section_pointer_events (Optional[str]): Pointer events for right section.
+            right_section_props (Optional[dict]): Right adornment props.
+            right_section_width (Optional[str]): Right adornment width.
+            size (Optional[str]): Control size.
+            sort_dates (Optional[bool]): Sort selected dates.
+            type (Optional[str]): Picker mode.
+            value_format (Optional[str]): Output value format.
+            weekday_format (Optional[str]): Weekday label format.
+            weekend_days (Optional[list]): Weekend days indices.
+            with_asterisk (Optional[bool]): Show required asterisk.
+            with_cell_spacing (Optional[bool]): Add spacing between cells.
+            with_error_styles (Optional[bool]): Apply error styles.
+            with_week_numbers (Optional[bool]): Show week numbers.
+            wrapper_props (Optional[dict]): Wrapper props.
+            year_label_format (Optional[str]): Year label format.
+            years_list_format (Optional[str]): Years list format.
+            kwargs: Additional props to set.
+
+        Returns:
+            Optional[Union[datetime.date, list[datetime.date], tuple[datetime.date, datetime.date]]]: Current value.
+        """
+        key = key or self._new_widget_id("datepickerinput", label)
+        return cast(
+            Optional[
+                Union[
+                    datetime.date,
+                    list[datetime.date],
+                    tuple[datetime.date, datetime.date],
+                ]
+            ],
+            self._x_input(
+                "datepickerinput",
+                key,
+                label=label,
+                description=description,
+                value=value,
+                allowDeselect=allow_deselect,
+                allowSingleDateInRange=allow_single_date_in_range,
+                ariaLabels=aria_labels,
+                rlAvailability=_availability_props(availability),
+                rlMonthAvailability=self._month_availability(
+                    key,
+                    availability_loader,
+                    availability_resource,
+                    self.session_state.get(key, value),
+                    number_of_columns,
+                ),
+                clearButtonProps=clear_button_props,
+                clearable=clearable,
+                closeOnChange=close_on_change,
+                columnsToScroll=columns_to_scroll,
+                decadeLabelFormat=decade_label_format,
+                defaultLevel=default_level,
+                descriptionProps=description_props,
+                disabled=disabled,
+                dropdownType=dropdown_type,
+                enableKeyboardNavigation=enable_keyboard_navigation,
+                error=error,
+                errorProps=error_props,
+                firstDayOfWeek=first_day_of_week,
+                headerControlsOrder=header_controls_order,
+                hideOutsideDates=hide_outside_dates,
+                hideWeekdays=hide_weekdays,
+                highlightToday=highlight_today,
+                inputSize=input_size,
+                inputWrapperOrder=input_wrapper_order,
+                labelProps=label_props,
+                labelSeparator=label_separator,
+                leftSection=left_section,
+                leftSectionPointerEvents=left_section_pointer_events,
+                leftSectionProps=left_section_props,
+                leftSectionWidth=left_section_width,
+                level=level,
+                locale=locale,
+                maxDate=max_date,
+                maxLevel=max_level,
+                minDate=min_date,
+                modalProps=modal_props,
+                monthLabelFormat=month_label_format,
+                monthsListFormat=months_list_format,
+                nextIcon=next_icon,
+                nextLabel=next_label,
+                numberOfColumns=number_of_columns,
+                on_change=on_change,
+                placeholder=placeholder,
+                pointer=pointer,
+                popoverProps=popover_props,
+                presets=presets,
+                previousIcon=previous_icon,
+                previousLabel=previous_label,
+                radius=radius,
+                readOnly=read_only,
+                required=required,
+                rightSection=right_section,
+                rightSectionPointerEvents=right_section_pointer_events,
+                rightSectionProps=right_section_props,
+                rightSectionWidth=right_section_width,
+                size=size,
+                sortDates=sort_dates,
+                type=type,
+                valueFormat=value_format,
+                weekdayFormat=weekday_format,
+                weekendDays=weekend_days,
+                withAsterisk=with_asterisk,
+                withCellSpacing=with_cell_spacing,
+                withErrorStyles=with_error_styles,
+                withWeekNumbers=with_week_numbers,
+                wrapperProps=wrapper_props,
+                yearLabelFormat=year_label_format,
+                yearsListFormat=years_list_format,
+                rl_format_func=self._format_date_picker,
+                **kwargs,
+            ),
+        )
+
+    def _format_time(self, value: Optional[Union[datetime.time, str]]) -> Optional[datetime.time]:
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return parse_time(value)
+        return value
+
+    def time_input(
+        self,
+        label: str,
+        value: Optional[Union[datetime.time, str]] = None,
+        *,
+        key: Optional[str] = None,
+        on_change: Optional[Callable[[Any], None]] = None,
+        description: Optional[Any] = None,
+        description_props: Optional[dict[str, Any]] = None,
+        disabled: Optional[bool] = None,
+        error: Optional[Any] = None,
+        error_props: Optional[dict[str, Any]] = None,
+        input_size: Optional[str] = None,
+        input_wrapper_order: Optional[list[str]] = None,
+        label_props: Optional[dict[str, Any]] = None,
+        left_section: Optional[Any] = None,
+        left_section_pointer_events: Optional[str] = None,
+        left_section_props: Optional[dict[str, Any]] = None,
+        left_section_width: Optional[Union[str, int]] = None,
+        max_time: Optional[str] = None,
+        min_time: Optional[str] = None,
+        pointer: Optional[bool] = None,
+        radius: Optional[Union[str, int]] = None,
+        required: Optional[bool] = None,
+        right_section: Optional[Any] = None,
+        right_section_pointer_events: Optional[str] = None,
+        right_section_props: Optional[dict[str, Any]] = None,
+        right_section_width: Optional[Union[str, int]] = None,
+        size: Optional[str] = None,
+        with_asterisk: Optional[bool] = None,
+        with_error_styles: Optional[bool] = None,
+        with_seconds: Optional[bool] = None,
+        wrapper_props: Optional[dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Optional[datetime.time]:
+        """
+        Time input with support for parsing from string.
+
+        Args:
+            label (str): Field label.
+            value (Optional[Union[datetime.time, str]]): Current value.
+            key (Optional[str]): Explicit element key.
+            on_change (Optional[Callable[[Any], None]]): Change handler.
+            description (Optional[Any]): Contents of Input.Description component.
+            description_props (Optional[dict[str, Any]]): Props passed to Input.Description component.
+            disabled (Optional[bool]): Sets disabled attribute on input element.
+            error (Optional[Any]): Contents of Input.Error component.
+            error_props (Optional[dict[str, Any]]): Props passed to Input.Error component.
+            input_size (Optional[str]): Size attribute for input element.
+            input_wrapper_order (Optional[list[str]]): Controls order of elements.
+            label_props (Optional[dict[str, Any]]): Props passed to Input.Label component.
+            left_section (Optional[Any]): Content displayed on left side of input.
+            left_section_pointer_events (Optional[str]): Pointer events style for left section.
+            left_section_props (Optional[dict[str, Any]]): Props for left section element.
+            left_section_width (Optional[Union[str, int]]): Width of left section.
+            max_time (Optional[str]): Maximum possible time value.
+            min_time (Optional[str]): Minimum possible time value.
+            pointer (Optional[bool]): Whether input should have pointer cursor.
+            radius (Optional[Union[str, int]]): Border radius value.
+            required (Optional[bool]): Whether input is required.
+            right_section (Optional[Any]): Content displayed on right side of input.
+            right_section_pointer_events (Optional[str]): Pointer events style for right section.
+            right_section_props (Optional[dict[str, Any]]): Props for right section element.
+            right_section_width (Optional[Union[str, int]]): Width of right section.
+            size (Optional[str]): Controls input height and padding.
+            with_asterisk (Optional[bool]): Whether to show required asterisk.
+            with_error_styles (Optional[bool]): Whether to show error styling.
+            with_seconds (Optional[bool]): Whether to show seconds input.
+            wrapper_props (Optional[dict[str, Any]]): Props for root element.
+            kwargs: Additional props to set.
+
+        Returns:
+            Optional[datetime.time]: Current value.
+        """
+        return cast(
+            Optional[datetime.time],
+            self._x_input(
+                "timeinput",
+                key=key or self._new_widget_id("timeinput", label),
+                label=label,
+                value=value,
+                description=description,
+                descriptionProps=description_props,
+                disabled=disabled,
+                error=error,
+                errorProps=error_props,
+                inputSize=input_size,
+                inputWrapperOrder=input_wrapper_order,
+                labelProps=label_props,
+                leftSection=left_section,
+                leftSectionPointerEvents=left_section_pointer_events,
+                leftSectionProps=left_section_props,
+                leftSectionWidth=left_section_width,
+                maxTime=max_time,
+                minTime=min_time,
+                pointer=pointer,
+                radius=radius,
+                required=required,
+                rightSection=right_section,
+                rightSectionPointerEvents=right_section_pointer_events,
+                rightSectionProps=right_section_props,
+                rightSectionWidth=right_section_width,
+                size=size,
+                withAsterisk=with_asterisk,
+                withErrorStyles=with_error_styles,
+                withSeconds=with_seconds,
+                wrapperProps=wrapper_props,
+                rl_format_func=self._format_time,
+                on_change=on_change,
+                **kwargs,
+            ),
+        )
+
+    def time_picker(
+        self,
+        label: str,
+        value: Optional[Union[datetime.time, str]] = None,
+        *,
+        key: Optional[str] = None,
+        on_change: Optional[Callable[[Any], None]] = None,
+        am_pm_input_label: Optional[str] = None,
+        am_pm_labels: Optional[dict[str, str]] = None,
+        am_pm_select_props: Optional[dict[str, Any]] = None,
+        clear_button_props: Optional[dict[str, Any]] = None,
+        clearable: Optional[bool] = None,
+        description: Optional[Any] = None,
+        description_props: Optional[dict[str, Any]] = None,
+        disabled: Optional[bool] = None,
+        error: Optional[Any] = None,
+        error_props: Optional[dict[str, Any]] = None,
+        form: Optional[str] = None,
+        format: Optional[str] = None,  # noqa: A002
+        hidden_input_props: Optional[dict[str, Any]] = None,
+        hours_input_label: Optional[str] = None,
+        hours_input_props: Optional[dict[str, Any]] = None,
+        hours_step: Optional[int] = None,
+        input_size: Optional[str] = None,
+        input_wrapper_order: Optional[list[str]] = None,
+        label_props: Optional[dict[str, Any]] = None,
+        left_section: Optional[Any] = None,
+        left_section_pointer_events: Optional[str] = None,
+        left_section_props: Optional[dict[str, Any]] = None,
+        left_section_width: Optional[Union[str, int]] = None,
+        max: Optional[str] = None,  # noqa: A002
+        max_dropdown_content_height: Optional[int] = None,
+        min: Optional[str] = None,  # noqa: A002
+        minutes_input_label: Optional[str] = None,
+        minutes_input_props: Optional[dict[str, Any]] = None,
+        minutes_step: Optional[int] = None,
+        name: Optional[str] = None,
+        pointer: Optional[bool] = None,
+        popover_props: Optional[dict[str, Any]] = None,
+        presets: Optional[Union[list[str], list[dict[str, Any]], TimePresetRange, list[TimePresetRange]]] = None,
+        radius: Optional[Union[str, int]] = None,
+        read_only: Optional[bool] = None,
+        required: Optional[bool] = None,
+        right_section: Optional[Any] = None,
+        right_section_pointer_events: Optional[str] = None,
+        right_section_props: Optional[dict[str, Any]] = None,
+        right_section_width: Optional[Union[str, int]] = None,
+        scroll_area_props: Optional[dict[str, Any]] = None,
+        seconds_input_label: Optional[str] = None,
+        seconds_input_props: Optional[dict[str, Any]] = None,
+        seconds_step: Optional[int] = None,
+        size: Optional[str] = None,
+        with_asterisk: Optional[bool] = None,
+        with_dropdown: Optional[bool] = None,
+        with_error_styles: Optional[bool] = None,
+        with_seconds: Optional[bool] = None,
+        wrapper_props: Optional[dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Optional[datetime.time]:
+        """
+        Time picker with support for parsing from string.
+
+        Args:
+            label (str): Label text.
+            value (Optional[Union[datetime.time, str]]): Current value.
+            key (Optional[str]): Unique key for the widget.
+            on_change (Optional[Callable[[Any], None]]): Called when value changes.
+            am_pm_input_label (Optional[str]): aria-label of am/pm input.
+            am_pm_labels (Optional[dict[str, str]]): Labels used for am/pm values.
+            am_pm_select_props (Optional[dict[str, Any]]): Props for am/pm select.
+            clear_button_props (Optional[dict[str, Any]]): Props for clear button.
+            clearable (Optional[bool]): Whether clear button should be displayed.
+            description (Optional[Any]): Description content.
+            description_props (Optional[dict[str, Any]]): Props for description.
+            disabled (Optional[bool]): Whether component is disabled.
+            error (Optional[Any]): Error content.
+            error_props (Optional[dict[str, Any]]): Props for error.
+            form (Optional[str]): Form prop for hidden input.
+            format (Optional[str]): Time format ('12h' or '24h').
+            hidden_input_props (Optional[dict[str, Any]]): Props for hidden input.
+            hours_input_label (Optional[str]): aria-label of hours input.
+            hours_input_props (Optional[dict[str, Any]]): Props for hours input.
+            hours_step (Optional[int]): Hours increment/decrement step.
+            input_size (Optional[str]): Size attribute for input element.
+            input_wrapper_order (Optional[list[str]]): Order of elements.
+            label_props (Optional[dict[str, Any]]): Props for label.
+            left_section (Optional[Any]): Left section content.
+            left_section_pointer_events (Optional[str]): Left section pointer events.
+            left_section_props (Optional[dict[str, Any]]): Props for left section.
+            left_section_width (Optional[Union[str, int]]): Left section width.
+            max (Optional[str]): Max time value (hh:mm:ss).
+            max_dropdown_content_height (Optional[int]): Max dropdown height in px.
+            min (Optional[str]): Min time value (hh:mm:ss).
+            minutes_input_label (Optional[str]): aria-label of minutes input.
+            minutes_input_props (Optional[dict[str, Any]]): Props for minutes input.
+            minutes_step (Optional[int]): Minutes increment/decrement step.
+            name (Optional[str]): Name prop for hidden input.
+            pointer (Optional[bool]): Whether to show pointer cursor.
+            popover_props (Optional[dict[str, Any]]): Props for popover.
+            presets (Optional[Union[list[str], list[dict[str, Any]], TimePresetRange, list[TimePresetRange]]]): Time presets
+                for dropdown, or generators (`{"start", "end", "step", "exclude", "label"}`) expanded in the browser.
+            radius (Optional[Union[str, int]]): Border radius.
+            read_only (Optional[bool]): Whether value is read-only.
+            required (Optional[bool]): Whether field is required.
+            right_section (Optional[Any]): Right section content.
+            right_section_pointer_events (Optional[str]): Right section pointer events.
+            right_section_props (Optional[dict[str, Any]]): Props for right section.
+            right_section_width (Optional[Union[str, int]]): Right section width.
+            scroll_area_props (Optional[dict[str, Any]]): Props for scroll areas.
+            seconds_input_label (Optional[str]): aria-label of seconds input.
+            seconds_input_props (Optional[dict[str, Any]]): Props for seconds input.
+            seconds_step (Optional[int]): Seconds increment/decrement step.
+            size (Optional[str]): Controls input height and padding.
+            value (Optional[Union[datetime.time, str]]): Current value.
+            with_asterisk (Optional[bool]): Whether to show required asterisk.
+            with_dropdown (Optional[bool]): Whether to show dropdown.
+            with_error_styles (Optional[bool]): Whether to show error styling.
+            with_seconds (Optional[bool]): Whether to show seconds input.
+            wrapper_props (Optional[dict[str, Any]]): Props for root element.
+            kwargs: Additional props to set.
+
+        Returns:
+            Optional[datetime.time]: Current value.
+        """
+        preset_ranges = (
+            time_preset_props(cast(list[TimePresetRange], presets)) if is_time_preset_range(presets) else None
+        )
+        return cast(
+            Optional[datetime.time],
+            self._x_input(
+                "timepicker",
+                key=key or self._new_widget_id("timepicker", label),
+                label=label,
+                value=value,
+                amPmInputLabel=am_pm_input_label,
+                amPmLabels=am_pm_labels,
+                amPmSelectProps=am_pm_select_props,
+                clearButtonProps=clear_button_props,
+                clearable=clearable,
+                description=description,
+                descriptionProps=description_props,
+                disabled=disabled,
+                error=error,
+                errorProps=error_props,
+                form=form,
+                format=format,
+                hiddenInputProps=hidden_input_props,
+                hoursInputLabel=hours_input_label,
+                hoursInputProps=hours_input_props,
+                hoursStep=hours_step,
+                inputSize=input_size,
+                inputWrapperOrder=input_wrapper_order,
+                labelProps=label_props,
+                leftSection=left_section,
+                leftSectionPointerEvents=left_section_pointer_events,
+                leftSectionProps=left_section_props,
+                leftSectionWidth=left_section_width,
+                max=max,
+                maxDropdownContentHeight=max_dropdown_content_height,
+                min=min,
+                minutesInputLabel=minutes_input_label,
+                minutesInputProps=minutes_input_props,
+                minutesStep=minutes_step,
+                name=name,
+                pointer=pointer,
+                popoverProps=popover_props,
+                presets=None if preset_ranges else presets,
+                rlPresetRanges=preset_ranges,
+                radius=radius,
+                readOnly=read_only,
+                required=required,
+                rightSection=right_section,
+                rightSectionPointerEvents=right_section_pointer_events,
+                rightSectionProps=right_section_props,
+                rightSectionWidth=right_section_width,
+                scrollAreaProps=scroll_area_props,
+                secondsInputLabel=seconds_input_label,
+                secondsInputProps=seconds_input_props,
+                secondsStep=seconds_step,
+                size=size,
+                withAsterisk=with_asterisk,
+                withDropdown=with_dropdown,
+                withErrorStyles=with_error_styles,
+                withSeconds=with_seconds,
+                wrapperProps=wrapper_props,
+                rl_format_func=self._format_time,
+                on_change=on_change,
+                **kwargs,
+            ),
+        )
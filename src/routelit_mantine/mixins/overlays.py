@@ -0,0 +1,165 @@
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+from routelit import RouteLitBuilder
+
+if TYPE_CHECKING:
+    from ..builder import RLBuilder
+
+
+class OverlaysMixin(RouteLitBuilder):
+    """
+    Dialog, drawer and modal methods of `RLBuilder`.
+    """
+
+    def dialog(
+        self,
+        key: Optional[str] = None,
+        *,
+        with_close_button: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> "RLBuilder":
+        """
+        Open a dialog container for arbitrary content.
+
+        Args:
+            key (Optional[str]): Explicit element key.
+            with_close_button (Optional[bool]): Show close button.
+            kwargs: Additional props to set.
+
+        Returns:
+            RLBuilder: A nested builder scoped to the dialog element.
+        """
+        return self._x_dialog(  # type: ignore[return-value]
+            "dialog",
+            key or self._new_text_id("dialog"),
+            opened=True,
+            withCloseButton=with_close_button,
+            **kwargs,
+        )
+
+    def drawer(
+        self,
+        key: Optional[str] = None,
+        *,
+        close_button_props: Optional[dict] = None,
+        close_on_click_outside: Optional[bool] = None,
+        close_on_escape: Optional[bool] = None,
+        on_close: Optional[Callable[[], bool]] = None,
+        keep_mounted: Optional[bool] = None,
+        lock_scroll: Optional[bool] = None,
+        offset: Optional[Union[str, int]] = None,
+        overlay_props: Optional[dict] = None,
+        padding: Optional[Union[str, int]] = None,
+        portal_props: Optional[dict] = None,
+        position: Optional[str] = None,
+        radius: Optional[Union[str, int]] = None,
+        remove_scroll_props: Optional[dict] = None,
+        return_focus: Optional[bool] = None,
+        scroll_area_component: Optional[str] = None,
+        shadow: Optional[str] = None,
+        size: Optional[Union[str, int]] = None,
+        stack_id: Optional[str] = None,
+        title: Optional[str] = None,
+        transition_props: Optional[dict] = None,
+        trap_focus: Optional[bool] = None,
+        with_close_button: Optional[bool] = None,
+        with_overlay: Optional[bool] = None,
+        within_portal: Optional[bool] = None,
+        z_index: Optional[Union[str, int]] = None,
+        **kwargs: Any,
+    ) -> "RLBuilder":
+        """
+        Drawer component that slides from screen edges.
+
+        Args:
+            key (Optional[str]): Explicit element key.
+            close_button_props (Optional[dict]): Close button props.
+            close_on_click_outside (Optional[bool]): Close when clicking outside.
+            close_on_escape (Optional[bool]): Close on Escape key.
+            on_close (Optional[Callable[[], bool]]): Close handler.
+            keep_mounted (Optional[bool]): Keep in DOM when closed.
+            lock_scroll (Optional[bool]): Lock document scroll when opened.
+            offset (Optional[Union[str, int]]): Offset from viewport edges.
+            overlay_props (Optional[dict]): Overlay props.
+            padding (Optional[Union[str, int]]): Content padding.
+            portal_props (Optional[dict]): Portal props.
+            position (Optional[str]): Edge position.
+            radius (Optional[Union[str, int]]): Corner radius.
+            remove_scroll_props (Optional[dict]): Remove scroll props.
+            return_focus (Optional[bool]): Return focus to trigger on close.
+            scroll_area_component (Optional[str]): Custom scroll area component.
+            shadow (Optional[str]): Shadow preset.
+            size (Optional[Union[str, int]]): Drawer size.
+            stack_id (Optional[str]): Stack identifier.
+            title (Optional[str]): Header title.
+            transition_props (Optional[dict]): Transition props.
+            trap_focus (Optional[bool]): Trap focus inside drawer.
+            with_close_button (Optional[bool]): Show close button.
+            with_overlay (Optional[bool]): Show overlay.
+            within_portal (Optional[bool]): Render within portal.
+            z_index (Optional[Union[str, int]]): CSS z-index.
+            kwargs: Additional props to set.
+
+        Returns:
+            RLBuilder: A nested builder scoped to the drawer element.
+        """
+        return self._x_dialog(  # type: ignore[return-value]
+            "drawer",
+            key or self._new_text_id("drawer"),
+            opened=True,
+            closeButtonProps=close_button_props,
+            closeOnClickOutside=close_on_click_outside,
+            closeOnEscape=close_on_escape,
+            keepMounted=keep_mounted,
+            lockScroll=lock_scroll,
+            offset=offset,
+            on_close=on_close,
+            overlayProps=overlay_props,
+            padding=padding,
+            portalProps=portal_props,
+            position=position,
+            radius=radius,
+            removeScrollProps=remove_scroll_props,
+            returnFocus=return_focus,
+            scrollAreaComponent=scroll_area_component,
+            shadow=shadow,
+            size=size,
+            stackId=stack_id,
+            title=title,
+            transitionProps=transition_props,
+            trapFocus=trap_focus,
+            withCloseButton=with_close_button,
+            withOverlay=with_overlay,
+            withinPortal=within_portal,
+            zIndex=z_index,
+            **kwargs,
+        )
+
+    def modal(
+        self,
+        key: Optional[str] = None,
+        *,
+        title: Optional[str] = None,
+        with_close_button: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> "RLBuilder":
+        """
+        Centered modal dialog.
+
+        Args:
+            key (Optional[str]): Explicit element key.
+            title (Optional[str]): Header title.
+            with_close_button (Optional[bool]): Show close button.
+            kwargs: Additional props to set.
+
+        Returns:
+            RLBuilder: A nested builder scoped to the modal element.
+        """
+        return self._x_dialog(  # type: ignore[return-value]
+            "modal",
+            key or self._new_text_id("modal"),
+            opened=True,
+            title=title,
+            withCloseButton=with_close_button,
+            **kwargs,
+        )
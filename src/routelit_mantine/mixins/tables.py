@@ -0,0 +1,247 @@
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from routelit import RouteLitBuilder
+
+if TYPE_CHECKING:
+    from ..builder import RLBuilder
+
+
+class TablesMixin(RouteLitBuilder):
+    """
+    Table methods of `RLBuilder`.
+    """
+
+    def table(
+        self,
+        key: Optional[str] = None,
+        *,
+        body: Optional[list[list[Any]]] = None,
+        caption: Optional[str] = None,
+        head: Optional[list[str]] = None,
+        foot: Optional[list[str]] = None,
+        sticky_header: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> "RLBuilder":
+        """
+        Data table with optional head, body, foot and caption.
+
+        Args:
+            key (Optional[str]): Explicit element key.
+            body (Optional[list[list[Any]]]): Table body rows.
+            caption (Optional[str]): Table caption.
+            head (Optional[list[str]]): Header row cells.
+            foot (Optional[list[str]]): Footer row cells.
+            sticky_header (Optional[bool]): Make header sticky when scrolling.
+            kwargs: Additional props to set.
+
+        Returns:
+            RLBuilder: A nested builder scoped to the table element.
+        """
+        data = {
+            "body": body,
+            "caption": caption,
+            "head": head,
+            "foot": foot,
+        }
+        return self._create_builder_element(  # type: ignore[return-value]
+            name="table",
+            key=key or self._new_text_id("table"),
+            props={"data": data, "stickyHeader": sticky_header, **kwargs},
+        )
+
+    def table_caption(
+        self,
+        text: str,
+        *,
+        key: Optional[str] = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Add a caption to the current table.
+
+        Args:
+            text (str): Caption text.
+            key (Optional[str]): Explicit element key.
+            kwargs: Additional props to set.
+        """
+        self._create_element(
+            name="tablecaption",
+            key=key or self._new_text_id("tablecaption"),
+            props={"children": text, **kwargs},
+            virtual=True,
+        )
+
+    def table_head(
+        self,
+        key: Optional[str] = None,
+        **kwargs: Any,
+    ) -> "RLBuilder":
+        """
+        Create a table head section.
+
+        Args:
+            key (Optional[str]): Explicit element key.
+            kwargs: Additional props to set.
+
+        Returns:
+            RLBuilder: A nested builder scoped to the head section.
+        """
+        return self._create_builder_element(  # type: ignore[return-value]
+            name="tablehead",
+            key=key or self._new_text_id("tablehead"),
+            props=kwargs,
+            virtual=True,
+        )
+
+    def table_foot(
+        self,
+        key: Optional[str] = None,
+        **kwargs: Any,
+    ) -> "RLBuilder":
+        """
+        Create a table foot section.
+
+        Args:
+            key (Optional[str]): Explicit element key.
+            kwargs: Additional props to set.
+
+        Returns:
+            RLBuilder: A nested builder scoped to the foot section.
+        """
+        return self._create_builder_element(  # type: ignore[return-value]
+            name="tablefoot",
+            key=key or self._new_text_id("tablefoot"),
+            props=kwargs,
+            virtual=True,
+        )
+
+    def table_row(
+        self,
+        key: Optional[str] = None,
+        **kwargs: Any,
+    ) -> "RLBuilder":
+        """
+        Create a table row.
+
+        Args:
+            key (Optional[str]): Explicit element key.
+            kwargs: Additional props to set.
+
+        Returns:
+            RLBuilder: A nested builder scoped to the row.
+        """
+        return self._create_builder_element(  # type: ignore[return-value]
+            name="tablerow",
+            key=key or self._new_text_id("tablerow"),
+            props=kwargs,
+            virtual=True,
+        )
+
+    def table_cell(
+        self,
+        text: Optional[str] = None,
+        *,
+        key: Optional[str] = None,
+        **kwargs: Any,
+    ) -> "RLBuilder":
+        """
+        Create a table cell.
+
+        Args:
+            text (Optional[str]): Cell text content.
+            key (Optional[str]): Explicit element key.
+            kwargs: Additional props to set.
+
+        Returns:
+            RLBuilder: A nested builder scoped to the cell.
+        """
+        return self._create_builder_element(  # type: ignore[return-value]
+            name="tablecell",
+            key=key or self._new_text_id("tablecell"),
+            props={"children": text, **kwargs},
+            virtual=True,
+        )
+
+    def table_header(
+        self,
+        text: Optional[str] = None,
+        *,
+        key: Optional[str] = None,
+        **kwargs: Any,
+    ) -> "RLBuilder":
+        """
+        Create a table header cell.
+
+        Args:
+            text (Optional[str]): Header text content.
+            key (Optional[str]): Explicit element key.
+            kwargs: Additional props to set.
+
+        Returns:
+            RLBuilder: A nested builder scoped to the header cell.
+        """
+        return self._create_builder_element(  # type: ignore[return-value]
+            name="tableheader",
+            key=key or self._new_text_id("tableheader"),
+            props={"children": text, **kwargs},
+            virtual=True,
+        )
+
+    def table_body(
+        self,
+        key: Optional[str] = None,
+        **kwargs: Any,
+    ) -> "RLBuilder":
+        """
+        Create a table body section.
+
+        Args:
+            key (Optional[str]): Explicit element key.
+            kwargs: Additional props to set.
+
+        Returns:
+            RLBuilder: A nested builder scoped to the body section.
+        """
+        return self._create_builder_element(  # type: ignore[return-value]
+            name="tablebody",
+            key=key or self._new_text_id("tablebody"),
+            props=kwargs,
+            virtual=True,
+        )
+
+    def table_scroll_container(
+        self,
+        *,
+        key: Optional[str] = None,
+        max_height: Optional[Union[str, int]] = None,
+        max_width: Optional[Union[str, int]] = None,
+        min_height: Optional[Union[str, int]] = None,
+        min_width: Optional[Union[str, int]] = None,
+        **kwargs: Any,
+    ) -> "RLBuilder":
+        """
+        Scrollable container for large tables.
+
+        Args:
+            key (Optional[str]): Explicit element key.
+            max_height (Optional[Union[str, int]]): Maximum height.
+            max_width (Optional[Union[str, int]]): Maximum width.
+            min_height (Optional[Union[str, int]]): Minimum height.
+            min_width (Optional[Union[str, int]]): Minimum width.
+            kwargs: Additional props to set.
+
+        Returns:
+            RLBuilder: A nested builder scoped to the scroll container.
+        """
+        return self._create_builder_element(  # type: ignore[return-value]
+            name="tablescrollcontainer",
+            key=key or self._new_text_id("tablescrollcontainer"),
+            props={
+                "maxHeight": max_height,
+                "maxWidth": max_width,
+                "minHeight": min_height,
+                "minWidth": min_width,
+                **kwargs,
+            },
+            virtual=True,
+        )
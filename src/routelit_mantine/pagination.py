@@ -0,0 +1,105 @@
+import threading
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, NamedTuple, Optional, Protocol
+
+from .cache import LRUCache
+
+PREFETCH_WORKERS = 2
+"""
+Threads fetching pages ahead, apart from the pool of `RLBuilder.parallel` so slow sources do not hold up fragments.
+"""
+
+
+class TextSourceError(TypeError):
+    def __init__(self, source: object) -> None:
+        super().__init__(f"paginated needs a sequence of items, not {type(source).__name__}")
+
+
+class Page(NamedTuple):
+    """
+    The items of a page and the cursor of the next page, None on the last page.
+    """
+
+    items: list[Any]
+    next_cursor: Any = None
+
+
+class PageSource(Protocol):
+    """
+    Data source of `RLBuilder.paginated`, read one page at a time.
+
+    Pages are addressed by cursors: None for the first page, then the `next_cursor` of the previous page, e.g. an
+    offset or the last id seen. Cursors are kept in session state, so they must be picklable.
+    """
+
+    def count(self) -> Optional[int]:
+        """
+        Number of items, or None if unknown. Without a count, the pagination control reaches one page past the
+        last page visited.
+        """
+        ...
+
+    def fetch_page(self, cursor: Any, page_size: int) -> Page:
+        """
+        The page of at most `page_size` items starting at `cursor`.
+        """
+        ...
+
+
+class SequenceSource:
+    """
+    Pages of an in-memory sequence. The cursor of a page is the index of its first item. Strings and bytes are
+    rejected rather than paginated character by character.
+    """
+
+    def __init__(self, items: Sequence[Any]) -> None:
+        if isinstance(items, (str, bytes, bytearray)):
+            raise TextSourceError(items)
+        self.items = items
+
+    def count(self) -> int:
+        return len(self.items)
+
+    def fetch_page(self, cursor: Optional[int], page_size: int) -> Page:
+        start = cursor or 0
+        end = start + page_size
+        return Page(list(self.items[start:end]), end if end < len(self.items) else None)
+
+
+PrefetchToken = tuple[str, str, str, int]
+"""
+Session state key, element key, fingerprint of the dependencies and page number of a prefetched page.
+"""
+
+_prefetched: LRUCache[PrefetchToken, "Future[Page]"] = LRUCache(256)
+_prefetched_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def prefetch_page(token: PrefetchToken, source: PageSource, cursor: Any, page_size: int) -> None:
+    """
+    Fetch a page on the prefetch threads, to be claimed with `take_prefetched` by a later run.
+    """
+    global _executor
+    with _prefetched_lock:
+        if token in _prefetched:
+            return
+        if _executor is None:
+            _executor = ThreadPoolExecutor(PREFETCH_WORKERS, thread_name_prefix="routelit-page-prefetch")
+        _prefetched[token] = _executor.submit(source.fetch_page, cursor, page_size)
+
+
+def take_prefetched(token: PrefetchToken) -> Optional[Page]:
+    """
+    The page prefetched for `token`, waiting for it if the fetch is still running, or None if it was not
+    prefetched or failed.
+    """
+    with _prefetched_lock:
+        future = _prefetched.pop(token)
+    if future is None:
+        return None
+    try:
+        return Page(*future.result())
+    except Exception:
+        return None
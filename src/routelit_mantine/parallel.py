@@ -0,0 +1,63 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_worker = threading.local()
+
+
+def uses_session_state(fn: F) -> F:
+    """
+    Mark a fragment as reading or writing session state shared with other fragments,
+    so that `RLBuilder.parallel` runs it on the calling thread instead of the pool.
+
+    Example:
+    ```python
+    @rl.fragment("cart")
+    @uses_session_state
+    def cart(ui: RLBuilder) -> None:
+        ui.session_state["items"] = ...
+    ```
+    """
+    fn.__rl_uses_session_state__ = True  # type: ignore[attr-defined]
+    return fn
+
+
+def is_serial(fn: Callable[..., Any]) -> bool:
+    """
+    Whether `fn`, or the function it wraps, is marked with `uses_session_state`.
+    """
+    while fn is not None:
+        if getattr(fn, "__rl_uses_session_state__", False):
+            return True
+        fn = getattr(fn, "__wrapped__", None)  # type: ignore[assignment]
+    return False
+
+
+def in_worker() -> bool:
+    """
+    Whether the current thread is running a task of the pool.
+    """
+    return getattr(_worker, "active", False)
+
+
+def _run_in_worker(task: Callable[[], Any]) -> Any:
+    _worker.active = True
+    try:
+        return task()
+    finally:
+        _worker.active = False
+
+
+def submit(task: Callable[[], Any], max_workers: int) -> "Future[Any]":
+    """
+    Run `task` on the process-wide pool, created with `max_workers` threads on first use.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=max(max_workers, 1), thread_name_prefix="routelit-fragment")
+    return _executor.submit(_run_in_worker, task)
@@ -0,0 +1,81 @@
+import datetime
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any, Optional, TypedDict, Union, cast
+
+TimeValue = Union[datetime.time, str]
+
+
+class TimePresetRange(TypedDict, total=False):
+    """
+    A generated list of time presets: every `step` from `start` to `end` (inclusive),
+    skipping the half-open `exclude` ranges. Presets sharing a `label` are grouped together.
+    """
+
+    start: TimeValue
+    end: TimeValue
+    step: Union[int, str, datetime.timedelta]  # minutes, "HH:mm[:ss]" or timedelta
+    exclude: list[tuple[TimeValue, TimeValue]]
+    label: str
+
+
+def _seconds(value: Union[TimeValue, int, datetime.timedelta], *, minutes: bool = False) -> int:
+    if isinstance(value, datetime.timedelta):
+        return int(value.total_seconds())
+    if isinstance(value, int):
+        return value * 60 if minutes else value
+    if isinstance(value, datetime.time):
+        return value.hour * 3600 + value.minute * 60 + value.second
+    hours, mins, *secs = (int(part) for part in value.split(":"))
+    return hours * 3600 + mins * 60 + (secs[0] if secs else 0)
+
+
+def is_time_preset_range(value: Any) -> bool:
+    """
+    Whether `value` is a preset generator (or a list of them) rather than explicit presets.
+    """
+    if isinstance(value, Mapping):
+        return "start" in value
+    return isinstance(value, list) and bool(value) and all(isinstance(v, Mapping) and "start" in v for v in value)
+
+
+def time_preset_props(presets: Union[TimePresetRange, list[TimePresetRange]]) -> list[dict[str, Any]]:
+    """
+    Compact form of preset generators sent to the client, with every time in seconds since midnight.
+    """
+    ranges = [presets] if isinstance(presets, Mapping) else presets
+    props = []
+    for preset in ranges:
+        prop: dict[str, Any] = {
+            "start": _seconds(preset["start"]),
+            "end": _seconds(preset["end"]),
+            "step": _seconds(preset.get("step", 30), minutes=True),
+        }
+        if preset.get("exclude"):
+            prop["exclude"] = [[_seconds(a), _seconds(b)] for a, b in preset["exclude"]]
+        if preset.get("label") is not None:
+            prop["label"] = preset["label"]
+        props.append(prop)
+    return props
+
+
+def iter_time_presets(
+    presets: Union[TimePresetRange, Iterable[TimePresetRange]],
+) -> Iterator[tuple[Optional[str], str]]:
+    """
+    Lazily expand preset generators into `(label, "HH:mm:ss")` pairs, in the order the picker shows them.
+
+    Args:
+        presets (Union[TimePresetRange, Iterable[TimePresetRange]]): Preset generators.
+
+    Returns:
+        Iterator[tuple[Optional[str], str]]: Group label and time of each preset.
+    """
+    ranges = [presets] if isinstance(presets, Mapping) else list(presets)
+    for preset in time_preset_props(cast(list[TimePresetRange], ranges)):
+        step = max(preset["step"], 1)
+        excluded = preset.get("exclude", [])
+        for seconds in range(preset["start"], preset["end"] + 1, step):
+            if any(a <= seconds < b for a, b in excluded):
+                continue
+            hours, rest = divmod(seconds, 3600)
+            yield preset.get("label"), f"{hours:02d}:{rest // 60:02d}:{rest % 60:02d}"
@@ -0,0 +1,88 @@
+"""
+Optional service worker that keeps the routelit_mantine bundles in the browser's cache.
+
+The bundles of the Vite manifest are precached when the worker installs and then served from the cache, so repeat
+visits do not revalidate them over the network. To enable it, add `SERVICE_WORKER_ASSETS` to the static assets of the
+builder, which loads the registration script, and serve `service_worker_script()` at `SERVICE_WORKER_PATH`:
+
+```python
+from routelit_mantine.service_worker import SERVICE_WORKER_ASSETS, SERVICE_WORKER_PATH, service_worker_script
+
+class Builder(RLBuilder):
+    static_assets_targets = [SERVICE_WORKER_ASSETS]
+
+@app.get(SERVICE_WORKER_PATH)
+def service_worker():
+    return Response(service_worker_script(), mimetype="text/javascript", headers={"Cache-Control": "no-cache"})
+```
+"""
+
+import functools
+import hashlib
+import json
+from importlib import resources
+
+from routelit import AssetTarget
+from routelit.assets_utils import get_vite_manifest
+
+SERVICE_WORKER_PATH = "/routelit-mantine-sw.js"
+"""
+Path the registration script expects the service worker at. Served from the root, the worker controls every page.
+"""
+
+SERVICE_WORKER_ASSETS: AssetTarget = {
+    "package_name": "routelit_mantine.service_worker",
+    "path": "static",
+}
+"""
+Static assets target holding the registration script.
+"""
+
+
+def _manifest_files(package_name: str) -> list[str]:
+    files: list[str] = []
+    for chunk in get_vite_manifest(package_name).values():
+        for file in [chunk["file"], *chunk.get("css", []), *chunk.get("assets", [])]:
+            if file not in files:
+                files.append(file)
+    return files
+
+
+@functools.lru_cache(maxsize=8)
+def service_worker_script(
+    package_names: tuple[str, ...] = ("routelit_mantine",),
+    static_prefix: str = "/routelit",
+) -> str:
+    """
+    Source of the service worker precaching the Vite manifest files of `package_names`, served by the app at
+    `SERVICE_WORKER_PATH`. Its version changes with the content of the files, so a new release installs a new
+    worker, which replaces the cached files.
+
+    Args:
+        package_names (tuple[str, ...]): Packages whose static files are precached.
+        static_prefix (str): URL prefix the routelit adapter serves package static files under.
+
+    Returns:
+        str: The JavaScript source of the service worker.
+    """
+    digest = hashlib.sha256()
+    urls: list[str] = []
+    immutable: list[str] = []
+    for package_name in package_names:
+        static = resources.files(package_name) / "static"
+        for file in _manifest_files(package_name):
+            url = f"{static_prefix}/{package_name}/{file}"
+            urls.append(url)
+            # Vite names the files it emits under `assets/` after their content
+            if file.startswith("assets/"):
+                immutable.append(url)
+            path = static / file
+            digest.update(url.encode())
+            if path.is_file():
+                digest.update(path.read_bytes())
+    precache = {"version": digest.hexdigest()[:16], "urls": urls, "immutable": immutable}
+    source = (resources.files(__name__) / "sw.js").read_text(encoding="utf-8")
+    return f"const PRECACHE = {json.dumps(precache)};\n{source}"
+
+
+__all__ = ["SERVICE_WORKER_ASSETS", "SERVICE_WORKER_PATH", "service_worker_script"]
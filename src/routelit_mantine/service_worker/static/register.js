@@ -0,0 +1,7 @@
+// Registers the routelit_mantine service worker, which the app serves at the
+// root of the site so that it controls every page.
+if ("serviceWorker" in navigator && window.isSecureContext) {
+  navigator.serviceWorker.register("/routelit-mantine-sw.js", { scope: "/" }).catch((error) => {
+    console.warn("routelit-mantine: service worker registration failed", error);
+  });
+}
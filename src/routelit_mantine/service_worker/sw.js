@@ -0,0 +1,59 @@
+// Service worker of routelit_mantine, served by `routelit_mantine.service_worker.service_worker_script`,
+// which defines PRECACHE = { version, urls, immutable } before this script.
+
+const CACHE_PREFIX = "routelit-mantine-";
+const CACHE = CACHE_PREFIX + PRECACHE.version;
+const PRECACHED = new Set(PRECACHE.urls);
+const IMMUTABLE = new Set(PRECACHE.immutable);
+
+self.addEventListener("install", (event) => {
+  event.waitUntil(
+    caches
+      .open(CACHE)
+      .then((cache) => cache.addAll(PRECACHE.urls))
+      .then(() => self.skipWaiting())
+  );
+});
+
+self.addEventListener("activate", (event) => {
+  event.waitUntil(
+    caches
+      .keys()
+      .then((keys) =>
+        Promise.all(
+          keys.filter((key) => key.startsWith(CACHE_PREFIX) && key !== CACHE).map((key) => caches.delete(key))
+        )
+      )
+      .then(() => self.clients.claim())
+  );
+});
+
+// Bundles are served from the cache. Those without a content hash in their
+// name are also refreshed in the background, so a changed bundle is used from
+// the next visit without a request blocking this one.
+self.addEventListener("fetch", (event) => {
+  const { request } = event;
+  const url = new URL(request.url);
+  if (request.method !== "GET" || url.origin !== self.location.origin || !PRECACHED.has(url.pathname)) {
+    return;
+  }
+  event.respondWith(
+    caches.open(CACHE).then(async (cache) => {
+      const cached = await cache.match(request, { ignoreSearch: true });
+      if (cached && IMMUTABLE.has(url.pathname)) {
+        return cached;
+      }
+      const refresh = fetch(request).then((response) => {
+        if (response.ok) {
+          return cache.put(url.pathname, response.clone()).then(() => response);
+        }
+        return response;
+      });
+      if (cached) {
+        event.waitUntil(refresh.catch(() => undefined));
+        return cached;
+      }
+      return refresh;
+    })
+  );
+});
@@ -0,0 +1,195 @@
+import sys
+import threading
+from collections.abc import Iterable, Sequence, Sized
+from typing import Any, Optional, TypedDict
+
+from routelit import PropertyDict
+
+from .cache import LRUCache
+from .lazy import LazyModule
+
+pickle: Any = LazyModule("pickle")
+
+WIDGET_STATE_KEY = "__widget_state"
+"""
+Session key of the widget state bookkeeping: the run counter and, per widget key, the last run it rendered in,
+the size of its value and when that size was measured.
+"""
+
+REMEASURE_RUNS = 16
+"""
+Runs after which the size of an unchanged widget value is measured again, to catch values mutated in place.
+"""
+
+
+class SessionStateSummary(TypedDict):
+    """
+    Distribution of widget-state bytes across the sessions seen recently by the process.
+    """
+
+    sessions: int
+    total_bytes: int
+    max_bytes: int
+    p50_bytes: int
+    p90_bytes: int
+    p99_bytes: int
+
+
+def value_size(value: Any) -> int:
+    """
+    Approximate size of a session value in bytes, measured by its pickled length.
+    """
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+def track_widget_state(
+    state: PropertyDict,
+    rendered: Iterable[str],
+    *,
+    max_idle_runs: Optional[int],
+    max_bytes: Optional[int],
+    companions: Sequence[str] = (),
+) -> int:
+    """
+    Account for the widget values of a finished run and evict the stale ones.
+
+    The size of a value is measured when the widget first renders, when its hash (or type and length, if it is
+    unhashable) changes and every `REMEASURE_RUNS` runs, not on every run.
+
+    Values of widgets that have not rendered for more than `max_idle_runs` runs are removed. While the remaining
+    values exceed `max_bytes`, the least recently rendered ones are removed too; values rendered in this run are kept.
+
+    Args:
+        state (PropertyDict): The session state.
+        rendered (Iterable[str]): Keys of the elements rendered in this run.
+        max_idle_runs (Optional[int]): Runs a widget may be absent before its value is dropped; never if not set.
+        max_bytes (Optional[int]): Cap on the widget values of the session; unbounded if not set.
+        companions (Sequence[str]): Formats of internal keys stored along a widget value, e.g. `"__{}_default"`.
+
+    Returns:
+        int: The bytes of widget state kept in the session.
+    """
+    meta = state.get(WIDGET_STATE_KEY)
+    if not isinstance(meta, dict):
+        meta = {"run": 0, "widgets": {}}
+    run = meta["run"] = meta["run"] + 1
+    widgets: dict[str, list[int]] = meta["widgets"]
+    for key in rendered:
+        if key in state:
+            _measure(widgets, key, state[key], run)
+    for key in [k for k in widgets if k not in state]:
+        widgets.pop(key)
+    if max_idle_runs is not None:
+        for key in [k for k, entry in widgets.items() if run - entry[0] > max_idle_runs]:
+            _evict(state, widgets, key, companions)
+    total = sum(entry[1] for entry in widgets.values())
+    if max_bytes is not None and total > max_bytes:
+        total = _evict_over_cap(state, widgets, run, total, max_bytes, companions)
+    state[WIDGET_STATE_KEY] = meta
+    return total
+
+
+def _signature(value: Any) -> int:
+    """
+    Cheap stand-in for a value, changing when it is replaced: its hash, or its type and length if unhashable.
+    """
+    try:
+        return hash(value)
+    except TypeError:
+        return hash((type(value).__qualname__, len(value) if isinstance(value, Sized) else -1))
+
+
+def _measure(widgets: dict[str, list[int]], key: str, value: Any, run: int) -> None:
+    entry = widgets.get(key)
+    signature = _signature(value)
+    # entries are [last rendered run, size, signature of the measured value, run it was measured in]
+    if entry is None or len(entry) < 4 or entry[2] != signature or run - entry[3] >= REMEASURE_RUNS:
+        widgets[key] = [run, value_size(value), signature, run]
+    else:
+        entry[0] = run
+
+
+def _evict(state: PropertyDict, widgets: dict[str, list[int]], key: str, companions: Sequence[str]) -> None:
+    widgets.pop(key, None)
+    state.pop(key, None)
+    for companion in companions:
+        state.pop(companion.format(key), None)
+
+
+def _evict_over_cap(
+    state: PropertyDict,
+    widgets: dict[str, list[int]],
+    run: int,
+    total: int,
+    max_bytes: int,
+    companions: Sequence[str],
+) -> int:
+    for key, (last, size, *_) in sorted(widgets.items(), key=lambda item: item[1][0]):
+        if total <= max_bytes or last == run:
+            break
+        _evict(state, widgets, key, companions)
+        total -= size
+    return total
+
+
+class SessionStateRegistry:
+    """
+    Widget-state bytes of the most recently active sessions of the process, summed over the pages of each session.
+    """
+
+    def __init__(self, maxsize: int = 10_000) -> None:
+        self._sessions: LRUCache[str, dict[str, int]] = LRUCache(maxsize)
+        self._lock = threading.Lock()
+
+    def record(self, session_id: str, page_key: str, nbytes: int) -> None:
+        with self._lock:
+            pages = self._sessions.get(session_id)
+            if pages is None:
+                pages = self._sessions[session_id] = {}
+            pages[page_key] = nbytes
+
+    def discard(self, session_id: str, page_key: str) -> None:
+        """
+        Forget the state of a page, e.g. after routelit cleared it on navigation.
+        """
+        with self._lock:
+            pages = self._sessions.get(session_id)
+            if pages is not None:
+                pages.pop(page_key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sessions.clear()
+
+    def summary(self) -> SessionStateSummary:
+        with self._lock:
+            totals = [sum(pages.values()) for pages in (self._sessions[key] for key in list(self._sessions)) if pages]
+        sizes = sorted(totals)
+
+        def percentile(q: int) -> int:
+            return sizes[min(len(sizes) - 1, len(sizes) * q // 100)] if sizes else 0
+
+        return {
+            "sessions": len(sizes),
+            "total_bytes": sum(sizes),
+            "max_bytes": sizes[-1] if sizes else 0,
+            "p50_bytes": percentile(50),
+            "p90_bytes": percentile(90),
+            "p99_bytes": percentile(99),
+        }
+
+
+session_state_registry = SessionStateRegistry()
+
+
+def session_state_summary() -> SessionStateSummary:
+    """
+    Distribution of widget-state bytes across the active sessions, e.g. to export as metrics.
+
+    Returns:
+        SessionStateSummary: Session count, total, maximum and percentiles in bytes.
+    """
+    return session_state_registry.summary()
@@ -0,0 +1,323 @@
+import bisect
+import datetime
+import functools
+import importlib
+import math
+import re
+from collections.abc import Mapping, Sequence
+from typing import Any, Literal, Optional, Union
+
+from .lazy import LazyModule
+
+np: Any = LazyModule("numpy")
+
+FillMethod = Literal["null", "zero", "previous", "drop"]
+"""
+How empty buckets are reported: as `None`, as `0`, with the previous bucket value, or left out.
+"""
+
+
+class InvalidIntervalError(ValueError):
+    def __init__(self, interval: object) -> None:
+        super().__init__(f"Invalid interval {interval!r}, expected e.g. '30s', '15min', '1h', '1d', '1w' or '1mo'")
+
+
+class InvalidAggregationError(ValueError):
+    def __init__(self, agg: str) -> None:
+        super().__init__(f"Invalid aggregation {agg!r}, expected sum, mean, min, max, count, median or p0 to p100")
+
+
+class TooManyBucketsError(ValueError):
+    def __init__(self, limit: int) -> None:
+        super().__init__(f"Resampling would produce more than {limit} buckets, use a larger interval")
+
+
+_INTERVAL_RE = re.compile(r"^\s*(\d*)\s*(s|min|h|d|w|mo)\s*$")
+_SECONDS = {"s": 1, "min": 60, "h": 3600, "d": 86400, "w": 604800}
+_MAX_BUCKETS = 1_000_000
+_UTC = datetime.timezone.utc
+
+
+def _parse_interval(interval: Union[str, datetime.timedelta]) -> tuple[int, str]:
+    if isinstance(interval, datetime.timedelta):
+        seconds = interval.total_seconds()
+        if seconds <= 0 or seconds != int(seconds):
+            raise InvalidIntervalError(interval)
+        return int(seconds), "s"
+    match = _INTERVAL_RE.match(interval)
+    if not match or match.group(1) == "0":
+        raise InvalidIntervalError(interval)
+    return int(match.group(1) or 1), match.group(2)
+
+
+def _to_tz(tz: Union[str, datetime.tzinfo, None]) -> datetime.tzinfo:
+    if tz is None:
+        return _UTC
+    if isinstance(tz, str):
+        return importlib.import_module("zoneinfo").ZoneInfo(tz)  # type: ignore[no-any-return]
+    return tz
+
+
+def _to_epoch(value: Any, tz: datetime.tzinfo) -> float:
+    if isinstance(value, str):
+        value = datetime.datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+    if isinstance(value, datetime.datetime):
+        return (value if value.tzinfo else value.replace(tzinfo=tz)).timestamp()
+    if isinstance(value, datetime.date):
+        return datetime.datetime(value.year, value.month, value.day, tzinfo=tz).timestamp()
+    return float(value)
+
+
+def _epochs(timestamps: Any, tz: datetime.tzinfo) -> Any:
+    """
+    Converts timestamps to POSIX seconds: an array when NumPy is available, a list otherwise.
+    Naive datetimes are read in `tz`; numbers are taken as POSIX seconds.
+    """
+    if np:
+        arr = np.asarray(timestamps)
+        if arr.dtype.kind == "M":
+            return arr.astype("datetime64[ns]").astype(np.int64) / 1e9
+        if arr.dtype.kind in "iuf":
+            return arr.astype(float)
+        return np.fromiter((_to_epoch(t, tz) for t in arr.tolist()), dtype=float, count=arr.size)
+    return [_to_epoch(t, tz) for t in timestamps]
+
+
+def _floor(moment: datetime.datetime, step: int, unit: str) -> datetime.datetime:
+    midnight = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    if unit == "mo":
+        months = moment.year * 12 + moment.month - 1
+        months -= months % step
+        return midnight.replace(year=months // 12, month=months % 12 + 1, day=1)
+    if unit == "w":
+        return midnight - datetime.timedelta(days=moment.weekday())
+    if unit == "d":
+        return midnight
+    width = step * _SECONDS[unit]
+    if 86400 % width == 0:
+        elapsed = moment.hour * 3600 + moment.minute * 60 + moment.second
+        return midnight + datetime.timedelta(seconds=elapsed - elapsed % width)
+    epoch = moment.timestamp()
+    return datetime.datetime.fromtimestamp(epoch - epoch % width, moment.tzinfo)
+
+
+def _advance(edge: datetime.datetime, step: int, unit: str) -> datetime.datetime:
+    if unit == "mo":
+        months = edge.year * 12 + edge.month - 1 + step
+        return edge.replace(year=months // 12, month=months % 12 + 1)
+    if unit in ("d", "w"):
+        # wall clock arithmetic, so days stay aligned to local midnight across DST changes
+        return edge + datetime.timedelta(days=step * (7 if unit == "w" else 1))
+    return datetime.datetime.fromtimestamp(edge.timestamp() + step * _SECONDS[unit], edge.tzinfo)
+
+
+@functools.lru_cache(maxsize=32)
+def _bucket_edges(
+    first: float, last: float, step: int, unit: str, tz: datetime.tzinfo
+) -> tuple[tuple[float, ...], tuple[datetime.datetime, ...]]:
+    """
+    Bucket boundaries covering [first, last] as POSIX seconds, plus the local start of each bucket.
+    """
+    edge = _floor(datetime.datetime.fromtimestamp(first, tz), step, unit)
+    starts: list[datetime.datetime] = []
+    edges: list[float] = []
+    while True:
+        epoch = edge.timestamp()
+        edges.append(epoch)
+        if epoch > last:
+            break
+        if len(starts) >= _MAX_BUCKETS:
+            raise TooManyBucketsError(_MAX_BUCKETS)
+        starts.append(edge)
+        edge = _advance(edge, step, unit)
+    return tuple(edges), tuple(starts)
+
+
+def _quantile(agg: str) -> Optional[float]:
+    if agg == "median":
+        return 0.5
+    if agg.startswith("p"):
+        try:
+            q = float(agg[1:]) / 100
+        except ValueError:
+            q = -1.0
+        if not 0 <= q <= 1:
+            raise InvalidAggregationError(agg)
+        return q
+    if agg not in ("sum", "mean", "min", "max", "count"):
+        raise InvalidAggregationError(agg)
+    return None
+
+
+def _aggregate_numpy(index: Any, values: Any, agg: str, size: int) -> list[Optional[float]]:
+    keep = np.isfinite(values)
+    index, values = index[keep], values[keep]
+    counts = np.bincount(index, minlength=size)
+    if agg == "count":
+        return counts.tolist()  # type: ignore[no-any-return]
+    if agg == "sum":
+        return np.bincount(index, weights=values, minlength=size).tolist()  # type: ignore[no-any-return]
+    empty = counts == 0
+    if agg == "mean":
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result = np.bincount(index, weights=values, minlength=size) / counts
+    elif agg in ("min", "max"):
+        result = np.full(size, np.inf if agg == "min" else -np.inf)
+        (np.minimum if agg == "min" else np.maximum).at(result, index, values)
+    else:
+        # linear interpolation between the closest ranks, as numpy.percentile does
+        q = _quantile(agg) or 0.0
+        ordered = values[np.lexsort((values, index))]
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        position = starts + q * np.maximum(counts - 1, 0)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.ceil(position).astype(np.int64)
+        if ordered.size:
+            lower, upper = np.minimum(lower, ordered.size - 1), np.minimum(upper, ordered.size - 1)
+            result = ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+        else:
+            result = np.zeros(size)
+    return [None if is_empty else float(value) for value, is_empty in zip(result.tolist(), empty.tolist())]
+
+
+def _aggregate_python(groups: list[list[float]], agg: str) -> list[Optional[float]]:
+    if agg == "count":
+        return [len(group) for group in groups]
+    if agg == "sum":
+        return [math.fsum(group) for group in groups]
+    result: list[Optional[float]] = []
+    q = _quantile(agg)
+    for group in groups:
+        if not group:
+            result.append(None)
+        elif agg == "mean":
+            result.append(math.fsum(group) / len(group))
+        elif agg == "min":
+            result.append(min(group))
+        elif agg == "max":
+            result.append(max(group))
+        else:
+            ordered = sorted(group)
+            position = (q or 0.0) * (len(ordered) - 1)
+            lower = ordered[math.floor(position)]
+            result.append(lower + (ordered[math.ceil(position)] - lower) * (position - math.floor(position)))
+    return result
+
+
+def _bucketize_numpy(
+    epochs: Any, edges: tuple[float, ...], series: Mapping[str, Any], aggs: Mapping[str, str]
+) -> tuple[dict[str, list[Optional[float]]], list[bool]]:
+    size = len(edges) - 1
+    index = np.searchsorted(np.asarray(edges), epochs, side="right") - 1
+    inside = (index >= 0) & (index < size)
+    index = index[inside]
+    columns = {}
+    for name, column in series.items():
+        data = np.zeros(len(epochs)) if column is None else np.asarray(column, dtype=float)
+        columns[name] = _aggregate_numpy(index, data[inside], aggs[name], size)
+    return columns, (np.bincount(index, minlength=size) > 0).tolist()
+
+
+def _bucketize_python(
+    epochs: Sequence[float], edges: tuple[float, ...], series: Mapping[str, Any], aggs: Mapping[str, str]
+) -> tuple[dict[str, list[Optional[float]]], list[bool]]:
+    size = len(edges) - 1
+    positions = [bisect.bisect_right(edges, t) - 1 for t in epochs]
+    occupied = [False] * size
+    for position in positions:
+        if 0 <= position < size:
+            occupied[position] = True
+    columns = {}
+    for name, column in series.items():
+        groups: list[list[float]] = [[] for _ in range(size)]
+        for position, value in zip(positions, [0.0] * len(positions) if column is None else column):
+            if 0 <= position < size and value is not None and math.isfinite(value):
+                groups[position].append(float(value))
+        columns[name] = _aggregate_python(groups, aggs[name])
+    return columns, occupied
+
+
+def resample(
+    timestamps: Any,
+    values: Union[Sequence[Any], Mapping[str, Sequence[Any]], None] = None,
+    *,
+    interval: Union[str, datetime.timedelta] = "1h",
+    agg: Union[str, Mapping[str, str]] = "mean",
+    fill: FillMethod = "null",
+    tz: Union[str, datetime.tzinfo, None] = None,
+    start: Any = None,
+    end: Any = None,
+    date_key: str = "date",
+    value_key: str = "value",
+    date_format: Optional[str] = None,
+) -> list[dict[str, Any]]:
+    """
+    Bucket irregular timestamped values into fixed intervals, in the format expected by
+    `line_chart`, `area_chart` and `bar_chart`.
+
+    Uses NumPy when it is installed and falls back to pure Python otherwise.
+    Day, week and month buckets start at local midnight in `tz`, also across DST changes.
+
+    Args:
+        timestamps (Any): Datetimes, ISO strings, POSIX seconds or a NumPy `datetime64` array (read as UTC).
+            Naive datetimes and ISO strings without offset are read in `tz`.
+        values (Union[Sequence[Any], Mapping[str, Sequence[Any]], None]): Values aligned with `timestamps`,
+            or a mapping of series name to values. When not set, events are counted.
+        interval (Union[str, datetime.timedelta]): Bucket width: `"30s"`, `"15min"`, `"1h"`, `"1d"`, `"1w"`, `"1mo"`.
+        agg (Union[str, Mapping[str, str]]): `"sum"`, `"mean"`, `"min"`, `"max"`, `"count"`, `"median"`
+            or a percentile such as `"p95"`; a mapping sets it per series.
+        fill (Literal["null", "zero", "previous", "drop"]): How to report buckets without values.
+            Sums and counts of empty buckets are always 0.
+        tz (Union[str, datetime.tzinfo, None]): Time zone of the bucket boundaries and labels, UTC if not set.
+        start (Any): Start of the first bucket, the earliest timestamp if not set.
+        end (Any): A moment inside the last bucket, the latest timestamp if not set.
+        date_key (str): Key of the bucket label in each row.
+        value_key (str): Key of the value when `values` is a single sequence.
+        date_format (Optional[str]): `strftime` format of the bucket labels, ISO 8601 if not set.
+
+    Returns:
+        list[dict[str, Any]]: One row per bucket: `{date_key: label, series: value, ...}`.
+
+    Example:
+    ```python
+    rows = resample(event_times, latencies, interval="5min", agg={"latency": "p95"}, tz="Europe/Madrid")
+    ui.line_chart(rows, data_key="date", series=[{"name": "latency"}])
+    ```
+    """
+    zone = _to_tz(tz)
+    step, unit = _parse_interval(interval)
+    if values is None:
+        series: Mapping[str, Any] = {"count": None}
+        agg = "count"
+    elif isinstance(values, Mapping):
+        series = values
+    else:
+        series = {value_key: values}
+    aggs = {name: agg if isinstance(agg, str) else agg.get(name, "mean") for name in series}
+    for series_agg in aggs.values():
+        _quantile(series_agg)
+
+    epochs = _epochs(timestamps, zone)
+    if len(epochs) == 0 and (start is None or end is None):
+        return []
+    first = _to_epoch(start, zone) if start is not None else float(min(epochs))
+    last = _to_epoch(end, zone) if end is not None else float(max(epochs))
+    edges, starts = _bucket_edges(first, last, step, unit, zone)
+    bucketize = _bucketize_numpy if np else _bucketize_python
+    columns, occupied = bucketize(epochs, edges, series, aggs)
+
+    rows: list[dict[str, Any]] = []
+    previous: dict[str, Optional[float]] = dict.fromkeys(series)
+    for i, moment in enumerate(starts):
+        if fill == "drop" and not occupied[i]:
+            continue
+        row: dict[str, Any] = {date_key: moment.strftime(date_format) if date_format else moment.isoformat()}
+        for name, column in columns.items():
+            value = column[i]
+            if value is None and fill == "zero":
+                value = 0
+            elif value is None and fill == "previous":
+                value = previous[name]
+            row[name] = previous[name] = value
+        rows.append(row)
+    return rows
@@ -0,0 +1,90 @@
+import random
+from typing import Any
+
+import pytest
+
+from routelit_mantine import binning
+from routelit_mantine.binning import BinKind, BinRangeError, bin_points
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(binning, "np", None)
+    return str(request.param)
+
+
+def _series(points: list[tuple[float, float]]) -> list[dict[str, Any]]:
+    return [{"name": "s", "color": "red", "data": [{"x": x, "y": y} for x, y in points]}]
+
+
+class TestBinPoints:
+    def test_grid_counts(self, backend: str) -> None:
+        points = [(0.1, 0.1), (0.2, 0.3), (0.9, 0.9), (1.0, 1.0)]
+        result = bin_points(_series(points), {"x": "x", "y": "y"}, "grid", bins=2, x_range=(0, 1), y_range=(0, 1))
+        assert result["type"] == "grid"
+        assert result["size"] == (0.5, 0.5)
+        cells = sorted(map(tuple, result["series"][0]["cells"]))
+        # half-cell units: (1, 1) is the lower-left cell, (3, 3) the upper-right one
+        assert cells == [(1, 1, 2), (3, 3, 2)]
+
+    def test_hex_keeps_every_point(self, backend: str) -> None:
+        rng = random.Random(7)  # noqa: S311
+        points = [(rng.gauss(0, 1), rng.gauss(0, 1)) for _ in range(2000)]
+        result = bin_points(_series(points), {"x": "x", "y": "y"}, "hex", bins=20)
+        cells = result["series"][0]["cells"]
+        assert sum(count for _, _, count in cells) == len(points)
+        assert len(cells) < len(points)
+
+    def test_column_mapping_and_non_finite_values(self, backend: str) -> None:
+        data = [{"name": "cols", "color": "blue", "data": {"x": [0.0, 1.0, float("nan")], "y": [0.0, 1.0, 2.0]}}]
+        result = bin_points(data, {"x": "x", "y": "y"}, "grid", bins=4, x_range=(0, 1), y_range=(0, 2))
+        assert result["series"][0]["name"] == "cols"
+        assert sum(count for _, _, count in result["series"][0]["cells"]) == 2
+
+    @pytest.mark.parametrize("kind", ["grid", "hex"])
+    def test_drops_points_outside_range(self, backend: str, kind: BinKind) -> None:
+        points = [(0.5, 0.5), (-3.0, 0.5), (0.5, 7.0), (1.0, 1.0)]
+        result = bin_points(_series(points), {"x": "x", "y": "y"}, kind, bins=2, x_range=(0, 1), y_range=(0, 1))
+        assert sum(count for _, _, count in result["series"][0]["cells"]) == 2
+
+    def test_drops_none_coordinates(self, backend: str) -> None:
+        data = [
+            {"name": "s", "color": "red", "data": [{"x": 0.2, "y": None}, {"x": None, "y": 0.3}, {"x": 0.4, "y": 0.4}]}
+        ]
+        kinds: tuple[BinKind, ...] = ("grid", "hex")
+        for kind in kinds:
+            result = bin_points(data, {"x": "x", "y": "y"}, kind, bins=2)
+            assert sum(count for _, _, count in result["series"][0]["cells"]) == 1
+
+    def test_backends_agree(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        pytest.importorskip("numpy")
+        rng = random.Random(1)  # noqa: S311
+        data = _series([(rng.random(), rng.random()) for _ in range(500)])
+        expected = bin_points(data, {"x": "x", "y": "y"}, "hex", bins=10)
+        monkeypatch.setattr(binning, "np", None)
+        actual = bin_points(data, {"x": "x", "y": "y"}, "hex", bins=10)
+        assert sorted(map(tuple, actual["series"][0]["cells"])) == sorted(map(tuple, expected["series"][0]["cells"]))
+
+    def test_degenerate_and_invalid_ranges(self, backend: str) -> None:
+        result = bin_points(_series([(0.0, 0.2)]), {"x": "x", "y": "y"}, "grid", bins=2, x_range=(0, 0), y_range=(0, 1))
+        assert result["origin"] == (-0.5, 0.0)
+        assert result["size"] == (0.5, 0.5)
+        assert sum(count for _, _, count in result["series"][0]["cells"]) == 1
+        with pytest.raises(BinRangeError):
+            bin_points(_series([(0.0, 0.0)]), {"x": "x", "y": "y"}, x_range=(1, 0))
+        with pytest.raises(BinRangeError):
+            bin_points(_series([(0.0, 0.0)]), {"x": "x", "y": "y"}, y_range=(0, float("inf")))
+
+    def test_backends_agree_with_infinite_coordinates(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        pytest.importorskip("numpy")
+        points = [(0.1, 0.1), (0.5, 0.6), (float("inf"), 0.5), (0.9, float("-inf")), (0.8, 0.9)]
+        expected = bin_points(_series(points), {"x": "x", "y": "y"}, "grid", bins=4)
+        monkeypatch.setattr(binning, "np", None)
+        actual = bin_points(_series(points), {"x": "x", "y": "y"}, "grid", bins=4)
+        assert actual["origin"] == expected["origin"] == (0.1, 0.1)
+        assert actual["size"] == expected["size"]
+        assert sorted(map(tuple, actual["series"][0]["cells"])) == sorted(map(tuple, expected["series"][0]["cells"]))
+        assert sum(count for _, _, count in actual["series"][0]["cells"]) == 3
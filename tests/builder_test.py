@@ -1,10 +1,31 @@
+import asyncio
+import copy
+import datetime
+import os
+import subprocess
+import sys
+import threading
 from collections.abc import Mapping
 from typing import Any, Optional
 
 import pytest
-from routelit import PropertyDict, RouteLitRequest
+from routelit import PropertyDict, RouteLit, RouteLitRequest
+from routelit.utils.misc import compare_elements
 
-from routelit_mantine.builder import RLBuilder
+from routelit_mantine import Page, app, session_state_summary, state, uses_session_state
+from routelit_mantine import builder as builder_module
+from routelit_mantine.builder import (
+    DateAvailability,
+    DuplicateItemKeyError,
+    RLBuilder,
+    StaticWidgetError,
+    VirtualListCountError,
+)
+from routelit_mantine.cache import LRUCache
+from routelit_mantine.mixins import dates as dates_mixin
+from routelit_mantine.mixins.charts import ChartsMixin
+from routelit_mantine.pagination import TextSourceError
+from routelit_mantine.state import SessionStateRegistry, value_size
 
 
 class MockRLRequest(RouteLitRequest):
@@ -33,6 +54,7 @@ class MockRLRequest(RouteLitRequest):
         self.pathname = pathname
         self.host = host
         self._method = method
+        super().__init__()
 
     def get_headers(self) -> dict[str, str]:
         return self.headers
@@ -108,9 +130,636 @@ class TestRLBuilder:
         assert app_shell_props["navbarProps"]["width"] == 200
         assert app_shell_props["withBorder"] is True
 
+    def test_route_cache_props(self, builder: RLBuilder) -> None:
+        main_props = builder._main.root_element.props
+        assert main_props["routeCacheSize"] == RLBuilder.route_cache_size
+        assert main_props["routeCacheTtl"] == RLBuilder.route_cache_ttl
+        assert "cacheRoute" not in main_props
+        builder.set_route_cacheable(False)
+        assert main_props["cacheRoute"] is False
+
     def test_container_layout_builder(self, builder: RLBuilder) -> None:
         nested = builder.container(fluid=True, size="xl", bg="var(--mantine-color-blue-light)")
         assert nested.root_element.name == "container"
         assert nested.root_element.props["fluid"] is True
         assert nested.root_element.props["size"] == "xl"
         assert nested.root_element.props["bg"] == "var(--mantine-color-blue-light)"
+
+    def test_sparkline_grid_single_element(self, builder: RLBuilder) -> None:
+        rows = [[1, 2, 3], [3, 2, None]]
+        builder.sparkline_grid(rows, labels=["a", "b"], columns=2)
+        element = builder._main.elements[-1]
+        assert element.name == "sparklinegrid"
+        assert element.props["data"] == rows
+        assert element.props["labels"] == ["a", "b"]
+        assert element.props["columns"] == 2
+        assert "cellHeight" not in element.props
+
+    def test_scatter_chart_canvas_renderer(self, builder: RLBuilder) -> None:
+        data = [{"name": "a", "color": "blue", "data": [{"x": 1, "y": 2}]}]
+        builder.scatter_chart(data, {"x": "x", "y": "y"})
+        builder.scatter_chart(data, {"x": "x", "y": "y"}, renderer="canvas")
+        builder.bubble_chart([{"x": 1, "y": 2, "z": 3}], {"x": "x", "y": "y", "z": "z"}, (10, 100), renderer="canvas")
+        svg, canvas, bubble = builder._main.elements[-3:]
+        assert svg.name == "scatterchart"
+        assert canvas.name == "canvasscatterchart"
+        assert svg.props["data"] == data
+        assert canvas.props["dataHash"] == svg.props["dataHash"]
+        assert bubble.name == "canvasbubblechart"
+
+    def test_heatmap_canvas_renderer(self, builder: RLBuilder) -> None:
+        data = {"2024-01-01": 3, "2025-06-30": 1}
+        with builder.heatmap(data, rect_size=8, gap=2, start_date="2023-01-01", renderer="canvas") as heatmap:
+            pass
+        assert heatmap.root_element.name == "canvasheatmap"
+        assert heatmap.root_element.props["rectSize"] == 8
+        assert heatmap.root_element.props["data"] == data
+        assert builder.heatmap(data).root_element.name == "heatmap"
+
+    def test_scatter_chart_binning(self, builder: RLBuilder) -> None:
+        points = [{"x": i % 10, "y": i // 10} for i in range(100)]
+        data = [{"name": "a", "color": "blue", "data": points}]
+        builder.scatter_chart(data, {"x": "x", "y": "y"}, bin="hex", bins=5)
+        builder.scatter_chart(data, {"x": "x", "y": "y"}, bin="grid", bins=5)
+        hexes, grid = builder._main.elements[-2:]
+        assert hexes.name == grid.name == "canvasscatterchart"
+        assert "data" not in hexes.props
+        assert hexes.props["bins"]["type"] == "hex"
+        assert grid.props["bins"]["type"] == "grid"
+        assert sum(cell[2] for cell in grid.props["bins"]["series"][0]["cells"]) == len(points)
+        assert len(grid.props["bins"]["series"][0]["cells"]) == 25
+
+    def test_chart_data_sent_once_per_session(self, mock_request: MockRLRequest) -> None:
+        session_state = PropertyDict({})
+        data = [{"month": "Jan", "a": 1}]
+
+        def run(request: MockRLRequest) -> Any:
+            builder = RLBuilder(request=request, session_state=session_state, fragments={})
+            builder.line_chart(data, "month", [{"name": "a"}], key="chart")
+            return builder._main.elements[-1].props
+
+        first = run(mock_request)
+        assert first["data"] == data
+        second = run(mock_request)
+        assert "data" not in second
+        assert second["dataHash"] == first["dataHash"]
+        data.append({"month": "Feb", "a": 2})
+        changed = run(mock_request)
+        assert changed["data"] == data
+        assert changed["dataHash"] != first["dataHash"]
+        miss = MockRLRequest(method="POST", json={"uiEvent": {"type": "datamiss", "componentId": "chart", "data": {}}})
+        assert run(miss)["data"] == data
+
+    def test_chart_data_version_skips_hashing(
+        self, mock_request: MockRLRequest, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from routelit_mantine.mixins import charts
+
+        session_state = PropertyDict({})
+        hashed: list[Any] = []
+        monkeypatch.setattr(charts, "fingerprint", lambda value: hashed.append(value) or str(len(value)))
+
+        def run(data: list[dict[str, Any]], version: int) -> Any:
+            builder = RLBuilder(request=mock_request, session_state=session_state, fragments={})
+            builder.line_chart(data, "month", [{"name": "a"}], key="chart", data_version=version)
+            return builder._main.elements[-1].props
+
+        assert "data" in run([{"month": "Jan", "a": 1}], 1)
+        assert "data" not in run([{"month": "Jan", "a": 1}], 1)
+        assert len(hashed) == 1
+        assert run([{"month": "Jan", "a": 1}, {"month": "Feb", "a": 2}], 2)["data"]
+        assert len(hashed) == 2
+
+    def test_chart_data_hash_kept_for_same_rows(
+        self, mock_request: MockRLRequest, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from routelit_mantine.mixins import charts
+
+        session_state = PropertyDict({})
+        hashed: list[Any] = []
+        monkeypatch.setattr(charts, "fingerprint", lambda value: hashed.append(value) or f"h{len(hashed)}")
+        monkeypatch.setattr(charts, "_row_digests", LRUCache(8))
+        data = [{"month": "Jan", "a": 1}, {"month": "Feb", "a": 2}]
+
+        def run() -> Any:
+            builder = RLBuilder(request=mock_request, session_state=session_state, fragments={})
+            builder.line_chart(data, "month", [{"name": "a"}], key="chart")
+            return builder._main.elements[-1].props
+
+        assert "data" in run()
+        assert "data" not in run()
+        assert len(hashed) == 1
+        data[1]["a"] = 3  # changed in place
+        assert run()["data"] == data
+        assert len(hashed) == 2
+        data.append({"month": "Mar", "a": 4})
+        assert run()["data"] == data
+        assert len(hashed) == 3
+
+    def test_chart_data_sent_as_columns(self, builder: RLBuilder, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(RLBuilder, "chart_columnar_min_rows", 3)
+        rows = [{"t": i, "a": i * 2, "b": None} for i in range(3)]
+        builder.line_chart(rows, "t", [{"name": "a"}], key="columns")
+        builder.line_chart(rows[:2], "t", [{"name": "a"}], key="rows")
+        builder.line_chart([*rows, {"t": 3}], "t", [{"name": "a"}], key="ragged")
+        columns, small, ragged = (element.props for element in builder._main.elements[-3:])
+        assert columns["dataEncoding"] == "columns"
+        assert columns["data"] == {"columns": {"t": [0, 1, 2], "a": [0, 2, 4], "b": [None] * 3}, "length": 3}
+        assert "dataEncoding" not in small
+        assert "dataEncoding" not in ragged
+
+    def test_prefetch_run_omits_chart_data(self) -> None:
+        request = MockRLRequest(method="POST", json={"uiEvent": {"type": "prefetch", "componentId": "", "data": {}}})
+        builder = RLBuilder(request=request, session_state=PropertyDict({}), fragments={})
+        assert builder.is_prefetch
+        builder.nav_link("/reports", "Reports", prefetch="hover")
+        builder.line_chart([{"t": 1, "a": 2}], "t", [{"name": "a"}], key="chart")
+        link, chart = builder._main.elements[-2:]
+        assert link.props["prefetch"] == "hover"
+        assert "data" not in chart.props
+        assert "dataHash" not in chart.props
+
+    def test_prefetch_request_leaves_session_untouched(self) -> None:
+        rl = app.RouteLit(BuilderClass=RLBuilder)
+
+        @rl.fragment("summary")
+        def summary(ui: RLBuilder) -> None:
+            ui.text_input("Search", key="search")
+
+        def view(ui: RLBuilder) -> None:
+            ui.session_state["visits"] = ui.session_state.get("visits", 0) + 1
+            ui.session_state["history"] = ui.session_state.get("history") or []
+            ui.session_state["history"].append("reports")
+            ui.text("Reports")
+            summary(ui)
+
+        rl.handle_post_request(view, MockRLRequest(method="POST", pathname="/reports"))
+        stored = copy.deepcopy(rl.session_storage)
+        prefetch = {"uiEvent": {"type": "prefetch", "componentId": "", "data": {}}}
+        request = MockRLRequest(method="POST", json=prefetch, pathname="/reports")
+        response = rl.handle_post_request(view, request)
+        (action,) = response["actions"]
+        assert action["type"] == "prefetch"
+        assert {"provider", "fragment", "text", "textinput"} <= set(action["components"])
+        assert action["components"] == sorted(set(action["components"]))
+
+        async def stream() -> list[Any]:
+            return [action async for action in rl.handle_post_request_async_stream(view, request)]
+
+        assert [action.type for action in asyncio.run(stream())] == ["prefetch"]
+        assert rl.session_storage == stored
+        assert stored[request.get_session_keys().state_key]["visits"] == 1
+
+    def test_memo_reuses_subtree_while_deps_unchanged(self, mock_request: MockRLRequest) -> None:
+        session_state = PropertyDict({})
+        calls = []
+
+        def run(category: str) -> Any:
+            builder = RLBuilder(request=mock_request, session_state=session_state, fragments={})
+            with builder.memo("products", deps=(category,)) as cached:
+                if not cached:
+                    calls.append(category)
+                    with builder.container(key="card"):
+                        builder.text(category, key="title")
+            return builder._main.elements[-1]
+
+        first = run("books")
+        second = run("books")
+        assert calls == ["books"]
+        assert second.name == "memo"
+        assert second.children is not None and second.children[0] is not first.children[0]  # type: ignore[index]
+        assert second.children[0].children[0].props == first.children[0].children[0].props  # type: ignore[index]
+        assert second.children[0].children[0].address == first.children[0].children[0].address  # type: ignore[index]
+        run("games")
+        assert calls == ["books", "games"]
+        builder = RLBuilder(request=mock_request, session_state=session_state, fragments={})
+        assert builder.memo_stats == {"hits": 1, "misses": 2, "size": 1}
+
+    def test_memo_cache_size(self, builder: RLBuilder, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(RLBuilder, "memo_cache_size", 2)
+        for key in ("a", "b", "c"):
+            with builder.memo(key, deps=[1]):
+                builder.text(key)
+        assert builder.memo_stats == {"hits": 0, "misses": 3, "size": 2}
+
+    def test_static_shared_across_sessions(self, mock_request: MockRLRequest) -> None:
+        RLBuilder.clear_static_cache()
+        calls = []
+
+        def run(locale: str) -> Any:
+            builder = RLBuilder(request=mock_request, session_state=PropertyDict({}), fragments={})
+            with builder.static("nav", variant=locale) as cached:
+                if not cached:
+                    calls.append(locale)
+                    builder.nav_link("/", label=f"home-{locale}", key="home")
+            return builder._main.elements[-1]
+
+        first = run("en")
+        second = run("en")
+        assert calls == ["en"]
+        assert second.children[0].props == first.children[0].props  # type: ignore[index]
+        assert second.children[0].props["label"] == "home-en"  # type: ignore[index]
+        run("es")
+        assert calls == ["en", "es"]
+        RLBuilder.clear_static_cache("nav")
+        run("en")
+        assert calls == ["en", "es", "en"]
+        RLBuilder.clear_static_cache()
+
+    def test_static_sessions_do_not_share_state(self, mock_request: MockRLRequest) -> None:
+        RLBuilder.clear_static_cache()
+
+        def run(session_state: PropertyDict) -> RLBuilder:
+            builder = RLBuilder(request=mock_request, session_state=session_state, fragments={})
+            with builder.static("nav") as cached:
+                if not cached:
+                    with builder.group(key="links"):
+                        builder.nav_link("/", label="home", key="home")
+            return builder
+
+        first = run(PropertyDict({}))
+        first._main.elements[-1].children[0].children[0].props["label"] = "changed"  # type: ignore[index]
+        second = run(PropertyDict({}))
+        assert second._main.elements[-1].children[0].children[0].props["label"] == "home"  # type: ignore[index]
+        second._main.elements[-1].children[0].children[0].props["label"] = "changed"  # type: ignore[index]
+        assert run(PropertyDict({}))._main.elements[-1].children[0].children[0].props["label"] == "home"  # type: ignore[index]
+
+        session_a = PropertyDict({"name": "alice"})
+        builder = RLBuilder(request=mock_request, session_state=session_a, fragments={})
+        with pytest.raises(StaticWidgetError), builder.static("form"), builder.group(key="fields"):
+            builder.text_input("Name", key="name")
+        session_b = PropertyDict({})
+        with run(session_b).static("form") as cached:
+            assert not cached
+        assert "name" not in session_b
+        RLBuilder.clear_static_cache()
+
+    def test_each_keeps_row_keys_stable(self, mock_request: MockRLRequest) -> None:
+        def run(items: list[dict[str, Any]]) -> Any:
+            builder = RLBuilder(request=mock_request, session_state=PropertyDict({}), fragments={})
+            with builder.stack(key="list") as stack:
+                for item, row in builder.each(items, key=lambda x: x["id"], prefix="todo"):
+                    row.text(item["title"])
+                    row.checkbox(item["title"], value=item["done"])
+            return stack.root_element
+
+        items = [{"id": 1, "title": "a", "done": False}, {"id": 2, "title": "b", "done": True}]
+        first = run(items)
+        second = run([{"id": 3, "title": "c", "done": False}, *items])
+        assert [row.key for row in first.children] == ["todo_1", "todo_2"]
+        assert [row.key for row in second.children] == ["todo_3", "todo_1", "todo_2"]
+        assert [c.key for c in second.children[1].children] == [c.key for c in first.children[0].children]
+        actions = compare_elements(first.children, second.children, target="app")
+        assert [type(action).__name__ for action in actions] == ["AddAction"]
+
+    def test_each_duplicate_keys(self, builder: RLBuilder) -> None:
+        with pytest.raises(DuplicateItemKeyError):
+            for _item, row in builder.each([1, 1], key=lambda x: x):
+                row.text("x")
+
+    def test_scroll_area_virtualize(self, builder: RLBuilder) -> None:
+        with builder.scroll_area(key="feed", virtualize=True, estimate_item_size=32, h=300) as feed:
+            feed.text("a")
+        assert feed.root_element.name == "virtualscrollarea"
+        assert feed.root_element.props == {"estimateItemSize": 32, "h": 300}
+        plain = builder.scroll_area(key="plain", overscan=3)
+        assert plain.root_element.name == "scrollarea"
+        assert "overscan" not in plain.root_element.props
+
+    def test_virtual_list_builds_window_around_shown_range(self) -> None:
+        session_state = PropertyDict({})
+        built: list[int] = []
+
+        def run(request: MockRLRequest) -> Any:
+            builder = RLBuilder(request=request, session_state=session_state, fragments={})
+            log = builder.virtual_list(
+                1000, lambda row, i: built.append(i) or row.text(str(i)), key="log", page_size=50
+            )
+            return log.root_element
+
+        first = run(MockRLRequest())
+        assert first.props["start"] == 0
+        assert first.props["count"] == 1000
+        assert [c.key for c in first.children] == [f"log_{i}" for i in range(50)]
+        built.clear()
+        event = {"type": "rangechange", "componentId": "log", "data": {"start": 420, "end": 440}}
+        second = run(MockRLRequest(method="POST", json={"uiEvent": event}))
+        assert second.props["start"] == 400
+        assert built == list(range(400, 500))
+        assert session_state["__virtual_range_log"] == [420, 440]
+
+    def test_select_virtualize_prop(self, builder: RLBuilder) -> None:
+        options = [str(i) for i in range(1000)]
+        builder.select("Country", options, key="country", virtualize=True)
+        builder.tags_input("Tags", options, key="tags")
+        select, tags = builder._main.elements[-2:]
+        assert select.props["virtualize"] is True
+        assert "virtualize" not in tags.props
+
+    def test_virtual_list_requires_count(self, builder: RLBuilder) -> None:
+        with pytest.raises(VirtualListCountError):
+            builder.virtual_list(render_item=lambda row, i: row.text(str(i)))
+
+    def test_paginated_sequence(self) -> None:
+        session_state = PropertyDict({})
+        items = list(range(45))
+
+        def run(page: Optional[int] = None) -> Any:
+            event = {"uiEvent": {"type": "change", "componentId": "nums", "data": {"value": page}}}
+            request = MockRLRequest(method="POST", json=event if page else None)
+            builder = RLBuilder(request=request, session_state=session_state, fragments={})
+            shown, body = builder.paginated(items, page_size=20, key="nums")
+            return shown, body.root_element, builder._main.elements[-1]
+
+        shown, body, element = run()
+        assert shown == list(range(20))
+        assert element.props["value"] == 1
+        assert element.props["total"] == 3
+        assert body.key == "nums_page_1"
+        shown, body, element = run(3)
+        assert shown == list(range(40, 45))
+        assert body.key == "nums_page_3"
+        assert run(9)[2].props["value"] == 3
+
+    def test_paginated_rejects_text(self, builder: RLBuilder) -> None:
+        with pytest.raises(TextSourceError):
+            builder.paginated("abc", key="text")
+        with pytest.raises(TextSourceError):
+            builder.paginated(b"abc", key="bytes")
+
+    def test_paginated_source_caches_and_prefetches_pages(self) -> None:
+        session_state = PropertyDict({})
+        fetched: list[Any] = []
+        threads: set[str] = set()
+
+        class Source:
+            def count(self) -> Optional[int]:
+                return None
+
+            def fetch_page(self, cursor: Any, page_size: int) -> Page:
+                fetched.append(cursor)
+                threads.add(threading.current_thread().name.split("_")[0])
+                start = cursor or 0
+                return Page(list(range(start, min(start + page_size, 25))), start + page_size if start < 20 else None)
+
+        def run(page: Optional[int] = None, deps: Any = ()) -> Any:
+            event = {"uiEvent": {"type": "change", "componentId": "src", "data": {"value": page}}}
+            request = MockRLRequest(method="POST", json=event if page else None)
+            builder = RLBuilder(request=request, session_state=session_state, fragments={})
+            shown, _ = builder.paginated(Source(), page_size=10, deps=deps, key="src")
+            return shown, builder._main.elements[-1].props
+
+        shown, props = run()
+        assert shown == list(range(10))
+        assert props["total"] == 2
+        shown, props = run(3)
+        assert shown == [20, 21, 22, 23, 24]
+        assert props["total"] == 3
+        assert sorted(fetched, key=lambda c: c or 0) == [None, 10, 20]  # page 2 was prefetched, then claimed
+        assert threads == {threading.current_thread().name.split("_")[0], "routelit-page-prefetch"}
+        assert run(1)[0] == list(range(10))
+        assert len(fetched) == 3
+        assert run(deps="other")[1]["value"] == 1
+        assert len(fetched) == 4
+
+    def test_widget_state_evicted_after_idle_runs(
+        self, mock_request: MockRLRequest, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(RLBuilder, "widget_state_max_idle_runs", 1)
+        session_state = PropertyDict({})
+
+        def run(show_drawer: bool) -> None:
+            builder = RLBuilder(request=mock_request, session_state=session_state, fragments={})
+            builder.checkbox("Agree", key="agree", checked=False)
+            if show_drawer:
+                builder.checkbox("Remember", key="remember", checked=True)
+            builder.on_end()
+
+        run(True)
+        assert session_state["remember"] is True
+        run(False)
+        run(False)
+        assert "remember" not in session_state
+        assert "__remember_default" not in session_state
+        assert session_state["agree"] is False
+        assert session_state_summary()["sessions"] >= 1
+
+    def test_widget_state_metrics_forget_page_navigated_from(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(RLBuilder, "widget_state_metrics", True)
+        monkeypatch.setattr(state, "session_state_registry", SessionStateRegistry())
+        monkeypatch.setattr(builder_module, "session_state_registry", state.session_state_registry)
+
+        def run(request: MockRLRequest) -> None:
+            builder = RLBuilder(request=request, session_state=PropertyDict({"name": "x" * 100}), fragments={})
+            builder.text_input("Name", key="name")
+            builder.on_end()
+
+        run(MockRLRequest(session_id="nav", pathname="/a", method="POST"))
+        assert session_state_summary()["max_bytes"] > 100
+        navigate = {"uiEvent": {"type": "navigate", "componentId": "", "data": {}}}
+        run(MockRLRequest(session_id="nav", pathname="/b", referrer="http://localhost/a", json=navigate, method="POST"))
+        summary = session_state_summary()
+        assert summary["sessions"] == 1
+        assert summary["max_bytes"] == value_size("x" * 100)
+
+    def test_widget_state_counts_streamed_runs_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(RLBuilder, "widget_state_metrics", True)
+        rl = RouteLit(BuilderClass=RLBuilder)
+
+        def view(ui: RLBuilder) -> None:
+            ui.text_input("Name", key="name")
+
+        async def stream(request: MockRLRequest) -> None:
+            async for _action in rl.handle_post_request_async_stream(view, request):
+                pass
+
+        request = MockRLRequest(session_id="stream", method="POST")
+        for _ in range(2):
+            asyncio.run(stream(request))
+        assert rl.session_storage[request.get_session_keys().state_key][state.WIDGET_STATE_KEY]["run"] == 2
+
+    def test_parallel_fragments(self, mock_request: MockRLRequest) -> None:
+        rl = RouteLit()
+        builder = RLBuilder(request=mock_request, session_state=PropertyDict({}), fragments={})
+        threads = {}
+        # both fragments must be waiting at once, which only happens if they run concurrently
+        barrier = threading.Barrier(2, timeout=5)
+        finished: list[str] = []
+
+        def slow(name: str) -> Any:
+            @rl.fragment(name)
+            def fragment(ui: RLBuilder) -> str:
+                threads[name] = threading.current_thread().name
+                barrier.wait()
+                ui.text(name, key="text")
+                finished.append(name)
+                return name
+
+            return fragment
+
+        @rl.fragment("cart")
+        @uses_session_state
+        def cart(ui: RLBuilder) -> None:
+            threads["cart"] = threading.current_thread().name
+            assert sorted(finished) == ["orders", "stock"]
+            ui.session_state["cart"] = 1
+
+        results = builder.parallel(slow("orders"), cart, slow("stock"))
+        assert results == ["orders", None, "stock"]
+        slots = builder._main.elements[-3:]
+        assert [slot.name for slot in slots] == ["slot"] * 3
+        assert [slot.children[0].key for slot in slots] == ["orders", "cart", "stock"]  # type: ignore[index]
+        assert slots[0].children[0].children[0].props["children"] == "orders"  # type: ignore[index]
+        assert set(builder.get_fragments()) == {"orders", "stock", "cart"}
+        assert threads["cart"] == threading.current_thread().name
+        assert threads["orders"].startswith("routelit-fragment")
+        # fragments registering concurrently may overwrite each other's (empty) arguments
+        params = rl.session_storage[mock_request.get_session_keys().fragment_params_key]
+        assert params["cart"] == {"args": (), "kwargs": {}}
+
+    def test_parallel_charts_share_session_caches(self, builder: RLBuilder) -> None:
+        data = [{"month": "Jan", "a": 1}]
+
+        def chart(ui: RLBuilder) -> None:
+            with ui.memo("chart", deps=len(data)) as cached:
+                if not cached:
+                    ui.bar_chart(data, "month", [{"name": "a"}], key="chart", data_version=1)
+
+        builder.parallel(*[chart] * 8)
+        assert builder.memo_stats["hits"] + builder.memo_stats["misses"] == 8
+        assert len(builder.session_state["__chart_data_hashes"]) == 1
+        assert builder.session_state["__chart_data_versions"].get("chart")[0] == 1
+
+    def test_parallel_propagates_errors(self, builder: RLBuilder) -> None:
+        def broken(ui: RLBuilder) -> None:
+            raise KeyError("missing")
+
+        with pytest.raises(KeyError):
+            builder.parallel(lambda ui: ui.text("ok"), broken)
+
+    def test_numpy_imported_on_first_use(self) -> None:
+        code = (
+            "import sys, routelit_mantine as rm; "
+            "print('numpy' in sys.modules); "
+            "rm.resample([0, 60], [1, 2], interval='1min'); "
+            "print('numpy' in sys.modules)"
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True, env=env)  # noqa: S603
+        assert output.stdout.split("\n")[:2] == ["False", "True"]
+
+    def test_subclass_extends_mixin_methods(self, mock_request: MockRLRequest) -> None:
+        class Builder(RLBuilder):
+            def table(self, *args: Any, **kwargs: Any) -> RLBuilder:
+                kwargs.setdefault("striped", True)
+                return super().table(*args, **kwargs)
+
+        builder = Builder(request=mock_request, session_state=PropertyDict({}), fragments={})
+        builder.table(body=[["a"]])
+        assert builder._main.elements[-1].props["striped"] is True
+        assert issubclass(Builder, ChartsMixin)
+        assert "line_chart" in dir(Builder)
+
+    def test_chart_data_cache_disabled(self, builder: RLBuilder, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(RLBuilder, "chart_data_cache_size", 0)
+        data = [{"month": "Jan", "a": 1}]
+        builder.bar_chart(data, "month", [{"name": "a"}])
+        builder.bar_chart(data, "month", [{"name": "a"}])
+        assert all(element.props["data"] == data for element in builder._main.elements[-2:])
+        assert "dataHash" not in builder._main.elements[-1].props
+
+    def test_date_picker_availability_rules(self, builder: RLBuilder) -> None:
+        availability: DateAvailability = {
+            "weekdays": [1, 2, 3, 4, 5],
+            "closed_ranges": [(datetime.date(2024, 12, 24), "2025-01-06")],
+            "closed_dates": ["2024-05-01"],
+            "open_dates": [datetime.date(2024, 6, 8)],
+        }
+        builder.date_picker("Booking", availability=availability)
+        builder.date_picker_input("Check-in", availability=availability)
+        builder.date_time_picker("Start", availability={"weekdays": [1]})
+        picker, picker_input, date_time = builder._main.elements[-3:]
+        expected = {
+            "weekdays": [1, 2, 3, 4, 5],
+            "closedRanges": [["2024-12-24", "2025-01-06"]],
+            "closedDates": ["2024-05-01"],
+            "openDates": ["2024-06-08"],
+        }
+        assert picker.props["rlAvailability"] == expected
+        assert picker_input.props["rlAvailability"] == expected
+        assert date_time.props["rlAvailability"]["weekdays"] == [1]
+        builder.date_picker("No rules")
+        assert "rlAvailability" not in builder._main.elements[-1].props
+
+    def test_format_date_picker_values(self, builder: RLBuilder) -> None:
+        assert builder._format_date_picker("2024-01-02") == datetime.date(2024, 1, 2)
+        assert builder._format_date_picker(["2024-01-02", datetime.date(2024, 1, 3)]) == [
+            datetime.date(2024, 1, 2),
+            datetime.date(2024, 1, 3),
+        ]
+        assert builder._format_date_picker(None) is None
+
+    def test_date_picker_lazy_month_availability(self, mock_request: MockRLRequest) -> None:
+        RLBuilder.clear_availability_cache()
+        calls: list[tuple[int, int]] = []
+
+        def loader(year: int, month: int) -> DateAvailability:
+            calls.append((year, month))
+            return {"closed_dates": [datetime.date(year, month, 1)]}
+
+        session_state = PropertyDict({})
+
+        def run(request: MockRLRequest) -> Any:
+            builder = RLBuilder(request=request, session_state=session_state, fragments={})
+            builder.date_picker(
+                "Room",
+                value=datetime.date(2024, 1, 15),
+                key="room",
+                availability_loader=loader,
+                availability_resource="room-1",
+                number_of_columns=2,
+            )
+            return builder._main.elements[-1].props["rlMonthAvailability"]
+
+        months = run(mock_request)
+        assert months == {"2024-01": {"closedDates": ["2024-01-01"]}, "2024-02": {"closedDates": ["2024-02-01"]}}
+        run(mock_request)
+        assert calls == [(2024, 1), (2024, 2)]
+        event = {"type": "monthchange", "componentId": "room", "data": {"month": "2024-12-01"}}
+        months = run(MockRLRequest(method="POST", json={"uiEvent": event}))
+        assert list(months) == ["2024-12", "2025-01"]
+        assert calls[-2:] == [(2024, 12), (2025, 1)]
+        RLBuilder.clear_availability_cache("room-1")
+        run(mock_request)
+        assert len(calls) == 6
+
+    def test_date_picker_availability_cached_per_loader_without_resource(self, builder: RLBuilder) -> None:
+        RLBuilder.clear_availability_cache()
+        calls: list[tuple[int, int]] = []
+
+        def loader(year: int, month: int) -> DateAvailability:
+            calls.append((year, month))
+            return {}
+
+        for availability_loader in [loader, loader, lambda year, month: loader(year, month)]:
+            builder.date_picker(
+                "Room", value=datetime.date(2024, 1, 15), key="room", availability_loader=availability_loader
+            )
+        assert calls == [(2024, 1), (2024, 1)]  # the inline loader is a new object, so it is called again
+        assert len(dates_mixin._month_availability_cache) == 0
+        other_session = RLBuilder(
+            request=MockRLRequest(session_id="other"), session_state=PropertyDict({}), fragments={}
+        )
+        other_session.date_picker("Room", value=datetime.date(2024, 1, 15), key="room", availability_loader=loader)
+        assert len(calls) == 3
+
+    def test_time_picker_generated_presets(self, builder: RLBuilder) -> None:
+        builder.time_picker("Slot", presets={"start": "08:00", "end": "18:00", "step": 5})
+        builder.time_picker("Fixed", presets=["10:00:00", "11:00:00"])
+        builder.date_time_picker("Visit", time_presets=[{"start": "08:00", "end": "12:00", "step": 15, "label": "AM"}])
+        generated, fixed, date_time = builder._main.elements[-3:]
+        assert "presets" not in generated.props
+        assert generated.props["rlPresetRanges"] == [{"start": 28800, "end": 64800, "step": 300}]
+        assert fixed.props["presets"] == ["10:00:00", "11:00:00"]
+        assert "rlPresetRanges" not in fixed.props
+        assert date_time.props["rlTimePresetRanges"][0]["label"] == "AM"
@@ -0,0 +1,41 @@
+import datetime
+
+from routelit_mantine.cache import LRUCache, fingerprint
+
+
+class TestLRUCache:
+    def test_evicts_least_recently_used(self) -> None:
+        cache = LRUCache[str, int](2)
+        cache["a"] = 1
+        cache["b"] = 2
+        assert cache.get("a") == 1
+        cache["c"] = 3
+        assert "b" not in cache
+        assert list(cache) == ["a", "c"]
+
+    def test_contains_does_not_promote(self) -> None:
+        cache = LRUCache[str, int](2)
+        cache["a"] = 1
+        cache["b"] = 2
+        assert "a" in cache
+        cache["c"] = 3
+        assert "a" not in cache
+        assert len(cache) == 2
+
+    def test_pop_and_default(self) -> None:
+        cache = LRUCache[str, int](1)
+        cache["a"] = 1
+        assert cache.pop("a") == 1
+        assert cache.pop("a") is None
+        assert cache.get("a", 0) == 0
+
+
+class TestFingerprint:
+    def test_stable_and_content_based(self) -> None:
+        assert fingerprint([{"x": 1}]) == fingerprint([{"x": 1}])
+        assert fingerprint([{"x": 1}]) != fingerprint([{"x": 2}])
+
+    def test_non_json_values(self) -> None:
+        day = datetime.date(2024, 1, 1)
+        assert fingerprint({"d": day}) == fingerprint({"d": datetime.date(2024, 1, 1)})
+        assert fingerprint({"d": day}) != fingerprint({"d": datetime.date(2024, 1, 2)})
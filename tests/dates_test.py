@@ -0,0 +1,39 @@
+import datetime
+
+import pytest
+
+from routelit_mantine import dates
+from routelit_mantine.dates import parse_date, parse_dates, parse_datetime, parse_time
+
+
+class TestParsing:
+    def test_scalars_are_cached(self) -> None:
+        parse_date.cache_clear()
+        assert parse_date("2024-02-29") == datetime.date(2024, 2, 29)
+        assert parse_date("2024-02-29") == datetime.date(2024, 2, 29)
+        assert parse_date.cache_info().hits == 1
+
+    def test_datetime_and_time(self) -> None:
+        assert parse_datetime("2024-01-02 10:30:00") == datetime.datetime(2024, 1, 2, 10, 30)
+        assert parse_datetime("2024-01-02T10:30:00Z") == datetime.datetime(
+            2024, 1, 2, 10, 30, tzinfo=datetime.timezone.utc
+        )
+        assert parse_time("08:15") == datetime.time(8, 15)
+
+    @pytest.mark.parametrize("backend", ["numpy", "python"])
+    def test_bulk_dates(self, backend: str, monkeypatch: pytest.MonkeyPatch) -> None:
+        if backend == "numpy":
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(dates, "np", None)
+        start = datetime.date(2024, 1, 1)
+        expected = [start + datetime.timedelta(days=i) for i in range(100)]
+        result = parse_dates([d.isoformat() for d in expected])
+        assert result == expected
+        assert all(type(d) is datetime.date for d in result)
+
+    def test_mixed_list_keeps_dates(self) -> None:
+        assert parse_dates(["2024-01-01", datetime.date(2024, 1, 2)]) == [
+            datetime.date(2024, 1, 1),
+            datetime.date(2024, 1, 2),
+        ]
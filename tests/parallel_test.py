@@ -0,0 +1,18 @@
+import functools
+from typing import Any
+
+from routelit_mantine.parallel import is_serial, uses_session_state
+
+
+def test_is_serial_follows_wrappers() -> None:
+    @uses_session_state
+    def cart(ui: Any) -> None: ...
+
+    @functools.wraps(cart)
+    def wrapper(ui: Any) -> None: ...
+
+    def other(ui: Any) -> None: ...
+
+    assert is_serial(cart)
+    assert is_serial(wrapper)
+    assert not is_serial(other)
@@ -0,0 +1,36 @@
+import datetime
+
+from routelit_mantine.presets import is_time_preset_range, iter_time_presets, time_preset_props
+
+
+class TestTimePresets:
+    def test_props_are_compact_seconds(self) -> None:
+        props = time_preset_props({
+            "start": "09:00",
+            "end": datetime.time(17, 0),
+            "step": 5,
+            "exclude": [("12:00", "13:00")],
+            "label": "Clinic A",
+        })
+        assert props == [{"start": 32400, "end": 61200, "step": 300, "exclude": [[43200, 46800]], "label": "Clinic A"}]
+
+    def test_iter_expands_lazily(self) -> None:
+        presets = iter_time_presets([
+            {"start": "09:00", "end": "10:00", "step": "00:20", "exclude": [("09:20", "09:40")]},
+            {"start": "14:00:30", "end": "14:01:30", "step": datetime.timedelta(seconds=30), "label": "PM"},
+        ])
+        assert next(presets) == (None, "09:00:00")
+        assert list(presets) == [
+            (None, "09:40:00"),
+            (None, "10:00:00"),
+            ("PM", "14:00:30"),
+            ("PM", "14:01:00"),
+            ("PM", "14:01:30"),
+        ]
+
+    def test_detects_generators(self) -> None:
+        assert is_time_preset_range({"start": "09:00", "end": "10:00"})
+        assert is_time_preset_range([{"start": "09:00", "end": "10:00"}])
+        assert not is_time_preset_range(["09:00:00", "10:00:00"])
+        assert not is_time_preset_range([{"label": "Morning", "values": ["09:00:00"]}])
+        assert not is_time_preset_range(None)
@@ -0,0 +1,28 @@
+import json
+
+from routelit.assets_utils import get_vite_components_assets
+
+from routelit_mantine import RLBuilder
+from routelit_mantine.service_worker import SERVICE_WORKER_ASSETS, service_worker_script
+
+
+class TestServiceWorker:
+    def test_registration_script_is_a_static_asset(self) -> None:
+        class Builder(RLBuilder):
+            static_assets_targets = [SERVICE_WORKER_ASSETS]  # noqa: RUF012
+
+        assert Builder.get_client_resource_paths() == [SERVICE_WORKER_ASSETS, *RLBuilder.static_assets_targets]
+        assets = get_vite_components_assets(SERVICE_WORKER_ASSETS["package_name"])
+        assert assets.js_files == ["register.js"]
+
+    def test_script_precaches_manifest_files(self) -> None:
+        script = service_worker_script(("routelit_mantine.service_worker",))
+        header, source = script.split("\n", 1)
+        precache = json.loads(header.removeprefix("const PRECACHE = ").removesuffix(";"))
+        assert precache["urls"] == ["/routelit/routelit_mantine.service_worker/register.js"]
+        assert precache["immutable"] == []
+        assert len(precache["version"]) == 16
+        assert 'addEventListener("fetch"' in source
+        assert "/static/routelit_mantine.service_worker/register.js" in service_worker_script(
+            ("routelit_mantine.service_worker",), "/static"
+        )
@@ -0,0 +1,80 @@
+from typing import Any
+
+import pytest
+from routelit import PropertyDict
+
+from routelit_mantine import state as state_module
+from routelit_mantine.state import SessionStateRegistry, track_widget_state, value_size
+
+
+class TestTrackWidgetState:
+    def test_evicts_idle_widgets(self) -> None:
+        state = PropertyDict({"name": "a", "__name_default": "a", "drawer_input": "b", "counter": 1})
+        track_widget_state(
+            state, ["name", "drawer_input"], max_idle_runs=1, max_bytes=None, companions=["__{}_default"]
+        )
+        track_widget_state(state, ["name"], max_idle_runs=1, max_bytes=None, companions=["__{}_default"])
+        assert "drawer_input" in state
+        track_widget_state(state, ["name"], max_idle_runs=1, max_bytes=None, companions=["__{}_default"])
+        assert "drawer_input" not in state
+        assert state["name"] == "a"
+        assert state["__name_default"] == "a"
+        assert state["counter"] == 1  # never rendered as a widget
+
+    def test_cap_keeps_rendered_widgets(self) -> None:
+        state = PropertyDict({"old": "x" * 1000, "new": "y" * 1000})
+        track_widget_state(state, ["old"], max_idle_runs=None, max_bytes=None)
+        total = track_widget_state(state, ["new"], max_idle_runs=None, max_bytes=1500)
+        assert "old" not in state
+        assert state["new"] == "y" * 1000
+        assert total == value_size("y" * 1000)
+        assert track_widget_state(state, ["new"], max_idle_runs=None, max_bytes=10) == total
+
+    def test_measures_changed_values_only(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        measured: list[Any] = []
+        monkeypatch.setattr(state_module, "value_size", lambda value: measured.append(value) or 1)
+        state = PropertyDict({"name": "a"})
+        track_widget_state(state, ["name"], max_idle_runs=None, max_bytes=None)
+        track_widget_state(state, ["name"], max_idle_runs=None, max_bytes=None)
+        assert measured == ["a"]
+        state["name"] = "b"
+        track_widget_state(state, ["name"], max_idle_runs=None, max_bytes=None)
+        assert measured == ["a", "b"]
+        for _ in range(state_module.REMEASURE_RUNS):
+            track_widget_state(state, ["name"], max_idle_runs=None, max_bytes=None)
+        assert measured == ["a", "b", "b"]
+
+    def test_detects_changes_by_value(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        measured: list[Any] = []
+        monkeypatch.setattr(state_module, "value_size", lambda value: measured.append(list(value)) or 1)
+        state = PropertyDict({"tags": ["a"]})
+        track_widget_state(state, ["tags"], max_idle_runs=None, max_bytes=None)
+        state["tags"] = ["a"]  # a new but equal-sized list, as loaded from a session store
+        track_widget_state(state, ["tags"], max_idle_runs=None, max_bytes=None)
+        assert measured == [["a"]]
+        state["tags"].append("b")
+        track_widget_state(state, ["tags"], max_idle_runs=None, max_bytes=None)
+        assert measured == [["a"], ["a", "b"]]
+
+
+class TestSessionStateRegistry:
+    def test_summary(self) -> None:
+        registry = SessionStateRegistry(maxsize=3)
+        assert registry.summary()["sessions"] == 0
+        for i, nbytes in enumerate([10, 20, 30, 40]):
+            registry.record(f"s{i}", "/page", nbytes)
+        summary = registry.summary()
+        assert summary["sessions"] == 3
+        assert summary["total_bytes"] == 90
+        assert summary["max_bytes"] == 40
+        assert summary["p50_bytes"] == 30
+
+    def test_pages_of_a_session_are_summed(self) -> None:
+        registry = SessionStateRegistry()
+        registry.record("s", "/a", 10)
+        registry.record("s", "/b", 5)
+        assert registry.summary()["max_bytes"] == 15
+        registry.discard("s", "/a")
+        assert registry.summary()["max_bytes"] == 5
+        registry.discard("s", "/b")
+        assert registry.summary()["sessions"] == 0
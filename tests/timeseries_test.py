@@ -0,0 +1,93 @@
+import datetime
+
+import pytest
+
+from routelit_mantine import timeseries
+from routelit_mantine.timeseries import InvalidAggregationError, InvalidIntervalError, resample
+
+UTC = datetime.timezone.utc
+
+
+@pytest.fixture(params=["numpy", "python"], autouse=True)
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(timeseries, "np", None)
+    return str(request.param)
+
+
+def _at(minute: int) -> datetime.datetime:
+    return datetime.datetime(2024, 1, 1, 10, minute, tzinfo=UTC)
+
+
+class TestResample:
+    def test_aggregations_and_gaps(self) -> None:
+        times = [_at(1), _at(4), _at(12), _at(31)]
+        values = [1.0, 3.0, 5.0, 7.0]
+        rows = resample(times, {"a": values, "b": values}, interval="10min", agg={"a": "mean", "b": "sum"})
+        assert [row["date"] for row in rows] == [_at(m).isoformat() for m in (0, 10, 20, 30)]
+        assert [row["a"] for row in rows] == [2.0, 5.0, None, 7.0]
+        assert [row["b"] for row in rows] == [4.0, 5.0, 0.0, 7.0]
+
+    @pytest.mark.parametrize(
+        ("fill", "expected"),
+        [("zero", [2.0, 0, 7.0]), ("previous", [2.0, 2.0, 7.0]), ("drop", [2.0, 7.0])],
+    )
+    def test_fill(self, fill: str, expected: list) -> None:
+        rows = resample([_at(1), _at(4), _at(21)], [1, 3, 7], interval="10min", fill=fill)  # type: ignore[arg-type]
+        assert [row["value"] for row in rows] == expected
+
+    def test_count_min_max_percentile(self) -> None:
+        times = [_at(m) for m in range(5)]
+        values = [5, 1, 4, 2, 3]
+        assert resample(times, interval="1h")[0]["count"] == 5
+        assert resample(times, values, interval="1h", agg="min")[0]["value"] == 1
+        assert resample(times, values, interval="1h", agg="max")[0]["value"] == 5
+        assert resample(times, values, interval="1h", agg="median")[0]["value"] == 3
+        assert resample(times, values, interval="1h", agg="p25")[0]["value"] == 2
+
+    def test_ignores_missing_values(self) -> None:
+        rows = resample([_at(1), _at(2), _at(3)], [1.0, None, float("nan")], interval="1h", agg="count")
+        assert rows[0]["value"] == 1
+
+    def test_daily_buckets_follow_local_midnight_across_dst(self) -> None:
+        # Europe/Madrid switches to summer time on 2024-03-31
+        tz = "Europe/Madrid"
+        times = ["2024-03-30T23:30:00Z", "2024-03-31T21:30:00Z", "2024-03-31T22:30:00Z", "2024-04-01T12:00:00"]
+        rows = resample(times, interval="1d", tz=tz, date_format="%Y-%m-%d")
+        assert rows == [
+            {"date": "2024-03-31", "count": 2},
+            {"date": "2024-04-01", "count": 2},
+        ]
+
+    def test_monthly_buckets_and_explicit_range(self) -> None:
+        times = [datetime.date(2024, 1, 15), datetime.date(2024, 3, 2)]
+        rows = resample(
+            times,
+            [1, 2],
+            interval="1mo",
+            agg="sum",
+            start=datetime.date(2023, 12, 1),
+            end=datetime.date(2024, 4, 1),
+            date_format="%Y-%m",
+        )
+        assert [(row["date"], row["value"]) for row in rows] == [
+            ("2023-12", 0.0),
+            ("2024-01", 1.0),
+            ("2024-02", 0.0),
+            ("2024-03", 2.0),
+            ("2024-04", 0.0),
+        ]
+
+    def test_epoch_seconds_and_timedelta_interval(self) -> None:
+        rows = resample([0, 30, 61], [1, 2, 3], interval=datetime.timedelta(minutes=1), agg="sum")
+        assert [row["value"] for row in rows] == [3.0, 3.0]
+        assert rows[0]["date"] == "1970-01-01T00:00:00+00:00"
+
+    def test_empty_and_invalid_input(self) -> None:
+        assert resample([], []) == []
+        with pytest.raises(InvalidIntervalError):
+            resample([_at(1)], [1], interval="fortnight")
+        with pytest.raises(InvalidAggregationError):
+            resample([_at(1)], [1], agg="p101")